@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of the per-call overhead of `nidaqmx.libnidaqmx.CALL`.
+
+The NI-DAQmx library is replaced by a stand-in whose functions are
+C callbacks that return 0 without looking at their arguments, so that
+the timings measure only the Python side of a call: function lookup,
+argument conversion and return code checking. The current `CALL` is
+compared against the previous implementation that looked the
+function up with getattr on every call and relied on ctypes guessing
+argument conversions.
+
+Usage::
+
+  python benchmarks/bench_call.py [number]
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import os
+import sys
+import ctypes
+import timeit
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+    from nidaqmx import libnidaqmx
+from nidaqmx.prototypes import prototypes
+
+try:
+    unicode
+except NameError:
+    unicode = str
+
+int32 = libnidaqmx.int32
+uInt32 = libnidaqmx.uInt32
+bool32 = libnidaqmx.bool32
+float64 = libnidaqmx.float64
+
+_stub_type = ctypes.CFUNCTYPE(int32)
+
+def _stub():
+    return 0
+
+class StandInLibrary(object):
+    """
+    Stand-in for the NI-DAQmx library that provides a function
+    ``DAQmx<name>`` for every name in `nidaqmx.prototypes`.
+    """
+
+    def __init__(self):
+        self._stub = _stub_type(_stub)
+        address = ctypes.cast(self._stub, ctypes.c_void_p).value
+        for name in prototypes:
+            # Each function gets its own function pointer object so
+            # that setting argtypes on one does not affect others.
+            setattr(self, 'DAQmx' + name, _stub_type(address))
+
+legacy_lib = StandInLibrary()
+
+def legacy_CALL(name, *args):
+    """
+    `CALL` as implemented before the function table was introduced.
+    """
+    funcname = 'DAQmx' + name
+    func = getattr(legacy_lib, funcname)
+    new_args = []
+    for a in args:
+        if isinstance(a, unicode):
+            new_args.append (bytes(a))
+        else:
+            new_args.append (a)
+    r = func(*new_args)
+    r = libnidaqmx.CHK(r, funcname, *new_args)
+    return r
+
+def setup_CALL():
+    libnidaqmx.libnidaqmx = StandInLibrary()
+    libnidaqmx._functions.clear()
+    return libnidaqmx.CALL
+
+task = libnidaqmx.TaskHandle(1234)
+data = np.zeros(1000, dtype=np.float64)
+samples = int32(0)
+value = float64(0)
+
+cases = [
+    ('ReadAnalogF64', lambda CALL: CALL(
+        'ReadAnalogF64', task, 1000, float64(10.0), 0, data.ctypes.data,
+        uInt32(data.size), ctypes.byref(samples), None)),
+    ('ReadAnalogScalarF64', lambda CALL: CALL(
+        'ReadAnalogScalarF64', task, float64(10.0), ctypes.byref(value), None)),
+    ('WriteAnalogF64', lambda CALL: CALL(
+        'WriteAnalogF64', task, int32(1000), bool32(False), float64(10.0),
+        0, data.ctypes.data, ctypes.byref(samples), None)),
+    ('GetAIMax', lambda CALL: CALL(
+        'GetAIMax', task, b'Dev1/ai0', ctypes.byref(value))),
+]
+
+def main(number=100000):
+    CALL = setup_CALL()
+    print('%-22s %12s %12s %8s' % ('function', 'legacy [us]', 'CALL [us]', 'speedup'))
+    for name, case in cases:
+        t_legacy = min(timeit.repeat(lambda: case(legacy_CALL), number=number, repeat=3))
+        t_new = min(timeit.repeat(lambda: case(CALL), number=number, repeat=3))
+        print('%-22s %12.3f %12.3f %7.2fx' % (name, 1e6 * t_legacy / number,
+                                             1e6 * t_new / number, t_legacy / t_new))
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
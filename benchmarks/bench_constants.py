@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Import time and memory of NI-DAQmx constants: the constant store of
+`nidaqmx.constants` against the generated ``nidaqmx_h_<version>``
+modules that `_load_header` used to import.
+
+The legacy module is regenerated from the store into a temporary
+directory in the format that `_convert_header` used to write. Each
+measurement runs in a fresh interpreter after numpy is imported, and
+covers loading the constants of one version and resolving
+``DAQmx.Val_Volts``. RSS is the growth of the resident set size.
+
+Usage::
+
+  python benchmarks/bench_constants.py [version] [repeat]
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import os
+import sys
+import shutil
+import pprint
+import tempfile
+import subprocess
+
+package_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'nidaqmx')
+sys.path.insert(0, package_dir)
+
+from constants import ConstantStore
+
+measure_template = '''
+from __future__ import print_function
+import os, sys, time
+import numpy
+
+def rss():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except IOError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+sys.path.insert(0, %(path)r)
+rss0 = rss()
+t0 = time.time()
+%(statement)s
+DAQmx.Val_Volts
+t1 = time.time()
+print(1e3 * (t1 - t0), rss() - rss0)
+'''
+
+legacy_statement = '''
+import %(module)s as mod
+DAQmx, error_map = mod.DAQmx, mod.error_map
+'''
+
+store_statement = '''
+from constants import ConstantStore
+DAQmx, error_map, prototypes = ConstantStore().load(%(version)r)
+'''
+
+def write_legacy_module(store, version, path):
+    constants, error_map, prototypes = store._read_all()[version]
+    with open(path, 'w') as f:
+        f.write("# This file is auto-generated. Do not edit!\n\n")
+        f.write("from collections import namedtuple\n\n")
+        f.write("_d = %s\n" % pprint.pformat(constants))
+        f.write("DAQmxConstants = namedtuple('DAQmxConstants', _d.keys())\n")
+        f.write("DAQmx = DAQmxConstants(**_d)\n\n")
+        f.write("error_map = %s\n" % pprint.pformat(error_map))
+
+def measure(path, statement):
+    code = measure_template % dict(path=path, statement=statement)
+    output = subprocess.check_output([sys.executable, '-c', code])
+    t, rss = output.split()
+    return float(t), int(rss)
+
+def main(version=None, repeat=5):
+    store = ConstantStore()
+    if version is None:
+        version = store.versions[-1]
+    module = 'nidaqmx_h_%s' % (version.replace('.', '_'))
+    tmpdir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmpdir, module + '.py')
+        write_legacy_module(store, version, path)
+        legacy = legacy_statement % dict(module=module)
+        cases = [
+            ('legacy module, first import', tmpdir, legacy, 1),
+            ('legacy module', tmpdir, legacy, repeat),
+            ('constant store', package_dir, store_statement % dict(version=version), repeat),
+        ]
+        print('NI-DAQmx %s: legacy module %d KiB, store %d KiB (all %d versions)'
+              % (version, os.path.getsize(path) // 1024, os.path.getsize(store.path) // 1024,
+                 len(store.versions)))
+        print('%-30s %10s %10s' % ('', 'time [ms]', 'RSS [KiB]'))
+        for name, path, statement, n in cases:
+            results = [measure(path, statement) for i in range(n)]
+            print('%-30s %10.2f %10d' % (name, min(t for t, rss in results),
+                                         min(rss for t, rss in results)))
+    finally:
+        shutil.rmtree(tmpdir)
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(*(args[:1] + [int(a) for a in args[1:]]))
@@ -0,0 +1,501 @@
+#!/usr/bin/env python
+"""
+Benchmark suite of the hot paths of `nidaqmx.libnidaqmx`, with
+results stored per commit.
+
+Benchmarks are classes in the style of asv: ``time_*`` methods are
+timed after `setup` is called with each combination of `params`.
+They run against `StandInLibrary`, the simulated library of
+`nidaqmx.simulated` with reads and writes that return at once, so
+the timings measure the Python side of a call (argument checks,
+array allocation, layout handling and CALL), not the driver or the
+sample clock. Per-call time is the best of several repeats.
+
+Results are saved as ``benchmarks/results/<commit>-py<version>.json``
+for the commit checked out, or ``<commit>-dirty-py<version>.json``
+when tracked files have uncommitted changes. ``--compare`` prints
+the ratios against the results of another commit, measured with the
+same Python version, and exits with status 1 when a benchmark got
+slower than ``--threshold``::
+
+  python benchmarks/bench_suite.py
+  python benchmarks/bench_suite.py --compare HEAD~1
+  python benchmarks/bench_suite.py --filter AnalogInput --no-save
+
+Usage::
+
+  python benchmarks/bench_suite.py [--filter REGEX] [--compare REV]
+                                   [--threshold RATIO] [--no-save]
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import os
+import re
+import sys
+import json
+import ctypes
+import timeit
+import argparse
+import platform
+import datetime
+import itertools
+import subprocess
+
+import numpy as np
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, root)
+
+from nidaqmx import libnidaqmx
+from nidaqmx.libnidaqmx import (AnalogInputTask, AnalogOutputTask, DigitalInputTask,
+                                CounterInputTask, CounterOutputTask, make_pattern)
+from nidaqmx.control import ControlLoop
+from nidaqmx.counter import EncoderStream, compile_pulses
+from nidaqmx.digital import ChangeEventReader, pack_lines
+from nidaqmx.simulated import SimulatedLibrary
+
+results_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+_stub_type = ctypes.CFUNCTYPE(ctypes.c_int32)
+_stub = _stub_type(lambda: 0)
+
+class StandInLibrary(SimulatedLibrary):
+    """
+    Simulated library whose reads and writes transfer no samples and
+    return at once, reporting all requested samples as read or
+    written.
+
+    Functions in `stubs` are C callbacks without arguments that
+    return 0, as in bench_call.py, so that their cost is that of
+    the call alone.
+    """
+
+    stubs = ['WaitForNextSampleClock', 'ReadAnalogScalarF64', 'ReadCounterScalarF64',
+             'WriteAnalogScalarF64']
+
+    def __getattr__(self, name):
+        if name[5:] in self.stubs:
+            func = _stub_type(ctypes.cast(_stub, ctypes.c_void_p).value)
+            setattr(self, name, func)
+            return func
+        return SimulatedLibrary.__getattr__(self, name)
+
+    def set_stubs(self, names):
+        """
+        Makes the functions in `names` the stubs, rebinding those
+        whose implementation changes.
+        """
+        for name in set(self.stubs).symmetric_difference(names):
+            self.__dict__.pop('DAQmx' + name, None)
+            libnidaqmx._functions.pop(name, None)
+        self.stubs = list(names)
+
+    def _ReadAnalogF64(self, handle, samples, timeout, fill_mode, address, size,
+                       read_address, reserved):
+        ctypes.c_int32.from_address(read_address).value = max(0, min(samples, size))
+
+    def _ReadBinaryI16(self, handle, samples, timeout, fill_mode, address, size,
+                       read_address, reserved):
+        ctypes.c_int32.from_address(read_address).value = max(0, min(samples, size))
+
+    def _ReadDigitalLines(self, handle, samples, timeout, fill_mode, address, size,
+                          read_address, bytes_address, reserved):
+        ctypes.c_int32.from_address(read_address).value = max(0, min(samples, size))
+
+    def _ReadDigitalU32(self, handle, samples, timeout, fill_mode, address, size,
+                        read_address, reserved):
+        ctypes.c_int32.from_address(read_address).value = max(0, min(samples, size))
+
+    def _ReadCounterF64(self, handle, samples, timeout, address, size, read_address, reserved):
+        ctypes.c_int32.from_address(read_address).value = max(0, min(samples, size))
+
+    def _WriteAnalogF64(self, handle, samples, auto_start, timeout, layout, address,
+                        written_address, reserved):
+        ctypes.c_int32.from_address(written_address).value = samples
+
+    def _WriteCtrTicks(self, handle, samples, auto_start, timeout, layout, high_address,
+                       low_address, written_address, reserved):
+        ctypes.c_int32.from_address(written_address).value = samples
+
+def install_library():
+    """
+    Makes `libnidaqmx` call a new `StandInLibrary`.
+    """
+    lib = StandInLibrary()
+    with libnidaqmx._load_lock:
+        libnidaqmx._library = lib
+        libnidaqmx._library_loaded = True
+        libnidaqmx._header = None
+        libnidaqmx.libnidaqmx = lib
+        libnidaqmx._functions.clear()
+    return lib
+
+class AnalogInputRead(object):
+    params = ([1, 16], [1, 100, 10000])
+    param_names = ['channels', 'samples_per_channel']
+
+    def setup(self, channels, samples_per_channel):
+        self.task = AnalogInputTask()
+        self.task.create_voltage_channel('Dev1/ai0:%d' % (channels - 1))
+        self.task.configure_timing_sample_clock(rate=1000.0)
+        self.out = np.zeros((samples_per_channel, channels))
+
+    def teardown(self, channels, samples_per_channel):
+        self.task.clear()
+
+    def time_read(self, channels, samples_per_channel):
+        self.task.read(samples_per_channel)
+
+    def time_read_group_by_channel(self, channels, samples_per_channel):
+        self.task.read(samples_per_channel, fill_mode='group_by_channel')
+
+    def time_read_into(self, channels, samples_per_channel):
+        self.task.read_into(self.out, samples_per_channel)
+
+    def time_read_float32(self, channels, samples_per_channel):
+        self.task.read(samples_per_channel, dtype=np.float32)
+
+    def time_read_raw(self, channels, samples_per_channel):
+        self.task.read_raw(samples_per_channel)
+
+class RawScaling(object):
+    params = ([1, 16], [100, 100000])
+    param_names = ['channels', 'samples_per_channel']
+
+    def setup(self, channels, samples_per_channel):
+        self.task = AnalogInputTask()
+        self.task.create_voltage_channel('Dev1/ai0:%d' % (channels - 1))
+        self.scaler = self.task.get_scaler()
+        self.raw = np.arange(samples_per_channel * channels, dtype=np.int16).reshape(-1, channels)
+        self.out = np.zeros(self.raw.shape)
+
+    def teardown(self, channels, samples_per_channel):
+        self.task.clear()
+
+    def time_scale(self, channels, samples_per_channel):
+        self.scaler.scale(self.raw, out=self.out)
+
+class AnalogInputReadScalar(object):
+
+    def setup(self):
+        self.task = AnalogInputTask()
+        self.task.create_voltage_channel('Dev1/ai0')
+
+    def teardown(self):
+        self.task.clear()
+
+    def time_read_scalar(self):
+        self.task.read_scalar()
+
+class AnalogOutputWrite(object):
+    params = ([1, 4], [1, 1000])
+    param_names = ['channels', 'samples_per_channel']
+
+    def setup(self, channels, samples_per_channel):
+        self.task = AnalogOutputTask()
+        self.task.create_voltage_channel('Dev1/ao0:%d' % (channels - 1))
+        self.task.configure_timing_sample_clock(rate=1000.0)
+        self.data = np.zeros((samples_per_channel, channels))
+        self.data_list = self.data.tolist()
+
+    def teardown(self, channels, samples_per_channel):
+        self.task.clear()
+
+    def time_write_array(self, channels, samples_per_channel):
+        self.task.write(self.data, auto_start=False)
+
+    def time_write_list(self, channels, samples_per_channel):
+        self.task.write(self.data_list, auto_start=False)
+
+class AnalogOutputWriteScalar(object):
+
+    def setup(self):
+        self.task = AnalogOutputTask()
+        self.task.create_voltage_channel('Dev1/ao0')
+
+    def teardown(self):
+        self.task.clear()
+
+    def time_write_scalar(self):
+        self.task.write(1.0)
+
+class DigitalInputRead(object):
+    params = (['per_line', 'for_all_lines'], [1, 1000])
+    param_names = ['grouping', 'samples_per_channel']
+
+    def setup(self, grouping, samples_per_channel):
+        self.task = DigitalInputTask()
+        self.task.create_channel('Dev1/port0/line0:7', grouping=grouping)
+        self.task.configure_timing_sample_clock(rate=1000.0)
+        self.reader = ChangeEventReader(self.task, samples_per_channel, sample_rate=1000.0)
+
+    def teardown(self, grouping, samples_per_channel):
+        self.task.clear()
+
+    def time_read(self, grouping, samples_per_channel):
+        self.task.read(samples_per_channel)
+
+    def time_read_port(self, grouping, samples_per_channel):
+        self.task.read_port(samples_per_channel)
+
+    def time_read_change_events(self, grouping, samples_per_channel):
+        self.reader.read(samples_per_channel)
+
+class CounterInputReadFreq(object):
+    params = [1, 1000]
+    param_names = ['samples_per_channel']
+
+    def setup(self, samples_per_channel):
+        self.task = CounterInputTask()
+        self.task.create_channel_freq('Dev1/ctr0')
+        self.task.configure_timing_sample_clock(rate=1000.0)
+        self.out = np.zeros(samples_per_channel)
+
+    def teardown(self, samples_per_channel):
+        self.task.clear()
+
+    def time_read_into(self, samples_per_channel):
+        self.task.read_into(self.out, samples_per_channel)
+
+    def time_read_scalar_loop(self, samples_per_channel):
+        read_scalar = self.task.read_scalar
+        for _ in range(samples_per_channel):
+            read_scalar()
+
+class CounterOutputWriteTicks(object):
+    params = [1, 1000]
+    param_names = ['samples_per_channel']
+
+    def setup(self, samples_per_channel):
+        self.task = CounterOutputTask()
+        self.task.create_channel_ticks('Dev1/ctr0', high_ticks=100, low_ticks=100)
+        self.high_ticks = np.full(samples_per_channel, 100, dtype=np.uint32)
+        self.low_ticks = np.full(samples_per_channel, 200, dtype=np.uint32)
+
+    def teardown(self, samples_per_channel):
+        self.task.clear()
+
+    def time_write_ticks(self, samples_per_channel):
+        self.task.write_ticks(self.high_ticks, self.low_ticks)
+
+class SinglePointLoop(object):
+    """
+    100 iterations of a hardware-timed single point loop over one
+    input and one output channel.
+
+    `ControlLoop` calls DAQmxReadAnalogF64 and DAQmxWriteAnalogF64,
+    which are stubs here as are the scalar functions called by the
+    per-sample loop it is compared with.
+    """
+
+    def setup(self):
+        self.ai_task = AnalogInputTask()
+        self.ai_task.create_voltage_channel('Dev1/ai0')
+        self.ao_task = AnalogOutputTask()
+        self.ao_task.create_voltage_channel('Dev1/ao0')
+        self.loop = ControlLoop(self.ai_task, self.ao_task, lambda inputs, outputs: None,
+                                rate=1000.0)
+        self.loop.start_tasks()
+        libnidaqmx._library.set_stubs(StandInLibrary.stubs + ['ReadAnalogF64',
+                                                              'WriteAnalogF64'])
+
+    def teardown(self):
+        libnidaqmx._library.set_stubs(StandInLibrary.stubs)
+        self.loop.stop_tasks()
+        self.ai_task.clear()
+        self.ao_task.clear()
+
+    def time_control_loop(self):
+        self.loop.run(100)
+
+    def time_read_scalar_write(self):
+        for i in range(100):
+            self.ai_task.wait_for_next_sample_clock()
+            self.ao_task.write(self.ai_task.read_scalar())
+
+class PackLines(object):
+    params = [8, 32]
+    param_names = ['lines']
+
+    def setup(self, lines):
+        self.matrix = np.random.RandomState(0).rand(1000000, lines) > 0.5
+        self.arrays = list(self.matrix.T.copy())
+        self.out = np.zeros(1000000, dtype=np.uint32)
+
+    def time_pack_matrix(self, lines):
+        pack_lines(self.matrix, dtype=np.uint32, out=self.out)
+
+    def time_pack_arrays(self, lines):
+        pack_lines(self.arrays, dtype=np.uint32, out=self.out)
+
+class EncoderUnwrap(object):
+
+    def setup(self):
+        self.task = CounterInputTask()
+        self.stream = EncoderStream(self.task, 1000000)
+        ticks = np.cumsum(np.random.RandomState(0).randint(-1000, 1000, 1000000))
+        self.counts = (ticks % (1 << 32)).astype(np.uint32)
+
+    def teardown(self):
+        self.task.clear()
+
+    def time_unwrap(self):
+        self.stream.unwrap(self.counts)
+
+class CompilePulses(object):
+
+    def setup(self):
+        rng = np.random.RandomState(0)
+        self.frequency = rng.uniform(1e3, 1e5, 1000000)
+        self.duty_cycle = rng.uniform(0.1, 0.9, 1000000)
+
+    def time_compile_pulses(self):
+        compile_pulses(self.frequency, self.duty_cycle, 100e6, max_error=1e-3)
+
+class MakePattern(object):
+    params = [16, 256, 4096]
+    param_names = ['channels']
+
+    def setup(self, channels):
+        self.paths = ['Dev%d/ai%d' % (i // 32 + 1, i % 32) for i in range(channels)]
+
+    def time_make_pattern(self, channels):
+        make_pattern(self.paths)
+
+class TaskInit(object):
+
+    def time_init_clear(self):
+        AnalogInputTask().clear()
+
+benchmarks = [AnalogInputRead, AnalogInputReadScalar, AnalogOutputWrite,
+              AnalogOutputWriteScalar, DigitalInputRead, CounterInputReadFreq,
+              CounterOutputWriteTicks, SinglePointLoop, RawScaling, PackLines, EncoderUnwrap,
+              CompilePulses, MakePattern, TaskInit]
+
+def _get_param_combinations(cls):
+    params = getattr(cls, 'params', None)
+    if params is None:
+        return [()]
+    if not isinstance(params, tuple):
+        params = (params,)
+    return list(itertools.product(*params))
+
+def iter_benchmarks(pattern=None):
+    """
+    Yields ``(name, cls, method, params)`` of the benchmarks whose
+    names match regular expression ``pattern``.
+    """
+    for cls in benchmarks:
+        methods = sorted(m for m in dir(cls) if m.startswith('time_'))
+        for method in methods:
+            for params in _get_param_combinations(cls):
+                name = '%s.%s' % (cls.__name__, method)
+                if params:
+                    name += '(%s)' % (', '.join(repr(p).lstrip('u') for p in params))
+                if pattern is None or re.search(pattern, name):
+                    yield name, cls, method, params
+
+def measure(cls, method, params, min_time=0.1, repeat=5):
+    """
+    Returns the best time, in seconds, of one call of benchmark
+    ``method`` of ``cls`` with ``params``.
+    """
+    bench = cls()
+    if hasattr(bench, 'setup'):
+        bench.setup(*params)
+    try:
+        func = getattr(bench, method)
+        call = lambda: func(*params)
+        timer = timeit.Timer(call)
+        number = 1
+        while timer.timeit(number) < min_time:
+            number *= 10
+        return min(timer.repeat(repeat, number)) / number
+    finally:
+        if hasattr(bench, 'teardown'):
+            bench.teardown(*params)
+
+def _git(*args):
+    try:
+        output = subprocess.check_output(('git',) + args, cwd=root, stderr=subprocess.STDOUT)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('utf-8').strip()
+
+def get_results_filename(commit, dirty=False):
+    return os.path.join(results_dir, '%s%s-py%d.%d.json'
+                        % ((commit, '-dirty' if dirty else '') + sys.version_info[:2]))
+
+def run(pattern=None):
+    """
+    Runs the benchmarks and returns the results as a dictionary.
+    """
+    install_library()
+    results = {}
+    for name, cls, method, params in iter_benchmarks(pattern):
+        results[name] = t = measure(cls, method, params)
+        print('%-60s %10.2f us' % (name, 1e6 * t))
+    return dict(commit=_git('rev-parse', 'HEAD') or 'unknown',
+                dirty=bool(_git('status', '--porcelain', '--untracked-files=no')),
+                date=datetime.datetime.now().isoformat(),
+                python=platform.python_version(), numpy=np.__version__,
+                machine=platform.node(), results=results)
+
+def save(report):
+    if not os.path.isdir(results_dir):
+        os.makedirs(results_dir)
+    filename = get_results_filename(report['commit'], report['dirty'])
+    with open(filename, 'w') as f:
+        json.dump(report, f, indent=1, sort_keys=True)
+    return filename
+
+def compare(report, revision, threshold):
+    """
+    Prints the ratios of the times in ``report`` to those stored for
+    ``revision``. Returns the names of the benchmarks that got slower
+    by more than ``threshold``.
+    """
+    commit = _git('rev-parse', revision)
+    filename = get_results_filename(commit or revision)
+    if not os.path.isfile(filename):
+        raise SystemExit('No results for %s in %s, check it out and run the suite first'
+                         % (revision, results_dir))
+    with open(filename) as f:
+        reference = json.load(f)['results']
+    regressions = []
+    print('\n%-60s %10s %10s %8s' % ('benchmark', revision[:10], 'current', 'ratio'))
+    for name, t in sorted(report['results'].items()):
+        if name not in reference:
+            continue
+        ratio = t / reference[name]
+        flag = ''
+        if ratio > threshold:
+            regressions.append(name)
+            flag = '  slower'
+        print('%-60s %8.2fus %8.2fus %7.2fx%s' % (name, 1e6 * reference[name], 1e6 * t,
+                                                  ratio, flag))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks of nidaqmx hot paths.')
+    parser.add_argument('--filter', help='run benchmarks whose names match this regex')
+    parser.add_argument('--compare', metavar='REV',
+                        help='compare with the stored results of a git revision')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='ratio above which --compare reports a regression')
+    parser.add_argument('--no-save', action='store_true', help='do not store the results')
+    args = parser.parse_args(argv)
+    report = run(args.filter)
+    regressions = []
+    if args.compare:
+        regressions = compare(report, args.compare, args.threshold)
+    if not args.no_save:
+        print('Results saved to %s' % (save(report)))
+    if regressions:
+        print('%d benchmarks are slower than %.2fx' % (len(regressions), args.threshold))
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Throughput of `nidaqmx.tdms.TdmsWriter` against the sample rate of a
+fast simulated device.
+
+The task is a stand-in analog input task whose reads copy a
+pregenerated block of samples, so the timings measure the writer and
+the file system, not the driver. The rate to keep up with defaults to
+that of a simulated X Series PCIe-6368: 16 channels at 2 MS/s each,
+the fastest sample clock a simulated device provides. Segment sizes
+are compared from one chunk, one write per read, upwards.
+
+Usage::
+
+  python benchmarks/bench_tdms.py [channels] [rate] [seconds]
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from nidaqmx.tdms import TdmsWriter
+
+class StandInTask(object):
+    """
+    Analog input task that reads a pregenerated block without
+    waiting for samples.
+    """
+
+    name = 'bench'
+
+    def __init__(self, number_of_channels, rate):
+        self.number_of_channels = number_of_channels
+        self.rate = rate
+        self.block = None
+
+    def get_names_of_channels(self):
+        return ['Dev1/ai%d' % (i) for i in range(self.number_of_channels)]
+
+    def get_units(self, channel_name):
+        return 'Volts'
+
+    def get_min(self, channel_name):
+        return -10.0
+
+    def get_max(self, channel_name):
+        return 10.0
+
+    def get_sample_clock_rate(self):
+        return self.rate
+
+    def _new_read_block(self, samples_per_channel, fill_mode):
+        return np.zeros((samples_per_channel, self.number_of_channels), dtype=np.float64)
+
+    def _read_block(self, data, samples_per_channel, timeout, fill_mode):
+        if self.block is None or self.block.shape != data.shape:
+            self.block = np.random.uniform(-10, 10, data.shape)
+        data[...] = self.block
+        return samples_per_channel
+
+def measure(task, filename, samples_per_chunk, chunks_per_segment, seconds):
+    """
+    Returns the number of samples per channel written per second.
+    """
+    with TdmsWriter(filename, task, samples_per_chunk, chunks_per_segment) as writer:
+        t0 = time.time()
+        t1 = t0
+        while t1 - t0 < seconds:
+            writer.read()
+            t1 = time.time()
+        samples = writer.samples_written
+    return samples / (t1 - t0)
+
+def main(number_of_channels=16, rate=2e6, seconds=2.0):
+    task = StandInTask(number_of_channels, rate)
+    tmpdir = tempfile.mkdtemp()
+    samples_per_chunk = int(rate) // 100
+    print('%d channels at %.3g S/s, %d samples per chunk (10 ms), %.1f MB/s required'
+          % (number_of_channels, rate, samples_per_chunk, rate * number_of_channels * 8 / 1e6))
+    print('%-20s %14s %10s %10s' % ('chunks per segment', 'rate [MS/s]', 'MB/s', 'headroom'))
+    try:
+        for chunks_per_segment in [1, 4, 16, 64]:
+            achieved = measure(task, os.path.join(tmpdir, 'bench.tdms'), samples_per_chunk,
+                               chunks_per_segment, seconds)
+            print('%-20d %14.2f %10.1f %9.2fx' % (chunks_per_segment, achieved / 1e6,
+                                                 achieved * number_of_channels * 8 / 1e6,
+                                                 achieved / rate))
+    finally:
+        shutil.rmtree(tmpdir)
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(*[f(a) for f, a in zip([int, float, float], args)])
@@ -16,6 +16,44 @@ that expose NI-DAQmx tasks to Python environment. The instances of
 these task classes provide methods to create channels, to set timing
 and triggering properties, as well as to read or write data.
 
+For continuous acquisition and generation, the following classes
+read an input task and write a non-regenerating output task on a
+background thread:
+
+.. autosummary::
+
+  StreamingReader
+  StreamingWriter
+
+and the following classes read or start several tasks concurrently,
+or start tasks in sync:
+
+.. autosummary::
+
+  TaskGroup
+  SynchronizedTasks
+
+For hardware-timed single point control, the following class runs a
+read, compute and write loop on the sample clock:
+
+.. autosummary::
+
+  ControlLoop
+
+For digital change detection, the following class reads packed port
+samples in blocks and returns the edges of the lines:
+
+.. autosummary::
+
+  ChangeEventReader
+
+For encoder and edge counting channels, the following class unwraps
+the 32-bit counts of the counter into 64-bit positions:
+
+.. autosummary::
+
+  EncoderStream
+
 Example usage
 =============
 
@@ -51,6 +89,18 @@ channels in the NI card::
 
 that should plot two sine waves.
 
+Profiling calls into NI-DAQmx
+=============================
+
+`nidaqmx.stats` returns the per-function call statistics of the
+process, recorded while enabled::
+
+  >>> import nidaqmx
+  >>> nidaqmx.stats().enable()
+  >>> ...
+  >>> print(nidaqmx.stats().format())
+  >>> nidaqmx.stats().write_openmetrics('nidaqmx.prom')
+
 Learning about your NI card and software
 ========================================
 
@@ -82,4 +132,10 @@ Module content
 
 from .libnidaqmx import AnalogInputTask, AnalogOutputTask,\
     DigitalInputTask, DigitalOutputTask, CounterInputTask,\
-    CounterOutputTask, Device, System, get_nidaqmx_version
+    CounterOutputTask, Device, System, get_nidaqmx_version, get_simulated_library
+from .streaming import StreamingReader, StreamingWriter
+from .multitask import TaskGroup, SynchronizedTasks
+from .control import ControlLoop
+from .digital import ChangeEventReader
+from .counter import EncoderStream
+from .instrumentation import stats
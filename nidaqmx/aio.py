@@ -0,0 +1,317 @@
+"""
+asyncio support for tasks. Requires Python 3.
+
+Coroutines of this module wait for samples or buffer space without
+blocking the event loop or a thread: DAQmx Every N Samples and Done
+events, registered once per task, wake the waiting coroutines through
+``loop.call_soon_threadsafe``, and the driver is then only called
+when it can complete without waiting. Several tasks and other I/O can
+thus be served from one event loop.
+
+The same functions are available as `Task.read_async`,
+`Task.write_async` and `Task.stream`.
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import asyncio
+import threading
+
+import numpy as np
+
+from . import libnidaqmx
+
+__all__ = ['TaskEvents', 'get_task_events', 'read_async', 'write_async', 'stream']
+
+def _get_running_loop():
+    get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+    return get_running_loop()
+
+class TaskEvents(object):
+    """
+    Wakes coroutines that wait on a task on DAQmx Every N Samples
+    and Done events. Use `get_task_events` to get the instance of a
+    task.
+
+    Events are registered on construction, which DAQmx allows only
+    while the task is not running. Waits for fewer samples than the
+    event interval end when the samples are due by the sample clock,
+    without waiting for the next event.
+
+    Parameters
+    ----------
+
+    task : Task
+      A task with buffered timing configured.
+
+    samples : int
+      The number of samples, per channel, acquired into or
+      transferred from the buffer between events.
+    """
+
+    def __init__(self, task, samples):
+        self.task = task
+        self.samples = samples
+        self.rate = libnidaqmx._get_or_none(task.get_sample_clock_rate)
+        self.done = False
+        self.status = 0
+        self._loop = _get_running_loop()
+        self._waiters = []
+        self._wake_pending = False
+        self._lock = threading.Lock()
+
+        # Callbacks are called on a DAQmx thread.
+        def on_samples(task, event_type, samples, cb_data):
+            self._schedule_wake()
+            return 0
+
+        def on_done(task, status, cb_data=None):
+            self.status = status
+            self.done = True
+            self._schedule_wake()
+            return 0
+
+        task.register_every_n_samples_event(on_samples, samples=samples)
+        task.register_done_event(on_done)
+
+    def start(self):
+        """
+        Starts the task, forgetting a previous Done event.
+        """
+        self.done = False
+        self.status = 0
+        self.task.start()
+
+    def _schedule_wake(self):
+        with self._lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+            loop = self._loop
+        try:
+            loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            # The event loop is closed.
+            pass
+
+    def _wake(self):
+        with self._lock:
+            self._wake_pending = False
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _get_deadline(self, timeout):
+        if timeout is None or timeout < 0:
+            return None
+        return self._loop.time() + timeout
+
+    async def _wait(self, deadline, samples):
+        """
+        Waits for the next event, until ``deadline`` in event loop
+        time, or until ``samples`` more samples per channel are due
+        by the sample clock when they are fewer than the event
+        interval. Raises asyncio.TimeoutError when the deadline
+        passes.
+        """
+        waiter = self._loop.create_future()
+        self._waiters.append(waiter)
+        timeout = None if deadline is None else max(0.0, deadline - self._loop.time())
+        if samples < self.samples and self.rate:
+            due = samples / self.rate
+            if timeout is None or due < timeout:
+                try:
+                    await asyncio.wait_for(waiter, due)
+                except asyncio.TimeoutError:
+                    pass
+                return
+        await asyncio.wait_for(waiter, timeout)
+
+    def _bind_loop(self):
+        loop = _get_running_loop()
+        if loop is not self._loop:
+            with self._lock:
+                self._loop = loop
+
+    async def wait_for_samples(self, samples_per_channel, timeout=10.0):
+        """
+        Waits until ``samples_per_channel`` samples are available to
+        read or, for finite tasks, until the task is done.
+
+        Returns the number of samples, per channel, that can be read
+        without waiting, at most ``samples_per_channel``.
+        """
+        self._bind_loop()
+        deadline = self._get_deadline(timeout)
+        while True:
+            done = self.done
+            available = self.task.get_samples_per_channel_available()
+            if available >= samples_per_channel:
+                return samples_per_channel
+            if done:
+                if not available:
+                    libnidaqmx.CHK(self.status, 'DAQmxDoneEventCallback')
+                return available
+            await self._wait(deadline, samples_per_channel - available)
+
+    async def wait_for_space(self, samples_per_channel, timeout=10.0):
+        """
+        Waits until the buffer has room for ``samples_per_channel``
+        samples, or until the task is done.
+        """
+        self._bind_loop()
+        deadline = self._get_deadline(timeout)
+        while not self.done:
+            space = self.task.get_write_space_available()
+            if space >= samples_per_channel:
+                return
+            await self._wait(deadline, samples_per_channel - space)
+        libnidaqmx.CHK(self.status, 'DAQmxDoneEventCallback')
+
+def get_task_events(task, samples):
+    """
+    Returns the `TaskEvents` of ``task``, registering events every
+    ``samples`` samples if the task has none yet.
+
+    Call this before starting the task to choose the event interval
+    of a task that is started explicitly. Otherwise the first call of
+    `read_async`, `write_async` or `stream` registers events with an
+    interval of the size of its request.
+
+    Returns
+    -------
+
+    events : TaskEvents
+
+    created : bool
+      True if the events were registered by this call.
+    """
+    events = getattr(task, '_task_events', None)
+    if events is not None:
+        return events, False
+    events = TaskEvents(task, samples)
+    task._task_events = events
+    return events, True
+
+async def read_async(task, samples_per_channel, timeout=10.0,
+                     fill_mode='group_by_scan_number', dtype=None):
+    """
+    Reads ``samples_per_channel`` samples from an input task.
+
+    The first call for a task registers its events and starts the
+    task. For finite tasks, fewer samples are returned when the task
+    is done.
+
+    Parameters
+    ----------
+
+    timeout : {float, None}
+      The time, in seconds, to wait for the samples. None or -1 wait
+      indefinitely. asyncio.TimeoutError is raised when the time
+      passes.
+
+    fill_mode :
+      See `AnalogInputTask.read`. Counter input tasks ignore
+      `fill_mode`.
+
+    dtype : {numpy.dtype, None}
+      The dtype of the array, see `Task.iter_blocks`.
+
+    Returns
+    -------
+
+    data : numpy.ndarray
+      A new array as returned by `Task.iter_blocks`.
+    """
+    events, created = get_task_events(task, samples_per_channel)
+    if created:
+        events.start()
+    samples = await events.wait_for_samples(samples_per_channel, timeout)
+    data = task._new_read_block(samples, fill_mode, dtype)
+    if samples:
+        task._read_block(data, samples, 0.0, fill_mode)
+    return data
+
+async def write_async(task, data, timeout=10.0, **kws):
+    """
+    Writes ``data`` to an output task with regeneration disabled, see
+    `Task.set_regeneration`.
+
+    The first call for a task registers its events, writes ``data``
+    to the empty buffer and starts the task. Later calls wait until
+    the buffer has room for ``data``, so ``data`` must not exceed the
+    buffer size.
+
+    Parameters
+    ----------
+
+    timeout : {float, None}
+      The time, in seconds, to wait for buffer space. None or -1 wait
+      indefinitely. asyncio.TimeoutError is raised when the time
+      passes.
+
+    kws :
+      Further arguments of the `write` method of the task, such as
+      `layout`.
+
+    Returns
+    -------
+
+    samples_written : int
+    """
+    data = np.asarray(data)
+    samples_per_channel = data.size // task._get_cached_number_of_channels()
+    events, created = get_task_events(task, samples_per_channel)
+    if created:
+        samples_written = task.write(data, auto_start=False, timeout=0.0, **kws)
+        events.start()
+        return samples_written
+    buffer_size = task.get_buffer_size()
+    if samples_per_channel > buffer_size:
+        raise ValueError('Writing %s samples per channel exceeds the buffer size of %s samples'
+                         % (samples_per_channel, buffer_size))
+    await events.wait_for_space(samples_per_channel, timeout)
+    return task.write(data, auto_start=False, timeout=0.0, **kws)
+
+async def stream(task, samples_per_block, n_buffers=2, timeout=10.0,
+                 fill_mode='group_by_scan_number', max_blocks=None, dtype=None):
+    """
+    Asynchronous generator of blocks of samples read from an input
+    task, see `Task.iter_blocks` for the parameters and the reuse of
+    blocks.
+
+    Blocks are read only when the consumer asks for the next block,
+    so a slow consumer leaves samples in the DAQmx buffer instead of
+    queueing them in memory. A consumer that falls behind by more
+    than the buffer size gets the overwrite error of DAQmx from the
+    next read; enlarge the buffer with `Task.set_buffer_size` to
+    absorb longer stalls.
+
+    The task is started when iteration begins, unless it is already
+    running, and stopped when the generator is closed or exhausted. For finite tasks, the last
+    block is shorter when the task is done in the middle of a block.
+    """
+    events, created = get_task_events(task, samples_per_block)
+    buffers = [task._new_read_block(samples_per_block, fill_mode, dtype)
+               for i in range(n_buffers)]
+    # A task started before iteration, with events from
+    # `get_task_events`, keeps running.
+    if created or task.is_done():
+        events.start()
+    try:
+        i = 0
+        while max_blocks is None or i < max_blocks:
+            samples = await events.wait_for_samples(samples_per_block, timeout)
+            if samples < samples_per_block:
+                if samples:
+                    data = task._new_read_block(samples, fill_mode, dtype)
+                    task._read_block(data, samples, 0.0, fill_mode)
+                    yield data
+                return
+            data = buffers[i % n_buffers]
+            task._read_block(data, samples_per_block, 0.0, fill_mode)
+            yield data
+            i += 1
+    finally:
+        task.stop()
@@ -0,0 +1,310 @@
+"""
+Store of NI-DAQmx constants, error codes and function prototypes for
+all known versions of NIDAQmx.h.
+
+The store is a single binary file of numpy arrays, each compressed
+with zlib, after an index of the arrays. Constant names and error
+codes of all versions are kept once, in sorted arrays that hold the
+value of the newest version defining them. Each version is a delta
+over this base: the indices of entries that the version does not
+define and the entries whose value differs.
+
+`ConstantStore.load` returns a `DAQmxConstants` instance that looks up
+a constant on first attribute access, and an `ErrorMap` that reads
+the error codes only when it is first used.
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import os
+import json
+import zlib
+import struct
+
+import numpy as np
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+__all__ = ['ConstantStore', 'DAQmxConstants', 'ErrorMap']
+
+default_store_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  'daqmx_constants.dat')
+
+_magic = b'NIDAQmx constants 1\n'
+
+def _version_key(version):
+    return tuple(int(n) for n in version.split('.'))
+
+def _prefix(version):
+    return 'v%s_' % (version.replace('.', '_'))
+
+def _to_bytes(name):
+    if isinstance(name, bytes):
+        return name
+    return name.encode('ascii')
+
+def _to_text(array):
+    return [s.decode('ascii') for s in array.tolist()]
+
+def _literals(values):
+    return np.array([json.dumps(v).encode('ascii') for v in values], dtype=bytes)
+
+class DAQmxConstants(object):
+    """
+    NI-DAQmx constants of one version, for example ``DAQmx.Val_Volts``.
+
+    Attributes are looked up in the store on first access and then
+    kept in the instance.
+    """
+
+    def __init__(self, store, version):
+        self._store = store
+        self._version = version
+        self._table = None
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if self._table is None:
+            self._table = self._store._get_constant_table(self._version)
+        names, values, literals, absent, changed = self._table
+        key = _to_bytes(name)
+        i = int(np.searchsorted(names, key))
+        if i == len(names) or names[i] != key or i in absent:
+            raise AttributeError('NI-DAQmx %s does not define %r' % (self._version, name))
+        if i in changed:
+            value = changed[i]
+        elif i in literals:
+            value = literals[i]
+        else:
+            value = int(values[i])
+        setattr(self, name, value)
+        return value
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self._version)
+
+class ErrorMap(Mapping):
+    """
+    Maps NI-DAQmx error and warning codes of one version to their
+    names. The codes are read from the store on first use.
+    """
+
+    def __init__(self, store, version):
+        self._store = store
+        self._version = version
+        self._map = None
+
+    def _get_map(self):
+        if self._map is None:
+            self._map = self._store._get_error_map(self._version)
+        return self._map
+
+    def __getitem__(self, code):
+        return self._get_map()[code]
+
+    def __iter__(self):
+        return iter(self._get_map())
+
+    def __len__(self):
+        return len(self._get_map())
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self._version)
+
+class ConstantStore(object):
+    """
+    Versioned store of NI-DAQmx constants in file ``path``.
+    """
+
+    def __init__(self, path=None):
+        if path is None:
+            path = default_store_path
+        self.path = path
+        self._versions = None
+
+    def _read(self, *keys):
+        """
+        Returns the arrays ``keys`` from the store file, None for
+        missing arrays. Only the requested arrays are decompressed.
+        """
+        if not os.path.isfile(self.path):
+            return [None] * len(keys)
+        arrays = []
+        with open(self.path, 'rb') as f:
+            if f.read(len(_magic)) != _magic:
+                raise ValueError('%r is not a NI-DAQmx constant store' % (self.path))
+            size, = struct.unpack('<I', f.read(4))
+            index = dict((e[0], e[1:]) for e in json.loads(f.read(size).decode('ascii')))
+            start = f.tell()
+            for key in keys:
+                if key not in index:
+                    arrays.append(None)
+                    continue
+                dtype, count, offset, nbytes = index[key]
+                if count == 0:
+                    arrays.append(np.zeros(0, dtype=dtype))
+                    continue
+                f.seek(start + offset)
+                arrays.append(np.frombuffer(zlib.decompress(f.read(nbytes)),
+                                            dtype=dtype, count=count))
+        return arrays
+
+    @property
+    def versions(self):
+        """
+        List of the versions in the store, oldest first.
+        """
+        if self._versions is None:
+            versions, = self._read('versions')
+            self._versions = [] if versions is None else _to_text(versions)
+        return self._versions
+
+    def load(self, version):
+        """
+        Returns ``(DAQmx, error_map, prototypes)`` of NI-DAQmx
+        ``version``.
+
+        ``prototypes`` is None unless the version was added with
+        function prototypes parsed from its header.
+        """
+        if version not in self.versions:
+            raise KeyError('NI-DAQmx %s is not in %r' % (version, self.path))
+        prototypes = None
+        lines, = self._read(_prefix(version) + 'prototypes')
+        if lines is not None:
+            prototypes = {}
+            for line in _to_text(lines):
+                name, restype, argtypes = line.split('\t')
+                prototypes[name] = (restype, tuple(filter(None, argtypes.split(','))))
+        return DAQmxConstants(self, version), ErrorMap(self, version), prototypes
+
+    def _get_constant_table(self, version):
+        p = _prefix(version)
+        (names, values, literal_index, literal_values, absent,
+         changed_index, changed_values) = self._read(
+             'constant_names', 'constant_values', 'constant_literal_index',
+             'constant_literal_values', p + 'constants_absent',
+             p + 'constants_changed', p + 'constants_changed_values')
+        literals = dict(zip(literal_index.tolist(),
+                            [json.loads(s) for s in _to_text(literal_values)]))
+        changed = dict(zip(changed_index.tolist(),
+                           [json.loads(s) for s in _to_text(changed_values)]))
+        return names, values, literals, set(absent.tolist()), changed
+
+    def _get_error_map(self, version):
+        p = _prefix(version)
+        codes, names, absent, changed_index, changed_names = self._read(
+            'error_codes', 'error_names', p + 'errors_absent',
+            p + 'errors_changed', p + 'errors_changed_names')
+        codes = codes.tolist()
+        error_map = dict(zip(codes, _to_text(names)))
+        for i in absent.tolist():
+            del error_map[codes[i]]
+        for i, name in zip(changed_index.tolist(), _to_text(changed_names)):
+            error_map[codes[i]] = name
+        return error_map
+
+    def _read_all(self):
+        """
+        Returns a dictionary that maps each version to a tuple of
+        constants, error map and prototypes dictionaries.
+        """
+        r = {}
+        for version in self.versions:
+            prototypes = self.load(version)[2]
+            error_map = self._get_error_map(version)
+            names, values, literals, absent, changed = self._get_constant_table(version)
+            constants = {}
+            for i, name in enumerate(_to_text(names)):
+                if i in absent:
+                    continue
+                constants[name] = changed.get(i, literals.get(i, int(values[i])))
+            r[version] = constants, error_map, prototypes
+        return r
+
+    def add_version(self, version, constants, error_map, prototypes=None, path=None):
+        """
+        Adds or replaces NI-DAQmx ``version`` in the store and writes
+        the store file.
+
+        The file is written to ``path`` when given, otherwise to the
+        store's own path, which by default is in the package directory.
+        """
+        data = self._read_all()
+        data[version] = constants, error_map, prototypes
+        self.write(data, path=path)
+
+    def write(self, data, path=None):
+        """
+        Writes the store file from a dictionary as returned by
+        `_read_all` to ``path``, the store's own path by default.
+        """
+        if path is None:
+            path = self.path
+        versions = sorted(data, key=_version_key)
+
+        # Base values are taken from the newest version defining them.
+        base_constants, base_errors = {}, {}
+        for version in versions:
+            constants, error_map, prototypes = data[version]
+            base_constants.update(constants)
+            base_errors.update(error_map)
+        constant_names = sorted(base_constants)
+        error_codes = sorted(base_errors)
+
+        arrays = {}
+        arrays['versions'] = np.array([_to_bytes(v) for v in versions], dtype=bytes)
+        arrays['constant_names'] = np.array([_to_bytes(n) for n in constant_names], dtype=bytes)
+        values = [base_constants[n] for n in constant_names]
+        is_int = [isinstance(v, int) and not isinstance(v, bool) for v in values]
+        arrays['constant_values'] = np.array([v if i else 0 for v, i in zip(values, is_int)],
+                                             dtype=np.int32)
+        literal_index = [k for k, i in enumerate(is_int) if not i]
+        arrays['constant_literal_index'] = np.array(literal_index, dtype=np.int32)
+        arrays['constant_literal_values'] = _literals([values[k] for k in literal_index])
+        arrays['error_codes'] = np.array(error_codes, dtype=np.int32)
+        arrays['error_names'] = np.array([_to_bytes(base_errors[c]) for c in error_codes],
+                                         dtype=bytes)
+
+        for version in versions:
+            p = _prefix(version)
+            constants, error_map, prototypes = data[version]
+            for kind, keys, base, current in [
+                    ('constants', constant_names, base_constants, constants),
+                    ('errors', error_codes, base_errors, error_map)]:
+                absent = [k for k, key in enumerate(keys) if key not in current]
+                changed = [k for k, key in enumerate(keys)
+                           if key in current and current[key] != base[key]]
+                arrays[p + kind + '_absent'] = np.array(absent, dtype=np.int32)
+                arrays[p + kind + '_changed'] = np.array(changed, dtype=np.int32)
+                changed_values = [current[keys[k]] for k in changed]
+                if kind == 'constants':
+                    arrays[p + 'constants_changed_values'] = _literals(changed_values)
+                else:
+                    arrays[p + 'errors_changed_names'] = np.array(
+                        [_to_bytes(n) for n in changed_values], dtype=bytes)
+            if prototypes is not None:
+                arrays[p + 'prototypes'] = np.array(
+                    [_to_bytes('%s\t%s\t%s' % (name, restype, ','.join(argtypes)))
+                     for name, (restype, argtypes) in sorted(prototypes.items())],
+                    dtype=bytes)
+
+        index, blocks, offset = [], [], 0
+        for key in sorted(arrays):
+            array = arrays[key]
+            block = zlib.compress(array.tobytes(), 9)
+            index.append([key, array.dtype.str, len(array), offset, len(block)])
+            blocks.append(block)
+            offset += len(block)
+        header = json.dumps(index).encode('ascii')
+        with open(path, 'wb') as f:
+            f.write(_magic)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            for block in blocks:
+                f.write(block)
+        self._versions = None
@@ -0,0 +1,299 @@
+"""
+Hardware-timed single point control loops.
+
+`ControlLoop` runs a step function once per sample clock period of
+an analog input task in hardware-timed single point mode, writing
+its result to an analog output task clocked by the same sample
+clock. All ctypes arguments are allocated before the loop starts and
+the library functions are called directly, so that one iteration
+costs three driver calls and the step function, without the
+argument conversion and allocation of `AnalogInputTask.read_scalar`
+and `AnalogOutputTask.write`.
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import ctypes
+from timeit import default_timer
+
+import numpy as np
+
+from . import libnidaqmx
+from .libnidaqmx import DAQmx, int32, uInt32, bool32, float64, void_p
+
+__all__ = ['ControlLoop']
+
+def _get_function(name):
+    """
+    Returns the bound library function ``'DAQmx' + name``.
+    """
+    func = libnidaqmx._functions.get(name)
+    if func is None:
+        func = libnidaqmx._bind_function(name)
+    return func
+
+class ControlLoop(object):
+    """
+    A control loop that reads an analog input task, calls a step
+    function and writes an analog output task on every pulse of the
+    sample clock.
+
+    Each iteration waits for the next sample clock pulse with
+    DAQmxWaitForNextSampleClock, reads one sample per input channel,
+    calls ``step(inputs, outputs)`` and writes one sample per output
+    channel. Iterations that started after their sample clock pulse
+    had passed are counted in `late`. The wake-up time and the time
+    spent until the write completed are kept for the last `history`
+    iterations, see `get_statistics`.
+
+    Parameters
+    ----------
+
+    ai_task : AnalogInputTask
+      The task whose sample clock paces the loop, with channels
+      created.
+
+    ao_task : {AnalogOutputTask, None}
+      The task to write the outputs to, with channels created, or
+      None for a loop that only reads.
+
+    step : callable
+      ``step(inputs, outputs)`` is called with an array of the input
+      values, one per channel of `ai_task`, and an array to store the
+      output values in, one per channel of `ao_task`. Both arrays are
+      reused by all iterations; outputs keep their values until
+      changed. Call `stop` from `step` to end the loop.
+
+    rate : {float, None}
+      The loop rate in Hz. If given, both tasks are configured for
+      hardware-timed single point sampling at this rate, with
+      `ao_task` clocked by the sample clock of `ai_task`. Otherwise
+      the tasks must be configured already.
+
+    timeout : float
+      The time, in seconds, to wait for a sample clock pulse, a
+      sample or a write.
+
+    allow_late : bool
+      If True then missed sample clock pulses are counted in `late`
+      and the loop continues. Otherwise the error of
+      DAQmxWaitForNextSampleClock is raised.
+
+    history : int
+      The number of iterations whose timing is kept.
+
+    Examples
+    --------
+
+    ::
+
+      def step(inputs, outputs):
+          error = setpoint - inputs[0]
+          outputs[0] = pid.update(error)
+
+      loop = ControlLoop(ai_task, ao_task, step, rate=5000.0)
+      loop.run(duration=10.0)
+      print(loop.get_statistics())
+    """
+
+    # Codes of missed sample clock pulses: the warning and error
+    # WaitForNextSampClkDetectedMissedSampClk, and the errors
+    # WaitForNextSampClkDetected3OrMoreSampClks and
+    # WaitForNextSampleClockOrReadDetected3OrMoreMissedSampClks.
+    late_codes = (209802, -209802, -209803, -201027)
+
+    def __init__(self, ai_task, ao_task, step, rate=None, timeout=1.0,
+                 allow_late=True, history=100000):
+        self.ai_task = ai_task
+        self.ao_task = ao_task
+        self.step = step
+        self.allow_late = allow_late
+        if rate is not None:
+            ai_task.configure_timing_sample_clock(rate=rate, sample_mode='hwtimed')
+            if ao_task is not None:
+                device = ai_task.get_devices()[0]
+                ao_task.configure_timing_sample_clock(
+                    source='/%s/ai/SampleClock' % (device), rate=rate, sample_mode='hwtimed')
+        self.rate = ai_task.get_sample_clock_rate()
+        self.inputs = np.zeros(ai_task.get_number_of_channels())
+        if ao_task is not None:
+            self.outputs = np.zeros(ao_task.get_number_of_channels())
+        else:
+            self.outputs = np.zeros(0)
+        self.iterations = 0
+        self.late = 0
+        self.wake_times = np.zeros(history)
+        self.busy_times = np.zeros(history)
+        self._stop = False
+        self._started = False
+
+        # Arguments of the calls in the loop.
+        self._timeout = float64(timeout)
+        self._is_late = bool32(0)
+        self._is_late_ref = ctypes.byref(self._is_late)
+        self._one = int32(1)
+        self._auto_start = bool32(0)
+        self._layout = bool32(DAQmx.Val_GroupByScanNumber)
+        self._inputs_address = void_p(self.inputs.ctypes.data)
+        self._inputs_size = uInt32(self.inputs.size)
+        self._samples_read = int32(0)
+        self._samples_read_ref = ctypes.byref(self._samples_read)
+        self._outputs_address = void_p(self.outputs.ctypes.data)
+        self._samples_written = int32(0)
+        self._samples_written_ref = ctypes.byref(self._samples_written)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop_tasks()
+
+    def start_tasks(self):
+        """
+        Writes the initial outputs, starts the output task and then
+        the input task, whose sample clock starts the loop.
+        """
+        if self.ao_task is not None:
+            self.ao_task.write(self.outputs, auto_start=False)
+            self.ao_task.start()
+        self.ai_task.start()
+        self._started = True
+
+    def stop_tasks(self):
+        """
+        Stops the input task and then the output task.
+        """
+        self.ai_task.stop()
+        if self.ao_task is not None:
+            self.ao_task.stop()
+        self._started = False
+
+    def stop(self):
+        """
+        Ends `run` after the current iteration. Can be called from
+        `step` or another thread.
+        """
+        self._stop = True
+
+    def _check(self, return_code, funcname, task):
+        if return_code in self.late_codes and self.allow_late:
+            self.late += 1
+        else:
+            libnidaqmx.CHK(return_code, funcname, task)
+
+    def run(self, iterations=None, duration=None):
+        """
+        Runs the loop, starting the tasks with `start_tasks` on the
+        first call. The library functions are looked up when the loop
+        starts, so its calls are recorded by `nidaqmx.stats` if that
+        was enabled before.
+
+        Parameters
+        ----------
+
+        iterations : {int, None}
+          The number of iterations to run.
+
+        duration : {float, None}
+          The time, in seconds, to run. The loop runs until `stop` is
+          called if neither `iterations` nor `duration` is given.
+
+        Returns
+        -------
+
+        iterations : int
+          The number of iterations run.
+        """
+        if not self._started:
+            self.start_tasks()
+        if duration is not None:
+            n = int(round(duration * self.rate))
+            iterations = n if iterations is None else min(iterations, n)
+        self._stop = False
+        wait = _get_function('WaitForNextSampleClock')
+        read = _get_function('ReadAnalogF64')
+        write = _get_function('WriteAnalogF64') if self.ao_task is not None else None
+        check = self._check
+        step = self.step
+        timer = default_timer
+        ai_task, ao_task = self.ai_task, self.ao_task
+        inputs, outputs = self.inputs, self.outputs
+        timeout, one, layout = self._timeout, self._one, self._layout
+        is_late, is_late_ref = self._is_late, self._is_late_ref
+        inputs_address, inputs_size = self._inputs_address, self._inputs_size
+        samples_read_ref = self._samples_read_ref
+        outputs_address, auto_start = self._outputs_address, self._auto_start
+        samples_written_ref = self._samples_written_ref
+        wake_times, busy_times = self.wake_times, self.busy_times
+        history = len(wake_times)
+        count = 0
+        while not self._stop and (iterations is None or count < iterations):
+            r = wait(ai_task, timeout, is_late_ref)
+            woke = timer()
+            if r:
+                check(r, 'DAQmxWaitForNextSampleClock', ai_task)
+            elif is_late.value:
+                self.late += 1
+            r = read(ai_task, one, timeout, layout, inputs_address, inputs_size,
+                     samples_read_ref, None)
+            if r:
+                check(r, 'DAQmxReadAnalogF64', ai_task)
+            step(inputs, outputs)
+            if write is not None:
+                r = write(ao_task, one, auto_start, timeout, layout, outputs_address,
+                          samples_written_ref, None)
+                if r:
+                    check(r, 'DAQmxWriteAnalogF64', ao_task)
+            i = self.iterations % history
+            wake_times[i] = woke
+            busy_times[i] = timer() - woke
+            self.iterations += 1
+            count += 1
+        return count
+
+    def _get_timing(self):
+        n = min(self.iterations, len(self.wake_times))
+        first = self.iterations % len(self.wake_times) if self.iterations > n else 0
+        order = np.roll(np.arange(n), -first)
+        return self.wake_times[order], self.busy_times[order]
+
+    def get_statistics(self, percentiles=(50, 90, 99, 99.9)):
+        """
+        Returns the timing statistics of the iterations in the
+        history.
+
+        Parameters
+        ----------
+
+        percentiles : sequence
+          The percentiles to compute.
+
+        Returns
+        -------
+
+        statistics : dict
+          ``'iterations'`` and ``'late'`` - the number of iterations
+          run and of late iterations in total.
+
+          ``'period'`` - the mean time between iterations in seconds.
+
+          ``'jitter'`` - percentiles, by percentile, of the absolute
+          deviation of the times between iterations from the sample
+          clock period, in seconds, and ``'max_jitter'`` its maximum.
+
+          ``'busy'`` - percentiles of the time from waking up to the
+          completion of the write, in seconds. Budget this against
+          the sample clock period.
+        """
+        wake_times, busy_times = self._get_timing()
+        periods = np.diff(wake_times)
+        jitter = np.abs(periods - 1.0 / self.rate)
+        result = dict(iterations=self.iterations, late=self.late,
+                      period=float(periods.mean()) if periods.size else None,
+                      max_jitter=float(jitter.max()) if jitter.size else None)
+        for key, values in [('jitter', jitter), ('busy', busy_times)]:
+            if values.size:
+                result[key] = dict(zip(percentiles, np.percentile(values, percentiles).tolist()))
+            else:
+                result[key] = {}
+        return result
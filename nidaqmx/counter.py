@@ -0,0 +1,315 @@
+"""
+Streaming of counter input samples.
+
+`EncoderStream` reads the 32-bit counts of encoder and edge counting
+channels in blocks and unwraps them into 64-bit positions, carrying
+the unwrap state from block to block, so that positions stay
+continuous when the counter rolls over::
+
+  with EncoderStream(task, 10000, dist_per_pulse=1e-6) as stream:
+      while ...:
+          positions, velocities = stream.read(velocity=True)
+
+`compile_pulses` converts frequencies and duty cycles of pulses to the
+high and low tick counts of `CounterOutputTask.write_ticks`, and
+`iter_pulse_blocks` does so for a stream of pulses, in fixed-size
+blocks, see `CounterOutputTask.stream_pulses`.
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import numpy as np
+
+__all__ = ['EncoderStream', 'compile_pulses', 'iter_pulse_blocks']
+
+# The largest number of ticks of a pulse phase.
+max_ticks = (1 << 32) - 1
+
+class EncoderStream(object):
+    """
+    Reads blocks of counts from a counter input task and returns
+    unwrapped positions.
+
+    The counts are read with DAQmxReadCounterU32 into a preallocated
+    uint32 block. Positions are computed with vectorized numpy
+    operations: the differences of consecutive counts are taken on
+    the uint32 values, so that they wrap around like the counter,
+    and their int32 view, the signed change of position, is summed
+    with int64 accumulation. Changes between consecutive samples must
+    be smaller than 2**31 counts. The count before the first sample
+    is taken to be 0, so the first count is read as a signed 32-bit
+    value, as initial counts of down-counting encoders are.
+
+    Parameters
+    ----------
+
+    task : CounterInputTask
+      A task with an encoder or edge counting channel and, for
+      velocities, sample clock timing configured.
+
+    samples_per_block : int
+      The maximum number of samples read at a time.
+
+    dist_per_pulse : {float, None}
+      The distance per count. If given, positions are float64
+      distances, ``offset + ticks * dist_per_pulse``. Otherwise they
+      are int64 counts.
+
+    offset : float
+      The position at count 0, when `dist_per_pulse` is given.
+
+    sample_rate : {float, None}
+      The sample clock rate, in Hz, used to compute velocities. By
+      default the sample clock rate of `task`.
+
+    Attributes
+    ----------
+
+    ticks : int
+      The unwrapped count of the last sample read.
+
+    samples_read : int
+      The number of samples read.
+    """
+
+    def __init__(self, task, samples_per_block, dist_per_pulse=None, offset=0.0,
+                 sample_rate=None):
+        self.task = task
+        self.samples_per_block = samples_per_block
+        self.dist_per_pulse = dist_per_pulse
+        self.offset = offset
+        self.sample_rate = sample_rate
+        self._block = np.zeros(samples_per_block, dtype=np.uint32)
+        self._deltas = np.zeros(samples_per_block, dtype=np.uint32)
+        self.samples_read = 0
+        self.ticks = 0
+        self._count = np.uint32(0)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Starts the task.
+        """
+        self.task.start()
+
+    def stop(self):
+        """
+        Stops the task. The unwrap state is kept.
+        """
+        self.task.stop()
+
+    @property
+    def position(self):
+        """
+        The position of the last sample read.
+        """
+        return self._scale(self.ticks)
+
+    def _scale(self, ticks):
+        if self.dist_per_pulse is None:
+            return ticks
+        return self.offset + ticks * float(self.dist_per_pulse)
+
+    def unwrap(self, counts):
+        """
+        Returns the unwrapped int64 counts of the next samples
+        `counts`, uint32 or int32 counts as read from the counter,
+        and updates the unwrap state.
+        """
+        counts = np.asarray(counts).view(np.uint32)
+        n = len(counts)
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+        if n <= len(self._deltas):
+            deltas = self._deltas[:n]
+        else:
+            deltas = np.empty(n, dtype=np.uint32)
+        np.subtract(counts[:1], self._count, out=deltas[:1])
+        np.subtract(counts[1:], counts[:-1], out=deltas[1:])
+        ticks = np.cumsum(deltas.view(np.int32), dtype=np.int64)
+        ticks += self.ticks
+        self._count = counts[-1]
+        self.ticks = int(ticks[-1])
+        return ticks
+
+    def read(self, samples_per_channel=-1, timeout=10.0, velocity=False):
+        """
+        Reads samples and returns their positions.
+
+        Parameters
+        ----------
+
+        samples_per_channel : int
+          The number of samples to read, at most `samples_per_block`.
+          The default value of -1 reads the samples available, up to
+          `samples_per_block`.
+
+        timeout : float
+          See `CounterInputTask.read`.
+
+        velocity : bool
+          If True then velocities are returned too.
+
+        Returns
+        -------
+
+        positions : numpy.ndarray
+          int64 counts or float64 distances, see `dist_per_pulse`.
+
+        velocities : numpy.ndarray
+          Only if `velocity` is True: float64 velocities in counts or
+          distance per second, the change of position from the
+          previous sample times the sample rate. The first velocity
+          of the stream is computed from position 0.
+        """
+        previous = self.ticks
+        n = self.task.read_into(self._block, samples_per_channel, timeout)
+        self.samples_read += n
+        ticks = self.unwrap(self._block[:n])
+        positions = self._scale(ticks)
+        if not velocity:
+            return positions
+        rate = self.sample_rate
+        if rate is None:
+            rate = self.sample_rate = self.task.get_sample_clock_rate()
+        velocities = np.empty(n)
+        if n:
+            velocities[0] = ticks[0] - previous
+            np.subtract(ticks[1:], ticks[:-1], out=velocities[1:])
+            velocities *= rate * (1.0 if self.dist_per_pulse is None
+                                  else float(self.dist_per_pulse))
+        return positions, velocities
+
+def compile_pulses(frequency, duty_cycle, timebase_rate, min_ticks=2, max_error=None):
+    """
+    Returns the high and low ticks of pulses with the given
+    frequencies and duty cycles.
+
+    The period of each pulse is rounded to a whole number of timebase
+    ticks, and so is its high time, in one vectorized pass.
+
+    Parameters
+    ----------
+
+    frequency, duty_cycle : {float, array_like}
+      The frequencies, in Hz, and duty cycles, between 0 and 1, of
+      the pulses, broadcast against each other.
+
+    timebase_rate : float
+      The rate of the counter timebase in Hz, see
+      `CounterOutputTask.get_timebase_rate`.
+
+    min_ticks : int
+      The minimum number of ticks of the high and of the low time of
+      a pulse. High times are clipped to leave both at least this
+      long.
+
+    max_error : {float, None}
+      If given, the largest allowed relative error of the pulse
+      frequencies and absolute error of the duty cycles caused by the
+      rounding and clipping. A ValueError is raised for larger errors.
+
+    Returns
+    -------
+
+    high_ticks, low_ticks : numpy.ndarray
+      uint32 arrays with the broadcast shape of the arguments.
+    """
+    frequency, duty_cycle = np.broadcast_arrays(np.asarray(frequency, dtype=np.float64),
+                                                np.asarray(duty_cycle, dtype=np.float64))
+    exact = np.divide(timebase_rate, frequency)
+    periods = np.rint(exact)
+    if periods.size and (periods.min() < 2 * min_ticks or periods.max() > 2 * max_ticks):
+        raise ValueError('Expected frequencies between %s and %s Hz for a %s Hz timebase'
+                         % (timebase_rate / (2.0 * max_ticks), timebase_rate / (2.0 * min_ticks),
+                            timebase_rate))
+    high = np.multiply(periods, duty_cycle)
+    np.rint(high, out=high)
+    low = np.subtract(periods, min_ticks)
+    np.minimum(high, low, out=high)
+    np.maximum(high, min_ticks, out=high)
+    np.subtract(periods, high, out=low)
+    if high.size and max(high.max(), low.max()) > max_ticks:
+        raise ValueError('Pulse phase of %s ticks exceeds the counter range'
+                         % (max(high.max(), low.max())))
+    if max_error is not None and periods.size:
+        # Relative error of the frequencies, that is, of the periods.
+        exact -= periods
+        np.abs(exact, out=exact)
+        exact /= periods
+        duty_cycle_error = np.divide(high, periods)
+        duty_cycle_error -= duty_cycle
+        np.abs(duty_cycle_error, out=duty_cycle_error)
+        error = np.maximum(exact, duty_cycle_error, out=exact)
+        i = int(np.argmax(error))
+        if error.flat[i] > max_error:
+            raise ValueError('Quantization error %.3g of pulse %s (%s Hz, duty cycle %s) exceeds %s'
+                             % (error.flat[i], i, frequency.flat[i], duty_cycle.flat[i],
+                                max_error))
+    return high.astype(np.uint32), low.astype(np.uint32)
+
+def iter_pulse_blocks(source, samples_per_block, timebase_rate, frequency=None, min_ticks=2,
+                      max_error=None):
+    """
+    Returns a generator of blocks of high and low ticks compiled from
+    the pulses of `source`.
+
+    Pulses are compiled with `compile_pulses` as `source` yields them
+    and copied into two preallocated uint32 arrays, which are yielded
+    whenever they are full, so a block is valid until the next one is
+    requested. The last block holds the remaining pulses when
+    `source` is exhausted.
+
+    Parameters
+    ----------
+
+    source : iterable
+      Yields ``(frequency, duty_cycle)`` pairs of arrays or scalars.
+      When `frequency` is given, it yields duty cycles only, as a PWM
+      setpoint generator. Yield arrays of many pulses at a time, so
+      that no Python code runs per pulse.
+
+    samples_per_block : int
+      The number of pulses in a block.
+
+    timebase_rate, min_ticks, max_error :
+      See `compile_pulses`.
+
+    frequency : {float, None}
+      The frequency of all pulses, in Hz.
+
+    Returns
+    -------
+
+    blocks : generator
+      Yields ``(high_ticks, low_ticks)`` tuples of uint32 arrays.
+    """
+    high_block = np.zeros(samples_per_block, dtype=np.uint32)
+    low_block = np.zeros(samples_per_block, dtype=np.uint32)
+    n = 0
+    for item in source:
+        if frequency is None:
+            item_frequency, duty_cycle = item
+        else:
+            item_frequency, duty_cycle = frequency, item
+        high, low = compile_pulses(item_frequency, duty_cycle, timebase_rate, min_ticks,
+                                   max_error)
+        high, low = high.ravel(), low.ravel()
+        i = 0
+        while i < len(high):
+            k = min(samples_per_block - n, len(high) - i)
+            high_block[n:n + k] = high[i:i + k]
+            low_block[n:n + k] = low[i:i + k]
+            n += k
+            i += k
+            if n == samples_per_block:
+                yield high_block, low_block
+                n = 0
+    if n:
+        yield high_block[:n], low_block[:n]
@@ -0,0 +1,370 @@
+"""
+Conversion between packed port samples and digital lines.
+
+`DigitalTask.read_port` returns one unsigned integer per channel and
+sample, with line ``L`` of the port in bit ``L``, instead of the one
+byte per line of `DigitalTask.read`. `unpack_lines` extracts lines
+from such samples when they are needed::
+
+  data = task.read_port(100000)
+  clock, frame = unpack_lines(data, [0, 5])
+
+`pack_lines` converts line patterns to packed samples for
+`DigitalOutputTask.write_port`::
+
+  task.write_port(pack_lines([clock, frame], [0, 5]))
+
+`ChangeEventReader` reads packed samples in blocks and returns only
+the edges of the lines, as event records.
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import sys
+
+import numpy as np
+
+__all__ = ['ChangeEventReader', 'get_port_dtype', 'pack_lines', 'unpack_lines']
+
+# The number of samples converted at a time by `pack_lines`.
+chunk_samples = 1 << 16
+
+# The bytes 0 to 255 with their bit order reversed.
+_reversed_bits = np.array([int('{0:08b}'.format(i)[::-1], 2) for i in range(256)],
+                          dtype=np.uint8)
+
+def get_port_dtype(width):
+    """
+    Returns the unsigned integer dtype that holds a port of ``width``
+    lines: uint8, uint16 or uint32.
+    """
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if width <= 8 * np.dtype(dtype).itemsize:
+            return np.dtype(dtype)
+    raise ValueError('Ports are at most 32 lines wide, got %s' % (width))
+
+def unpack_lines(data, lines=None, out=None):
+    """
+    Returns lines of packed port samples as 0 or 1.
+
+    Parameters
+    ----------
+
+    data : numpy.ndarray
+      Packed samples, for example of `DigitalTask.read_port`.
+
+    lines : {int, sequence, None}
+      The line number, or the sequence of line numbers, to unpack.
+      By default all bits of the dtype of `data` are unpacked.
+
+    out : {numpy.ndarray, None}
+      A uint8 or bool array to store the lines in.
+
+    Returns
+    -------
+
+    lines : numpy.ndarray
+      For a single line, a uint8 array with the shape of `data`.
+      Otherwise an array with shape ``(len(lines),) + data.shape``,
+      so that ``clock, frame = unpack_lines(data, [0, 5])`` unpacks
+      two lines. Each line is computed in one vectorized pass over
+      `data` without intermediates larger than `data`.
+    """
+    data = np.asarray(data)
+    if data.dtype.kind not in 'ui':
+        raise TypeError('Expected integer array but got %s' % (data.dtype))
+    if lines is None:
+        lines = range(8 * data.dtype.itemsize)
+    single = np.ndim(lines) == 0
+    lines = np.atleast_1d(lines)
+    if out is None:
+        out = np.empty(((len(lines),) if not single else ()) + data.shape, dtype=np.uint8)
+    elif out.shape != ((len(lines),) if not single else ()) + data.shape:
+        raise ValueError('Expected out array with shape %s but got %s'
+                         % (((len(lines),) if not single else ()) + data.shape, out.shape))
+    result = out.reshape((len(lines),) + data.shape)
+    shifted = np.empty_like(data)
+    for i, line in enumerate(lines):
+        np.right_shift(data, int(line), out=shifted)
+        np.bitwise_and(shifted, 1, out=result[i], casting='unsafe')
+    return out
+
+def pack_lines(lines, line_numbers=None, dtype=None, out=None):
+    """
+    Returns line patterns packed into port samples, line ``L`` in bit
+    ``L``.
+
+    Parameters
+    ----------
+
+    lines : {numpy.ndarray, sequence}
+      A 2-d boolean or 0/1 array with shape ``(samples, lines)``, one
+      column per line, or a sequence of 1-d arrays of equal length,
+      one per line. Nonzero values set the line.
+
+    line_numbers : {sequence, None}
+      The line number of each column or array, by default 0, 1, ...
+
+    dtype : {numpy.dtype, None}
+      The unsigned integer dtype of the samples, by default the
+      smallest that holds the highest line number.
+
+    out : {numpy.ndarray, None}
+      A 1-d array of `dtype` to store the samples in.
+
+    Returns
+    -------
+
+    data : numpy.ndarray
+      The packed samples, one per sample of `lines`.
+
+    The conversion runs over `chunk_samples` samples at a time, so
+    that long patterns need no temporary arrays with a byte per line
+    and sample. C-contiguous boolean arrays of lines 0, 1, ..., 8k-1
+    are packed with ``numpy.packbits``; other inputs are shifted into
+    place one line at a time.
+    """
+    matrix = isinstance(lines, np.ndarray) and lines.ndim == 2
+    if matrix:
+        number_of_lines = lines.shape[1]
+        samples = lines.shape[0]
+    else:
+        lines = [np.asarray(line) for line in lines]
+        number_of_lines = len(lines)
+        samples = len(lines[0]) if lines else 0
+        if any(line.shape != (samples,) for line in lines):
+            raise ValueError('Expected 1-d line arrays of %s samples' % (samples))
+    if line_numbers is None:
+        line_numbers = np.arange(number_of_lines)
+    line_numbers = np.asarray(line_numbers, dtype=int)
+    if line_numbers.shape != (number_of_lines,):
+        raise ValueError('Expected %s line numbers but got %s'
+                         % (number_of_lines, line_numbers.size))
+    if dtype is None:
+        dtype = get_port_dtype(line_numbers.max() + 1 if number_of_lines else 1)
+    dtype = np.dtype(dtype)
+    width = 8 * dtype.itemsize
+    if number_of_lines and (line_numbers.min() < 0 or line_numbers.max() >= width):
+        raise ValueError('Line numbers must be in range(%s) for %s' % (width, dtype))
+    if out is None:
+        out = np.empty(samples, dtype=dtype)
+    elif out.shape != (samples,) or out.dtype != dtype:
+        raise ValueError('Expected %s out array with shape %s but got %s %s'
+                         % (dtype, (samples,), out.dtype, out.shape))
+    # packbits stores the first of 8 bits in the most significant
+    # bit, so the packed bytes are bit reversed with _reversed_bits.
+    # It applies to boolean columns of lines 0, 1, ... whose packed
+    # bytes form the little-endian samples.
+    packbits = (matrix and lines.dtype == np.bool_ and lines.flags.c_contiguous
+                and number_of_lines % 8 == 0
+                and np.array_equal(line_numbers, np.arange(number_of_lines))
+                and sys.byteorder == 'little' and out.flags.c_contiguous)
+    if packbits:
+        out_bytes = out.view(np.uint8).reshape(samples, dtype.itemsize)
+        if number_of_lines // 8 < dtype.itemsize:
+            out[...] = 0
+    bit = None
+    for start in range(0, samples, chunk_samples):
+        stop = min(start + chunk_samples, samples)
+        if packbits:
+            packed = np.packbits(lines[start:stop].reshape(-1))
+            if number_of_lines // 8 == dtype.itemsize:
+                np.take(_reversed_bits, packed, out=out_bytes[start:stop].reshape(-1))
+            else:
+                out_bytes[start:stop, :number_of_lines // 8] = np.take(
+                    _reversed_bits, packed).reshape(stop - start, number_of_lines // 8)
+            continue
+        chunk = out[start:stop]
+        chunk[...] = 0
+        if bit is None or len(bit) != stop - start:
+            bit = np.empty(stop - start, dtype=dtype)
+        for i, number in enumerate(line_numbers):
+            line = lines[start:stop, i] if matrix else lines[i][start:stop]
+            np.not_equal(line, 0, out=bit, casting='unsafe')
+            np.left_shift(bit, int(number), out=bit)
+            chunk |= bit
+    return out
+
+class ChangeEventReader(object):
+    """
+    Reads packed samples from a digital input task in blocks and
+    returns the rising and falling edges of its lines.
+
+    Edges are found with a vectorized XOR of consecutive samples, so
+    only the samples in which watched lines changed are unpacked, and
+    the events returned take memory proportional to the number of
+    edges, not to the number of samples. The state of the lines before
+    the first sample is taken from the first sample.
+
+    Each event is a record of `event_dtype` with the fields
+
+      ``'line'`` - the line number in the port,
+
+      ``'edge'`` - 1 for a rising and -1 for a falling edge,
+
+      ``'sample'`` - the index of the sample in the acquisition,
+
+      ``'time'`` - the time of the sample in seconds, from the
+      counter task, or from the sample index and `sample_rate`, or
+      NaN if neither is given.
+
+    Parameters
+    ----------
+
+    task : DigitalInputTask
+      The task to read, with channels and timing configured: change
+      detection timing, see `Task.configure_timing_change_detection`,
+      or sample clock timing.
+
+    samples_per_block : int
+      The maximum number of samples, per channel, read at a time.
+
+    lines : {sequence, None}
+      The line numbers to watch, by default all lines of the port.
+
+    channel : int
+      The index of the channel of `task` to watch.
+
+    counter_task : {CounterInputTask, None}
+      A counter input task that counts the edges of a timebase and is
+      clocked by the samples of `task`, for example by the
+      ``/Dev1/ChangeDetectionEvent`` terminal. One count is read with
+      every sample to timestamp it. Counter rollover is unwrapped.
+
+    timebase_rate : {float, None}
+      The rate, in Hz, of the timebase counted by `counter_task`.
+      Required with `counter_task`.
+
+    sample_rate : {float, None}
+      The sample clock rate of `task` in Hz, to timestamp samples
+      without a counter task.
+
+    Examples
+    --------
+
+    ::
+
+      task.configure_timing_change_detection('Dev1/port0/line0:3', 'Dev1/port0/line0:3')
+      counter.configure_timing_sample_clock(source='/Dev1/ChangeDetectionEvent', rate=1e6)
+      with ChangeEventReader(task, 10000, counter_task=counter, timebase_rate=100e6) as reader:
+          while ...:
+              for event in reader.read():
+                  ...
+    """
+
+    event_dtype = np.dtype([('line', np.uint8), ('edge', np.int8), ('sample', np.int64),
+                            ('time', np.float64)])
+
+    def __init__(self, task, samples_per_block, lines=None, channel=0, counter_task=None,
+                 timebase_rate=None, sample_rate=None):
+        if counter_task is not None and not timebase_rate:
+            raise ValueError('timebase_rate is needed to timestamp samples with counter_task')
+        self.task = task
+        self.samples_per_block = samples_per_block
+        self.channel = channel
+        self.counter_task = counter_task
+        self.timebase_rate = timebase_rate
+        self.sample_rate = sample_rate
+        self._block = np.zeros((samples_per_block, task.get_number_of_channels()),
+                               dtype=task._get_port_dtype())
+        dtype = self._block.dtype
+        if lines is None:
+            lines = range(8 * dtype.itemsize)
+        self.lines = np.atleast_1d(np.asarray(lines, dtype=int))
+        self.mask = dtype.type(sum(1 << int(line) for line in set(self.lines)))
+        if counter_task is not None:
+            self._counts = np.zeros(samples_per_block, dtype=np.uint32)
+        self.samples_read = 0
+        # The packed value of the last sample read, and the unwrapped
+        # count of the counter task at that sample.
+        self.state = None
+        self._count = None
+        self._ticks = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Starts the counter task and then the task, so that the
+        counter samples from the first sample on.
+        """
+        if self.counter_task is not None:
+            self.counter_task.start()
+        self.task.start()
+
+    def stop(self):
+        """
+        Stops the task and the counter task.
+        """
+        self.task.stop()
+        if self.counter_task is not None:
+            self.counter_task.stop()
+
+    def read(self, samples_per_channel=-1, timeout=10.0):
+        """
+        Reads samples and returns the edges found in them.
+
+        Parameters
+        ----------
+
+        samples_per_channel : int
+          The number of samples to read, at most `samples_per_block`.
+          The default value of -1 reads the samples available, up to
+          `samples_per_block`.
+
+        timeout : float
+          See `AnalogInputTask.read`.
+
+        Returns
+        -------
+
+        events : numpy.ndarray
+          Records of `event_dtype`, ordered by sample and line.
+        """
+        n = self.task.read_port_into(self._block, samples_per_channel, timeout)
+        events = np.zeros(0, dtype=self.event_dtype)
+        if n:
+            values = self._block[:n, self.channel]
+            if self.state is None:
+                self.state = values[0]
+            ticks = None
+            if self.counter_task is not None:
+                counts = self._counts[:n]
+                self.counter_task.read_into(counts, n, timeout)
+                if self._count is None:
+                    self._count = counts[0]
+                # Differences of uint32 counts wrap around at rollover.
+                deltas = np.empty(n, dtype=np.uint32)
+                np.subtract(counts[:1], self._count, out=deltas[:1])
+                np.subtract(counts[1:], counts[:-1], out=deltas[1:])
+                ticks = np.cumsum(deltas, dtype=np.int64)
+                ticks += self._ticks
+                self._count = counts[-1]
+                self._ticks = ticks[-1]
+            previous = np.empty_like(values)
+            previous[0] = self.state
+            previous[1:] = values[:-1]
+            changes = (values ^ previous) & self.mask
+            changed = np.flatnonzero(changes)
+            if changed.size:
+                edges = unpack_lines(changes[changed], self.lines)
+                sample_index, line_index = np.nonzero(edges.T)
+                new = unpack_lines(values[changed], self.lines)
+                events = np.zeros(len(sample_index), dtype=self.event_dtype)
+                events['line'] = self.lines[line_index]
+                events['edge'] = np.where(new.T[sample_index, line_index], 1, -1)
+                events['sample'] = self.samples_read + changed[sample_index]
+                if ticks is not None:
+                    events['time'] = ticks[changed[sample_index]] / float(self.timebase_rate)
+                elif self.sample_rate:
+                    events['time'] = events['sample'] / float(self.sample_rate)
+                else:
+                    events['time'] = np.nan
+            self.state = values[-1]
+        self.samples_read += n
+        return events
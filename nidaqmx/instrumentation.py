@@ -0,0 +1,235 @@
+"""
+Per-function statistics of the calls into the NI-DAQmx library.
+
+`stats` returns the `CallStats` of the process. While enabled, every
+call made through `nidaqmx.libnidaqmx.CALL` is timed and recorded
+under the DAQmx function name, without the ``DAQmx`` prefix, and the
+time `nidaqmx.libnidaqmx.CHK` spends fetching and formatting error
+and warning messages is recorded under ``'CHK'``::
+
+  import nidaqmx
+  nidaqmx.stats().enable()
+  ...
+  print(nidaqmx.stats().format())
+  nidaqmx.stats().write_openmetrics('nidaqmx.prom')
+
+Recording wraps the bound library functions of
+`nidaqmx.libnidaqmx`, so while disabled `CALL` runs unchanged and
+costs nothing extra. Code that calls bound functions directly, such
+as `ControlLoop.run`, looks them up when it starts and records its
+calls if recording was enabled before. Calls that do not go through
+the bound functions are not recorded: ``DAQmxClearTask`` in
+`Task.clear`, which also runs from ``__del__``, the version queries
+made when the library is loaded, and the error message queries of
+`CHK`, whose time is recorded under ``'CHK'``.
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import bisect
+import threading
+from timeit import default_timer
+
+__all__ = ['CallStats', 'stats']
+
+# Upper bounds, in seconds, of the latency histogram buckets, from
+# property queries of a microsecond to reads that wait for seconds.
+histogram_bounds = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0,
+                    2.5, 5.0, 10.0)
+
+class _FunctionStats(object):
+
+    __slots__ = ['count', 'total', 'max', 'errors', 'warnings', 'buckets']
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+        self.warnings = 0
+        # The last bucket counts calls longer than all bounds.
+        self.buckets = [0] * (len(histogram_bounds) + 1)
+
+    def add(self, duration, return_code):
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        self.buckets[bisect.bisect_left(histogram_bounds, duration)] += 1
+        if return_code:
+            if return_code < 0:
+                self.errors += 1
+            else:
+                self.warnings += 1
+
+class CallStats(object):
+    """
+    Call counts, latencies and error counts per NI-DAQmx function.
+
+    Use the instance returned by `stats`.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._functions = {}
+        self._lock = threading.Lock()
+        self._original_CHK = None
+
+    def record(self, name, duration, return_code=0):
+        """
+        Records a call of function ``name`` that took ``duration``
+        seconds and returned ``return_code``.
+        """
+        with self._lock:
+            function_stats = self._functions.get(name)
+            if function_stats is None:
+                function_stats = self._functions[name] = _FunctionStats()
+            function_stats.add(duration, return_code)
+
+    def wrap(self, name, func):
+        """
+        Returns a function that calls ``func`` and records the call
+        under ``name``.
+        """
+        record = self.record
+        def timed(*args):
+            start = default_timer()
+            r = func(*args)
+            record(name, default_timer() - start, r)
+            return r
+        timed.__wrapped__ = func
+        return timed
+
+    def enable(self):
+        """
+        Starts recording calls.
+        """
+        from . import libnidaqmx
+        with libnidaqmx._load_lock:
+            if self.enabled:
+                return
+            for name, func in list(libnidaqmx._functions.items()):
+                libnidaqmx._functions[name] = self.wrap(name, func)
+            CHK = self._original_CHK = libnidaqmx.CHK
+            record = self.record
+            def timed_CHK(return_code, funcname, *args):
+                start = default_timer()
+                try:
+                    return CHK(return_code, funcname, *args)
+                finally:
+                    record('CHK', default_timer() - start)
+            libnidaqmx.CHK = timed_CHK
+            libnidaqmx._call_stats = self
+            self.enabled = True
+
+    def disable(self):
+        """
+        Stops recording calls. Recorded statistics are kept.
+        """
+        from . import libnidaqmx
+        with libnidaqmx._load_lock:
+            if not self.enabled:
+                return
+            libnidaqmx._call_stats = None
+            libnidaqmx.CHK = self._original_CHK
+            for name, func in list(libnidaqmx._functions.items()):
+                libnidaqmx._functions[name] = getattr(func, '__wrapped__', func)
+            self.enabled = False
+
+    def reset(self):
+        """
+        Forgets the recorded statistics.
+        """
+        with self._lock:
+            self._functions.clear()
+
+    def as_dict(self):
+        """
+        Returns the statistics as a dictionary.
+
+        Returns
+        -------
+
+        stats : dict
+          For each function name, a dictionary with the number of
+          calls ``'count'``, the total and the maximum latency in
+          seconds ``'total'`` and ``'max'``, the numbers of calls that
+          returned ``'errors'`` and ``'warnings'``, and
+          ``'histogram'``, a list of ``(upper_bound, count)`` pairs
+          of the calls in each latency bucket, the last with bound
+          ``float('inf')``.
+        """
+        bounds = list(histogram_bounds) + [float('inf')]
+        with self._lock:
+            return dict((name, dict(count=s.count, total=s.total, max=s.max,
+                                    errors=s.errors, warnings=s.warnings,
+                                    histogram=list(zip(bounds, s.buckets))))
+                        for name, s in self._functions.items())
+
+    def format(self):
+        """
+        Returns the statistics as a table, functions sorted by total
+        latency.
+        """
+        lines = ['%-32s %9s %11s %11s %11s %7s %7s'
+                 % ('function', 'calls', 'total [s]', 'mean [us]', 'max [us]',
+                    'errors', 'warns')]
+        items = sorted(self.as_dict().items(), key=lambda item: -item[1]['total'])
+        for name, s in items:
+            lines.append('%-32s %9d %11.4f %11.2f %11.2f %7d %7d'
+                         % (name, s['count'], s['total'], 1e6 * s['total'] / s['count'],
+                            1e6 * s['max'], s['errors'], s['warnings']))
+        return '\n'.join(lines)
+
+    def to_openmetrics(self, prefix='nidaqmx'):
+        """
+        Returns the statistics in the OpenMetrics text format, with
+        the function name as label ``function``.
+        """
+        lines = []
+        def family(name, metric_type, help_text):
+            lines.extend(['# TYPE %s_%s %s' % (prefix, name, metric_type),
+                          '# HELP %s_%s %s' % (prefix, name, help_text)])
+        def sample(name, function, value, extra=''):
+            value = repr(value) if isinstance(value, float) else '%d' % (value)
+            lines.append('%s_%s{function="%s"%s} %s' % (prefix, name, function, extra, value))
+        items = sorted(self.as_dict().items())
+        family('call_seconds', 'histogram', 'Latency of NI-DAQmx function calls.')
+        for name, s in items:
+            cumulative = 0
+            for bound, count in s['histogram']:
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                sample('call_seconds_bucket', name, cumulative, ',le="%s"' % (le))
+            sample('call_seconds_count', name, s['count'])
+            sample('call_seconds_sum', name, s['total'])
+        family('call_max_seconds', 'gauge', 'Maximum latency of NI-DAQmx function calls.')
+        for name, s in items:
+            sample('call_max_seconds', name, s['max'])
+        family('call_errors', 'counter', 'NI-DAQmx function calls that returned an error.')
+        for name, s in items:
+            sample('call_errors_total', name, s['errors'])
+        family('call_warnings', 'counter', 'NI-DAQmx function calls that returned a warning.')
+        for name, s in items:
+            sample('call_warnings_total', name, s['warnings'])
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def write_openmetrics(self, filename, prefix='nidaqmx'):
+        """
+        Writes `to_openmetrics` to file ``filename``, for example a
+        file collected by the textfile collector of a Prometheus node
+        exporter.
+        """
+        with open(filename, 'w') as f:
+            f.write(self.to_openmetrics(prefix))
+
+_stats = CallStats()
+
+def stats():
+    """
+    Returns the `CallStats` of the process, see the module
+    documentation.
+    """
+    return _stats
@@ -15,13 +15,29 @@ See http://pylibnidaqmx.googlecode.com/
 from __future__ import print_function, division, unicode_literals, absolute_import
 
 import os
+import re
 import sys
 import textwrap
 import numpy as np
 import ctypes
-import ctypes.util
 import warnings
-from inspect import getargspec
+import weakref
+import threading
+import itertools
+from timeit import default_timer
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+try:
+    from inspect import getfullargspec as getargspec
+except ImportError:
+    from inspect import getargspec
+
+try:
+    unicode
+except NameError:
+    unicode = str
 
 ########################################################################
 
@@ -29,11 +45,18 @@ __all__ = [
     'AnalogInputTask', 'AnalogOutputTask',
     'DigitalInputTask', 'DigitalOutputTask',
     'CounterInputTask', 'CounterOutputTask',
-    'System', 'Device', 'get_nidaqmx_version',
+    'System', 'Device', 'get_nidaqmx_version', 'get_simulated_library',
 ]
 
 class NIDAQmxRuntimeError(RuntimeError):
-    pass
+    """
+    Error of a libnidaqmx function call. `code` is the NI-DAQmx error
+    code, or None for errors without one.
+    """
+
+    def __init__(self, *args, **kws):
+        self.code = kws.pop('code', None)
+        RuntimeError.__init__(self, *args, **kws)
 
 int8 = ctypes.c_int8
 uInt8 = ctypes.c_uint8
@@ -103,6 +126,12 @@ def _find_library_nt():
     return header_name, libname, libfile
 
 def _find_library():
+    from nidaqmx.simulated import SimulatedLibrary
+    lib = SimulatedLibrary.from_environment()
+    if lib is not None:
+        return None, lib
+
+    import ctypes.util # pylint: disable=redefined-outer-name
     if os.name == "nt":
         header_name, libname, libfile = _find_library_nt()
     else:
@@ -124,25 +153,113 @@ def _find_library():
     # FIXME If lib is None.
     return header_name, lib
 
-_header_name, libnidaqmx = _find_library()
+# The library and the constants are loaded on first use, so that
+# importing this module does no driver work.
+_load_lock = threading.RLock()
+_header_name = None
+_library = None
+_library_loaded = False
+_header = None
+
+def _load_library():
+    """
+    Finds and loads the NI-DAQmx library on first call. Returns the
+    library, or None when it is not installed.
+    """
+    global _header_name, _library, _library_loaded
+    with _load_lock:
+        if not _library_loaded:
+            _header_name, _library = _find_library()
+            _library_loaded = True
+    return _library
+
+class _LibraryProxy(object):
+    """
+    Module level stand-in for the NI-DAQmx library that loads the
+    library on first attribute access, see `_load_library`.
+    """
+
+    _library = None
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        lib = self._library
+        if lib is None:
+            lib = _load_library()
+            if lib is None:
+                raise NIDAQmxRuntimeError('NI-DAQmx library is not available')
+            self._library = lib
+        attr = getattr(lib, name)
+        setattr(self, name, attr)
+        return attr
+
+libnidaqmx = _LibraryProxy()
 
 def get_nidaqmx_version ():
-    if libnidaqmx is None:
+    lib = _load_library()
+    if lib is None:
         return None
     d = uInt32 (0)
-    libnidaqmx.DAQmxGetSysNIDAQMajorVersion(ctypes.byref(d))
+    lib.DAQmxGetSysNIDAQMajorVersion(ctypes.byref(d))
     major = d.value
-    libnidaqmx.DAQmxGetSysNIDAQMinorVersion(ctypes.byref(d))
+    lib.DAQmxGetSysNIDAQMinorVersion(ctypes.byref(d))
     minor = d.value
     return '%s.%s' % (major, minor)
 
-def _convert_header(header_name, header_module_name):
-    import pprint
+def get_simulated_library():
+    """
+    Returns the simulated NI-DAQmx library when it is in use, see
+    `nidaqmx.simulated`, or None otherwise. Use its ``set_signal``
+    and ``connect`` methods to set the signals seen by inputs.
+    """
+    lib = _load_library()
+    from .simulated import SimulatedLibrary
+    if isinstance(lib, SimulatedLibrary):
+        return lib
+    return None
+
+def _parse_prototype(line):
+    """
+    Return ``(name, (restype, argtypes))`` for a ``__CFUNC`` function
+    declaration line of NIDAQmx.h, or None for any other line.
+
+    Argument types are recorded as declared without parameter names,
+    for example ``'const char[]'`` or ``'int32*'``.
+    """
+    m = re.match(r'\s*(\w+)\s+__CFUNC\s+DAQmx(\w+)\s*\((.*)\)\s*;', line)
+    if m is None:
+        return None
+    restype, name, params = m.groups()
+    argtypes = []
+    for param in params.split(','):
+        param = param.strip()
+        if param in ['', 'void']:
+            continue
+        suffix = ''
+        if param.endswith('[]'):
+            suffix = '[]'
+            param = param[:-2]
+        suffix += '*' * param.count('*')
+        words = param.replace('*', ' ').split()
+        argtypes.append(' '.join(words[:-1]) + suffix)
+    return name, (restype, tuple(argtypes))
+
+def _convert_header(header_name):
+    """
+    Returns ``(constants, error_map, prototypes)`` dictionaries parsed
+    from NIDAQmx.h file ``header_name``.
+    """
     assert os.path.isfile(header_name), repr(header_name)
     d = {}
     err_map = {}
+    protos = {}
     with open (header_name, 'r') as f:
         for line in f.readlines():
+            proto = _parse_prototype(line)
+            if proto is not None:
+                protos[proto[0]] = proto[1]
+                continue
             if not line.startswith('#define'): continue
             i = line.find('//')
             words = line[7:i].strip().split(None, 2)
@@ -169,42 +286,81 @@ def _convert_header(header_name, header_module_name):
                 print(name, value, file=sys.stderr)
 
         # DAQmxSuccess is not renamed, because it's unused and I'm lazy.
-        _d = {k.replace("DAQmx_", ""): v for k,v in d.viewitems()}
-                 
-    try:
-        path = os.path.dirname(os.path.abspath (__file__))
-    except NameError:
-        path = os.getcwd()
-    fn = os.path.join(path, header_module_name)
-    print('Generating %r' % (fn), file=sys.stderr)
-    with open(fn, 'w') as f:
-        f.write("# This file is auto-generated. Do not edit!\n\n")
-        f.write("from collections import namedtuple\n\n")
-        f.write("_d = %s\n" % pprint.pformat(_d))
-        f.write("DAQmxConstants = namedtuple('DAQmxConstants', _d.keys())\n")
-        f.write("DAQmx = DAQmxConstants(**_d)\n\n")
-        f.write("error_map = %s\n" % pprint.pformat(err_map))
-
-    print('Please upload generated file %r to http://code.google.com/p/pylibnidaqmx/issues'
-          % (fn), file=sys.stderr)
+        _d = {k.replace("DAQmx_", ""): v for k,v in d.items()}
+
+    return _d, err_map, protos
 
 def _load_header(header_name):
-    if libnidaqmx is None:
-        return (None, None)
+    # Versions added before prototypes were parsed from the header
+    # fall back to the prototypes of the functions used in this module.
+    from nidaqmx.prototypes import prototypes
+    prototypes = dict(prototypes)
 
+    if _load_library() is None:
+        return (None, None, prototypes)
+
+    from nidaqmx.constants import ConstantStore
+    store = ConstantStore()
     version = get_nidaqmx_version()
-    mod_name = 'nidaqmx_h_%s' % (version.replace ('.', '_'))
-    pkg_name = "nidaqmx."
-    
-    try:
-        mod = __import__(pkg_name + mod_name, fromlist=[mod_name])
-    except ImportError:
-        _convert_header(header_name, mod_name + ".py")
-        mod = __import__(pkg_name + mod_name, fromlist=[mod_name])
+    if version not in store.versions:
+        print('Adding NI-DAQmx %s constants from %r to %r'
+              % (version, header_name, store.path), file=sys.stderr)
+        store.add_version(version, *_convert_header(header_name))
+        print('Please upload generated file %r to http://code.google.com/p/pylibnidaqmx/issues'
+              % (store.path), file=sys.stderr)
+    DAQmx, error_map, header_prototypes = store.load(version)
+    prototypes.update(header_prototypes or {})
+
+    return DAQmx, error_map, prototypes
+
+def _get_header():
+    """
+    Returns ``(DAQmx, error_map, prototypes)`` of the installed
+    NI-DAQmx, loading them on first call, see `_load_header`.
+    """
+    global _header
+    with _load_lock:
+        if _header is None:
+            _load_library()
+            _header = _load_header(_header_name)
+    return _header
+
+class _ConstantsProxy(object):
+    """
+    Module level stand-in for the NI-DAQmx constants that loads them
+    on first attribute access, see `_get_header`.
+    """
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        constants = _get_header()[0]
+        if constants is None:
+            raise NIDAQmxRuntimeError('NI-DAQmx library is not available')
+        value = getattr(constants, name)
+        setattr(self, name, value)
+        return value
+
+class _ErrorMapProxy(Mapping):
+    """
+    Module level stand-in for the NI-DAQmx error map that loads it on
+    first use, see `_get_header`.
+    """
+
+    def _get_map(self):
+        return _get_header()[1] or {}
+
+    def __getitem__(self, code):
+        return self._get_map()[code]
 
-    return mod.DAQmx, mod.error_map
+    def __iter__(self):
+        return iter(self._get_map())
 
-DAQmx, error_map = _load_header(_header_name)
+    def __len__(self):
+        return len(self._get_map())
+
+DAQmx = _ConstantsProxy()
+error_map = _ErrorMapProxy()
 
 ########################################################################
 
@@ -236,35 +392,113 @@ def CHK(return_code, funcname, *args):
                 raise NIDAQmxRuntimeError(
                     '%s%s failed with error %s=%d: %s'
                     % (funcname, args, error_map[return_code],
-                       return_code, repr(buf.value)))
+                       return_code, repr(_decode(buf.value))), code=return_code)
             else:
                 warning = error_map.get(return_code, return_code)
                 sys.stderr.write('%s%s warning: %s\n' % (funcname, args, warning))
         else:
-            text = '\n  '.join(['']+textwrap.wrap(buf.value, 80)+['-'*10])
+            text = '\n  '.join(['']+textwrap.wrap(_decode(buf.value), 80)+['-'*10])
             if return_code < 0:
-                raise NIDAQmxRuntimeError('%s%s:%s' % (funcname,args, text))
+                raise NIDAQmxRuntimeError('%s%s:%s' % (funcname,args, text), code=return_code)
             else:
                 sys.stderr.write('%s%s warning:%s\n' % (funcname, args, text))
     return return_code
 
+def _get_or_none(getter, *args):
+    """
+    Return ``getter(*args)``, or None when the driver reports an
+    error, for example for a property that a task or channel does not
+    have.
+    """
+    try:
+        return getter(*args)
+    except NIDAQmxRuntimeError:
+        return None
+
 ########################################################################
 
+class _String(object):
+    """
+    Argument type of ``const char[]`` parameters. Accepts bytes,
+    unicode and None.
+    """
+
+    @staticmethod
+    def from_param(value):
+        if isinstance(value, unicode):
+            value = value.encode('ascii')
+        return ctypes.c_char_p.from_param(value)
+
+_argtypes_map = dict(int8=int8, uInt8=uInt8, int16=int16, uInt16=uInt16,
+                     int32=int32, uInt32=uInt32, bool32=bool32,
+                     int64=int64, uInt64=uInt64,
+                     float32=float32, float64=float64,
+                     TaskHandle=TaskHandle, CalHandle=uInt32)
+
+def _get_argtype(decl):
+    """
+    Return ctypes type for an argument type ``decl`` as recorded in
+    ``prototypes``.
+
+    Strings map to `_String`. Other pointers, arrays and callbacks
+    map to ``void_p`` so that ``ctypes.byref`` results, addresses of
+    numpy arrays, CFUNCTYPE instances and None are all accepted.
+    """
+    if decl.endswith(('*', '[]')):
+        if decl in ['const char[]', 'const char*']:
+            return _String
+        return void_p
+    if decl.endswith('Ptr'):
+        return void_p
+    return _argtypes_map[decl.replace('const ', '')]
+
+# Maps function names (without the DAQmx prefix) to bound library
+# functions, see `_bind_function`.
+_functions = {}
+
+# The CallStats that records calls while enabled, see
+# nidaqmx.instrumentation.
+_call_stats = None
+
+def _bind_function(name):
+    """
+    Return libnidaqmx function ``'DAQmx' + name`` with ``restype`` and
+    ``argtypes`` set from ``prototypes`` and store it in `_functions`.
+
+    Functions without a known prototype are wrapped so that unicode
+    arguments are converted to bytes as ctypes would not do it.
+    """
+    func = getattr(libnidaqmx, 'DAQmx' + name)
+    proto = _get_header()[2].get(name)
+    try:
+        if proto is None:
+            raise KeyError(name)
+        restype, argtypes = proto
+        argtypes = [_get_argtype(decl) for decl in argtypes]
+        func.restype = _argtypes_map[restype]
+    except KeyError:
+        raw_func = func
+        def func(*args):
+            return raw_func(*[a.encode('ascii') if isinstance(a, unicode) else a
+                              for a in args])
+    else:
+        func.argtypes = argtypes
+    if _call_stats is not None:
+        func = _call_stats.wrap(name, func)
+    _functions[name] = func
+    return func
+
 def CALL(name, *args):
     """
     Calls libnidaqmx function ``name`` and arguments ``args``.
     """
-    funcname = 'DAQmx' + name
-    func = getattr(libnidaqmx, funcname)
-    new_args = []
-    for a in args:
-        if isinstance(a, unicode):
-            #print(name, 'argument', a, 'is unicode', file=sys.stderr)
-            new_args.append (bytes(a))
-        else:
-            new_args.append (a)
-    r = func(*new_args)
-    r = CHK(r, funcname, *new_args)
+    try:
+        func = _functions[name]
+    except KeyError:
+        func = _bind_function(name)
+    r = func(*args)
+    if r:
+        CHK(r, 'DAQmx' + name, *args)
     return r
 
 def make_pattern(paths, _main=True):
@@ -363,6 +597,14 @@ def _test_make_pattern():
 
 ########################################################################
 
+def _decode(value):
+    """
+    Returns the contents ``value`` of a string buffer as str.
+    """
+    if isinstance(value, str):
+        return value
+    return value.decode('utf-8', 'replace')
+
 class Device(str):
 
     """
@@ -376,7 +618,7 @@ class Device(str):
         buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL ('GetDevProductType', self, ctypes.byref (buf), buf_size)
-        return buf.value
+        return _decode(buf.value)
 
     def get_product_number(self):
         """
@@ -416,7 +658,7 @@ class Device(str):
             buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL ('GetDevAIPhysicalChans', self, ctypes.byref (buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         return names        
 
     def get_analog_output_channels(self, buf_size=None):
@@ -439,7 +681,7 @@ class Device(str):
             buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL('GetDevAOPhysicalChans', self, ctypes.byref (buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         return names        
 
     def get_digital_input_lines(self, buf_size=None):
@@ -462,7 +704,7 @@ class Device(str):
             buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL ('GetDevDILines', self, ctypes.byref (buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         return names        
 
     def get_digital_input_ports(self, buf_size=None):
@@ -485,7 +727,7 @@ class Device(str):
             buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL ('GetDevDIPorts', self, ctypes.byref (buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         return names        
 
     def get_digital_output_lines(self, buf_size=None):
@@ -508,7 +750,7 @@ class Device(str):
             buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL ('GetDevDOLines', self, ctypes.byref (buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         return names        
 
     def get_digital_output_ports(self, buf_size=None):
@@ -531,7 +773,7 @@ class Device(str):
             buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL ('GetDevDOPorts', self, ctypes.byref (buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         return names        
 
     def get_counter_input_channels (self, buf_size=None):
@@ -554,7 +796,7 @@ class Device(str):
             buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL ('GetDevCIPhysicalChans', self, ctypes.byref (buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         return names        
 
     def get_counter_output_channels (self, buf_size=None):
@@ -577,7 +819,7 @@ class Device(str):
             buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL ('GetDevCOPhysicalChans', self, ctypes.byref (buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         return names        
 
     def get_bus_type(self):
@@ -693,7 +935,7 @@ class System(object):
         buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL ('GetSysDevNames', ctypes.byref (buf), buf_size)
-        names = [Device(n.strip()) for n in buf.value.split(',') if n.strip()]
+        names = [Device(n.strip()) for n in _decode(buf.value).split(',') if n.strip()]
         return names
 
     @property
@@ -705,7 +947,7 @@ class System(object):
         buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL ('GetSysTasks', ctypes.byref (buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         return names
 
     @property
@@ -717,7 +959,7 @@ class System(object):
         buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL ('GetSysGlobalChans', ctypes.byref (buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         return names
 
 class Task(TaskHandle):
@@ -775,7 +1017,7 @@ class Task(TaskHandle):
         buf_size = max(len(name)+1, default_buf_size)
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL('GetTaskName', self, ctypes.byref(buf), buf_size)
-        self.name = buf.value
+        self.name = _decode(buf.value)
         self.sample_mode = None
         self.samples_per_channel = None
 
@@ -816,8 +1058,10 @@ class Task(TaskHandle):
         within the loop after you finish with the task to avoid
         allocating unnecessary memory.
         """
+        self._invalidate_channel_cache()
         if self.value:
             r = libnidaqmx.DAQmxClearTask(self)
+            self.value = None
             if r:
                 warnings.warn("DAQmxClearTask failed with error code %s (%r)" % (r, error_map.get(r)))
 
@@ -894,11 +1138,67 @@ class Task(TaskHandle):
         val = map_.get(key)
         if val is None:
             raise ValueError('Expected %s %s but got %r'
-                             % (label, '|'.join(map_.viewkeys()), key))
+                             % (label, '|'.join(sorted(map_)), key))
         return val
 
+    _channel_cache = None
+
+    def _invalidate_channel_cache(self):
+        """
+        Forgets the cached channel metadata of the task. Must be
+        called whenever channels are added to the task.
+        """
+        self._channel_cache = None
+
+    def _get_channel_cache(self):
+        """
+        Returns a dictionary holding channel metadata of the task that
+        read and write methods use. The dictionary is filled lazily and
+        emptied by `_invalidate_channel_cache`.
+        """
+        cache = self._channel_cache
+        if cache is None:
+            cache = self._channel_cache = {}
+        return cache
+
+    def _get_cached_number_of_channels(self):
+        """
+        Returns the number of channels in the task, see
+        `get_number_of_channels`.
+        """
+        cache = self._get_channel_cache()
+        n = cache.get('number_of_channels')
+        if n is None:
+            n = cache['number_of_channels'] = self.get_number_of_channels()
+        return n
+
+    def _get_cached_names_of_channels(self):
+        """
+        Returns the names of channels in the task, see
+        `get_names_of_channels`.
+        """
+        cache = self._get_channel_cache()
+        names = cache.get('names_of_channels')
+        if names is None:
+            names = cache['names_of_channels'] = self.get_names_of_channels()
+        return names
+
+    def _encode_name(self, name):
+        """
+        Returns channel ``name`` as bytes. Encoded names are kept in
+        the channel cache so that repeated property calls on the same
+        channel do not encode it again.
+        """
+        if isinstance(name, bytes):
+            return name
+        encoded_names = self._get_channel_cache().setdefault('encoded_names', {})
+        encoded = encoded_names.get(name)
+        if encoded is None:
+            encoded = encoded_names[name] = ('%s' % (name)).encode('ascii')
+        return encoded
+
     def _reshape_data(self, data, layout):
-        number_of_channels = self.get_number_of_channels()
+        number_of_channels = self._get_cached_number_of_channels()
 
         if number_of_channels == 0:
             raise ValueError('Can\'t write any data without any channels')
@@ -927,6 +1227,229 @@ class Task(TaskHandle):
 
         return data, samples_per_channel
 
+    def _check_read_array(self, data, dtypes, number_of_channels, fill_mode):
+        """
+        Validates a caller supplied read array and returns the number
+        of samples per channel that fits into it.
+        """
+        if not isinstance(data, np.ndarray):
+            raise TypeError('Expected numpy array but got %r' % (type(data).__name__))
+        if data.dtype not in dtypes:
+            raise TypeError('Expected array with dtype %s but got %s'
+                            % ('|'.join(str(np.dtype(t)) for t in dtypes), data.dtype))
+        if not (data.flags.c_contiguous and data.flags.writeable):
+            raise ValueError('Expected writeable C-contiguous array')
+        if number_of_channels == 0:
+            raise ValueError('Can\'t read any data without any channels')
+        if data.ndim == 1:
+            if data.size % number_of_channels:
+                raise ValueError('Array size %s is not a multiple of the number of channels %s'
+                                 % (data.size, number_of_channels))
+        elif data.ndim == 2:
+            if fill_mode == 'group_by_scan_number':
+                nof_channels = data.shape[1]
+            else:
+                nof_channels = data.shape[0]
+            if nof_channels != number_of_channels:
+                raise ValueError('Expected array with %s channels for %s but got shape %s'
+                                 % (number_of_channels, fill_mode, data.shape))
+        else:
+            raise ValueError('Expected 1-d or 2-d array but got shape %s' % (data.shape,))
+        return data.size // number_of_channels
+
+    def _check_samples_per_channel(self, samples_per_channel):
+        if samples_per_channel is not None and samples_per_channel < -1:
+            raise ValueError('Expected samples_per_channel >= 0, -1 or None but got %s'
+                             % (samples_per_channel))
+
+    def _get_read_size(self, data, size, samples_per_channel, fill_mode):
+        """
+        Returns the number of samples per channel to request when
+        reading into an array ``data`` that holds ``size`` samples per
+        channel, and the number of samples per channel that the driver
+        may store.
+        """
+        self._check_samples_per_channel(samples_per_channel)
+        if samples_per_channel is None:
+            return size, size
+        if samples_per_channel > size:
+            raise ValueError('Array holds %s samples per channel but %s were requested'
+                             % (size, samples_per_channel))
+        if samples_per_channel == -1:
+            if fill_mode == 'group_by_channel':
+                raise ValueError('Reading all available samples requires group_by_scan_number fill mode')
+            return samples_per_channel, size
+        if fill_mode == 'group_by_channel' and data.ndim == 2 and samples_per_channel != size:
+            raise ValueError('Reading %s samples into array with shape %s requires group_by_scan_number fill mode'
+                             % (samples_per_channel, data.shape))
+        return samples_per_channel, samples_per_channel
+
+    def _read_array(self, read_into, samples_per_channel, fill_mode, out, dtypes, dtype):
+        """
+        Reads samples with ``read_into(data, samples_per_channel)``
+        into a view of ``out``, validated against ``dtypes``, or into a
+        new array of ``dtype``, and returns the samples read. None or
+        -1 for ``samples_per_channel`` read the available samples, at
+        most as many as fit into ``out``. A ``fill_mode`` of None
+        reads a 1-d array of a single channel.
+
+        This implements the `read` methods of the task classes.
+        """
+        self._check_samples_per_channel(samples_per_channel)
+        if fill_mode is None:
+            number_of_channels = 1
+        else:
+            number_of_channels = self._get_cached_number_of_channels()
+        # pylint: disable=no-member
+        if out is not None:
+            size = self._check_read_array(out, dtypes, number_of_channels,
+                                          fill_mode or 'group_by_scan_number')
+            if samples_per_channel in [None,-1]:
+                samples_per_channel = min(self.get_samples_per_channel_available(), size)
+            elif samples_per_channel > size:
+                raise ValueError('Array holds %s samples per channel but %s were requested'
+                                 % (size, samples_per_channel))
+            data = out.reshape(-1)[:samples_per_channel * number_of_channels]
+        else:
+            if samples_per_channel in [None,-1]:
+                samples_per_channel = self.get_samples_per_channel_available()
+            data = np.zeros(samples_per_channel * number_of_channels, dtype=dtype)
+        if fill_mode=='group_by_scan_number':
+            data = data.reshape((samples_per_channel, number_of_channels))
+        elif fill_mode=='group_by_channel':
+            data = data.reshape((number_of_channels, samples_per_channel))
+        # pylint: enable=no-member
+
+        samples_read = read_into(data, samples_per_channel)
+
+        if fill_mode=='group_by_channel':
+            return data[:,:samples_read]
+        return data[:samples_read]
+
+    def _new_read_block(self, samples_per_channel, fill_mode, dtype=None):
+        """
+        Returns a new array that `_read_block` reads
+        ``samples_per_channel`` samples into, of ``dtype`` or of the
+        default dtype of the task when None.
+        """
+        raise TypeError('%s does not support reading blocks' % (self.__class__.__name__))
+
+    def _check_block_dtype(self, dtype, default):
+        """
+        Returns ``default``, the only dtype of blocks that the task
+        reads, after checking that ``dtype`` is None or equal to it.
+        """
+        if dtype is not None and np.dtype(dtype) != default:
+            raise TypeError('%s reads samples of dtype %s but %s was requested'
+                            % (self.__class__.__name__, np.dtype(default), np.dtype(dtype)))
+        return default
+
+    def _read_block(self, data, samples_per_channel, timeout, fill_mode):
+        return self.read_into(data, samples_per_channel, timeout, fill_mode)
+
+    def iter_blocks(self, samples_per_block, n_buffers=2, timeout=10.0,
+                    fill_mode='group_by_scan_number', max_blocks=None, dtype=None):
+        """
+        Returns a generator of blocks of samples read from the task.
+
+        The blocks are arrays from a pool of `n_buffers` arrays that
+        are allocated once and reused in turn, so a block is valid
+        only until ``n_buffers - 1`` further blocks have been read.
+        Copy blocks that must be kept longer. The task is started on
+        the first ``next()`` and stopped when the generator is closed
+        or exhausted.
+
+        Parameters
+        ----------
+
+        samples_per_block : int
+          The number of samples, per channel, in a block.
+
+        n_buffers : int
+          The number of arrays in the pool.
+
+        timeout, fill_mode :
+          See `read` documentation. Counter input tasks ignore
+          `fill_mode`.
+
+        max_blocks : {int, None}
+          The number of blocks to read, for example for finite
+          acquisitions. If None then blocks are read until the
+          generator is closed.
+
+        dtype : {numpy.dtype, None}
+          The dtype of the blocks. Analog input tasks read float64
+          samples by default and float32 samples on request, see
+          `AnalogInputTask.read_into`. Counter input tasks read
+          uint32 counts or float64 values, depending on the
+          measurement type, see `CounterInputTask.read`. Other tasks
+          read a fixed dtype.
+
+        Examples
+        --------
+
+        ::
+
+          blocks = task.iter_blocks(1000, n_buffers=4)
+          for block in blocks:
+              process(block)
+
+        See also
+        --------
+        read_into
+        """
+        buffers = [self._new_read_block(samples_per_block, fill_mode, dtype)
+                   for i in range(n_buffers)]
+        self.start()
+        try:
+            i = 0
+            while max_blocks is None or i < max_blocks:
+                data = buffers[i % n_buffers]
+                self._read_block(data, samples_per_block, timeout, fill_mode)
+                yield data
+                i += 1
+        finally:
+            self.stop()
+
+    def read_async(self, samples_per_channel, timeout=10.0, fill_mode='group_by_scan_number',
+                   dtype=None):
+        """
+        Returns an asyncio awaitable of ``samples_per_channel``
+        samples read from the task. Requires Python 3.
+
+        The first call registers DAQmx events and starts the task, so
+        do not start the task yourself. See `nidaqmx.aio.read_async`.
+        """
+        from .aio import read_async
+        return read_async(self, samples_per_channel, timeout, fill_mode, dtype)
+
+    def write_async(self, data, timeout=10.0, **kws):
+        """
+        Returns an asyncio awaitable that writes ``data`` to the task
+        once the buffer has room for it. Requires Python 3.
+
+        The first call registers DAQmx events, writes the data and
+        starts the task. See `nidaqmx.aio.write_async`.
+        """
+        from .aio import write_async
+        return write_async(self, data, timeout, **kws)
+
+    def stream(self, samples_per_block, n_buffers=2, timeout=10.0,
+               fill_mode='group_by_scan_number', max_blocks=None, dtype=None):
+        """
+        Returns an asynchronous generator of blocks of samples, the
+        asyncio counterpart of `iter_blocks`. Requires Python 3.
+
+        ::
+
+          async for block in task.stream(1000):
+              await process(block)
+
+        See `nidaqmx.aio.stream`.
+        """
+        from .aio import stream
+        return stream(self, samples_per_block, n_buffers, timeout, fill_mode, max_blocks, dtype)
+
     def get_number_of_channels(self):
         """
         Indicates the number of virtual channels in the task.
@@ -954,7 +1477,7 @@ class Task(TaskHandle):
             buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL('GetTaskChannels', self, ctypes.byref(buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         n = self.get_number_of_channels()
         assert len(names)==n,repr((names, n))
         return names
@@ -979,7 +1502,7 @@ class Task(TaskHandle):
             buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL('GetTaskDevices', self, ctypes.byref(buf), buf_size)
-        names = [n.strip() for n in buf.value.split(',') if n.strip()]
+        names = [n.strip() for n in _decode(buf.value).split(',') if n.strip()]
         return names
 
     def alter_state(self, state):
@@ -1033,6 +1556,16 @@ class Task(TaskHandle):
     # Not implemented: DAQmxAddGlobalChansToTask, DAQmxLoadTask
     # DAQmxGetNthTaskChannel
 
+    def _make_callback(self, callback_type, func):
+        """
+        Returns a ``callback_type`` C callback that calls ``func`` with
+        this task instead of the task handle as first argument.
+        """
+        task = weakref.ref(self)
+        def callback(handle, *args):
+            return func(task(), *args) or 0
+        return callback_type(callback)
+
     _register_every_n_samples_event_cache = None
 
     def register_every_n_samples_event(self, func, 
@@ -1106,7 +1639,7 @@ class Task(TaskHandle):
             if len(argspec.args) != 4:
                 raise ValueError("Function signature should be like f(task, event_type, samples, cb_data) -> 0.")
             # TODO: use wrapper function that converts cb_data argument to given Python object
-            c_func = EveryNSamplesEventCallback_map[self.channel_type](func)
+            c_func = self._make_callback(EveryNSamplesEventCallback, func)
         
         self._register_every_n_samples_event_cache = c_func
 
@@ -1190,7 +1723,7 @@ class Task(TaskHandle):
             argspec = getargspec(func)
             if len(argspec.args) != 3 or argspec.defaults != (None,):
                 raise ValueError("Function signature should be like f(task, status, cb_data=None) -> 0.")
-            c_func = DoneEventCallback_map[self.channel_type](func)
+            c_func = self._make_callback(DoneEventCallback, func)
         self._register_done_event_cache = c_func
 
         return CALL('RegisterDoneEvent', self, uInt32 (options), c_func, cb_data)==0
@@ -1263,11 +1796,11 @@ class Task(TaskHandle):
             c_func = None
         else:
             if self._register_signal_event_cache is not None:
-                self._register_signal_event(None, signal=signal, options=options, cb_data=cb_data)
+                self.register_signal_event(None, signal=signal, options=options, cb_data=cb_data)
             argspec = getargspec(func)
             if len(argspec.args) != 4:
                 raise ValueError("Function signature should be like f(task, signalID, cb_data) -> 0.")
-            c_func = SignalEventCallback_map[self.channel_type](func)
+            c_func = self._make_callback(SignalEventCallback, func)
         self._register_signal_event_cache = c_func
         return CALL('RegisterSignalEvent', self, signalID_val, uInt32(options), c_func, cb_data)==0
 
@@ -1838,12 +2371,11 @@ class Task(TaskHandle):
 
 
     # Not implemented:
-    # DAQmxReadBinary*, DAQmxReadCounter*, DAQmxReadDigital*
+    # DAQmxReadBinaryU16, DAQmxReadBinaryU32, DAQmxReadCounterScalarU32, DAQmxReadDigitalScalarU32
     # DAQmxGetNthTaskReadChannel, DAQmxReadRaw
     # DAQmxWrite*
     # DAQmxExportSignal
     # DAQmxCalculateReversePolyCoeff, DAQmxCreateLinScale
-    # DAQmxWaitForNextSampleClock
     # DAQmxSwitch*
     # DAQmxConnectTerms, DAQmxDisconnectTerms, DAQmxTristateOutputTerm
     # DAQmxResetDevice
@@ -1862,11 +2394,11 @@ class Task(TaskHandle):
         Indicates the name of the physical channel upon which this
         virtual channel is based.
         """
-        channel_name = str (channel_name)
+        channel_name = self._encode_name(channel_name)
         buf_size = default_buf_size
         buf = ctypes.create_string_buffer(b'\000' * buf_size)
         CALL('GetPhysicalChanName', self, channel_name, ctypes.byref(buf), uInt32(buf_size))
-        return buf.value
+        return _decode(buf.value)
 
     def get_channel_type(self, channel_name):
         """
@@ -1877,7 +2409,7 @@ class Task(TaskHandle):
 
         channel_type : {'AI', 'AO', 'DI', 'DO', 'CI', 'CO'}
         """
-        channel_name = str (channel_name)
+        channel_name = self._encode_name(channel_name)
         t = int32(0)
         CALL('GetChanType', self, channel_name, ctypes.byref(t))
         channel_type_map = {DAQmx.Val_AI:'AI', DAQmx.Val_AO:'AO',
@@ -1890,7 +2422,7 @@ class Task(TaskHandle):
         """
         Indicates whether the channel is a global channel.
         """
-        channel_name = str (channel_name)
+        channel_name = self._encode_name(channel_name)
         d = bool32(0)
         CALL('GetChanIsGlobal', self, channel_name, ctypes.byref (d))
         return bool(d.value)
@@ -2088,7 +2620,7 @@ class Task(TaskHandle):
         --------
         set_max, reset_max
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         d = float64(0)
         channel_type = self.channel_type
         CALL ('Get%sMax' % (channel_type), self, channel_name, ctypes.byref(d))
@@ -2107,7 +2639,7 @@ class Task(TaskHandle):
         --------
         get_max, reset_max
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         channel_type = self.channel_type
         return CALL ('Set%sMax' % (channel_type), self, channel_name, float64 (value))==0
 
@@ -2119,7 +2651,7 @@ class Task(TaskHandle):
         --------
         set_max, reset_max
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         channel_type = self.channel_type
         return CALL ('Reset%sMax' % (channel_type), self, channel_name)==0
 
@@ -2131,7 +2663,7 @@ class Task(TaskHandle):
         --------
         set_min, reset_min
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         d = float64(0)
         channel_type = self.channel_type
         CALL ('Get%sMin' % (channel_type), self, channel_name, ctypes.byref(d))
@@ -2151,7 +2683,7 @@ class Task(TaskHandle):
         get_min, reset_min
         """
 
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         channel_type = self.channel_type
         return CALL ('Set%sMin' % (channel_type), self, channel_name, float64 (value))==0
 
@@ -2168,7 +2700,7 @@ class Task(TaskHandle):
         --------
         get_min, set_min
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         channel_type = self.channel_type
         return CALL ('Reset%sMin' % (channel_type), self, channel_name)==0
 
@@ -2182,7 +2714,7 @@ class Task(TaskHandle):
         --------
         set_high, reset_high
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         d = float64(0)
         channel_type = self.channel_type
         CALL ('Get%sRngHigh' % (channel_type), self, channel_name, ctypes.byref(d))
@@ -2198,7 +2730,7 @@ class Task(TaskHandle):
         --------
         set_low, reset_low
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         d = float64(0)
         channel_type = self.channel_type
         CALL ('Get%sRngLow' % (channel_type), self, channel_name, ctypes.byref(d))
@@ -2212,7 +2744,7 @@ class Task(TaskHandle):
         --------
         set_gain, reset_gain
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         d = float64(0)
         channel_type = self.channel_type
         CALL ('Get%sGain' % (channel_type), self, channel_name, ctypes.byref(d))
@@ -2226,7 +2758,7 @@ class Task(TaskHandle):
 
         Indicates whether the channel generates voltage or current.
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         d = int32(0)
         channel_type = self.channel_type
         if channel_type=='AI':
@@ -2265,7 +2797,7 @@ class Task(TaskHandle):
         --------
         set_units, reset_units
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         mt = self.get_measurment_type(channel_name)
         channel_type = self.channel_type
         if mt=='voltage':
@@ -2287,7 +2819,7 @@ class Task(TaskHandle):
         --------
         set_auto_zero_mode, reset_auto_zero_mode
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         d = int32(0)
         channel_type = self.channel_type
         CALL('Get%sAutoZeroMode' % (channel_type), self, channel_name, ctypes.byref (d))
@@ -2304,7 +2836,7 @@ class Task(TaskHandle):
         --------
         set_data_transfer_mechanism, reset_data_transfer_mechanism
         """
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         d = int32(0)
         channel_type = self.channel_type
         CALL('Get%sDataXferMech' % (channel_type), self, channel_name, ctypes.byref (d))
@@ -2641,7 +3173,7 @@ class Task(TaskHandle):
         channel. NI-DAQmx returns a single value because this value is
         the same for all channels.
         """
-        d = uInt32(0)
+        d = uInt64(0)
         CALL('GetReadTotalSampPerChanAcquired', self, ctypes.byref(d))
         return d.value
 
@@ -2655,6 +3187,15 @@ class Task(TaskHandle):
         CALL('GetWriteTotalSampPerChanGenerated', self, ctypes.byref(d))
         return d.value
 
+    def get_write_space_available(self):
+        """
+        Indicates in samples per channel the amount of available
+        space in the buffer.
+        """
+        d = uInt32(0)
+        CALL('GetWriteSpaceAvail', self, ctypes.byref(d))
+        return d.value
+
     def wait_until_done(self, timeout=-1):
         """
         Waits for the measurement or generation to complete. Use this
@@ -2686,6 +3227,34 @@ class Task(TaskHandle):
         """
         return CALL('WaitUntilTaskDone', self, float64 (timeout))==0
 
+    def wait_for_next_sample_clock(self, timeout=10.0):
+        """
+        Waits until the next pulse of the sample clock of a task with
+        hardware-timed single point timing, see
+        `configure_timing_sample_clock`.
+
+        Parameters
+        ----------
+
+        timeout : float
+          The maximum amount of time, in seconds, to wait.
+
+        Returns
+        -------
+
+        is_late : bool
+          True if one or more sample clock pulses occurred since the
+          previous call, so that the loop calling this function did
+          not keep up with the sample clock.
+
+        See also
+        --------
+        nidaqmx.control.ControlLoop
+        """
+        is_late = bool32(0)
+        CALL('WaitForNextSampleClock', self, float64(timeout), ctypes.byref(is_late))
+        return bool(is_late.value)
+
     def get_read_relative_to(self):
         """
         Returns the point in the buffer relative to which a read operation
@@ -2915,7 +3484,7 @@ class Task(TaskHandle):
           set_read_relative_to
 
         """
-        r = CALL('SetReadOffset', self, uInt32(offset))
+        r = CALL('SetReadOffset', self, int32(offset))
         return r == 0
 
     def reset_read_offset(self):
@@ -2949,6 +3518,12 @@ class AnalogInputTask(Task):
 
     channel_type = 'AI'
 
+    # The dtypes of arrays that `read` and `read_into` store samples
+    # in. float32 samples are read through a float64 staging block
+    # of at most `staging_samples` samples per channel.
+    _read_dtypes = (np.dtype(np.float64), np.dtype(np.float32))
+    staging_samples = 4096
+
     def get_convert_max_rate(self):
         """
         Indicates the maximum convert rate supported by the task,
@@ -3048,7 +3623,7 @@ class AnalogInputTask(Task):
 
         """
         phys_channel = str(phys_channel)
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         terminal_map = dict (default = DAQmx.Val_Cfg_Default,
                              rse = DAQmx.Val_RSE,
                              nrse = DAQmx.Val_NRSE,
@@ -3064,13 +3639,14 @@ class AnalogInputTask(Task):
             if custom_scale_name is None:
                 raise ValueError ('Must specify custom_scale_name for custom scale.')
 
+        self._invalidate_channel_cache()
         r = CALL('CreateAIVoltageChan', self, phys_channel, channel_name, terminal_val,
                  float64(min_val), float64(max_val), units_val, custom_scale_name)
         self._set_channel_type(self.get_channel_type(channel_name))
         return r==0
 
     def read(self, samples_per_channel=None, timeout=10.0,
-             fill_mode='group_by_scan_number'):
+             fill_mode='group_by_scan_number', out=None, dtype=np.float64):
         """
         Reads multiple floating-point samples from a task that
         contains one or more analog input channels.
@@ -3122,40 +3698,144 @@ class AnalogInputTask(Task):
 
             'group_by_scan_number'
               Group by scan number (interleaved)::
-              
+
                 ch0:s1, ch1:s1, ch2:s1, ch0:s2, ch1:s2, ch2:s2,...
 
+        out : {numpy.ndarray, None}
+          A C-contiguous float64 or float32 array to read samples
+          into instead of allocating a new one, see `read_into`. If
+          `samples_per_channel` is None then at most as many samples
+          as fit into `out` are read.
+
+        dtype : {numpy.float64, numpy.float32}
+          The dtype of the array allocated when `out` is None.
+
         Returns
         -------
-        
+
         data :
-          The array to read samples into, organized according to `fill_mode`.
+          The array to read samples into, organized according to
+          `fill_mode`. When `out` is given, a view of `out`.
+
+        See also
+        --------
+        read_into
+        """
+        def read_into(data, samples_per_channel):
+            return self.read_into(data, samples_per_channel, timeout, fill_mode)
+        return self._read_array(read_into, samples_per_channel, fill_mode, out,
+                                self._read_dtypes, self._check_read_dtype(dtype))
+
+    def _check_read_dtype(self, dtype):
+        if dtype is None:
+            return self._read_dtypes[0]
+        dtype = np.dtype(dtype)
+        if dtype not in self._read_dtypes:
+            raise TypeError('Expected dtype %s but got %s'
+                            % ('|'.join(str(t) for t in self._read_dtypes), dtype))
+        return dtype
+
+    def _new_read_block(self, samples_per_channel, fill_mode, dtype=None):
+        number_of_channels = self._get_cached_number_of_channels()
+        dtype = self._check_read_dtype(dtype)
+        if fill_mode == 'group_by_scan_number':
+            return np.zeros((samples_per_channel, number_of_channels), dtype=dtype)
+        return np.zeros((number_of_channels, samples_per_channel), dtype=dtype)
+
+    def read_into(self, data, samples_per_channel=None, timeout=10.0,
+                  fill_mode='group_by_scan_number'):
+        """
+        Reads multiple floating-point samples from a task that
+        contains one or more analog input channels into a caller
+        supplied array. No memory is allocated for the samples, so
+        this is the method to use in acquisition loops that read
+        blocks repeatedly.
+
+        Parameters
+        ----------
+
+        data : numpy.ndarray
+          A C-contiguous, writeable float64 or float32 array with
+          shape ``(samples, channels)`` for 'group_by_scan_number' or
+          ``(channels, samples)`` for 'group_by_channel', or a 1-d
+          array holding the same number of elements. Samples are
+          stored from the beginning of the array. float32 samples are
+          read in steps of `staging_samples` samples per channel into
+          a float64 staging block that the task allocates once, and
+          converted into `data`.
+
+        samples_per_channel : {int, None}
+          The number of samples, per channel, to read. If None then
+          as many samples as fit into `data` are read. A value of -1
+          (DAQmx_Val_Auto) reads all available samples that fit into
+          `data`. For 2-d arrays in 'group_by_channel' mode only the
+          full array can be read.
+
+        timeout, fill_mode :
+          See `read` documentation.
+
+        Returns
+        -------
+
+        samples_read : int
+          The actual number of samples read from each channel.
+
+        See also
+        --------
+        read
         """
         fill_mode_map = dict(group_by_channel = DAQmx.Val_GroupByChannel,
                              group_by_scan_number = DAQmx.Val_GroupByScanNumber)
         fill_mode_val = self._get_map_value('fill_mode', fill_mode_map, fill_mode)
+        number_of_channels = self._get_cached_number_of_channels()
+        size = self._check_read_array(data, self._read_dtypes, number_of_channels, fill_mode)
+        samples_per_channel, size = self._get_read_size(data, size, samples_per_channel, fill_mode)
+        if data.dtype != np.float64: # pylint: disable=no-member
+            return self._read_staged(data, samples_per_channel, size, timeout, fill_mode)
 
-        if samples_per_channel is None:
-            samples_per_channel = self.get_samples_per_channel_available()
-
-        number_of_channels = self.get_number_of_channels()
-        # pylint: disable=no-member
-        if fill_mode=='group_by_scan_number':
-            data = np.zeros((samples_per_channel, number_of_channels),dtype=np.float64)
-        else:
-            data = np.zeros((number_of_channels, samples_per_channel),dtype=np.float64)
-        # pylint: enable=no-member
         samples_read = int32(0)
-
         CALL('ReadAnalogF64', self, samples_per_channel, float64(timeout),
-             fill_mode_val, data.ctypes.data, data.size, ctypes.byref(samples_read), None)
-
-        if samples_per_channel < samples_read.value:
-            if fill_mode=='group_by_scan_number':
-                return data[:samples_read.value]
+             fill_mode_val, data.ctypes.data, uInt32(size * number_of_channels),
+             ctypes.byref(samples_read), None)
+        return samples_read.value
+
+    def _read_staged(self, data, samples_per_channel, size, timeout, fill_mode):
+        """
+        Reads samples into a validated float32 array through the
+        float64 staging block of the task, see `read_into`.
+        """
+        number_of_channels = self._get_cached_number_of_channels()
+        if samples_per_channel == -1:
+            samples_per_channel = min(self.get_samples_per_channel_available(), size)
+        data = data.reshape(-1)[:samples_per_channel * number_of_channels]
+        by_scan = fill_mode == 'group_by_scan_number'
+        if by_scan:
+            data = data.reshape((samples_per_channel, number_of_channels))
+        else:
+            data = data.reshape((number_of_channels, samples_per_channel))
+        cache = self._get_channel_cache()
+        staging = cache.get('staging_block')
+        if staging is None:
+            staging = cache['staging_block'] = np.zeros(self.staging_samples * number_of_channels)
+        deadline = default_timer() + timeout if timeout >= 0 else None
+        samples_read = 0
+        while samples_read < samples_per_channel:
+            n = min(samples_per_channel - samples_read, self.staging_samples)
+            if by_scan:
+                block = staging[:n * number_of_channels].reshape((n, number_of_channels))
+            else:
+                block = staging[:n * number_of_channels].reshape((number_of_channels, n))
+            if deadline is not None:
+                timeout = max(0.0, deadline - default_timer())
+            n_read = self.read_into(block, n, timeout, fill_mode)
+            if by_scan:
+                data[samples_read:samples_read + n_read] = block[:n_read]
             else:
-                return data[:,:samples_read.value]
-        return data
+                data[:, samples_read:samples_read + n_read] = block[:, :n_read]
+            samples_read += n_read
+            if n_read < n:
+                break
+        return samples_read
 
     def read_scalar(self, timeout=10.0):
         """
@@ -3188,6 +3868,151 @@ class AnalogInputTask(Task):
              float64(timeout), ctypes.byref(data), None)
         return data.value
 
+    def get_raw_sample_size(self, channel_name):
+        """
+        Indicates in bits the size of a raw sample from the device.
+
+        See also
+        --------
+        read_raw
+        """
+        channel_name = self._encode_name(channel_name)
+        d = uInt32(0)
+        CALL('GetAIRawSampSize', self, channel_name, ctypes.byref(d))
+        return d.value
+
+    def get_device_scaling_coefficients(self, channel_name):
+        """
+        Indicates the coefficients of a polynomial equation that
+        NI-DAQmx uses to scale values from the native format of the
+        device to volts. Each element of the array corresponds to a
+        term of the equation, lowest order first.
+
+        Returns
+        -------
+
+        coefficients : numpy.ndarray
+
+        See also
+        --------
+        get_scaler
+        """
+        channel_name = self._encode_name(channel_name)
+        try:
+            func = _functions['GetAIDevScalingCoeff']
+        except KeyError:
+            func = _bind_function('GetAIDevScalingCoeff')
+        # With an empty array the function returns the number of
+        # coefficients.
+        n = func(self, channel_name, None, uInt32(0))
+        if n < 0:
+            CHK(n, 'DAQmxGetAIDevScalingCoeff', self, channel_name)
+        coefficients = np.zeros(n, dtype=np.float64)
+        CALL('GetAIDevScalingCoeff', self, channel_name,
+             coefficients.ctypes.data, uInt32(n))
+        return coefficients
+
+    def get_scaler(self):
+        """
+        Returns a `nidaqmx.scaling.PolynomialScaler` that converts the
+        samples of `read_raw` to volts. The scaling coefficients of
+        the channels are queried once and cached until channels are
+        added; query them again after changing the input ranges.
+
+        See also
+        --------
+        read_raw, get_device_scaling_coefficients
+        """
+        cache = self._get_channel_cache()
+        scaler = cache.get('scaler')
+        if scaler is None:
+            from .scaling import PolynomialScaler
+            scaler = cache['scaler'] = PolynomialScaler(
+                [self.get_device_scaling_coefficients(name)
+                 for name in self._get_cached_names_of_channels()])
+        return scaler
+
+    def _get_raw_dtype(self):
+        """
+        Returns the dtype of `read_raw` arrays: int16 for devices with
+        raw samples of up to 16 bits, int32 otherwise.
+        """
+        cache = self._get_channel_cache()
+        dtype = cache.get('raw_dtype')
+        if dtype is None:
+            size = max(self.get_raw_sample_size(name)
+                       for name in self._get_cached_names_of_channels())
+            dtype = cache['raw_dtype'] = np.dtype(np.int16 if size <= 16 else np.int32)
+        return dtype
+
+    def read_raw(self, samples_per_channel=None, timeout=10.0,
+                 fill_mode='group_by_scan_number', out=None):
+        """
+        Reads multiple unscaled samples from a task that contains one
+        or more analog input channels.
+
+        Raw samples are the integers of the analog-to-digital
+        converter, int16 for devices with up to 16 bits resolution and
+        int32 otherwise. Use `get_scaler` to convert them to volts
+        when needed.
+
+        Parameters
+        ----------
+
+        samples_per_channel, timeout, fill_mode :
+          See `read` documentation.
+
+        out : {numpy.ndarray, None}
+          A C-contiguous array of the raw dtype to read samples into
+          instead of allocating a new one, see `read_raw_into`.
+
+        Returns
+        -------
+
+        data :
+          The array of raw samples, organized according to
+          `fill_mode`. When `out` is given, a view of `out`.
+
+        See also
+        --------
+        read_raw_into, get_scaler
+        """
+        dtype = self._get_raw_dtype()
+        def read_into(data, samples_per_channel):
+            return self.read_raw_into(data, samples_per_channel, timeout, fill_mode)
+        return self._read_array(read_into, samples_per_channel, fill_mode, out, [dtype], dtype)
+
+    def read_raw_into(self, data, samples_per_channel=None, timeout=10.0,
+                      fill_mode='group_by_scan_number'):
+        """
+        Reads multiple unscaled samples from a task that contains one
+        or more analog input channels into a caller supplied int16 or
+        int32 array, see `read_into` and `read_raw`.
+
+        Returns
+        -------
+
+        samples_read : int
+          The actual number of samples read from each channel.
+
+        See also
+        --------
+        read_raw
+        """
+        fill_mode_map = dict(group_by_channel = DAQmx.Val_GroupByChannel,
+                             group_by_scan_number = DAQmx.Val_GroupByScanNumber)
+        fill_mode_val = self._get_map_value('fill_mode', fill_mode_map, fill_mode)
+        number_of_channels = self._get_cached_number_of_channels()
+        size = self._check_read_array(data, [np.int16, np.int32], number_of_channels, fill_mode) # pylint: disable=no-member
+        samples_per_channel, size = self._get_read_size(data, size, samples_per_channel, fill_mode)
+
+        samples_read = int32(0)
+        CALL('ReadBinaryI16' if data.dtype == np.int16 else 'ReadBinaryI32', # pylint: disable=no-member
+             self, samples_per_channel, float64(timeout),
+             fill_mode_val, data.ctypes.data, uInt32(size * number_of_channels),
+             ctypes.byref(samples_read), None)
+        return samples_read.value
+
 class AnalogOutputTask (Task):
 
     """Exposes NI-DAQmx analog output task to Python.
@@ -3213,7 +4038,7 @@ class AnalogOutputTask (Task):
           AnalogInputTask.create_voltage_channel
         """
         phys_channel = str(phys_channel)
-        channel_name = str(channel_name)
+        channel_name = self._encode_name(channel_name)
         if custom_scale_name is not None:
             custom_scale_name = str(custom_scale_name)
         self._set_channel_type('AO')
@@ -3226,6 +4051,7 @@ class AnalogOutputTask (Task):
             if custom_scale_name is None:
                 raise ValueError ('Must specify custom_scale_name for custom scale.')
 
+        self._invalidate_channel_cache()
         r = CALL('CreateAOVoltageChan', self, phys_channel, channel_name,
                  float64(min_val), float64(max_val), units_val, custom_scale_name)
         self._set_channel_type(self.get_channel_type(channel_name))
@@ -3323,7 +4149,8 @@ class DigitalTask (Task):
         CALL('Get%sNumLines' % (channel_type), self, channel, ctypes.byref(d))
         return d.value
 
-    def read(self, samples_per_channel=None, timeout=10.0, fill_mode='group_by_scan_number'):
+    def read(self, samples_per_channel=None, timeout=10.0, fill_mode='group_by_scan_number',
+             out=None):
         """
         Reads multiple samples from each digital line in a task. Each
         line in a channel gets one byte per sample.
@@ -3376,6 +4203,13 @@ class DigitalTask (Task):
   
             'group_by_scan_number' - Group by scan number (interleaved).
 
+        out : {numpy.ndarray, None}
+
+          A C-contiguous array to read samples into instead of
+          allocating a new one, see `read_into`. If
+          `samples_per_channel` is None then at most as many samples
+          as fit into `out` are read.
+
         Returns
         -------
 
@@ -3384,7 +4218,8 @@ class DigitalTask (Task):
             The array to read samples into. Each `bytes_per_sample`
             corresponds to one sample per channel, with each element
             in that grouping corresponding to a line in that channel,
-            up to the number of lines contained in the channel.
+            up to the number of lines contained in the channel. When
+            `out` is given, a view of `out`.
 
           bytes_per_sample : int
 
@@ -3393,45 +4228,239 @@ class DigitalTask (Task):
             `bytes_per_sample` is the number of bytes that channel
             consists of.
 
+        See also
+        --------
+        read_into
         """
-        fill_mode_map = dict(group_by_channel = DAQmx.Val_GroupByChannel,
-                             group_by_scan_number = DAQmx.Val_GroupByScanNumber)
-        fill_mode_val = self._get_map_value('fill_mode', fill_mode_map, fill_mode)
+        dtype = self._get_read_dtype()
+        bytes_per_sample = int32(0)
+        def read_into(data, samples_per_channel):
+            return self._read_digital_lines(data, samples_per_channel, timeout, fill_mode,
+                                            bytes_per_sample)
+        data = self._read_array(read_into, samples_per_channel, fill_mode, out, [dtype], dtype)
+        return data, bytes_per_sample.value
 
-        if samples_per_channel in [None,-1]:
-            samples_per_channel = self.get_samples_per_channel_available()
+    def read_into(self, data, samples_per_channel=None, timeout=10.0,
+                  fill_mode='group_by_scan_number'):
+        """
+        Reads multiple samples from each digital line in a task into
+        a caller supplied array. No memory is allocated for the
+        samples, so this is the method to use in acquisition loops
+        that read blocks repeatedly.
 
-        if self.one_channel_for_all_lines:
-            nof_lines = []
-            for channel in self.get_names_of_channels():
-                nof_lines.append(self.get_number_of_lines (channel))
-            c = int (max (nof_lines))
-            dtype = getattr(np, 'uint%s'%(8 * c))
-        else:
-            c = 1
-            dtype = np.uint8 # pylint: disable=no-member
-        number_of_channels = self.get_number_of_channels()
-        # pylint: disable=no-member
-        if fill_mode=='group_by_scan_number':
-            data = np.zeros((samples_per_channel, number_of_channels),dtype=dtype)
+        Parameters
+        ----------
+
+        data : numpy.ndarray
+
+          A C-contiguous, writeable array with shape ``(samples,
+          channels)`` for 'group_by_scan_number' or ``(channels,
+          samples)`` for 'group_by_channel', or a 1-d array holding
+          the same number of elements. The dtype must be uint8 for
+          'per_line' channels and the type `read` returns for
+          'for_all_lines' channels. Samples are stored from the
+          beginning of the array.
+
+        samples_per_channel : {int, None}
+
+          The number of samples, per channel, to read. If None then
+          as many samples as fit into `data` are read. A value of -1
+          (DAQmx_Val_Auto) reads all available samples that fit into
+          `data`. For 2-d arrays in 'group_by_channel' mode only the
+          full array can be read.
+
+        timeout, fill_mode :
+
+          See `read` documentation.
+
+        Returns
+        -------
+
+          samples_read : int
+
+            The actual number of samples read from each channel.
+
+        See also
+        --------
+        read
+        """
+        dtype = self._get_read_dtype()
+        size = self._check_read_array(data, [dtype], self._get_cached_number_of_channels(), fill_mode)
+        samples_per_channel, size = self._get_read_size(data, size, samples_per_channel, fill_mode)
+        return self._read_digital_lines(data, samples_per_channel, timeout, fill_mode, int32(0), size)
+
+    def _new_read_block(self, samples_per_channel, fill_mode, dtype=None):
+        number_of_channels = self._get_cached_number_of_channels()
+        if fill_mode == 'group_by_scan_number':
+            shape = (samples_per_channel, number_of_channels)
         else:
-            data = np.zeros((number_of_channels, samples_per_channel),dtype=dtype)
-        # pylint: enable=no-member
-        
+            shape = (number_of_channels, samples_per_channel)
+        return np.zeros(shape, dtype=self._check_block_dtype(dtype, self._get_read_dtype()))
+
+    def _read_digital_lines(self, data, samples_per_channel, timeout, fill_mode,
+                            bytes_per_sample, size=None):
+        """
+        Calls DAQmxReadDigitalLines with an already validated array.
+        """
+        fill_mode_map = dict(group_by_channel = DAQmx.Val_GroupByChannel,
+                             group_by_scan_number = DAQmx.Val_GroupByScanNumber)
+        fill_mode_val = self._get_map_value('fill_mode', fill_mode_map, fill_mode)
+        if size is None:
+            size = samples_per_channel
+        number_of_channels = self._get_cached_number_of_channels()
         samples_read = int32(0)
-        bytes_per_sample = int32(0)
 
         CALL ('ReadDigitalLines', self, samples_per_channel, float64 (timeout),
-              fill_mode_val, data.ctypes.data, uInt32 (data.size * c), 
+              fill_mode_val, data.ctypes.data,
+              uInt32 (size * number_of_channels * data.itemsize),
               ctypes.byref (samples_read), ctypes.byref (bytes_per_sample),
               None
               )
-        if samples_read.value < samples_per_channel:
-            if fill_mode=='group_by_scan_number':
-                return data[:samples_read.value], bytes_per_sample.value
+        return samples_read.value
+
+    def _get_read_dtype(self):
+        """
+        Returns the array type used for reading the lines of the task.
+        Each line gets one byte per sample.
+        """
+        cache = self._get_channel_cache()
+        dtype = cache.get('read_dtype')
+        if dtype is None:
+            if self.one_channel_for_all_lines:
+                c = int (max (self._get_cached_number_of_lines()))
+                if c not in (1, 2, 4, 8):
+                    raise ValueError('No integer type holds the %s lines of a channel'
+                                     ' at one byte per line, use read_port instead' % (c))
+                dtype = getattr(np, 'uint%s'%(8 * c))
             else:
-                return data[:,:samples_read.value], bytes_per_sample.value
-        return data, bytes_per_sample.value
+                dtype = np.uint8 # pylint: disable=no-member
+            cache['read_dtype'] = dtype
+        return dtype
+
+    def _get_cached_number_of_lines(self):
+        """
+        Returns the number of lines in each channel of the task, see
+        `get_number_of_lines`.
+        """
+        cache = self._get_channel_cache()
+        nof_lines = cache.get('number_of_lines')
+        if nof_lines is None:
+            nof_lines = cache['number_of_lines'] = [self.get_number_of_lines(channel)
+                                                    for channel in self._get_cached_names_of_channels()]
+        return nof_lines
+
+    def get_port_width(self, channel_name):
+        """
+        Indicates in bits the width of the digital port of the
+        channel, or of its widest port for channels on several ports.
+
+        See also
+        --------
+        read_port
+        """
+        widths = []
+        for name in self.get_physical_channel_name(channel_name).split(','):
+            m = re.match(r'/?(.+?/port)(\d+)(?::(\d+))?', name.strip())
+            if m is None:
+                raise ValueError('Expected a port or line name but got %r' % (name))
+            first = int(m.group(2))
+            last = int(m.group(3) or first)
+            for port in range(min(first, last), max(first, last) + 1):
+                d = uInt32(0)
+                CALL('GetPhysicalChan%sPortWidth' % (self.channel_type),
+                     '%s%d' % (m.group(1), port), ctypes.byref(d))
+                widths.append(d.value)
+        return max(widths)
+
+    def _get_port_dtype(self):
+        """
+        Returns the dtype of `read_port` arrays, the unsigned integer
+        type of the widest port of the task.
+        """
+        cache = self._get_channel_cache()
+        dtype = cache.get('port_dtype')
+        if dtype is None:
+            from .digital import get_port_dtype
+            dtype = cache['port_dtype'] = get_port_dtype(
+                max(self.get_port_width(name) for name in self._get_cached_names_of_channels()))
+        return dtype
+
+    def read_port(self, samples_per_channel=None, timeout=10.0,
+                  fill_mode='group_by_scan_number', out=None):
+        """
+        Reads multiple samples from each channel of a task as packed
+        port values, one unsigned integer per channel and sample with
+        line ``L`` of the port in bit ``L``. Lines that are not in a
+        channel read as 0.
+
+        The samples are read with DAQmxReadDigitalU8, U16 or U32,
+        chosen from the width of the widest port of the task, and take
+        one, two or four bytes, whereas `read` takes one byte per
+        line. Use `nidaqmx.digital.unpack_lines` to extract lines.
+        Create channels with 'for_all_lines' grouping so that a
+        channel holds all lines of its port.
+
+        Parameters
+        ----------
+
+        samples_per_channel, timeout, fill_mode :
+          See `read` documentation.
+
+        out : {numpy.ndarray, None}
+          A C-contiguous uint8, uint16 or uint32 array to read
+          samples into instead of allocating a new one, see
+          `read_port_into`.
+
+        Returns
+        -------
+
+        data : numpy.ndarray
+          The array of packed samples, organized according to
+          `fill_mode`. When `out` is given, a view of `out`.
+
+        See also
+        --------
+        read_port_into, get_port_width
+        """
+        def read_into(data, samples_per_channel):
+            return self.read_port_into(data, samples_per_channel, timeout, fill_mode)
+        return self._read_array(read_into, samples_per_channel, fill_mode, out,
+                                [np.uint8, np.uint16, np.uint32], # pylint: disable=no-member
+                                self._get_port_dtype())
+
+    def read_port_into(self, data, samples_per_channel=None, timeout=10.0,
+                       fill_mode='group_by_scan_number'):
+        """
+        Reads multiple samples from each channel of a task as packed
+        port values into a caller supplied uint8, uint16 or uint32
+        array, see `read_into` and `read_port`. The dtype of `data`
+        selects DAQmxReadDigitalU8, U16 or U32 and must hold the
+        ports of the task.
+
+        Returns
+        -------
+
+          samples_read : int
+
+            The actual number of samples read from each channel.
+
+        See also
+        --------
+        read_port
+        """
+        fill_mode_map = dict(group_by_channel = DAQmx.Val_GroupByChannel,
+                             group_by_scan_number = DAQmx.Val_GroupByScanNumber)
+        fill_mode_val = self._get_map_value('fill_mode', fill_mode_map, fill_mode)
+        number_of_channels = self._get_cached_number_of_channels()
+        size = self._check_read_array(data, [np.uint8, np.uint16, np.uint32], # pylint: disable=no-member
+                                      number_of_channels, fill_mode)
+        samples_per_channel, size = self._get_read_size(data, size, samples_per_channel, fill_mode)
+
+        samples_read = int32(0)
+        CALL('ReadDigitalU%d' % (8 * data.itemsize), self, samples_per_channel,
+             float64(timeout), fill_mode_val, data.ctypes.data,
+             uInt32(size * number_of_channels), ctypes.byref(samples_read), None)
+        return samples_read.value
 
 class DigitalInputTask(DigitalTask):
 
@@ -3493,6 +4522,7 @@ class DigitalInputTask(DigitalTask):
                             for_all_lines = DAQmx.Val_ChanForAllLines)
         grouping_val = self._get_map_value('grouping', grouping_map, grouping)
         self.one_channel_for_all_lines =  grouping_val==DAQmx.Val_ChanForAllLines
+        self._invalidate_channel_cache()
         return CALL('CreateDIChan', self, lines, name, grouping_val)==0
 
 class DigitalOutputTask(DigitalTask):
@@ -3555,6 +4585,7 @@ class DigitalOutputTask(DigitalTask):
                             for_all_lines = DAQmx.Val_ChanForAllLines)
         grouping_val = self._get_map_value('grouping', grouping_map, grouping)
         self.one_channel_for_all_lines =  grouping_val==DAQmx.Val_ChanForAllLines
+        self._invalidate_channel_cache()
         return CALL('CreateDOChan', self, lines, name, grouping_val)==0
 
     def write(self, data, 
@@ -3614,7 +4645,7 @@ class DigitalOutputTask(DigitalTask):
         layout_val = self._get_map_value('layout', layout_map, layout)
         samples_written = int32(0)
 
-        number_of_channels = self.get_number_of_channels()
+        number_of_channels = self._get_cached_number_of_channels()
 
         # pylint: disable=no-member
         if np.isscalar(data):
@@ -3632,6 +4663,69 @@ class DigitalOutputTask(DigitalTask):
 
         return samples_written.value
 
+    def write_port(self, data, auto_start=True, timeout=10.0,
+                   layout='group_by_channel'):
+        """
+        Writes multiple packed port samples to each channel in a
+        task, one unsigned integer per channel and sample with line
+        ``L`` of the port in bit ``L``. Bits of lines that are not in
+        a channel are ignored.
+
+        The samples are written with DAQmxWriteDigitalU8, U16 or U32
+        according to the dtype of `data`, or with
+        DAQmxWriteDigitalScalarU32 for a scalar and a single channel.
+        Use `nidaqmx.digital.pack_lines` to convert line patterns to
+        port samples.
+
+        Parameters
+        ----------
+
+        data : {int, array}
+          The samples to write to the task. Arrays that are not of
+          dtype uint8, uint16 or uint32 are converted to the dtype of
+          the widest port of the task.
+
+        auto_start, timeout, layout :
+          See `write` documentation.
+
+        Returns
+        -------
+
+          samples_written : int
+
+        See also
+        --------
+        write, get_port_width
+        """
+        layout_map = dict(group_by_channel = DAQmx.Val_GroupByChannel,
+                          group_by_scan_number = DAQmx.Val_GroupByScanNumber)
+        layout_val = self._get_map_value('layout', layout_map, layout)
+        samples_written = int32(0)
+
+        number_of_channels = self._get_cached_number_of_channels()
+
+        # pylint: disable=no-member
+        if np.isscalar(data):
+            if number_of_channels == 1:
+                CALL('WriteDigitalScalarU32', self, bool32(auto_start), float64(timeout),
+                     uInt32(data), None)
+                return 1
+            data = np.array([data]*number_of_channels, dtype=self._get_port_dtype())
+        else:
+            data = np.asarray(data)
+            if data.dtype not in (np.uint8, np.uint16, np.uint32):
+                data = data.astype(self._get_port_dtype())
+            data = np.ascontiguousarray(data)
+        # pylint: enable=no-member
+
+        data, samples_per_channel = self._reshape_data(data, layout)
+
+        CALL('WriteDigitalU%d' % (8 * data.itemsize), self, samples_per_channel,
+             bool32(auto_start), float64(timeout), layout_val,
+             data.ctypes.data, ctypes.byref(samples_written), None)
+
+        return samples_written.value
+
     def set_drive_type(self, drive_type, channel=None):
         """Sets the drive type of the channel.
 
@@ -3664,8 +4758,6 @@ class DigitalOutputTask(DigitalTask):
                 "output_drive", output_drive_mapping, drive_type)
             CALL("SetDOOutputDriveType", self, channel, drive_type)
 
-    # NotImplemented: WriteDigitalU8, WriteDigitalU16, WriteDigitalU32, WriteDigitalScalarU32
-
 class CounterInputTask(Task):
 
     """Exposes NI-DAQmx counter input task to Python.
@@ -3747,6 +4839,7 @@ class CounterInputTask(Task):
         edge_val = self._get_map_value ('edge', edge_map, edge)
         direction_val = self._get_map_value ('direction', direction_map, direction)
         init = uInt32(init)
+        self._invalidate_channel_cache()
         return CALL ('CreateCICountEdgesChan', self, counter, name, edge_val, init, direction_val)==0
 
     def create_channel_linear_encoder(
@@ -3867,6 +4960,7 @@ class CounterInputTask(Task):
         if units_val != DAQmx.Val_FromCustomScale:
             customScaleName = None
 
+        self._invalidate_channel_cache()
         return CALL(
                 'CreateCILinEncoderChan',
                 self,
@@ -3883,7 +4977,7 @@ class CounterInputTask(Task):
                 )==0
 
     def create_channel_freq(self, counter, name="", min_val=1e2, max_val=1e3,
-                            units="hertz", edge="rising", meas_method="low_freq1",
+                            units="hertz", edge="rising", meas_method="low_freq",
                             meas_time=1.0, divisor=1, custom_scale_name=None):
         """
         Creates a channel to measure the frequency of a digital signal
@@ -3995,14 +5089,15 @@ class CounterInputTask(Task):
         meas_meth_val = self._get_map_value('meas_method', meas_meth_map,
                                             meas_method)
         meas_time = float64(meas_time)
-        divisor = uInt32(divisor)
         assert divisor > 0
+        divisor = uInt32(divisor)
         if (units_val == DAQmx.Val_FromCustomScale
             and custom_scale_name is None):
             raise ValueError('Must specify custom_scale_name for custom scale.')
         if custom_scale_name is not None:
             custom_scale_name = str(custom_scale_name)
         
+        self._invalidate_channel_cache()
         return CALL('CreateCIFreqChan', self, counter, name,
                     min_val, max_val,
                     units_val, edge_val, meas_meth_val,
@@ -4113,12 +5208,41 @@ class CounterInputTask(Task):
         """
         return CALL('ResetCICtrTimebaseRate', self, channel)==0
 
+    # Measurement types whose samples are counts rather than scaled
+    # values. Samples of other types are read as float64.
+    _count_measurement_types = ('CountEdges', 'Position_LinEncoder', 'Position_AngEncoder')
 
-    def read(self, samples_per_channel=None, timeout=10.0):
+    def _reads_counts(self):
+        """
+        Returns True when the measurement type of the channel of the
+        task has integer counts for samples, see `read`.
         """
-        Reads multiple 32-bit integer samples from a counter task.
-        Use this function when counter samples are returned unscaled,
-        such as for edge counting.
+        cache = self._get_channel_cache()
+        counts = cache.get('reads_counts')
+        if counts is None:
+            d = int32(0)
+            CALL('GetCIMeasType', self,
+                 self._encode_name(self._get_cached_names_of_channels()[0]), ctypes.byref(d))
+            counts = cache['reads_counts'] = d.value in [
+                getattr(DAQmx, 'Val_' + name) for name in self._count_measurement_types]
+        return counts
+
+    def _get_read_dtype(self):
+        if self._reads_counts():
+            return np.dtype(np.int32)
+        return np.dtype(np.float64)
+
+    def read(self, samples_per_channel=None, timeout=10.0, out=None, dtype=None):
+        """
+        Reads multiple samples from a counter task.
+
+        The dtype of the samples is chosen from the measurement type
+        of the channel: edge counting and encoder channels return
+        unscaled int32 counts, read with DAQmxReadCounterU32, whereas
+        frequency, period, pulse width and the other measurements
+        return float64 values in the units of the channel, read with
+        DAQmxReadCounterF64. One call reads all samples, so use this
+        instead of `read_scalar` for buffered measurements.
 
         Parameters
         ----------
@@ -4157,24 +5281,93 @@ class CounterInputTask(Task):
           is successful. Otherwise, the function returns a timeout
           error and returns the samples that were actually read.
 
+        out : {numpy.ndarray, None}
+          A C-contiguous int32, uint32 or float64 array to read
+          samples into instead of allocating a new one, see
+          `read_into`. If `samples_per_channel` is None then at most
+          as many samples as fit into `out` are read.
+
+        dtype : {None, numpy.int32, numpy.uint32, numpy.float64}
+          The dtype of the new array when `out` is None. By default
+          it is chosen from the measurement type.
+
         Returns
         -------
-        
+
         data :
-          The array to read samples into, organized according to `fill_mode`.
+          The array to read samples into. When `out` is given, a view
+          of `out`.
+
+        See also
+        --------
+        read_into
         """
+        def read_into(data, samples_per_channel):
+            return self.read_into(data, samples_per_channel, timeout)
+        return self._read_array(read_into, samples_per_channel, None, out, self._read_dtypes,
+                                self._check_read_dtype(dtype))
 
-        if samples_per_channel is None:
-            samples_per_channel = self.get_samples_per_channel_available()
+    def read_into(self, data, samples_per_channel=None, timeout=10.0):
+        """
+        Reads multiple samples from a counter task into a caller
+        supplied array. No memory is allocated for the samples, so
+        this is the method to use in acquisition loops that read
+        blocks repeatedly.
 
-        data = np.zeros((samples_per_channel,),dtype=np.int32) # pylint: disable=no-member
+        Parameters
+        ----------
+
+        data : numpy.ndarray
+          A C-contiguous, writeable int32 or uint32 array, read with
+          DAQmxReadCounterU32, or float64 array, read with
+          DAQmxReadCounterF64. Samples are stored from the beginning
+          of the array.
+
+        samples_per_channel : {int, None}
+          The number of samples to read. If None then as many samples
+          as fit into `data` are read. A value of -1 (DAQmx.Val_Auto)
+          reads all available samples that fit into `data`.
+
+        timeout :
+          See `read` documentation.
+
+        Returns
+        -------
+
+        samples_read : int
+          The actual number of samples read.
+
+        See also
+        --------
+        read
+        """
+        size = self._check_read_array(data, self._read_dtypes, 1, 'group_by_scan_number')
+        samples_per_channel, size = self._get_read_size(data, size, samples_per_channel,
+                                                        'group_by_scan_number')
         samples_read = int32(0)
 
-        
-        CALL('ReadCounterU32', self, samples_per_channel, float64(timeout),
-             data.ctypes.data, data.size, ctypes.byref(samples_read), None)
-        
-        return data[:samples_read.value]
+        CALL('ReadCounterF64' if data.dtype == np.float64 else 'ReadCounterU32', self,
+             samples_per_channel, float64(timeout), data.ctypes.data, uInt32(size),
+             ctypes.byref(samples_read), None)
+
+        return samples_read.value
+
+    _read_dtypes = (np.dtype(np.int32), np.dtype(np.uint32), np.dtype(np.float64))
+
+    def _check_read_dtype(self, dtype):
+        if dtype is None:
+            return self._get_read_dtype()
+        dtype = np.dtype(dtype)
+        if dtype not in self._read_dtypes:
+            raise TypeError('Expected dtype %s but got %s'
+                            % ('|'.join(str(t) for t in self._read_dtypes), dtype))
+        return dtype
+
+    def _new_read_block(self, samples_per_channel, fill_mode, dtype=None):
+        return np.zeros(samples_per_channel, dtype=self._check_read_dtype(dtype))
+
+    def _read_block(self, data, samples_per_channel, timeout, fill_mode):
+        return self.read_into(data, samples_per_channel, timeout)
 
     def read_scalar(self, timeout=10.0):
         """
@@ -4284,6 +5477,7 @@ class CounterOutputTask(Task):
         idle_state_map = dict (low=DAQmx.Val_Low, high=DAQmx.Val_High)
         units_val = self._get_map_value('units', units_map, units)
         idle_state_val = self._get_map_value('idle_state', idle_state_map, idle_state)
+        self._invalidate_channel_cache()
         return CALL('CreateCOPulseChanFreq', self, counter, name, units_val, idle_state_val,
                     float64(delay), float64(freq), float64(duty_cycle))==0
 
@@ -4352,6 +5546,7 @@ class CounterOutputTask(Task):
         name = str(name)
         idle_state_map = dict (low=DAQmx.Val_Low, high=DAQmx.Val_High)
         idle_state_val = self._get_map_value('idle_state', idle_state_map, idle_state)
+        self._invalidate_channel_cache()
         return CALL('CreateCOPulseChanTicks', self, counter, name, source, idle_state_val,
                     int32 (delay), int32 (low_ticks), int32 (high_ticks))==0
 
@@ -4421,6 +5616,7 @@ class CounterOutputTask(Task):
         idle_state_map = dict (low=DAQmx.Val_Low, high=DAQmx.Val_High)
         units_val = self._get_map_value('units', units_map, units)
         idle_state_val = self._get_map_value('idle_state', idle_state_map, idle_state)
+        self._invalidate_channel_cache()
         return CALL('CreateCOPulseChanTime', self, counter, name, units_val, idle_state_val,
                     float64 (delay), float64(low_time), float64(high_time))==0
 
@@ -4501,9 +5697,9 @@ class CounterOutputTask(Task):
 
         assert len(high_ticks) == len(low_ticks)
 
-        low_ticks = np.asarray(low_ticks, dtype = uInt32)
+        low_ticks = np.ascontiguousarray(low_ticks, dtype = uInt32)
         low_ticks, samples_per_channel = self._reshape_data(low_ticks, layout)
-        high_ticks = np.asarray(high_ticks, dtype = uInt32)
+        high_ticks = np.ascontiguousarray(high_ticks, dtype = uInt32)
         high_ticks, samples_per_channel = self._reshape_data(high_ticks, layout)
 
         CALL('WriteCtrTicks', self, samples_per_channel,
@@ -4513,29 +5709,140 @@ class CounterOutputTask(Task):
 
         return samples_written.value
 
+    def get_timebase_rate(self, channel=None):
+        """
+        Returns the frequency of the counter timebase of `channel`,
+        by default of the first channel of the task.
+
+        See also
+        --------
+        write_pulses
+        """
+        if channel is None:
+            channel = self._get_cached_names_of_channels()[0]
+        data = float64(0)
+        CALL('GetCOCtrTimebaseRate', self, self._encode_name(channel), ctypes.byref(data))
+        return data.value
+
+    def write_pulses(self, frequency, duty_cycle=0.5, auto_start=False, timeout=10.0,
+                     max_error=None):
+        """
+        Writes pulses given by their frequencies and duty cycles to a
+        continuous counter output task with one channel, see
+        `write_ticks`.
+
+        The pulses are converted to ticks of the counter timebase with
+        `nidaqmx.counter.compile_pulses`.
+
+        Parameters
+        ----------
+
+        frequency, duty_cycle : {float, array_like}
+          The frequencies, in Hz, and duty cycles of the pulses.
+
+        auto_start, timeout :
+          See `write_ticks` documentation.
+
+        max_error : {float, None}
+          The largest allowed quantization error, see
+          `nidaqmx.counter.compile_pulses`.
+
+        Returns
+        -------
+
+        samples_written : int
+          The number of pulses written.
+
+        See also
+        --------
+        stream_pulses
+        """
+        from .counter import compile_pulses
+        high_ticks, low_ticks = compile_pulses(frequency, duty_cycle, self.get_timebase_rate(),
+                                               max_error=max_error)
+        return self.write_ticks(high_ticks.ravel(), low_ticks.ravel(), auto_start, timeout)
+
+    def stream_pulses(self, source, samples_per_block, frequency=None, timeout=10.0,
+                      max_error=None, max_blocks=None):
+        """
+        Writes the pulses of a generator to a continuous counter output
+        task with one channel in blocks of `samples_per_block` pulses,
+        starting the task after the first block.
+
+        Pulses are compiled to ticks with
+        `nidaqmx.counter.iter_pulse_blocks`. Each block is written
+        with one `write_ticks` call, which waits for space in the
+        buffer, so the generation is paced by the counter. Configure
+        a buffer of a few blocks with `configure_timing_implicit`.
+
+        Parameters
+        ----------
+
+        source : iterable
+          Yields ``(frequency, duty_cycle)`` pairs of arrays, or duty
+          cycles when `frequency` is given.
+
+        samples_per_block : int
+          The number of pulses written at a time.
+
+        frequency : {float, None}
+          The frequency of all pulses in Hz.
+
+        timeout :
+          See `write_ticks` documentation.
+
+        max_error : {float, None}
+          See `write_pulses` documentation.
+
+        max_blocks : {int, None}
+          The number of blocks to write. If None then pulses are
+          written until `source` is exhausted.
+
+        Returns
+        -------
+
+        samples_written : int
+          The number of pulses written.
+
+        Examples
+        --------
+
+        ::
+
+          def setpoints():
+              while True:
+                  yield controller.next_duty_cycles(1000)
+
+          task.configure_timing_implicit(samples_per_channel=4000)
+          task.stream_pulses(setpoints(), 1000, frequency=20e3)
+        """
+        from .counter import iter_pulse_blocks
+        blocks = iter_pulse_blocks(source, samples_per_block, self.get_timebase_rate(),
+                                   frequency=frequency, max_error=max_error)
+        if max_blocks is not None:
+            blocks = itertools.islice(blocks, max_blocks)
+        samples_written = 0
+        for high_ticks, low_ticks in blocks:
+            samples_written += self.write_ticks(high_ticks, low_ticks, auto_start=True,
+                                                timeout=timeout)
+        return samples_written
+
 ########################################################################
 
-DoneEventCallback_map = dict(AI=ctypes.CFUNCTYPE (int32, AnalogInputTask, int32, void_p),
-                             AO=ctypes.CFUNCTYPE (int32, AnalogOutputTask, int32, void_p),
-                             DI=ctypes.CFUNCTYPE (int32, DigitalInputTask, int32, void_p),
-                             DO=ctypes.CFUNCTYPE (int32, DigitalOutputTask, int32, void_p),
-                             CI=ctypes.CFUNCTYPE (int32, CounterInputTask, int32, void_p),
-                             CO=ctypes.CFUNCTYPE (int32, CounterOutputTask, int32, void_p),
-                             )
-EveryNSamplesEventCallback_map = dict(AI=ctypes.CFUNCTYPE (int32, AnalogInputTask, int32, uInt32, void_p),
-                                      AO=ctypes.CFUNCTYPE (int32, AnalogOutputTask, int32, uInt32, void_p),
-                                      DI=ctypes.CFUNCTYPE (int32, DigitalInputTask, int32, uInt32, void_p),
-                                      DO=ctypes.CFUNCTYPE (int32, DigitalOutputTask, int32, uInt32, void_p),
-                                      CI=ctypes.CFUNCTYPE (int32, CounterInputTask, int32, uInt32, void_p),
-                                      CO=ctypes.CFUNCTYPE (int32, CounterOutputTask, int32, uInt32, void_p),
-                                      )
-SignalEventCallback_map = dict(AI=ctypes.CFUNCTYPE (int32, AnalogInputTask, int32, void_p),
-                               AO=ctypes.CFUNCTYPE (int32, AnalogOutputTask, int32, void_p),
-                               DI=ctypes.CFUNCTYPE (int32, DigitalInputTask, int32, void_p),
-                               DO=ctypes.CFUNCTYPE (int32, DigitalOutputTask, int32, void_p),
-                               CI=ctypes.CFUNCTYPE (int32, CounterInputTask, int32, void_p),
-                               CO=ctypes.CFUNCTYPE (int32, CounterOutputTask, int32, void_p),
-                               )
+# Callbacks receive the task handle as an integer. Task classes
+# cannot be argument types: ctypes would call their constructor,
+# creating a new task, for every callback. `Task._make_callback`
+# passes the task instance instead.
+DoneEventCallback = ctypes.CFUNCTYPE(int32, void_p, int32, void_p)
+EveryNSamplesEventCallback = ctypes.CFUNCTYPE(int32, void_p, int32, uInt32, void_p)
+SignalEventCallback = ctypes.CFUNCTYPE(int32, void_p, int32, void_p)
+
+# Deprecated aliases of the callback types above by channel type.
+# Callbacks of these types now receive the task handle, not a task.
+_channel_types = ['AI', 'AO', 'DI', 'DO', 'CI', 'CO']
+DoneEventCallback_map = dict((t, DoneEventCallback) for t in _channel_types)
+EveryNSamplesEventCallback_map = dict((t, EveryNSamplesEventCallback) for t in _channel_types)
+SignalEventCallback_map = dict((t, SignalEventCallback) for t in _channel_types)
 
 ########################################################################
 
@@ -0,0 +1,395 @@
+"""
+Operating several tasks at once.
+
+`TaskGroup` runs the blocking NI-DAQmx calls of several tasks, such
+as reads from different devices, concurrently on a thread pool.
+ctypes releases the GIL during calls into the NI-DAQmx library, so
+the time of a round is that of the slowest task rather than the sum
+over tasks.
+
+`SynchronizedTasks` shares the sample clock or start trigger of one
+task with others, so that they acquire and generate in lockstep.
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+from timeit import default_timer
+
+import numpy as np
+
+__all__ = ['TaskGroup', 'SynchronizedTasks']
+
+class TaskGroup(object):
+    """
+    A group of tasks whose reads and state changes run concurrently,
+    one thread per task.
+
+    Parameters
+    ----------
+
+    tasks : {list, dict}
+      The tasks, or a dictionary of tasks by name. Tasks in a list
+      are named by their `name`. The order of the tasks is the order
+      of `names`.
+
+    max_workers : {int, None}
+      The number of threads, by default one per task.
+
+    Examples
+    --------
+
+    ::
+
+      with TaskGroup([task1, task2, task3]) as group:
+          group.alter_state('commit')
+          group.start()
+          while ...:
+              data, timing = group.read(1000)
+    """
+
+    def __init__(self, tasks, max_workers=None):
+        from multiprocessing.pool import ThreadPool
+        if isinstance(tasks, dict):
+            self.names = sorted(tasks)
+            self.tasks = [tasks[name] for name in self.names]
+        else:
+            self.tasks = list(tasks)
+            self.names = [task.name for task in self.tasks]
+        if len(set(self.names)) != len(self.names):
+            raise ValueError('Task names in a group must be unique: %s' % (self.names,))
+        self._pool = ThreadPool(max_workers or len(self.tasks))
+        # Blocks that stacked reads read into, by task, see `read`.
+        self._blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def __getitem__(self, name):
+        return self.tasks[self.names.index(name)]
+
+    def map(self, func, *args):
+        """
+        Calls ``func(task, *args)`` for all tasks concurrently.
+
+        Returns the list of results in the order of the tasks. When
+        calls raise, the exception of the first task that raised is
+        raised after all calls have returned.
+        """
+        return self._pool.map(lambda task: func(task, *args), self.tasks)
+
+    def _call_timed(self, func, *args):
+        def call(task):
+            start = default_timer()
+            result = func(task, *args)
+            return result, default_timer() - start
+        results = self._pool.map(call, self.tasks)
+        return [r for r, t in results], dict(zip(self.names, [t for r, t in results]))
+
+    def start(self):
+        """
+        Starts all tasks concurrently.
+
+        Returns
+        -------
+
+        timing : dict
+          The time, in seconds, each task took to start.
+        """
+        return self._call_timed(lambda task: task.start())[1]
+
+    def stop(self):
+        """
+        Stops all tasks concurrently, see `start`.
+        """
+        return self._call_timed(lambda task: task.stop())[1]
+
+    def alter_state(self, state):
+        """
+        Alters the state of all tasks concurrently, see
+        `Task.alter_state` and `start`. Committing a group before
+        starting it minimizes the time of `start`.
+        """
+        return self._call_timed(lambda task: task.alter_state(state))[1]
+
+    def read(self, samples_per_channel, timeout=10.0, fill_mode='group_by_scan_number',
+             stack=False, out=None):
+        """
+        Reads ``samples_per_channel`` samples from every task, reading
+        the tasks concurrently.
+
+        Parameters
+        ----------
+
+        samples_per_channel : int
+          The number of samples, per channel, to read from each task.
+
+        timeout, fill_mode :
+          See `AnalogInputTask.read`. Counter input tasks ignore
+          `fill_mode`.
+
+        stack : bool
+          If True then the channels of all tasks are returned in one
+          array instead of a dictionary.
+
+        out : {dict, numpy.ndarray, None}
+          Where to store the samples instead of in new arrays. If
+          `stack` is False, a dictionary of arrays by task name, each
+          with the shape and dtype of the array that is returned for
+          the task, see `Task.read_into`. If `stack` is True, an array
+          with the shape of the stacked array. Use this to read in a
+          loop without allocating arrays in every round.
+
+        Returns
+        -------
+
+        data : {dict, numpy.ndarray}
+          Arrays of samples by task name, or, if `stack` is True, an
+          array with shape ``(samples, channels)`` for
+          'group_by_scan_number' or ``(channels, samples)`` for
+          'group_by_channel' holding the channels of the tasks in
+          order. All tasks must have samples of the same type and
+          must read the same number of samples to be stacked. When
+          `out` is given, views of `out` or `out` itself.
+
+        timing : dict
+          The time, in seconds, of the read of each task.
+        """
+        if stack:
+            # The blocks are copied into the stacked array, so they
+            # are allocated once and reused in later rounds.
+            blocks = [self._get_block(task, samples_per_channel, fill_mode)
+                      for task in self.tasks]
+        elif out is not None:
+            blocks = [out[name] for name in self.names]
+        else:
+            blocks = [task._new_read_block(samples_per_channel, fill_mode)
+                      for task in self.tasks]
+        targets = dict(zip(map(id, self.tasks), blocks))
+        def read(task):
+            data = targets[id(task)]
+            samples_read = task._read_block(data, samples_per_channel, timeout, fill_mode)
+            if data.ndim == 1 or fill_mode == 'group_by_scan_number':
+                return data[:samples_read]
+            return data[:, :samples_read]
+        blocks, timing = self._call_timed(read)
+        if not stack:
+            return dict(zip(self.names, blocks)), timing
+        if fill_mode == 'group_by_scan_number':
+            blocks = [b.reshape(-1, 1) if b.ndim == 1 else b for b in blocks]
+            return np.concatenate(blocks, axis=1, out=out), timing
+        blocks = [b.reshape(1, -1) if b.ndim == 1 else b for b in blocks]
+        return np.concatenate(blocks, axis=0, out=out), timing
+
+    def _get_block(self, task, samples_per_channel, fill_mode):
+        """
+        Returns the block of ``task`` for stacked reads, allocating
+        it when the size or fill mode changed since the last read.
+        """
+        key = (samples_per_channel, fill_mode)
+        cached = self._blocks.get(id(task))
+        if cached is None or cached[0] != key:
+            cached = self._blocks[id(task)] = (key, task._new_read_block(samples_per_channel,
+                                                                         fill_mode))
+        return cached[1]
+
+    def close(self):
+        """
+        Shuts down the threads. Tasks are not stopped or cleared.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self._blocks = {}
+
+class SynchronizedTasks(object):
+    """
+    Tasks that start together on the sample clock or start trigger
+    of a master task.
+
+    The slave tasks are configured to take the sample clock, or to
+    trigger on the start trigger, of the master task, as done by
+    hand in ``examples/contrib/simultan_ai_ao.py``. All tasks are
+    committed ahead of the first start, so that starting is fast and
+    takes the same time in repeated trials, and `start` starts the
+    slaves before the master so that no slave misses the first clock
+    edge.
+
+    Parameters
+    ----------
+
+    master : {AnalogInputTask, AnalogOutputTask, DigitalInputTask, DigitalOutputTask}
+      The task whose sample clock or start trigger is shared, with
+      channels created.
+
+    slaves : list
+      Tasks with channels created. Write the data of output tasks,
+      with ``auto_start=False``, before calling `start`.
+
+    Examples
+    --------
+
+    ::
+
+      sync = SynchronizedTasks(ai_task, [ao_task])
+      sync.configure_timing_sample_clock(rate=10000.0, sample_mode='finite',
+                                         samples_per_channel=1000)
+      ao_task.write(data, auto_start=False)
+      skew = sync.start()
+      sync.wait_until_done(10.0)
+      sync.stop()
+      sync.close()
+    """
+
+    terminal_prefixes = dict(AI='ai', AO='ao', DI='di', DO='do')
+
+    def __init__(self, master, slaves):
+        if master.channel_type not in self.terminal_prefixes:
+            raise ValueError('%s cannot be a master task, use one of %s tasks'
+                             % (master, ', '.join(sorted(self.terminal_prefixes))))
+        self.master = master
+        self.slaves = list(slaves)
+        self.tasks = [master] + self.slaves
+        self.committed = False
+        self.start_duration = None
+        # The TaskGroup that commits the tasks, see `commit`.
+        self._group = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_terminal(self, signal):
+        """
+        Returns the name of the ``signal`` terminal of the master,
+        for example ``'/Dev1/ai/SampleClock'`` for 'SampleClock'.
+        """
+        device = self.master.get_devices()[0]
+        return '/%s/%s/%s' % (device, self.terminal_prefixes[self.master.channel_type], signal)
+
+    def configure_timing_sample_clock(self, rate, sample_mode='continuous',
+                                      samples_per_channel=1000, share='sample_clock'):
+        """
+        Configures the sample clock timing of all tasks.
+
+        Parameters
+        ----------
+
+        rate, sample_mode, samples_per_channel :
+          See `Task.configure_timing_sample_clock`. The same values
+          are used for all tasks.
+
+        share : {'sample_clock', 'start_trigger'}
+          'sample_clock' - The slaves sample on the sample clock of
+          the master, so that samples of all tasks are taken at the
+          same instants.
+
+          'start_trigger' - The slaves use their own sample clocks
+          and start on the start trigger of the master, for tasks on
+          devices that cannot share the sample clock or that sample
+          at other rates.
+        """
+        if share not in ('sample_clock', 'start_trigger'):
+            raise ValueError('share must be sample_clock or start_trigger, got %r' % (share,))
+        self.committed = False
+        self.master.configure_timing_sample_clock(rate=rate, sample_mode=sample_mode,
+                                                  samples_per_channel=samples_per_channel)
+        for task in self.slaves:
+            if share == 'sample_clock':
+                task.configure_timing_sample_clock(
+                    source=self.get_terminal('SampleClock'), rate=rate,
+                    sample_mode=sample_mode, samples_per_channel=samples_per_channel)
+            else:
+                task.configure_timing_sample_clock(rate=rate, sample_mode=sample_mode,
+                                                   samples_per_channel=samples_per_channel)
+                task.configure_trigger_digital_edge_start(self.get_terminal('StartTrigger'))
+
+    def commit(self):
+        """
+        Commits all tasks concurrently. `start` commits the tasks
+        when they are not committed. A stopped task returns to the
+        committed state, so tasks are committed once for repeated
+        trials.
+
+        Returns
+        -------
+
+        timing : dict
+          The time, in seconds, each task took to commit, see
+          `TaskGroup.alter_state`.
+        """
+        if self._group is None:
+            self._group = TaskGroup(self.tasks)
+        timing = self._group.alter_state('commit')
+        self.committed = True
+        return timing
+
+    def _get_samples(self, task):
+        if task.channel_io_type == 'input':
+            return task.get_samples_per_channel_acquired()
+        return task.get_samples_per_channel_generated()
+
+    def start(self):
+        """
+        Starts the slaves and then the master.
+
+        Returns
+        -------
+
+        skew : dict
+          The number of samples each slave acquired or generated
+          ahead of the master, by task name, measured right after the
+          start. The samples of the master are sampled before and
+          after those of the slaves and averaged. With a shared sample
+          clock, a nonzero skew means that a slave missed clock edges.
+          The time the starts took, in seconds, is stored in
+          `start_duration`.
+        """
+        if not self.committed:
+            self.commit()
+        start = default_timer()
+        for task in self.slaves:
+            task.start()
+        self.master.start()
+        self.start_duration = default_timer() - start
+        before = self._get_samples(self.master)
+        samples = [self._get_samples(task) for task in self.slaves]
+        after = self._get_samples(self.master)
+        master_samples = (before + after) / 2
+        return dict((task.name, n - master_samples) for task, n in zip(self.slaves, samples))
+
+    def wait_until_done(self, timeout=-1):
+        """
+        Waits for all tasks to complete, see `Task.wait_until_done`.
+        ``timeout`` is the time to wait for all tasks together, -1 to
+        wait indefinitely.
+        """
+        deadline = None if timeout < 0 else default_timer() + timeout
+        for task in self.tasks:
+            if deadline is not None:
+                timeout = max(0.0, deadline - default_timer())
+            task.wait_until_done(timeout)
+
+    def stop(self):
+        """
+        Stops the master, and thereby its clock, and then the slaves.
+        """
+        for task in self.tasks:
+            task.stop()
+
+    def close(self):
+        """
+        Shuts down the threads that commit the tasks. Tasks are not
+        stopped or cleared.
+        """
+        if self._group is not None:
+            self._group.close()
+            self._group = None
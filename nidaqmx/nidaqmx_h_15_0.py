@@ -1,3380 +0,0 @@
-# This file is auto-generated. Do not edit!
-
-from collections import namedtuple
-
-_d = {u'AIConv_ActiveEdge': 6227,
- u'AIConv_DigFltr_Enable': 11996,
- u'AIConv_DigFltr_MinPulseWidth': 11997,
- u'AIConv_DigFltr_TimebaseRate': 11999,
- u'AIConv_DigFltr_TimebaseSrc': 11998,
- u'AIConv_DigSync_Enable': 12000,
- u'AIConv_MaxRate': 8905,
- u'AIConv_Rate': 6216,
- u'AIConv_Src': 5378,
- u'AIConv_TimebaseDiv': 4917,
- u'AIConv_Timebase_Src': 4921,
- u'AI_ACExcit_Freq': 257,
- u'AI_ACExcit_SyncEnable': 258,
- u'AI_ACExcit_WireMode': 6349,
- u'AI_ADCCustomTimingMode': 12139,
- u'AI_ADCTimingMode': 10745,
- u'AI_Accel_Sensitivity': 1682,
- u'AI_Accel_SensitivityUnits': 8604,
- u'AI_Accel_Units': 1651,
- u'AI_Accel_dBRef': 10674,
- u'AI_Atten': 6145,
- u'AI_AutoZeroMode': 5984,
- u'AI_AveragingWinSize': 12270,
- u'AI_Bridge_Balance_CoarsePot': 6129,
- u'AI_Bridge_Balance_FinePot': 6388,
- u'AI_Bridge_Cfg': 135,
- u'AI_Bridge_ElectricalUnits': 12167,
- u'AI_Bridge_InitialRatio': 12166,
- u'AI_Bridge_InitialVoltage': 6125,
- u'AI_Bridge_NomResistance': 6124,
- u'AI_Bridge_PhysicalUnits': 12168,
- u'AI_Bridge_Poly_ForwardCoeff': 12176,
- u'AI_Bridge_Poly_ReverseCoeff': 12177,
- u'AI_Bridge_ScaleType': 12169,
- u'AI_Bridge_ShuntCal_Enable': 148,
- u'AI_Bridge_ShuntCal_GainAdjust': 6463,
- u'AI_Bridge_ShuntCal_Select': 8661,
- u'AI_Bridge_ShuntCal_ShuntCalAActualResistance': 12153,
- u'AI_Bridge_ShuntCal_ShuntCalAResistance': 12152,
- u'AI_Bridge_ShuntCal_ShuntCalASrc': 12490,
- u'AI_Bridge_ShuntCal_ShuntCalBActualResistance': 12155,
- u'AI_Bridge_ShuntCal_ShuntCalBResistance': 12154,
- u'AI_Bridge_Table_ElectricalVals': 12174,
- u'AI_Bridge_Table_PhysicalVals': 12175,
- u'AI_Bridge_TwoPointLin_First_ElectricalVal': 12170,
- u'AI_Bridge_TwoPointLin_First_PhysicalVal': 12171,
- u'AI_Bridge_TwoPointLin_Second_ElectricalVal': 12172,
- u'AI_Bridge_TwoPointLin_Second_PhysicalVal': 12173,
- u'AI_Bridge_Units': 12178,
- u'AI_ChanCal_ApplyCalIfExp': 8857,
- u'AI_ChanCal_Desc': 8868,
- u'AI_ChanCal_EnableCal': 8856,
- u'AI_ChanCal_HasValidCalInfo': 8855,
- u'AI_ChanCal_OperatorName': 8867,
- u'AI_ChanCal_Poly_ForwardCoeff': 8863,
- u'AI_ChanCal_Poly_ReverseCoeff': 8864,
- u'AI_ChanCal_ScaleType': 8860,
- u'AI_ChanCal_Table_PreScaledVals': 8861,
- u'AI_ChanCal_Table_ScaledVals': 8862,
- u'AI_ChanCal_Verif_AcqVals': 8866,
- u'AI_ChanCal_Verif_RefVals': 8865,
- u'AI_Coupling': 100,
- u'AI_CurrentShunt_Loc': 6130,
- u'AI_CurrentShunt_Resistance': 6131,
- u'AI_Current_ACRMS_Units': 6115,
- u'AI_Current_Units': 1793,
- u'AI_CustomScaleName': 6112,
- u'AI_DCOffset': 10889,
- u'AI_DataXferCustomThreshold': 8972,
- u'AI_DataXferMech': 6177,
- u'AI_DataXferReqCond': 6283,
- u'AI_DevScalingCoeff': 6448,
- u'AI_DigFltr_Bandpass_CenterFreq': 12483,
- u'AI_DigFltr_Bandpass_Width': 12484,
- u'AI_DigFltr_Coeff': 12487,
- u'AI_DigFltr_Enable': 12477,
- u'AI_DigFltr_Highpass_CutoffFreq': 12482,
- u'AI_DigFltr_Lowpass_CutoffFreq': 12481,
- u'AI_DigFltr_Notch_CenterFreq': 12485,
- u'AI_DigFltr_Notch_Width': 12486,
- u'AI_DigFltr_Order': 12480,
- u'AI_DigFltr_Response': 12479,
- u'AI_DigFltr_Type': 12478,
- u'AI_Dither_Enable': 104,
- u'AI_EddyCurrentProxProbe_Sensitivity': 10942,
- u'AI_EddyCurrentProxProbe_SensitivityUnits': 10943,
- u'AI_EddyCurrentProxProbe_Units': 10944,
- u'AI_EnhancedAliasRejectionEnable': 8852,
- u'AI_Excit_ActualVal': 6275,
- u'AI_Excit_DCorAC': 6139,
- u'AI_Excit_IdleOutputBehavior': 12472,
- u'AI_Excit_Src': 6132,
- u'AI_Excit_UseForScaling': 6140,
- u'AI_Excit_UseMultiplexed': 8576,
- u'AI_Excit_Val': 6133,
- u'AI_Excit_VoltageOrCurrent': 6134,
- u'AI_FilterDelay': 12269,
- u'AI_FilterDelayAdjustment': 12404,
- u'AI_FilterDelayUnits': 12401,
- u'AI_ForceReadFromChan': 6392,
- u'AI_Force_IEPESensor_Sensitivity': 12161,
- u'AI_Force_IEPESensor_SensitivityUnits': 12162,
- u'AI_Force_Units': 12149,
- u'AI_Freq_Hyst': 2068,
- u'AI_Freq_ThreshVoltage': 2069,
- u'AI_Freq_Units': 2054,
- u'AI_Gain': 6168,
- u'AI_Impedance': 98,
- u'AI_InputSrc': 8600,
- u'AI_Is_TEDS': 10627,
- u'AI_LVDT_Sensitivity': 2361,
- u'AI_LVDT_SensitivityUnits': 8602,
- u'AI_LVDT_Units': 2320,
- u'AI_LeadWireResistance': 6126,
- u'AI_LossyLSBRemoval_CompressedSampSize': 8921,
- u'AI_Lowpass_CutoffFreq': 6147,
- u'AI_Lowpass_Enable': 6146,
- u'AI_Lowpass_SwitchCap_ClkSrc': 6276,
- u'AI_Lowpass_SwitchCap_ExtClkDiv': 6278,
- u'AI_Lowpass_SwitchCap_ExtClkFreq': 6277,
- u'AI_Lowpass_SwitchCap_OutClkDiv': 6279,
- u'AI_Max': 6109,
- u'AI_MeasType': 1685,
- u'AI_MemMapEnable': 6284,
- u'AI_Microphone_Sensitivity': 5430,
- u'AI_Min': 6110,
- u'AI_OpenThrmcplDetectEnable': 12146,
- u'AI_Pressure_Units': 12150,
- u'AI_ProbeAtten': 10888,
- u'AI_RTD_A': 4112,
- u'AI_RTD_B': 4113,
- u'AI_RTD_C': 4115,
- u'AI_RTD_R0': 4144,
- u'AI_RTD_Type': 4146,
- u'AI_RVDT_Sensitivity': 2307,
- u'AI_RVDT_SensitivityUnits': 8603,
- u'AI_RVDT_Units': 2167,
- u'AI_RawDataCompressionType': 8920,
- u'AI_RawSampJustification': 80,
- u'AI_RawSampSize': 8922,
- u'AI_RemoveFilterDelay': 12221,
- u'AI_ResistanceCfg': 6273,
- u'AI_Resistance_Units': 2389,
- u'AI_Resolution': 5989,
- u'AI_ResolutionUnits': 5988,
- u'AI_Rng_High': 6165,
- u'AI_Rng_Low': 6166,
- u'AI_RosetteStrainGage_Orientation': 12284,
- u'AI_RosetteStrainGage_RosetteMeasType': 12285,
- u'AI_RosetteStrainGage_RosetteType': 12286,
- u'AI_RosetteStrainGage_StrainChans': 12283,
- u'AI_SampAndHold_Enable': 6170,
- u'AI_SoundPressure_MaxSoundPressureLvl': 8762,
- u'AI_SoundPressure_Units': 5416,
- u'AI_SoundPressure_dBRef': 10673,
- u'AI_StrainGage_Cfg': 2434,
- u'AI_StrainGage_ForceReadFromChan': 12282,
- u'AI_StrainGage_GageFactor': 2452,
- u'AI_StrainGage_PoissonRatio': 2456,
- u'AI_Strain_Units': 2433,
- u'AI_TEDS_Units': 8672,
- u'AI_Temp_Units': 4147,
- u'AI_TermCfg': 4247,
- u'AI_Thrmcpl_CJCChan': 4148,
- u'AI_Thrmcpl_CJCSrc': 4149,
- u'AI_Thrmcpl_CJCVal': 4150,
- u'AI_Thrmcpl_LeadOffsetVoltage': 12216,
- u'AI_Thrmcpl_ScaleType': 10704,
- u'AI_Thrmcpl_Type': 4176,
- u'AI_Thrmstr_A': 6345,
- u'AI_Thrmstr_B': 6347,
- u'AI_Thrmstr_C': 6346,
- u'AI_Thrmstr_R1': 4193,
- u'AI_Torque_Units': 12151,
- u'AI_UsbXferReqCount': 12288,
- u'AI_UsbXferReqSize': 10894,
- u'AI_Velocity_IEPESensor_Sensitivity': 12278,
- u'AI_Velocity_IEPESensor_SensitivityUnits': 12279,
- u'AI_Velocity_IEPESensor_dBRef': 12277,
- u'AI_Velocity_Units': 12276,
- u'AI_Voltage_ACRMS_Units': 6114,
- u'AI_Voltage_Units': 4244,
- u'AI_Voltage_dBRef': 10672,
- u'AO_Current_Units': 4361,
- u'AO_CustomScaleName': 4488,
- u'AO_DAC_Offset_ExtSrc': 8788,
- u'AO_DAC_Offset_Src': 8787,
- u'AO_DAC_Offset_Val': 8789,
- u'AO_DAC_Ref_AllowConnToGnd': 6192,
- u'AO_DAC_Ref_ConnToGnd': 304,
- u'AO_DAC_Ref_ExtSrc': 8786,
- u'AO_DAC_Ref_Src': 306,
- u'AO_DAC_Ref_Val': 6194,
- u'AO_DAC_Rng_High': 6190,
- u'AO_DAC_Rng_Low': 6189,
- u'AO_DataXferMech': 308,
- u'AO_DataXferReqCond': 6204,
- u'AO_DevScalingCoeff': 6449,
- u'AO_EnhancedImageRejectionEnable': 8769,
- u'AO_FilterDelay': 12405,
- u'AO_FilterDelayAdjustment': 12402,
- u'AO_FilterDelayUnits': 12406,
- u'AO_FuncGen_Amplitude': 10778,
- u'AO_FuncGen_FMDeviation': 10787,
- u'AO_FuncGen_Freq': 10777,
- u'AO_FuncGen_ModulationType': 10786,
- u'AO_FuncGen_Offset': 10779,
- u'AO_FuncGen_Square_DutyCycle': 10780,
- u'AO_FuncGen_Type': 10776,
- u'AO_Gain': 280,
- u'AO_IdleOutputBehavior': 8768,
- u'AO_LoadImpedance': 289,
- u'AO_Max': 4486,
- u'AO_MemMapEnable': 6287,
- u'AO_Min': 4487,
- u'AO_OutputImpedance': 5264,
- u'AO_OutputType': 4360,
- u'AO_PowerAmp_ChannelEnable': 12386,
- u'AO_PowerAmp_Gain': 12389,
- u'AO_PowerAmp_Offset': 12390,
- u'AO_PowerAmp_Overcurrent': 12388,
- u'AO_PowerAmp_ScalingCoeff': 12387,
- u'AO_ReglitchEnable': 307,
- u'AO_Resolution': 6188,
- u'AO_ResolutionUnits': 6187,
- u'AO_TermCfg': 6286,
- u'AO_UsbXferReqCount': 12289,
- u'AO_UsbXferReqSize': 10895,
- u'AO_UseOnlyOnBrdMem': 6202,
- u'AO_Voltage_CurrentLimit': 10781,
- u'AO_Voltage_Units': 4484,
- u'AdvTrig_Type': 4965,
- u'AnlgEdge_RefTrig_Coupling': 8757,
- u'AnlgEdge_RefTrig_DigFltr_Enable': 12006,
- u'AnlgEdge_RefTrig_DigFltr_MinPulseWidth': 12007,
- u'AnlgEdge_RefTrig_DigFltr_TimebaseRate': 12009,
- u'AnlgEdge_RefTrig_DigFltr_TimebaseSrc': 12008,
- u'AnlgEdge_RefTrig_DigSync_Enable': 12010,
- u'AnlgEdge_RefTrig_Hyst': 5153,
- u'AnlgEdge_RefTrig_Lvl': 5154,
- u'AnlgEdge_RefTrig_Slope': 5155,
- u'AnlgEdge_RefTrig_Src': 5156,
- u'AnlgEdge_StartTrig_Coupling': 8755,
- u'AnlgEdge_StartTrig_DigFltr_Enable': 12001,
- u'AnlgEdge_StartTrig_DigFltr_MinPulseWidth': 12002,
- u'AnlgEdge_StartTrig_DigFltr_TimebaseRate': 12004,
- u'AnlgEdge_StartTrig_DigFltr_TimebaseSrc': 12003,
- u'AnlgEdge_StartTrig_DigSync_Enable': 12005,
- u'AnlgEdge_StartTrig_Hyst': 5013,
- u'AnlgEdge_StartTrig_Lvl': 5014,
- u'AnlgEdge_StartTrig_Slope': 5015,
- u'AnlgEdge_StartTrig_Src': 5016,
- u'AnlgLvl_PauseTrig_Coupling': 8758,
- u'AnlgLvl_PauseTrig_DigFltr_Enable': 12016,
- u'AnlgLvl_PauseTrig_DigFltr_MinPulseWidth': 12017,
- u'AnlgLvl_PauseTrig_DigFltr_TimebaseRate': 12019,
- u'AnlgLvl_PauseTrig_DigFltr_TimebaseSrc': 12018,
- u'AnlgLvl_PauseTrig_DigSync_Enable': 12020,
- u'AnlgLvl_PauseTrig_Hyst': 4968,
- u'AnlgLvl_PauseTrig_Lvl': 4969,
- u'AnlgLvl_PauseTrig_Src': 4976,
- u'AnlgLvl_PauseTrig_When': 4977,
- u'AnlgWin_PauseTrig_Btm': 4981,
- u'AnlgWin_PauseTrig_Coupling': 8759,
- u'AnlgWin_PauseTrig_DigFltr_Enable': 12021,
- u'AnlgWin_PauseTrig_DigFltr_MinPulseWidth': 12022,
- u'AnlgWin_PauseTrig_DigFltr_TimebaseRate': 12024,
- u'AnlgWin_PauseTrig_DigFltr_TimebaseSrc': 12023,
- u'AnlgWin_PauseTrig_DigSync_Enable': 12025,
- u'AnlgWin_PauseTrig_Src': 4979,
- u'AnlgWin_PauseTrig_Top': 4982,
- u'AnlgWin_PauseTrig_When': 4980,
- u'AnlgWin_RefTrig_Btm': 5160,
- u'AnlgWin_RefTrig_Coupling': 6231,
- u'AnlgWin_RefTrig_DigFltr_Enable': 12011,
- u'AnlgWin_RefTrig_DigFltr_MinPulseWidth': 12012,
- u'AnlgWin_RefTrig_DigFltr_TimebaseRate': 12014,
- u'AnlgWin_RefTrig_DigFltr_TimebaseSrc': 12013,
- u'AnlgWin_RefTrig_DigSync_Enable': 12015,
- u'AnlgWin_RefTrig_Src': 5158,
- u'AnlgWin_RefTrig_Top': 5161,
- u'AnlgWin_RefTrig_When': 5159,
- u'AnlgWin_StartTrig_Btm': 5122,
- u'AnlgWin_StartTrig_Coupling': 8756,
- u'AnlgWin_StartTrig_DigFltr_Enable': 12031,
- u'AnlgWin_StartTrig_DigFltr_MinPulseWidth': 12032,
- u'AnlgWin_StartTrig_DigFltr_TimebaseRate': 12034,
- u'AnlgWin_StartTrig_DigFltr_TimebaseSrc': 12033,
- u'AnlgWin_StartTrig_DigSync_Enable': 12035,
- u'AnlgWin_StartTrig_Src': 5120,
- u'AnlgWin_StartTrig_Top': 5123,
- u'AnlgWin_StartTrig_When': 5121,
- u'ArmStartTrig_Type': 5140,
- u'ArmStart_Term': 12159,
- u'Buf_Input_BufSize': 6252,
- u'Buf_Input_OnbrdBufSize': 8970,
- u'Buf_Output_BufSize': 6253,
- u'Buf_Output_OnbrdBufSize': 8971,
- u'CI_AngEncoder_InitialAngle': 2177,
- u'CI_AngEncoder_PulsesPerRev': 2165,
- u'CI_AngEncoder_Units': 6310,
- u'CI_Count': 328,
- u'CI_CountEdges_ActiveEdge': 1687,
- u'CI_CountEdges_CountDir_DigFltr_Enable': 8689,
- u'CI_CountEdges_CountDir_DigFltr_MinPulseWidth': 8690,
- u'CI_CountEdges_CountDir_DigFltr_TimebaseRate': 8692,
- u'CI_CountEdges_CountDir_DigFltr_TimebaseSrc': 8691,
- u'CI_CountEdges_CountDir_DigSync_Enable': 8693,
- u'CI_CountEdges_CountDir_LogicLvlBehavior': 12446,
- u'CI_CountEdges_CountDir_TermCfg': 12445,
- u'CI_CountEdges_CountReset_ActiveEdge': 12210,
- u'CI_CountEdges_CountReset_DigFltr_Enable': 12211,
- u'CI_CountEdges_CountReset_DigFltr_MinPulseWidth': 12212,
- u'CI_CountEdges_CountReset_DigFltr_TimebaseRate': 12214,
- u'CI_CountEdges_CountReset_DigFltr_TimebaseSrc': 12213,
- u'CI_CountEdges_CountReset_DigSync_Enable': 12215,
- u'CI_CountEdges_CountReset_Enable': 12207,
- u'CI_CountEdges_CountReset_LogicLvlBehavior': 12448,
- u'CI_CountEdges_CountReset_ResetCount': 12208,
- u'CI_CountEdges_CountReset_Term': 12209,
- u'CI_CountEdges_CountReset_TermCfg': 12447,
- u'CI_CountEdges_DigFltr_Enable': 8694,
- u'CI_CountEdges_DigFltr_MinPulseWidth': 8695,
- u'CI_CountEdges_DigFltr_TimebaseRate': 8697,
- u'CI_CountEdges_DigFltr_TimebaseSrc': 8696,
- u'CI_CountEdges_DigSync_Enable': 8698,
- u'CI_CountEdges_Dir': 1686,
- u'CI_CountEdges_DirTerm': 8673,
- u'CI_CountEdges_InitialCnt': 1688,
- u'CI_CountEdges_LogicLvlBehavior': 12444,
- u'CI_CountEdges_Term': 6343,
- u'CI_CountEdges_TermCfg': 12443,
- u'CI_CtrTimebaseActiveEdge': 322,
- u'CI_CtrTimebaseMasterTimebaseDiv': 6323,
- u'CI_CtrTimebaseRate': 6322,
- u'CI_CtrTimebaseSrc': 323,
- u'CI_CtrTimebase_DigFltr_Enable': 8817,
- u'CI_CtrTimebase_DigFltr_MinPulseWidth': 8818,
- u'CI_CtrTimebase_DigFltr_TimebaseRate': 8820,
- u'CI_CtrTimebase_DigFltr_TimebaseSrc': 8819,
- u'CI_CtrTimebase_DigSync_Enable': 8821,
- u'CI_CustomScaleName': 6302,
- u'CI_DataXferMech': 512,
- u'CI_DataXferReqCond': 12027,
- u'CI_DupCountPrevent': 8620,
- u'CI_DutyCycle_DigFltr_Enable': 12430,
- u'CI_DutyCycle_DigFltr_MinPulseWidth': 12431,
- u'CI_DutyCycle_DigFltr_TimebaseRate': 12433,
- u'CI_DutyCycle_DigFltr_TimebaseSrc': 12432,
- u'CI_DutyCycle_LogicLvlBehavior': 12450,
- u'CI_DutyCycle_StartingEdge': 12434,
- u'CI_DutyCycle_Term': 12429,
- u'CI_DutyCycle_TermCfg': 12449,
- u'CI_Encoder_AInputLogicLvlBehavior': 12452,
- u'CI_Encoder_AInputTerm': 8605,
- u'CI_Encoder_AInputTermCfg': 12451,
- u'CI_Encoder_AInput_DigFltr_Enable': 8699,
- u'CI_Encoder_AInput_DigFltr_MinPulseWidth': 8700,
- u'CI_Encoder_AInput_DigFltr_TimebaseRate': 8702,
- u'CI_Encoder_AInput_DigFltr_TimebaseSrc': 8701,
- u'CI_Encoder_AInput_DigSync_Enable': 8703,
- u'CI_Encoder_BInputLogicLvlBehavior': 12454,
- u'CI_Encoder_BInputTerm': 8606,
- u'CI_Encoder_BInputTermCfg': 12453,
- u'CI_Encoder_BInput_DigFltr_Enable': 8704,
- u'CI_Encoder_BInput_DigFltr_MinPulseWidth': 8705,
- u'CI_Encoder_BInput_DigFltr_TimebaseRate': 8707,
- u'CI_Encoder_BInput_DigFltr_TimebaseSrc': 8706,
- u'CI_Encoder_BInput_DigSync_Enable': 8708,
- u'CI_Encoder_DecodingType': 8678,
- u'CI_Encoder_ZIndexEnable': 2192,
- u'CI_Encoder_ZIndexPhase': 2185,
- u'CI_Encoder_ZIndexVal': 2184,
- u'CI_Encoder_ZInputLogicLvlBehavior': 12456,
- u'CI_Encoder_ZInputTerm': 8607,
- u'CI_Encoder_ZInputTermCfg': 12455,
- u'CI_Encoder_ZInput_DigFltr_Enable': 8709,
- u'CI_Encoder_ZInput_DigFltr_MinPulseWidth': 8710,
- u'CI_Encoder_ZInput_DigFltr_TimebaseRate': 8712,
- u'CI_Encoder_ZInput_DigFltr_TimebaseSrc': 8711,
- u'CI_Encoder_ZInput_DigSync_Enable': 8713,
- u'CI_Freq_DigFltr_Enable': 8679,
- u'CI_Freq_DigFltr_MinPulseWidth': 8680,
- u'CI_Freq_DigFltr_TimebaseRate': 8682,
- u'CI_Freq_DigFltr_TimebaseSrc': 8681,
- u'CI_Freq_DigSync_Enable': 8683,
- u'CI_Freq_Div': 327,
- u'CI_Freq_EnableAveraging': 11984,
- u'CI_Freq_LogicLvlBehavior': 12440,
- u'CI_Freq_MeasMeth': 324,
- u'CI_Freq_MeasTime': 325,
- u'CI_Freq_StartingEdge': 1945,
- u'CI_Freq_Term': 6306,
- u'CI_Freq_TermCfg': 12439,
- u'CI_Freq_Units': 6305,
- u'CI_GPS_SyncMethod': 4242,
- u'CI_GPS_SyncSrc': 4243,
- u'CI_LinEncoder_DistPerPulse': 2321,
- u'CI_LinEncoder_InitialPos': 2325,
- u'CI_LinEncoder_Units': 6313,
- u'CI_Max': 6300,
- u'CI_MaxMeasPeriod': 12437,
- u'CI_MeasType': 6304,
- u'CI_MemMapEnable': 11986,
- u'CI_Min': 6301,
- u'CI_NumPossiblyInvalidSamps': 6460,
- u'CI_OutputState': 329,
- u'CI_Period_DigFltr_Enable': 8684,
- u'CI_Period_DigFltr_MinPulseWidth': 8685,
- u'CI_Period_DigFltr_TimebaseRate': 8687,
- u'CI_Period_DigFltr_TimebaseSrc': 8686,
- u'CI_Period_DigSync_Enable': 8688,
- u'CI_Period_Div': 6446,
- u'CI_Period_EnableAveraging': 11985,
- u'CI_Period_LogicLvlBehavior': 12442,
- u'CI_Period_MeasMeth': 6444,
- u'CI_Period_MeasTime': 6445,
- u'CI_Period_StartingEdge': 2130,
- u'CI_Period_Term': 6308,
- u'CI_Period_TermCfg': 12441,
- u'CI_Period_Units': 6307,
- u'CI_Prescaler': 8761,
- u'CI_PulseWidth_DigFltr_Enable': 8714,
- u'CI_PulseWidth_DigFltr_MinPulseWidth': 8715,
- u'CI_PulseWidth_DigFltr_TimebaseRate': 8717,
- u'CI_PulseWidth_DigFltr_TimebaseSrc': 8716,
- u'CI_PulseWidth_DigSync_Enable': 8718,
- u'CI_PulseWidth_LogicLvlBehavior': 12458,
- u'CI_PulseWidth_StartingEdge': 2085,
- u'CI_PulseWidth_Term': 6314,
- u'CI_PulseWidth_TermCfg': 12457,
- u'CI_PulseWidth_Units': 2083,
- u'CI_Pulse_Freq_DigFltr_Enable': 12038,
- u'CI_Pulse_Freq_DigFltr_MinPulseWidth': 12039,
- u'CI_Pulse_Freq_DigFltr_TimebaseRate': 12041,
- u'CI_Pulse_Freq_DigFltr_TimebaseSrc': 12040,
- u'CI_Pulse_Freq_DigSync_Enable': 12042,
- u'CI_Pulse_Freq_LogicLvlBehavior': 12466,
- u'CI_Pulse_Freq_Start_Edge': 12037,
- u'CI_Pulse_Freq_Term': 12036,
- u'CI_Pulse_Freq_TermCfg': 12465,
- u'CI_Pulse_Freq_Units': 12043,
- u'CI_Pulse_Ticks_DigFltr_Enable': 12054,
- u'CI_Pulse_Ticks_DigFltr_MinPulseWidth': 12055,
- u'CI_Pulse_Ticks_DigFltr_TimebaseRate': 12057,
- u'CI_Pulse_Ticks_DigFltr_TimebaseSrc': 12056,
- u'CI_Pulse_Ticks_DigSync_Enable': 12058,
- u'CI_Pulse_Ticks_LogicLvlBehavior': 12470,
- u'CI_Pulse_Ticks_StartEdge': 12053,
- u'CI_Pulse_Ticks_Term': 12052,
- u'CI_Pulse_Ticks_TermCfg': 12469,
- u'CI_Pulse_Time_DigFltr_Enable': 12046,
- u'CI_Pulse_Time_DigFltr_MinPulseWidth': 12047,
- u'CI_Pulse_Time_DigFltr_TimebaseRate': 12049,
- u'CI_Pulse_Time_DigFltr_TimebaseSrc': 12048,
- u'CI_Pulse_Time_DigSync_Enable': 12050,
- u'CI_Pulse_Time_LogicLvlBehavior': 12468,
- u'CI_Pulse_Time_StartEdge': 12045,
- u'CI_Pulse_Time_Term': 12044,
- u'CI_Pulse_Time_TermCfg': 12467,
- u'CI_Pulse_Time_Units': 12051,
- u'CI_SampClkOverrunBehavior': 12435,
- u'CI_SampClkOverrunSentinelVal': 12436,
- u'CI_SemiPeriod_DigFltr_Enable': 8729,
- u'CI_SemiPeriod_DigFltr_MinPulseWidth': 8730,
- u'CI_SemiPeriod_DigFltr_TimebaseRate': 8732,
- u'CI_SemiPeriod_DigFltr_TimebaseSrc': 8731,
- u'CI_SemiPeriod_DigSync_Enable': 8733,
- u'CI_SemiPeriod_LogicLvlBehavior': 12464,
- u'CI_SemiPeriod_StartingEdge': 8958,
- u'CI_SemiPeriod_Term': 6320,
- u'CI_SemiPeriod_TermCfg': 12463,
- u'CI_SemiPeriod_Units': 6319,
- u'CI_TCReached': 336,
- u'CI_ThreshVoltage': 12471,
- u'CI_Timestamp_InitialSeconds': 8884,
- u'CI_Timestamp_Units': 8883,
- u'CI_TwoEdgeSep_FirstEdge': 2099,
- u'CI_TwoEdgeSep_FirstLogicLvlBehavior': 12460,
- u'CI_TwoEdgeSep_FirstTerm': 6317,
- u'CI_TwoEdgeSep_FirstTermCfg': 12459,
- u'CI_TwoEdgeSep_First_DigFltr_Enable': 8719,
- u'CI_TwoEdgeSep_First_DigFltr_MinPulseWidth': 8720,
- u'CI_TwoEdgeSep_First_DigFltr_TimebaseRate': 8722,
- u'CI_TwoEdgeSep_First_DigFltr_TimebaseSrc': 8721,
- u'CI_TwoEdgeSep_First_DigSync_Enable': 8723,
- u'CI_TwoEdgeSep_SecondEdge': 2100,
- u'CI_TwoEdgeSep_SecondLogicLvlBehavior': 12462,
- u'CI_TwoEdgeSep_SecondTerm': 6318,
- u'CI_TwoEdgeSep_SecondTermCfg': 12461,
- u'CI_TwoEdgeSep_Second_DigFltr_Enable': 8724,
- u'CI_TwoEdgeSep_Second_DigFltr_MinPulseWidth': 8725,
- u'CI_TwoEdgeSep_Second_DigFltr_TimebaseRate': 8727,
- u'CI_TwoEdgeSep_Second_DigFltr_TimebaseSrc': 8726,
- u'CI_TwoEdgeSep_Second_DigSync_Enable': 8728,
- u'CI_TwoEdgeSep_Units': 6316,
- u'CI_UsbXferReqCount': 12292,
- u'CI_UsbXferReqSize': 10898,
- u'CO_AutoIncrCnt': 661,
- u'CO_ConstrainedGenMode': 10738,
- u'CO_Count': 659,
- u'CO_CtrTimebaseActiveEdge': 833,
- u'CO_CtrTimebaseMasterTimebaseDiv': 6339,
- u'CO_CtrTimebaseRate': 6338,
- u'CO_CtrTimebaseSrc': 825,
- u'CO_CtrTimebase_DigFltr_Enable': 8822,
- u'CO_CtrTimebase_DigFltr_MinPulseWidth': 8823,
- u'CO_CtrTimebase_DigFltr_TimebaseRate': 8825,
- u'CO_CtrTimebase_DigFltr_TimebaseSrc': 8824,
- u'CO_CtrTimebase_DigSync_Enable': 8826,
- u'CO_DataXferMech': 11980,
- u'CO_DataXferReqCond': 11981,
- u'CO_EnableInitialDelayOnRetrigger': 11977,
- u'CO_MemMapEnable': 11987,
- u'CO_OutputState': 660,
- u'CO_OutputType': 6325,
- u'CO_Prescaler': 8813,
- u'CO_PulseDone': 6414,
- u'CO_Pulse_DutyCyc': 4470,
- u'CO_Pulse_Freq': 4472,
- u'CO_Pulse_Freq_InitialDelay': 665,
- u'CO_Pulse_Freq_Units': 6357,
- u'CO_Pulse_HighTicks': 4457,
- u'CO_Pulse_HighTime': 6330,
- u'CO_Pulse_IdleState': 4464,
- u'CO_Pulse_LowTicks': 4465,
- u'CO_Pulse_LowTime': 6331,
- u'CO_Pulse_Term': 6369,
- u'CO_Pulse_Ticks_InitialDelay': 664,
- u'CO_Pulse_Time_InitialDelay': 6332,
- u'CO_Pulse_Time_Units': 6358,
- u'CO_RdyForNewVal': 8959,
- u'CO_UsbXferReqCount': 12293,
- u'CO_UsbXferReqSize': 10899,
- u'CO_UseOnlyOnBrdMem': 11979,
- u'Cal_AccConnectionCount': 12267,
- u'Cal_DevTemp': 8763,
- u'Cal_RecommendedAccConnectionCountLimit': 12268,
- u'Cal_UserDefinedInfo': 6241,
- u'Cal_UserDefinedInfo_MaxSize': 6428,
- u'Carrier_SerialNum': 10890,
- u'ChanDescr': 6438,
- u'ChanIsGlobal': 8964,
- u'ChanType': 6271,
- u'ChangeDetect_DI_FallingEdgePhysicalChans': 8598,
- u'ChangeDetect_DI_RisingEdgePhysicalChans': 8597,
- u'ChangeDetect_DI_Tristate': 12026,
- u'DAQmxSuccess': 0,
- u'DI_AcquireOn': 10598,
- u'DI_DataXferMech': 8803,
- u'DI_DataXferReqCond': 8804,
- u'DI_DigFltr_Enable': 8662,
- u'DI_DigFltr_EnableBusMode': 12030,
- u'DI_DigFltr_MinPulseWidth': 8663,
- u'DI_DigFltr_TimebaseRate': 11989,
- u'DI_DigFltr_TimebaseSrc': 11988,
- u'DI_DigSync_Enable': 11990,
- u'DI_InvertLines': 1939,
- u'DI_LogicFamily': 10605,
- u'DI_MemMapEnable': 10602,
- u'DI_NumLines': 8568,
- u'DI_Tristate': 6288,
- u'DI_UsbXferReqCount': 12290,
- u'DI_UsbXferReqSize': 10896,
- u'DO_DataXferMech': 8806,
- u'DO_DataXferReqCond': 8807,
- u'DO_GenerateOn': 10601,
- u'DO_InvertLines': 4403,
- u'DO_LineStates_DoneState': 10600,
- u'DO_LineStates_PausedState': 10599,
- u'DO_LineStates_StartState': 10610,
- u'DO_LogicFamily': 10606,
- u'DO_MemMapEnable': 10603,
- u'DO_NumLines': 8569,
- u'DO_OutputDriveType': 4407,
- u'DO_Overcurrent_AutoReenable': 10886,
- u'DO_Overcurrent_Limit': 10885,
- u'DO_Overcurrent_ReenablePeriod': 10887,
- u'DO_Tristate': 6387,
- u'DO_UsbXferReqCount': 12291,
- u'DO_UsbXferReqSize': 10897,
- u'DO_UseOnlyOnBrdMem': 8805,
- u'DelayFromSampClk_Delay': 4887,
- u'DelayFromSampClk_DelayUnits': 4868,
- u'Dev_AI_BridgeRngs': 12240,
- u'Dev_AI_Couplings': 10644,
- u'Dev_AI_CurrentIntExcitDiscreteVals': 10699,
- u'Dev_AI_CurrentRngs': 10641,
- u'Dev_AI_DigFltr_LowpassCutoffFreqDiscreteVals': 12488,
- u'Dev_AI_DigFltr_LowpassCutoffFreqRangeVals': 12489,
- u'Dev_AI_FreqRngs': 10642,
- u'Dev_AI_Gains': 10643,
- u'Dev_AI_LowpassCutoffFreqDiscreteVals': 10645,
- u'Dev_AI_LowpassCutoffFreqRangeVals': 10703,
- u'Dev_AI_MaxMultiChanRate': 10637,
- u'Dev_AI_MaxSingleChanRate': 10636,
- u'Dev_AI_MinRate': 10638,
- u'Dev_AI_PhysicalChans': 8990,
- u'Dev_AI_ResistanceRngs': 10773,
- u'Dev_AI_SampModes': 12252,
- u'Dev_AI_SimultaneousSamplingSupported': 10639,
- u'Dev_AI_SupportedMeasTypes': 12242,
- u'Dev_AI_TrigUsage': 10630,
- u'Dev_AI_VoltageIntExcitDiscreteVals': 10697,
- u'Dev_AI_VoltageIntExcitRangeVals': 10698,
- u'Dev_AI_VoltageRngs': 10640,
- u'Dev_AO_CurrentRngs': 10652,
- u'Dev_AO_Gains': 10653,
- u'Dev_AO_MaxRate': 10647,
- u'Dev_AO_MinRate': 10648,
- u'Dev_AO_PhysicalChans': 8991,
- u'Dev_AO_SampClkSupported': 10646,
- u'Dev_AO_SampModes': 12253,
- u'Dev_AO_SupportedOutputTypes': 12243,
- u'Dev_AO_TrigUsage': 10631,
- u'Dev_AO_VoltageRngs': 10651,
- u'Dev_Accessory_ProductNums': 12142,
- u'Dev_Accessory_ProductTypes': 12141,
- u'Dev_Accessory_SerialNums': 12143,
- u'Dev_AnlgTrigSupported': 10628,
- u'Dev_BusType': 8998,
- u'Dev_CI_MaxSize': 10655,
- u'Dev_CI_MaxTimebase': 10656,
- u'Dev_CI_PhysicalChans': 8996,
- u'Dev_CI_SampClkSupported': 10654,
- u'Dev_CI_SampModes': 12254,
- u'Dev_CI_SupportedMeasTypes': 12244,
- u'Dev_CI_TrigUsage': 10634,
- u'Dev_CO_MaxSize': 10657,
- u'Dev_CO_MaxTimebase': 10658,
- u'Dev_CO_PhysicalChans': 8997,
- u'Dev_CO_SampClkSupported': 12123,
- u'Dev_CO_SampModes': 12255,
- u'Dev_CO_SupportedOutputTypes': 12245,
- u'Dev_CO_TrigUsage': 10635,
- u'Dev_Chassis_ModuleDevNames': 10678,
- u'Dev_CompactDAQ_ChassisDevName': 10679,
- u'Dev_CompactDAQ_SlotNum': 10680,
- u'Dev_DI_Lines': 8992,
- u'Dev_DI_MaxRate': 10649,
- u'Dev_DI_Ports': 8993,
- u'Dev_DI_TrigUsage': 10632,
- u'Dev_DO_Lines': 8994,
- u'Dev_DO_MaxRate': 10650,
- u'Dev_DO_Ports': 8995,
- u'Dev_DO_TrigUsage': 10633,
- u'Dev_DigTrigSupported': 10629,
- u'Dev_IsSimulated': 8906,
- u'Dev_NumDMAChans': 9020,
- u'Dev_PCI_BusNum': 8999,
- u'Dev_PCI_DevNum': 9000,
- u'Dev_PXI_ChassisNum': 9001,
- u'Dev_PXI_SlotNum': 9002,
- u'Dev_ProductCategory': 10665,
- u'Dev_ProductNum': 8989,
- u'Dev_ProductType': 1585,
- u'Dev_SerialNum': 1586,
- u'Dev_TCPIP_EthernetIP': 10892,
- u'Dev_TCPIP_Hostname': 10891,
- u'Dev_TCPIP_WirelessIP': 10893,
- u'Dev_TEDS_HWTEDSSupported': 12246,
- u'Dev_Terminals': 10816,
- u'DigEdge_AdvTrig_DigFltr_Enable': 8760,
- u'DigEdge_AdvTrig_Edge': 4960,
- u'DigEdge_AdvTrig_Src': 4962,
- u'DigEdge_ArmStartTrig_DigFltr_Enable': 8749,
- u'DigEdge_ArmStartTrig_DigFltr_MinPulseWidth': 8750,
- u'DigEdge_ArmStartTrig_DigFltr_TimebaseRate': 8752,
- u'DigEdge_ArmStartTrig_DigFltr_TimebaseSrc': 8751,
- u'DigEdge_ArmStartTrig_DigSync_Enable': 8753,
- u'DigEdge_ArmStartTrig_Edge': 5141,
- u'DigEdge_ArmStartTrig_Src': 5143,
- u'DigEdge_RefTrig_DigFltr_Enable': 11991,
- u'DigEdge_RefTrig_DigFltr_MinPulseWidth': 11992,
- u'DigEdge_RefTrig_DigFltr_TimebaseRate': 11994,
- u'DigEdge_RefTrig_DigFltr_TimebaseSrc': 11993,
- u'DigEdge_RefTrig_DigSync_Enable': 11995,
- u'DigEdge_RefTrig_Edge': 5168,
- u'DigEdge_RefTrig_Src': 5172,
- u'DigEdge_StartTrig_DigFltr_Enable': 8739,
- u'DigEdge_StartTrig_DigFltr_MinPulseWidth': 8740,
- u'DigEdge_StartTrig_DigFltr_TimebaseRate': 8742,
- u'DigEdge_StartTrig_DigFltr_TimebaseSrc': 8741,
- u'DigEdge_StartTrig_DigSync_Enable': 8743,
- u'DigEdge_StartTrig_Edge': 5124,
- u'DigEdge_StartTrig_Src': 5127,
- u'DigEdge_WatchdogExpirTrig_Edge': 8613,
- u'DigEdge_WatchdogExpirTrig_Src': 8612,
- u'DigLvl_PauseTrig_DigFltr_Enable': 8744,
- u'DigLvl_PauseTrig_DigFltr_MinPulseWidth': 8745,
- u'DigLvl_PauseTrig_DigFltr_TimebaseRate': 8747,
- u'DigLvl_PauseTrig_DigFltr_TimebaseSrc': 8746,
- u'DigLvl_PauseTrig_DigSync_Enable': 8748,
- u'DigLvl_PauseTrig_Src': 4985,
- u'DigLvl_PauseTrig_When': 4992,
- u'DigPattern_PauseTrig_Pattern': 8584,
- u'DigPattern_PauseTrig_Src': 8559,
- u'DigPattern_PauseTrig_When': 8560,
- u'DigPattern_RefTrig_Pattern': 8583,
- u'DigPattern_RefTrig_Src': 5175,
- u'DigPattern_RefTrig_When': 5176,
- u'DigPattern_StartTrig_Pattern': 8582,
- u'DigPattern_StartTrig_Src': 5136,
- u'DigPattern_StartTrig_When': 5137,
- u'Exported_10MHzRefClk_OutputTerm': 8814,
- u'Exported_20MHzTimebase_OutputTerm': 5719,
- u'Exported_AIConvClk_OutputTerm': 5767,
- u'Exported_AIConvClk_Pulse_Polarity': 5768,
- u'Exported_AIHoldCmpltEvent_OutputTerm': 6381,
- u'Exported_AIHoldCmpltEvent_PulsePolarity': 6382,
- u'Exported_AdvCmpltEvent_Delay': 5975,
- u'Exported_AdvCmpltEvent_OutputTerm': 5713,
- u'Exported_AdvCmpltEvent_Pulse_Polarity': 5714,
- u'Exported_AdvCmpltEvent_Pulse_Width': 5716,
- u'Exported_AdvTrig_OutputTerm': 5701,
- u'Exported_AdvTrig_Pulse_Polarity': 5702,
- u'Exported_AdvTrig_Pulse_Width': 5704,
- u'Exported_AdvTrig_Pulse_WidthUnits': 5703,
- u'Exported_ChangeDetectEvent_OutputTerm': 8599,
- u'Exported_ChangeDetectEvent_Pulse_Polarity': 8963,
- u'Exported_CtrOutEvent_OutputBehavior': 5967,
- u'Exported_CtrOutEvent_OutputTerm': 5911,
- u'Exported_CtrOutEvent_Pulse_Polarity': 5912,
- u'Exported_CtrOutEvent_Toggle_IdleState': 6250,
- u'Exported_DataActiveEvent_Lvl_ActiveLvl': 5684,
- u'Exported_DataActiveEvent_OutputTerm': 5683,
- u'Exported_DividedSampClkTimebase_OutputTerm': 8609,
- u'Exported_HshkEvent_Delay': 8892,
- u'Exported_HshkEvent_Interlocked_AssertOnStart': 8894,
- u'Exported_HshkEvent_Interlocked_AssertedLvl': 8893,
- u'Exported_HshkEvent_Interlocked_DeassertDelay': 8895,
- u'Exported_HshkEvent_OutputBehavior': 8891,
- u'Exported_HshkEvent_OutputTerm': 8890,
- u'Exported_HshkEvent_Pulse_Polarity': 8896,
- u'Exported_HshkEvent_Pulse_Width': 8897,
- u'Exported_PauseTrig_Lvl_ActiveLvl': 5654,
- u'Exported_PauseTrig_OutputTerm': 5653,
- u'Exported_RdyForStartEvent_Lvl_ActiveLvl': 5969,
- u'Exported_RdyForStartEvent_OutputTerm': 5641,
- u'Exported_RdyForXferEvent_DeassertCond': 10595,
- u'Exported_RdyForXferEvent_DeassertCondCustomThreshold': 10596,
- u'Exported_RdyForXferEvent_Lvl_ActiveLvl': 8886,
- u'Exported_RdyForXferEvent_OutputTerm': 8885,
- u'Exported_RefTrig_OutputTerm': 1424,
- u'Exported_RefTrig_Pulse_Polarity': 1425,
- u'Exported_SampClkTimebase_OutputTerm': 6393,
- u'Exported_SampClk_DelayOffset': 8644,
- u'Exported_SampClk_OutputBehavior': 6251,
- u'Exported_SampClk_OutputTerm': 5731,
- u'Exported_SampClk_Pulse_Polarity': 5732,
- u'Exported_StartTrig_OutputTerm': 1412,
- u'Exported_StartTrig_Pulse_Polarity': 1413,
- u'Exported_SyncPulseEvent_OutputTerm': 8764,
- u'Exported_WatchdogExpiredEvent_OutputTerm': 8618,
- u'ExtCal_LastTemp': 6247,
- u'ExtCal_RecommendedInterval': 6248,
- u'HshkTrig_Type': 8887,
- u'Hshk_DelayAfterXfer': 8898,
- u'Hshk_SampleInputDataWhen': 8900,
- u'Hshk_StartCond': 8899,
- u'Implicit_UnderflowBehavior': 12029,
- u'Interlocked_HshkTrig_AssertedLvl': 8889,
- u'Interlocked_HshkTrig_Src': 8888,
- u'Logging_FilePath': 11972,
- u'Logging_FilePreallocationSize': 12230,
- u'Logging_FileWriteSize': 12227,
- u'Logging_Mode': 11973,
- u'Logging_Pause': 12259,
- u'Logging_SampsPerFile': 12260,
- u'Logging_TDMS_GroupName': 11974,
- u'Logging_TDMS_Operation': 11975,
- u'MasterTimebase_Rate': 5269,
- u'MasterTimebase_Src': 4931,
- u'OnDemand_SimultaneousAOEnable': 8608,
- u'PauseTrig_Term': 12064,
- u'PauseTrig_Type': 4966,
- u'PersistedChan_AllowInteractiveDeletion': 8914,
- u'PersistedChan_AllowInteractiveEditing': 8913,
- u'PersistedChan_Author': 8912,
- u'PersistedScale_AllowInteractiveDeletion': 8918,
- u'PersistedScale_AllowInteractiveEditing': 8917,
- u'PersistedScale_Author': 8916,
- u'PersistedTask_AllowInteractiveDeletion': 8910,
- u'PersistedTask_AllowInteractiveEditing': 8909,
- u'PersistedTask_Author': 8908,
- u'PhysicalChanName': 6389,
- u'PhysicalChan_AI_InputSrcs': 12248,
- u'PhysicalChan_AI_SupportedMeasTypes': 12247,
- u'PhysicalChan_AI_TermCfgs': 9026,
- u'PhysicalChan_AO_ManualControlAmplitude': 10783,
- u'PhysicalChan_AO_ManualControlEnable': 10782,
- u'PhysicalChan_AO_ManualControlFreq': 10784,
- u'PhysicalChan_AO_ManualControl_ShortDetected': 11971,
- u'PhysicalChan_AO_SupportedOutputTypes': 12249,
- u'PhysicalChan_AO_SupportedPowerUpOutputTypes': 12366,
- u'PhysicalChan_AO_TermCfgs': 10659,
- u'PhysicalChan_CI_SupportedMeasTypes': 12250,
- u'PhysicalChan_CO_SupportedOutputTypes': 12251,
- u'PhysicalChan_DI_ChangeDetectSupported': 10662,
- u'PhysicalChan_DI_PortWidth': 10660,
- u'PhysicalChan_DI_SampClkSupported': 10661,
- u'PhysicalChan_DI_SampModes': 12256,
- u'PhysicalChan_DO_PortWidth': 10663,
- u'PhysicalChan_DO_SampClkSupported': 10664,
- u'PhysicalChan_DO_SampModes': 12257,
- u'PhysicalChan_TEDS_BitStream': 8671,
- u'PhysicalChan_TEDS_MfgID': 8666,
- u'PhysicalChan_TEDS_ModelNum': 8667,
- u'PhysicalChan_TEDS_SerialNum': 8668,
- u'PhysicalChan_TEDS_TemplateIDs': 8847,
- u'PhysicalChan_TEDS_VersionLetter': 8670,
- u'PhysicalChan_TEDS_VersionNum': 8669,
- u'ReadWaitMode': 8754,
- u'Read_AccessoryInsertionOrRemovalDetected': 12144,
- u'Read_AutoStart': 6182,
- u'Read_AvailSampPerChan': 4643,
- u'Read_ChangeDetect_HasOverflowed': 8596,
- u'Read_ChannelsToRead': 6179,
- u'Read_CommonModeRangeErrorChans': 10905,
- u'Read_CommonModeRangeErrorChansExist': 10904,
- u'Read_CurrReadPos': 4641,
- u'Read_DevsWithInsertedOrRemovedAccessories': 12145,
- u'Read_DigitalLines_BytesPerChan': 8572,
- u'Read_ExcitFaultChans': 12425,
- u'Read_ExcitFaultChansExist': 12424,
- u'Read_NumChans': 8571,
- u'Read_Offset': 6411,
- u'Read_OpenCurrentLoopChans': 10762,
- u'Read_OpenCurrentLoopChansExist': 10761,
- u'Read_OpenThrmcplChans': 10903,
- u'Read_OpenThrmcplChansExist': 10902,
- u'Read_OverWrite': 4625,
- u'Read_OvercurrentChans': 10727,
- u'Read_OvercurrentChansExist': 10726,
- u'Read_OverloadedChans': 8565,
- u'Read_OverloadedChansExist': 8564,
- u'Read_OvertemperatureChans': 12418,
- u'Read_OvertemperatureChansExist': 12417,
- u'Read_RawDataWidth': 8570,
- u'Read_ReadAllAvailSamp': 4629,
- u'Read_RelativeTo': 6410,
- u'Read_SleepTime': 8880,
- u'Read_TotalSampPerChanAcquired': 6442,
- u'Read_WaitMode': 8754,
- u'RealTime_ConvLateErrorsToWarnings': 8942,
- u'RealTime_NumOfWarmupIters': 8941,
- u'RealTime_ReportMissedSamp': 8985,
- u'RealTime_WaitForNextSampClkWaitMode': 8943,
- u'RealTime_WriteRecoveryMode': 8986,
- u'RefClk_Rate': 4885,
- u'RefClk_Src': 4886,
- u'RefTrig_AutoTrigEnable': 11969,
- u'RefTrig_AutoTriggered': 11970,
- u'RefTrig_Delay': 5251,
- u'RefTrig_PretrigSamples': 5189,
- u'RefTrig_Term': 12063,
- u'RefTrig_Type': 5145,
- u'SampClkTimebase_Term': 12060,
- u'SampClk_ActiveEdge': 4865,
- u'SampClk_DigFltr_Enable': 8734,
- u'SampClk_DigFltr_MinPulseWidth': 8735,
- u'SampClk_DigFltr_TimebaseRate': 8737,
- u'SampClk_DigFltr_TimebaseSrc': 8736,
- u'SampClk_DigSync_Enable': 8738,
- u'SampClk_MaxRate': 8904,
- u'SampClk_OverrunBehavior': 12028,
- u'SampClk_Rate': 4932,
- u'SampClk_Src': 6226,
- u'SampClk_Term': 12059,
- u'SampClk_TimebaseDiv': 6379,
- u'SampClk_Timebase_ActiveEdge': 6380,
- u'SampClk_Timebase_MasterTimebaseDiv': 4869,
- u'SampClk_Timebase_Rate': 4867,
- u'SampClk_Timebase_Src': 4872,
- u'SampClk_UnderflowBehavior': 10593,
- u'SampQuant_SampMode': 4864,
- u'SampQuant_SampPerChan': 4880,
- u'SampTimingEngine': 10790,
- u'SampTimingType': 4935,
- u'Scale_Descr': 4646,
- u'Scale_Lin_Slope': 4647,
- u'Scale_Lin_YIntercept': 4648,
- u'Scale_Map_PreScaledMax': 4657,
- u'Scale_Map_PreScaledMin': 4658,
- u'Scale_Map_ScaledMax': 4649,
- u'Scale_Map_ScaledMin': 4656,
- u'Scale_Poly_ForwardCoeff': 4660,
- u'Scale_Poly_ReverseCoeff': 4661,
- u'Scale_PreScaledUnits': 6391,
- u'Scale_ScaledUnits': 6427,
- u'Scale_Table_PreScaledVals': 4663,
- u'Scale_Table_ScaledVals': 4662,
- u'Scale_Type': 6441,
- u'SelfCal_LastTemp': 6244,
- u'SelfCal_Supported': 6240,
- u'StartTrig_Delay': 6230,
- u'StartTrig_DelayUnits': 6344,
- u'StartTrig_Retriggerable': 6415,
- u'StartTrig_Term': 12062,
- u'StartTrig_Type': 5011,
- u'SwitchChan_AnlgBusSharingEnable': 12190,
- u'SwitchChan_Bandwidth': 1600,
- u'SwitchChan_Impedance': 1601,
- u'SwitchChan_MaxACCarryCurrent': 1608,
- u'SwitchChan_MaxACCarryPwr': 1602,
- u'SwitchChan_MaxACSwitchCurrent': 1606,
- u'SwitchChan_MaxACSwitchPwr': 1604,
- u'SwitchChan_MaxACVoltage': 1617,
- u'SwitchChan_MaxDCCarryCurrent': 1607,
- u'SwitchChan_MaxDCCarryPwr': 1603,
- u'SwitchChan_MaxDCSwitchCurrent': 1605,
- u'SwitchChan_MaxDCSwitchPwr': 1609,
- u'SwitchChan_MaxDCVoltage': 1616,
- u'SwitchChan_Usage': 6372,
- u'SwitchChan_WireMode': 6373,
- u'SwitchDev_AutoConnAnlgBus': 6106,
- u'SwitchDev_NumColumns': 6378,
- u'SwitchDev_NumRelays': 6374,
- u'SwitchDev_NumRows': 6377,
- u'SwitchDev_NumSwitchChans': 6376,
- u'SwitchDev_PwrDownLatchRelaysAfterSettling': 8923,
- u'SwitchDev_RelayList': 6108,
- u'SwitchDev_Settled': 4675,
- u'SwitchDev_SettlingTime': 4676,
- u'SwitchDev_SwitchChanList': 6375,
- u'SwitchDev_Temperature': 12314,
- u'SwitchDev_Topology': 6461,
- u'SwitchScan_BreakMode': 4679,
- u'SwitchScan_RepeatMode': 4680,
- u'SwitchScan_WaitingForAdv': 6105,
- u'SyncClk_Interval': 12158,
- u'SyncPulse_MinDelayToStart': 8767,
- u'SyncPulse_ResetDelay': 12157,
- u'SyncPulse_ResetTime': 12156,
- u'SyncPulse_Src': 8765,
- u'SyncPulse_SyncTime': 8766,
- u'SyncPulse_Term': 12165,
- u'Sys_DevNames': 6459,
- u'Sys_GlobalChans': 4709,
- u'Sys_NIDAQMajorVersion': 4722,
- u'Sys_NIDAQMinorVersion': 6435,
- u'Sys_NIDAQUpdateVersion': 12066,
- u'Sys_Scales': 4710,
- u'Sys_Tasks': 4711,
- u'Task_Channels': 4723,
- u'Task_Complete': 4724,
- u'Task_Devices': 8974,
- u'Task_Name': 4726,
- u'Task_NumChans': 8577,
- u'Task_NumDevices': 10682,
- u'Timing_SyncPulseForce': 12474,
- u'Trigger_SyncType': 12160,
- u'Val_100MHzTimebase': 15857,
- u'Val_10MHzRefClock': 12536,
- u'Val_20MHzTimebase': 12537,
- u'Val_20MHzTimebaseClock': 12486,
- u'Val_2Wire': 2,
- u'Val_2point5V': 14620,
- u'Val_3Wire': 3,
- u'Val_3point3V': 14621,
- u'Val_4Wire': 4,
- u'Val_5V': 14619,
- u'Val_5Wire': 5,
- u'Val_80MHzTimebase': 14636,
- u'Val_8MHzTimebase': 16023,
- u'Val_A': 12513,
- u'Val_AC': 10045,
- u'Val_AHighBHigh': 10040,
- u'Val_AHighBLow': 10041,
- u'Val_AI': 10100,
- u'Val_AIConvertClock': 12484,
- u'Val_AIHoldCmpltEvent': 12493,
- u'Val_ALowBHigh': 10042,
- u'Val_ALowBLow': 10043,
- u'Val_AM': 14756,
- u'Val_AO': 10102,
- u'Val_AOSeries': 14647,
- u'Val_AandB': 12515,
- u'Val_AboveLvl': 10093,
- u'Val_AccelUnit_g': 10186,
- u'Val_Accelerometer': 10356,
- u'Val_Acquired_Into_Buffer': 1,
- u'Val_Action_Cancel': 1,
- u'Val_Action_Commit': 0,
- u'Val_ActiveDrive': 12573,
- u'Val_ActiveHigh': 10095,
- u'Val_ActiveLow': 10096,
- u'Val_AdvCmpltEvent': 12492,
- u'Val_AdvanceTrigger': 12488,
- u'Val_AllowRegen': 10097,
- u'Val_Amps': 10342,
- u'Val_AnlgEdge': 10099,
- u'Val_AnlgLvl': 10101,
- u'Val_AnlgWin': 10103,
- u'Val_Auto': -1,
- u'Val_B': 12514,
- u'Val_BSeriesDAQ': 14662,
- u'Val_B_Type_TC': 10047,
- u'Val_Bandpass': 16073,
- u'Val_Bar': 15880,
- u'Val_BelowLvl': 10107,
- u'Val_Best50HzRejection': 14713,
- u'Val_Best60HzRejection': 14714,
- u'Val_Bit_CouplingTypes_AC': 1,
- u'Val_Bit_CouplingTypes_DC': 2,
- u'Val_Bit_CouplingTypes_Ground': 4,
- u'Val_Bit_CouplingTypes_HFReject': 8,
- u'Val_Bit_CouplingTypes_LFReject': 16,
- u'Val_Bit_CouplingTypes_NoiseReject': 32,
- u'Val_Bit_TermCfg_Diff': 4,
- u'Val_Bit_TermCfg_NRSE': 2,
- u'Val_Bit_TermCfg_PseudoDIFF': 8,
- u'Val_Bit_TermCfg_RSE': 1,
- u'Val_Bit_TriggerUsageTypes_Advance': 1,
- u'Val_Bit_TriggerUsageTypes_ArmStart': 32,
- u'Val_Bit_TriggerUsageTypes_Handshake': 16,
- u'Val_Bit_TriggerUsageTypes_Pause': 2,
- u'Val_Bit_TriggerUsageTypes_Reference': 4,
- u'Val_Bit_TriggerUsageTypes_Start': 8,
- u'Val_Bits': 10109,
- u'Val_BreakBeforeMake': 10110,
- u'Val_Bridge': 15908,
- u'Val_BuiltIn': 10200,
- u'Val_BurstHandshake': 12548,
- u'Val_Butterworth': 16076,
- u'Val_CI': 10131,
- u'Val_CO': 10132,
- u'Val_CSeriesModule': 14659,
- u'Val_CartesianShearStrainXY': 15976,
- u'Val_CartesianStrainX': 15974,
- u'Val_CartesianStrainY': 15975,
- u'Val_Cfg_Default': -1,
- u'Val_Chan': 10113,
- u'Val_ChanForAllLines': 1,
- u'Val_ChanPerLine': 0,
- u'Val_ChangeDetection': 12504,
- u'Val_ChangeDetectionEvent': 12511,
- u'Val_ChannelCurrent': 1,
- u'Val_ChannelHighImpedance': 2,
- u'Val_ChannelVoltage': 0,
- u'Val_ClearExpiration': 1,
- u'Val_Closed': 10438,
- u'Val_CompactDAQ': 14637,
- u'Val_CompactDAQChassis': 14658,
- u'Val_ConstVal': 10116,
- u'Val_ConstantGroupDelay': 16075,
- u'Val_Cont': 10117,
- u'Val_ContSamps': 10123,
- u'Val_CountDown': 10124,
- u'Val_CountEdges': 10125,
- u'Val_CountUp': 10128,
- u'Val_CounterOutputEvent': 12494,
- u'Val_Create': 15848,
- u'Val_CreateOrReplace': 15847,
- u'Val_CurrReadPos': 10425,
- u'Val_CurrWritePos': 10430,
- u'Val_Current': 10134,
- u'Val_CurrentRMS': 10351,
- u'Val_Custom': 10137,
- u'Val_DC': 10050,
- u'Val_DI': 10151,
- u'Val_DMA': 10054,
- u'Val_DO': 10153,
- u'Val_Default': -1,
- u'Val_DegC': 10143,
- u'Val_DegF': 10144,
- u'Val_DegR': 10145,
- u'Val_Degrees': 10146,
- u'Val_DeltaRosette': 15969,
- u'Val_Diff': 10106,
- u'Val_DigEdge': 10150,
- u'Val_DigLvl': 10152,
- u'Val_DigPattern': 10398,
- u'Val_DigitalIO': 14648,
- u'Val_DoNotAllowRegen': 10158,
- u'Val_DoNotInvertPolarity': 0,
- u'Val_DoNotOverwriteUnreadSamps': 10159,
- u'Val_DoNotWrite': 12540,
- u'Val_DutyCycle': 16070,
- u'Val_DynAvg': 16065,
- u'Val_DynamicSignalAcquisition': 14649,
- u'Val_ESeriesDAQ': 14642,
- u'Val_E_Type_TC': 10055,
- u'Val_Elliptical': 16077,
- u'Val_EnteringWin': 10163,
- u'Val_EverySample': 10164,
- u'Val_ExtControlled': 10326,
- u'Val_External': 10167,
- u'Val_FM': 14757,
- u'Val_Falling': 10171,
- u'Val_FallingSlope': 10171,
- u'Val_Finite': 10172,
- u'Val_FiniteSamps': 10178,
- u'Val_FirstPretrigSamp': 10427,
- u'Val_FirstSample': 10424,
- u'Val_Fixed50PercentDutyCycle': 14711,
- u'Val_FixedHighFreq': 14709,
- u'Val_FixedLowFreq': 14710,
- u'Val_FootPounds': 15884,
- u'Val_Force_Bridge': 15899,
- u'Val_Force_IEPESensor': 15895,
- u'Val_Freq': 10179,
- u'Val_Freq_Voltage': 10181,
- u'Val_FromCustomScale': 10065,
- u'Val_FromTEDS': 12516,
- u'Val_FullBridge': 10182,
- u'Val_FullBridgeI': 10183,
- u'Val_FullBridgeII': 10184,
- u'Val_FullBridgeIII': 10185,
- u'Val_FuncGen': 14750,
- u'Val_GND': 10066,
- u'Val_GPS_Timestamp': 10362,
- u'Val_Ground': 2,
- u'Val_GroupByChannel': 0,
- u'Val_GroupByScanNumber': 1,
- u'Val_HWTimedSinglePoint': 12522,
- u'Val_HalfBridge': 10187,
- u'Val_HalfBridgeI': 10188,
- u'Val_HalfBridgeII': 10189,
- u'Val_HaltOutputAndError': 14615,
- u'Val_Handshake': 10389,
- u'Val_HandshakeTriggerAsserts': 12552,
- u'Val_HandshakeTriggerDeasserts': 12553,
- u'Val_HardwareDefined': 10191,
- u'Val_High': 10192,
- u'Val_HighFreq2Ctr': 10157,
- u'Val_HighImpedance': 12527,
- u'Val_HighResolution': 10195,
- u'Val_HighSpeed': 14712,
- u'Val_Highpass': 16072,
- u'Val_Hz': 10373,
- u'Val_IRIGB': 10070,
- u'Val_IgnoreOverruns': 15863,
- u'Val_Immediate': 10198,
- u'Val_Implicit': 10451,
- u'Val_InchOunces': 15882,
- u'Val_InchPounds': 15883,
- u'Val_Inches': 10379,
- u'Val_InchesPerSecond': 15960,
- u'Val_InchesPerSecondSquared': 12471,
- u'Val_InsideWin': 10199,
- u'Val_Interlocked': 12549,
- u'Val_Internal': 10200,
- u'Val_Interrupts': 10204,
- u'Val_InvertPolarity': 1,
- u'Val_J_Type_TC': 10072,
- u'Val_K_Type_TC': 10073,
- u'Val_Kelvins': 10325,
- u'Val_KilogramForce': 15877,
- u'Val_LargeRng2Ctr': 10205,
- u'Val_LeavingWin': 10208,
- u'Val_LeftJustified': 10209,
- u'Val_Linear': 10447,
- u'Val_Load': 10440,
- u'Val_Log': 15844,
- u'Val_LogAndRead': 15842,
- u'Val_LogicLevelPullUp': 16064,
- u'Val_Loopback0': 0,
- u'Val_Loopback180': 1,
- u'Val_LosslessPacking': 12555,
- u'Val_LossyLSBRemoval': 12556,
- u'Val_Low': 10214,
- u'Val_LowFreq1Ctr': 10105,
- u'Val_Lowpass': 16071,
- u'Val_Lvl': 10210,
- u'Val_MSeriesDAQ': 14643,
- u'Val_MaintainExistingValue': 12528,
- u'Val_MapRanges': 10448,
- u'Val_Master': 15888,
- u'Val_MaxShearStrain': 15977,
- u'Val_MaxShearStrainAngle': 15978,
- u'Val_Meters': 10219,
- u'Val_MetersPerSecond': 15959,
- u'Val_MetersPerSecondSquared': 12470,
- u'Val_MilliVoltsPerInchPerSecond': 15964,
- u'Val_MillivoltsPerMillimeterPerSecond': 15963,
- u'Val_MostRecentSamp': 10428,
- u'Val_Multicycle': 14614,
- u'Val_NIELVIS': 14755,
- u'Val_NRSE': 10078,
- u'Val_N_Type_TC': 10077,
- u'Val_NetworkDAQ': 14829,
- u'Val_NewtonMeters': 15881,
- u'Val_Newtons': 15875,
- u'Val_NoAction': 10227,
- u'Val_NoBridge': 10228,
- u'Val_NoChange': 10160,
- u'Val_None': 10230,
- u'Val_Notch': 16074,
- u'Val_Off': 10231,
- u'Val_Ohms': 10384,
- u'Val_OnBrdMemEmpty': 10235,
- u'Val_OnBrdMemHalfFullOrLess': 10239,
- u'Val_OnBrdMemMoreThanHalfFull': 10237,
- u'Val_OnBrdMemNotEmpty': 10241,
- u'Val_OnBrdMemNotFull': 10242,
- u'Val_OnDemand': 10390,
- u'Val_OnbrdMemCustomThreshold': 12577,
- u'Val_OnbrdMemFull': 10236,
- u'Val_OnbrdMemMoreThanHalfFull': 10237,
- u'Val_Once': 10244,
- u'Val_Open': 10437,
- u'Val_OpenCollector': 12574,
- u'Val_OpenOrCreate': 15846,
- u'Val_OutsideWin': 10251,
- u'Val_OverwriteUnreadSamps': 10252,
- u'Val_PCCard': 12585,
- u'Val_PCI': 12582,
- u'Val_PCIe': 13612,
- u'Val_PPS': 10080,
- u'Val_PXI': 12583,
- u'Val_PXIe': 14706,
- u'Val_Pascals': 10081,
- u'Val_PathStatus_AlreadyExists': 10432,
- u'Val_PathStatus_Available': 10431,
- u'Val_PathStatus_ChannelInUse': 10434,
- u'Val_PathStatus_ChannelReservedForRouting': 10436,
- u'Val_PathStatus_SourceChannelConflict': 10435,
- u'Val_PathStatus_Unsupported': 10433,
- u'Val_PatternDoesNotMatch': 10253,
- u'Val_PatternMatches': 10254,
- u'Val_PauseUntilDataAvailable': 14616,
- u'Val_Period': 10256,
- u'Val_PipelinedSampClk': 14668,
- u'Val_Poll': 12524,
- u'Val_Polynomial': 10449,
- u'Val_Position_AngEncoder': 10360,
- u'Val_Position_EddyCurrentProximityProbe': 14835,
- u'Val_Position_LVDT': 10352,
- u'Val_Position_LinEncoder': 10361,
- u'Val_Position_RVDT': 10353,
- u'Val_Pounds': 15876,
- u'Val_PoundsPerSquareInch': 15879,
- u'Val_Pressure_Bridge': 15902,
- u'Val_PrincipalStrain1': 15971,
- u'Val_PrincipalStrain2': 15972,
- u'Val_PrincipalStrainAngle': 15973,
- u'Val_ProgrammedIO': 10264,
- u'Val_PseudoDiff': 12529,
- u'Val_Pt3750': 12481,
- u'Val_Pt3851': 10071,
- u'Val_Pt3911': 12482,
- u'Val_Pt3916': 10069,
- u'Val_Pt3920': 10053,
- u'Val_Pt3928': 12483,
- u'Val_PullDown': 15951,
- u'Val_PullUp': 15950,
- u'Val_Pulse': 10265,
- u'Val_PulseFrequency': 15864,
- u'Val_PulseTicks': 15866,
- u'Val_PulseTime': 15865,
- u'Val_PulseWidth': 10359,
- u'Val_Pulse_Freq': 10119,
- u'Val_Pulse_Ticks': 10268,
- u'Val_Pulse_Time': 10269,
- u'Val_QuarterBridge': 10270,
- u'Val_QuarterBridgeI': 10271,
- u'Val_QuarterBridgeII': 10272,
- u'Val_R1': 12465,
- u'Val_R2': 12466,
- u'Val_R3': 12467,
- u'Val_R4': 14813,
- u'Val_RSE': 10083,
- u'Val_R_Type_TC': 10082,
- u'Val_Radians': 10273,
- u'Val_RectangularRosette': 15968,
- u'Val_RefTrig': 10426,
- u'Val_ReferenceTrigger': 12490,
- u'Val_RepeatedData': 16062,
- u'Val_ReservedForRouting': 10441,
- u'Val_ResetTimer': 0,
- u'Val_Resistance': 10278,
- u'Val_RightJustified': 10279,
- u'Val_Rising': 10280,
- u'Val_RisingSlope': 10280,
- u'Val_Rosette_Strain_Gage': 15980,
- u'Val_SCC': 14707,
- u'Val_SCCConnectorBlock': 14704,
- u'Val_SCCModule': 14705,
- u'Val_SCExpress': 15886,
- u'Val_SCSeriesDAQ': 14645,
- u'Val_SCXI': 12584,
- u'Val_SCXI1124Range0to10V': 14631,
- u'Val_SCXI1124Range0to1V': 14629,
- u'Val_SCXI1124Range0to20mA': 14635,
- u'Val_SCXI1124Range0to5V': 14630,
- u'Val_SCXI1124RangeNeg10to10V': 14634,
- u'Val_SCXI1124RangeNeg1to1V': 14632,
- u'Val_SCXI1124RangeNeg5to5V': 14633,
- u'Val_SCXIModule': 14660,
- u'Val_SSeriesDAQ': 14644,
- u'Val_S_Type_TC': 10085,
- u'Val_SameAsMasterTimebase': 10282,
- u'Val_SameAsSampTimebase': 10284,
- u'Val_SampClk': 10388,
- u'Val_SampClkActiveEdge': 14617,
- u'Val_SampClkInactiveEdge': 14618,
- u'Val_SampClkPeriods': 10286,
- u'Val_SampleClkPeriods': 10286,
- u'Val_SampleClock': 12487,
- u'Val_SampleCompleteEvent': 12530,
- u'Val_Save_AllowInteractiveDeletion': 4,
- u'Val_Save_AllowInteractiveEditing': 2,
- u'Val_Save_Overwrite': 1,
- u'Val_Sawtooth': 14754,
- u'Val_Seconds': 10364,
- u'Val_SemiPeriod': 10289,
- u'Val_SentinelValue': 16063,
- u'Val_Sine': 14751,
- u'Val_SingleCycle': 14613,
- u'Val_Slave': 15889,
- u'Val_Sleep': 12547,
- u'Val_Software': 10292,
- u'Val_SoundPressure_Microphone': 10354,
- u'Val_Source': 10439,
- u'Val_Square': 14753,
- u'Val_StartTrigger': 12491,
- u'Val_StopTaskAndError': 15862,
- u'Val_Strain': 10299,
- u'Val_Strain_Gage': 10300,
- u'Val_SwitchBlock': 15870,
- u'Val_Switch_Topology_1127_Independent': u'1127/Independent',
- u'Val_Switch_Topology_1128_Independent': u'1128/Independent',
- u'Val_Switch_Topology_1130_Independent': u'1130/Independent',
- u'Val_Switch_Topology_1160_16_SPDT': u'1160/16-SPDT',
- u'Val_Switch_Topology_1161_8_SPDT': u'1161/8-SPDT',
- u'Val_Switch_Topology_1166_16_DPDT': u'1166/16-DPDT',
- u'Val_Switch_Topology_1166_32_SPDT': u'1166/32-SPDT',
- u'Val_Switch_Topology_1167_Independent': u'1167/Independent',
- u'Val_Switch_Topology_1169_100_SPST': u'1169/100-SPST',
- u'Val_Switch_Topology_1169_50_DPST': u'1169/50-DPST',
- u'Val_Switch_Topology_1192_8_SPDT': u'1192/8-SPDT',
- u'Val_Switch_Topology_1193_Independent': u'1193/Independent',
- u'Val_Switch_Topology_2510_Independent': u'2510/Independent',
- u'Val_Switch_Topology_2512_Independent': u'2512/Independent',
- u'Val_Switch_Topology_2514_Independent': u'2514/Independent',
- u'Val_Switch_Topology_2515_Independent': u'2515/Independent',
- u'Val_Switch_Topology_2520_80_SPST': u'2520/80-SPST',
- u'Val_Switch_Topology_2521_40_DPST': u'2521/40-DPST',
- u'Val_Switch_Topology_2522_53_SPDT': u'2522/53-SPDT',
- u'Val_Switch_Topology_2523_26_DPDT': u'2523/26-DPDT',
- u'Val_Switch_Topology_2527_Independent': u'2527/Independent',
- u'Val_Switch_Topology_2530_Independent': u'2530/Independent',
- u'Val_Switch_Topology_2548_4_SPDT': u'2548/4-SPDT',
- u'Val_Switch_Topology_2558_4_SPDT': u'2558/4-SPDT',
- u'Val_Switch_Topology_2564_16_SPST': u'2564/16-SPST',
- u'Val_Switch_Topology_2564_8_DPST': u'2564/8-DPST',
- u'Val_Switch_Topology_2565_16_SPST': u'2565/16-SPST',
- u'Val_Switch_Topology_2566_16_SPDT': u'2566/16-SPDT',
- u'Val_Switch_Topology_2566_8_DPDT': u'2566/8-DPDT',
- u'Val_Switch_Topology_2567_Independent': u'2567/Independent',
- u'Val_Switch_Topology_2568_15_DPST': u'2568/15-DPST',
- u'Val_Switch_Topology_2568_31_SPST': u'2568/31-SPST',
- u'Val_Switch_Topology_2569_100_SPST': u'2569/100-SPST',
- u'Val_Switch_Topology_2569_50_DPST': u'2569/50-DPST',
- u'Val_Switch_Topology_2570_20_DPDT': u'2570/20-DPDT',
- u'Val_Switch_Topology_2570_40_SPDT': u'2570/40-SPDT',
- u'Val_Switch_Topology_2571_66_SPDT': u'2571/66-SPDT',
- u'Val_Switch_Topology_2576_Independent': u'2576/Independent',
- u'Val_Switch_Topology_2584_Independent': u'2584/Independent',
- u'Val_Switch_Topology_2586_10_SPST': u'2586/10-SPST',
- u'Val_Switch_Topology_2586_5_DPST': u'2586/5-DPST',
- u'Val_Switch_Topology_2593_Independent': u'2593/Independent',
- u'Val_Switch_Topology_2599_2_SPDT': u'2599/2-SPDT',
- u'Val_Switch_Topology_2720_Independent': u'2720/Independent',
- u'Val_Switch_Topology_2722_Independent': u'2722/Independent',
- u'Val_Switch_Topology_2725_Independent': u'2725/Independent',
- u'Val_Switch_Topology_2727_Independent': u'2727/Independent',
- u'Val_Switch_Topology_2790_Independent': u'2790/Independent',
- u'Val_Switch_Topology_2799_2_SPDT': u'2799/2-SPDT',
- u'Val_Switches': 14650,
- u'Val_SynchronousEventCallbacks': 1,
- u'Val_TCPIP': 14828,
- u'Val_TEDS_Sensor': 12531,
- u'Val_TIOSeries': 14661,
- u'Val_T_Type_TC': 10086,
- u'Val_Table': 10450,
- u'Val_Task_Abort': 6,
- u'Val_Task_Commit': 3,
- u'Val_Task_Reserve': 4,
- u'Val_Task_Start': 0,
- u'Val_Task_Stop': 1,
- u'Val_Task_Unreserve': 5,
- u'Val_Task_Verify': 2,
- u'Val_TeeRosette': 15970,
- u'Val_Temp_BuiltInSensor': 10311,
- u'Val_Temp_RTD': 10301,
- u'Val_Temp_TC': 10303,
- u'Val_Temp_Thrmstr': 10302,
- u'Val_Ticks': 10304,
- u'Val_Toggle': 10307,
- u'Val_Torque_Bridge': 15905,
- u'Val_Transferred_From_Buffer': 2,
- u'Val_Triangle': 14752,
- u'Val_Tristate': 10310,
- u'Val_TwoEdgeSep': 10267,
- u'Val_TwoPointLinear': 15898,
- u'Val_TwoPulseCounting': 10313,
- u'Val_USB': 12586,
- u'Val_USBDAQ': 14646,
- u'Val_USBbulk': 12590,
- u'Val_Unconstrained': 14708,
- u'Val_Unknown': 12588,
- u'Val_UserProvided': 10167,
- u'Val_Velocity_IEPESensor': 15966,
- u'Val_Voltage': 10322,
- u'Val_VoltageRMS': 10350,
- u'Val_Voltage_CustomWithExcitation': 10323,
- u'Val_Volts': 10348,
- u'Val_VoltsPerG': 12510,
- u'Val_VoltsPerMil': 14837,
- u'Val_VoltsPerMillimeter': 14839,
- u'Val_VoltsPerVolt': 15896,
- u'Val_WDTExpiredEvent': 12512,
- u'Val_WaitForHandshakeTriggerAssert': 12550,
- u'Val_WaitForHandshakeTriggerDeassert': 12551,
- u'Val_WaitForInterrupt': 12523,
- u'Val_WaitInfinitely': -1.0,
- u'Val_WhenAcqComplete': 12546,
- u'Val_WriteToEEPROM': 12538,
- u'Val_WriteToPROM': 12539,
- u'Val_X1': 10090,
- u'Val_X2': 10091,
- u'Val_X4': 10092,
- u'Val_XSeriesDAQ': 15858,
- u'Val_Yield': 12525,
- u'Val_ZeroVolts': 12526,
- u'Val_ZeroVoltsOrAmps': 12526,
- u'Val_g': 10186,
- u'Val_mVoltsPerG': 12509,
- u'Val_mVoltsPerMicron': 14840,
- u'Val_mVoltsPerMil': 14836,
- u'Val_mVoltsPerMillimeter': 14838,
- u'Val_mVoltsPerNewton': 15891,
- u'Val_mVoltsPerPound': 15892,
- u'Val_mVoltsPerVolt': 15897,
- u'Val_mVoltsPerVoltPerDegree': 12507,
- u'Val_mVoltsPerVoltPerMilliInch': 12505,
- u'Val_mVoltsPerVoltPerMillimeter': 12506,
- u'Val_mVoltsPerVoltPerRadian': 12508,
- u'WatchdogExpirTrig_TrigOnNetworkConnLoss': 12381,
- u'WatchdogExpirTrig_Type': 8611,
- u'Watchdog_AO_ExpirState': 12383,
- u'Watchdog_AO_OutputType': 12382,
- u'Watchdog_CO_ExpirState': 12384,
- u'Watchdog_DO_ExpirState': 8615,
- u'Watchdog_HasExpired': 8616,
- u'Watchdog_Timeout': 8617,
- u'Write_AccessoryInsertionOrRemovalDetected': 12371,
- u'Write_CurrWritePos': 5208,
- u'Write_DevsWithInsertedOrRemovedAccessories': 12372,
- u'Write_DigitalLines_BytesPerChan': 8575,
- u'Write_ExternalOvervoltageChans': 12476,
- u'Write_ExternalOvervoltageChansExist': 12475,
- u'Write_NextWriteIsLast': 10604,
- u'Write_NumChans': 8574,
- u'Write_Offset': 6413,
- u'Write_OpenCurrentLoopChans': 10731,
- u'Write_OpenCurrentLoopChansExist': 10730,
- u'Write_OvercurrentChans': 10729,
- u'Write_OvercurrentChansExist': 10728,
- u'Write_OverloadedChans': 12421,
- u'Write_OverloadedChansExist': 12420,
- u'Write_OvertemperatureChans': 12419,
- u'Write_OvertemperatureChansExist': 10884,
- u'Write_PowerSupplyFaultChans': 10733,
- u'Write_PowerSupplyFaultChansExist': 10732,
- u'Write_RawDataWidth': 8573,
- u'Write_RegenMode': 5203,
- u'Write_RelativeTo': 6412,
- u'Write_SleepTime': 8882,
- u'Write_SpaceAvail': 5216,
- u'Write_TotalSampPerChanGenerated': 6443,
- u'Write_WaitMode': 8881}
-DAQmxConstants = namedtuple('DAQmxConstants', _d.keys())
-DAQmx = DAQmxConstants(**_d)
-
-error_map = {-209805: u'COCannotKeepUpInHWTimedSinglePoint',
- -209803: u'WaitForNextSampClkDetected3OrMoreSampClks',
- -209802: u'WaitForNextSampClkDetectedMissedSampClk',
- -209801: u'WriteNotCompleteBeforeSampClk',
- -209800: u'ReadNotCompleteBeforeSampClk',
- -201510: u'InconsistentDigitalFilteringAcrossTerminals',
- -201509: u'InconsistentPullUpCfgAcrossTerminals',
- -201508: u'InconsistentTermCfgAcrossTerminals',
- -201507: u'VCXODCMBecameUnlocked',
- -201506: u'PLLDACUpdateFailed',
- -201505: u'NoCabledDevice',
- -201504: u'LostRefClk',
- -201503: u'CantUseAITimingEngineWithCounters',
- -201502: u'DACOffsetValNotSet',
- -201501: u'CalAdjustRefValOutOfRange',
- -201500: u'ChansForCalAdjustMustPerformSetContext',
- -201499: u'GetCalDataInvalidForCalMode',
- -201498: u'NoIEPEWithACNotAllowed',
- -201497: u'SetupCalNeededBeforeGetCalDataPoints',
- -201496: u'VoltageNotCalibrated',
- -201495: u'MissingRangeForCalibration',
- -201494: u'MultipleChansNotSupportedDuringCalAdjust',
- -201493: u'ShuntCalFailedOutOfRange',
- -201492: u'OperationNotSupportedOnSimulatedDevice',
- -201491: u'FirmwareVersionSameAsInstalledVersion',
- -201490: u'FirmwareVersionOlderThanInstalledVersion',
- -201489: u'FirmwareUpdateInvalidState',
- -201488: u'FirmwareUpdateInvalidID',
- -201487: u'FirmwareUpdateAutomaticManagementEnabled',
- -201486: u'SetupCalibrationNotCalled',
- -201485: u'CalMeasuredDataSizeVsActualDataSizeMismatch',
- -201484: u'CDAQMissingDSAMasterForChanExpansion',
- -201483: u'CDAQMasterNotFoundForChanExpansion',
- -201482: u'AllChansShouldBeProvidedForCalibration',
- -201481: u'MustSpecifyExpirationStateForAllLinesInRange',
- -201480: u'OpenSessionExists',
- -201479: u'CannotQueryTerminalForSWArmStart',
- -201478: u'ChassisWatchdogTimerExpired',
- -201477: u'CantReserveWatchdogTaskWhileOtherTasksReserved',
- -201476: u'CantReserveTaskWhileWatchdogTaskReserving',
- -201475: u'AuxPowerSourceRequired',
- -201474: u'DeviceNotSupportedOnLocalSystem',
- -201472: u'OneTimestampChannelRequiredForCombinedNavigationRead',
- -201471: u'MultDevsMultPhysChans',
- -201470: u'InvalidCalAdjustmentPointValues',
- -201469: u'DifferentDigitizerFromCommunicator',
- -201468: u'CDAQSyncMasterClockNotPresent',
- -201467: u'AssociatedChansHaveConflictingProps',
- -201466: u'AutoConfigBetweenMultipleDeviceStatesInvalid',
- -201465: u'AutoConfigOfOfflineDevicesInvalid',
- -201464: u'ExternalFIFOFault',
- -201463: u'ConnectionsNotReciprocal',
- -201462: u'InvalidOutputToInputCDAQSyncConnection',
- -201461: u'ReferenceClockNotPresent',
- -201460: u'BlankStringExpansionFoundNoSupportedCDAQSyncConnectionDevices',
- -201459: u'NoDevicesSupportCDAQSyncConnections',
- -201458: u'InvalidCDAQSyncTimeoutValue',
- -201457: u'CDAQSyncConnectionToSamePort',
- -201456: u'DevsWithoutCommonSyncConnectionStrategy',
- -201455: u'NoCDAQSyncBetweenPhysAndSimulatedDevs',
- -201454: u'UnableToContainCards',
- -201453: u'FindDisconnectedBetweenPhysAndSimDeviceStatesInvalid',
- -201452: u'OperationAborted',
- -201451: u'TwoPortsRequired',
- -201450: u'DeviceDoesNotSupportCDAQSyncConnections',
- -201449: u'InvalidcDAQSyncPortConnectionFormat',
- -201448: u'RosetteMeasurementsNotSpecified',
- -201447: u'InvalidNumOfPhysChansForDeltaRosette',
- -201446: u'InvalidNumOfPhysChansForTeeRosette',
- -201445: u'RosetteStrainChanNamesNeeded',
- -201444: u'MultideviceWithOnDemandTiming',
- -201443: u'FREQOUTCannotProduceDesiredFrequency3',
- -201442: u'TwoEdgeSeparationSameTerminalSameEdge',
- -201441: u'DontMixSyncPulseAndSampClkTimebaseOn449x',
- -201440: u'NeitherRefClkNorSampClkTimebaseConfiguredForDSASync',
- -201439: u'RetriggeringFiniteCONotAllowed',
- -201438: u'DeviceRebootedFromWDTTimeout',
- -201437: u'TimeoutValueExceedsMaximum',
- -201436: u'SharingDifferentWireModes',
- -201435: u'CantPrimeWithEmptyBuffer',
- -201434: u'ConfigFailedBecauseWatchdogExpired',
- -201433: u'WriteFailedBecauseWatchdogChangedLineDirection',
- -201432: u'MultipleSubsytemCalibration',
- -201431: u'IncorrectChannelForOffsetAdjustment',
- -201430: u'InvalidNumRefVoltagesToWrite',
- -201429: u'StartTrigDelayWithDSAModule',
- -201428: u'MoreThanOneSyncPulseDetected',
- -201427: u'DevNotSupportedWithinDAQmxAPI',
- -201426: u'DevsWithoutSyncStrategies',
- -201425: u'DevsWithoutCommonSyncStrategy',
- -201424: u'SyncStrategiesCannotSync',
- -201423: u'ChassisCommunicationInterrupted',
- -201422: u'UnknownCardPowerProfileInCarrier',
- -201421: u'AttrNotSupportedOnAccessory',
- -201420: u'NetworkDeviceReservedByAnotherHost',
- -201419: u'IncorrectFirmwareFileUploaded',
- -201418: u'InvalidFirmwareFileUploaded',
- -201417: u'InTimerTimeoutOnArm',
- -201416: u'CantExceedSlotRelayDriveLimit',
- -201415: u'ModuleUnsupportedFor9163',
- -201414: u'ConnectionsNotSupported',
- -201413: u'AccessoryNotPresent',
- -201412: u'SpecifiedAccessoryChannelsNotPresentOnDevice',
- -201411: u'ConnectionsNotSupportedOnAccessory',
- -201410: u'RateTooFastForHWTSP',
- -201409: u'DelayFromSampleClockOutOfRangeForHWTSP',
- -201408: u'AveragingWhenNotInternalHWTSP',
- -201407: u'AttributeNotSupportedUnlessHWTSP',
- -201406: u'FiveVoltDetectFailed',
- -201405: u'AnalogBusStateInconsistent',
- -201404: u'CardDetectedDoesNotMatchExpectedCard',
- -201403: u'LoggingStartNewFileNotCalled',
- -201402: u'LoggingSampsPerFileNotDivisible',
- -201401: u'RetrievingNetworkDeviceProperties',
- -201400: u'FilePreallocationFailed',
- -201399: u'ModuleMismatchInSameTimedTask',
- -201398: u'InvalidAttributeValuePossiblyDueToOtherAttributeValues',
- -201397: u'ChangeDetectionStoppedToPreventDeviceHang',
- -201396: u'FilterDelayRemovalNotPosssibleWithAnalogTrigger',
- -201395: u'NonbufferedOrNoChannels',
- -201394: u'TristateLogicLevelNotSpecdForEntirePort',
- -201393: u'TristateLogicLevelNotSupportedOnDigOutChan',
- -201392: u'TristateLogicLevelNotSupported',
- -201391: u'IncompleteGainAndCouplingCalAdjustment',
- -201390: u'NetworkStatusConnectionLost',
- -201389: u'ModuleChangeDuringConnectionLoss',
- -201388: u'NetworkDeviceNotReservedByHost',
- -201387: u'DuplicateCalibrationAdjustmentInput',
- -201386: u'SelfCalFailedContactTechSupport',
- -201385: u'SelfCalFailedToConverge',
- -201384: u'UnsupportedSimulatedModuleForSimulatedChassis',
- -201383: u'LoggingWriteSizeTooBig',
- -201382: u'LoggingWriteSizeNotDivisible',
- -201381: u'MyDAQPowerRailFault',
- -201380: u'DeviceDoesNotSupportThisOperation',
- -201379: u'NetworkDevicesNotSupportedOnThisPlatform',
- -201378: u'UnknownFirmwareVersion',
- -201377: u'FirmwareIsUpdating',
- -201376: u'AccessoryEEPROMIsCorrupt',
- -201375: u'ThrmcplLeadOffsetNullingCalNotSupported',
- -201374: u'SelfCalFailedTryExtCal',
- -201373: u'OutputP2PNotSupportedWithMultithreadedScripts',
- -201372: u'ThrmcplCalibrationChannelsOpen',
- -201371: u'MDNSServiceInstanceAlreadyInUse',
- -201370: u'IPAddressAlreadyInUse',
- -201369: u'HostnameAlreadyInUse',
- -201368: u'InvalidNumberOfCalAdjustmentPoints',
- -201367: u'FilterOrDigitalSyncInternalSignal',
- -201366: u'BadDDSSource',
- -201365: u'OnboardRegenWithMoreThan16Channels',
- -201364: u'TriggerTooFast',
- -201363: u'MinMaxOutsideTableRange',
- -201362: u'ChannelExpansionWithInvalidAnalogTriggerDevice',
- -201361: u'SyncPulseSrcInvalidForTask',
- -201360: u'InvalidCarrierSlotNumberSpecd',
- -201359: u'CardsMustBeInSameCarrier',
- -201358: u'CardDevCarrierSimMustMatch',
- -201357: u'DevMustHaveAtLeastOneCard',
- -201356: u'CardTopologyError',
- -201355: u'ExceededCarrierPowerLimit',
- -201354: u'CardsIncompatible',
- -201353: u'AnalogBusNotValid',
- -201352: u'ReservationConflict',
- -201351: u'MemMappedOnDemandNotSupported',
- -201350: u'SlaveWithNoStartTriggerConfigured',
- -201349: u'ChannelExpansionWithDifferentTriggerDevices',
- -201348: u'CounterSyncAndRetriggered',
- -201347: u'NoExternalSyncPulseDetected',
- -201346: u'SlaveAndNoExternalSyncPulse',
- -201345: u'CustomTimingRequiredForAttribute',
- -201344: u'CustomTimingModeNotSet',
- -201343: u'AccessoryPowerTripped',
- -201342: u'UnsupportedAccessory',
- -201341: u'InvalidAccessoryChange',
- -201340: u'FirmwareRequiresUpgrade',
- -201339: u'FastExternalTimebaseNotSupportedForDevice',
- -201338: u'InvalidShuntLocationForCalibration',
- -201337: u'DeviceNameTooLong',
- -201336: u'BridgeScalesUnsupported',
- -201335: u'MismatchedElecPhysValues',
- -201334: u'LinearRequiresUniquePoints',
- -201333: u'MissingRequiredScalingParameter',
- -201332: u'LoggingNotSupportOnOutputTasks',
- -201331: u'MemoryMappedHardwareTimedNonBufferedUnsupported',
- -201330: u'CannotUpdatePulseTrainWithAutoIncrementEnabled',
- -201329: u'HWTimedSinglePointAndDataXferNotDMA',
- -201328: u'SCCSecondStageEmpty',
- -201327: u'SCCInvalidDualStageCombo',
- -201326: u'SCCInvalidSecondStage',
- -201325: u'SCCInvalidFirstStage',
- -201324: u'CounterMultipleSampleClockedChannels',
- -201323: u'2CounterMeasurementModeAndSampleClocked',
- -201322: u'CantHaveBothMemMappedAndNonMemMappedTasks',
- -201321: u'MemMappedDataReadByAnotherProcess',
- -201320: u'RetriggeringInvalidForGivenSettings',
- -201319: u'AIOverrun',
- -201318: u'COOverrun',
- -201317: u'CounterMultipleBufferedChannels',
- -201316: u'InvalidTimebaseForCOHWTSP',
- -201315: u'WriteBeforeEvent',
- -201314: u'CIOverrun',
- -201313: u'CounterNonResponsiveAndReset',
- -201312: u'MeasTypeOrChannelNotSupportedForLogging',
- -201311: u'FileAlreadyOpenedForWrite',
- -201310: u'TdmsNotFound',
- -201309: u'GenericFileIO',
- -201308: u'FiniteSTCCounterNotSupportedForLogging',
- -201307: u'MeasurementTypeNotSupportedForLogging',
- -201306: u'FileAlreadyOpened',
- -201305: u'DiskFull',
- -201304: u'FilePathInvalid',
- -201303: u'FileVersionMismatch',
- -201302: u'FileWriteProtected',
- -201301: u'ReadNotSupportedForLoggingMode',
- -201300: u'AttributeNotSupportedWhenLogging',
- -201299: u'LoggingModeNotSupportedNonBuffered',
- -201298: u'PropertyNotSupportedWithConflictingProperty',
- -201297: u'ParallelSSHOnConnector1',
- -201296: u'COOnlyImplicitSampleTimingTypeSupported',
- -201295: u'CalibrationFailedAOOutOfRange',
- -201294: u'CalibrationFailedAIOutOfRange',
- -201293: u'CalPWMLinearityFailed',
- -201292: u'OverrunUnderflowConfigurationCombo',
- -201291: u'CannotWriteToFiniteCOTask',
- -201290: u'NetworkDAQInvalidWEPKeyLength',
- -201289: u'CalInputsShortedNotSupported',
- -201288: u'CannotSetPropertyWhenTaskIsReserved',
- -201287: u'Minus12VFuseBlown',
- -201286: u'Plus12VFuseBlown',
- -201285: u'Plus5VFuseBlown',
- -201284: u'Plus3VFuseBlown',
- -201283: u'DeviceSerialPortError',
- -201282: u'PowerUpStateMachineNotDone',
- -201281: u'TooManyTriggersSpecifiedInTask',
- -201280: u'VerticalOffsetNotSupportedOnDevice',
- -201279: u'InvalidCouplingForMeasurementType',
- -201278: u'DigitalLineUpdateTooFastForDevice',
- -201277: u'CertificateIsTooBigToTransfer',
- -201276: u'OnlyPEMOrDERCertiticatesAccepted',
- -201275: u'CalCouplingNotSupported',
- -201274: u'DeviceNotSupportedIn64Bit',
- -201273: u'NetworkDeviceInUse',
- -201272: u'InvalidIPv4AddressFormat',
- -201271: u'NetworkProductTypeMismatch',
- -201270: u'OnlyPEMCertificatesAccepted',
- -201269: u'CalibrationRequiresPrototypingBoardEnabled',
- -201268: u'AllCurrentLimitingResourcesAlreadyTaken',
- -201267: u'UserDefInfoStringBadLength',
- -201266: u'PropertyNotFound',
- -201265: u'OverVoltageProtectionActivated',
- -201264: u'ScaledIQWaveformTooLarge',
- -201263: u'FirmwareFailedToDownload',
- -201262: u'PropertyNotSupportedForBusType',
- -201261: u'ChangeRateWhileRunningCouldNotBeCompleted',
- -201260: u'CannotQueryManualControlAttribute',
- -201259: u'InvalidNetworkConfiguration',
- -201258: u'InvalidWirelessConfiguration',
- -201257: u'InvalidWirelessCountryCode',
- -201256: u'InvalidWirelessChannel',
- -201255: u'NetworkEEPROMHasChanged',
- -201254: u'NetworkSerialNumberMismatch',
- -201253: u'NetworkStatusDown',
- -201252: u'NetworkTargetUnreachable',
- -201251: u'NetworkTargetNotFound',
- -201250: u'NetworkStatusTimedOut',
- -201249: u'InvalidWirelessSecuritySelection',
- -201248: u'NetworkDeviceConfigurationLocked',
- -201247: u'NetworkDAQDeviceNotSupported',
- -201246: u'NetworkDAQCannotCreateEmptySleeve',
- -201245: u'UserDefInfoStringTooLong',
- -201244: u'ModuleTypeDoesNotMatchModuleTypeInDestination',
- -201243: u'InvalidTEDSInterfaceAddress',
- -201242: u'DevDoesNotSupportSCXIComm',
- -201241: u'SCXICommDevConnector0MustBeCabledToModule',
- -201240: u'SCXIModuleDoesNotSupportDigitizationMode',
- -201239: u'DevDoesNotSupportMultiplexedSCXIDigitizationMode',
- -201238: u'DevOrDevPhysChanDoesNotSupportSCXIDigitization',
- -201237: u'InvalidPhysChanName',
- -201236: u'SCXIChassisCommModeInvalid',
- -201235: u'RequiredDependencyNotFound',
- -201234: u'InvalidStorage',
- -201233: u'InvalidObject',
- -201232: u'StorageAlteredPriorToSave',
- -201231: u'TaskDoesNotReferenceLocalChannel',
- -201230: u'ReferencedDevSimMustMatchTarget',
- -201229: u'ProgrammedIOFailsBecauseOfWatchdogTimer',
- -201228: u'WatchdogTimerFailsBecauseOfProgrammedIO',
- -201227: u'CantUseThisTimingEngineWithAPort',
- -201226: u'ProgrammedIOConflict',
- -201225: u'ChangeDetectionIncompatibleWithProgrammedIO',
- -201224: u'TristateNotEnoughLines',
- -201223: u'TristateConflict',
- -201222: u'GenerateOrFiniteWaitExpectedBeforeBreakBlock',
- -201221: u'BreakBlockNotAllowedInLoop',
- -201220: u'ClearTriggerNotAllowedInBreakBlock',
- -201219: u'NestingNotAllowedInBreakBlock',
- -201218: u'IfElseBlockNotAllowedInBreakBlock',
- -201217: u'RepeatUntilTriggerLoopNotAllowedInBreakBlock',
- -201216: u'WaitUntilTriggerNotAllowedInBreakBlock',
- -201215: u'MarkerPosInvalidInBreakBlock',
- -201214: u'InvalidWaitDurationInBreakBlock',
- -201213: u'InvalidSubsetLengthInBreakBlock',
- -201212: u'InvalidWaveformLengthInBreakBlock',
- -201211: u'InvalidWaitDurationBeforeBreakBlock',
- -201210: u'InvalidSubsetLengthBeforeBreakBlock',
- -201209: u'InvalidWaveformLengthBeforeBreakBlock',
- -201208: u'SampleRateTooHighForADCTimingMode',
- -201207: u'ActiveDevNotSupportedWithMultiDevTask',
- -201206: u'RealDevAndSimDevNotSupportedInSameTask',
- -201205: u'RTSISimMustMatchDevSim',
- -201204: u'BridgeShuntCaNotSupported',
- -201203: u'StrainShuntCaNotSupported',
- -201202: u'GainTooLargeForGainCalConst',
- -201201: u'OffsetTooLargeForOffsetCalConst',
- -201200: u'ElvisPrototypingBoardRemoved',
- -201199: u'Elvis2PowerRailFault',
- -201198: u'Elvis2PhysicalChansFault',
- -201197: u'Elvis2PhysicalChansThermalEvent',
- -201196: u'RXBitErrorRateLimitExceeded',
- -201195: u'PHYBitErrorRateLimitExceeded',
- -201194: u'TwoPartAttributeCalledOutOfOrder',
- -201193: u'InvalidSCXIChassisAddress',
- -201192: u'CouldNotConnectToRemoteMXS',
- -201191: u'ExcitationStateRequiredForAttributes',
- -201190: u'DeviceNotUsableUntilUSBReplug',
- -201189: u'InputFIFOOverflowDuringCalibrationOnFullSpeedUSB',
- -201188: u'InputFIFOOverflowDuringCalibration',
- -201187: u'CJCChanConflictsWithNonThermocoupleChan',
- -201186: u'CommDeviceForPXIBackplaneNotInRightmostSlot',
- -201185: u'CommDeviceForPXIBackplaneNotInSameChassis',
- -201184: u'CommDeviceForPXIBackplaneNotPXI',
- -201183: u'InvalidCalExcitFrequency',
- -201182: u'InvalidCalExcitVoltage',
- -201181: u'InvalidAIInputSrc',
- -201180: u'InvalidCalInputRef',
- -201179: u'dBReferenceValueNotGreaterThanZero',
- -201178: u'SampleClockRateIsTooFastForSampleClockTiming',
- -201177: u'DeviceNotUsableUntilColdStart',
- -201176: u'SampleClockRateIsTooFastForBurstTiming',
- -201175: u'DevImportFailedAssociatedResourceIDsNotSupported',
- -201174: u'SCXI1600ImportNotSupported',
- -201173: u'PowerSupplyConfigurationFailed',
- -201172: u'IEPEWithDCNotAllowed',
- -201171: u'MinTempForThermocoupleTypeOutsideAccuracyForPolyScaling',
- -201170: u'DevImportFailedNoDeviceToOverwriteAndSimulationNotSupported',
- -201169: u'DevImportFailedDeviceNotSupportedOnDestination',
- -201168: u'FirmwareIsTooOld',
- -201167: u'FirmwareCouldntUpdate',
- -201166: u'FirmwareIsCorrupt',
- -201165: u'FirmwareTooNew',
- -201164: u'SampClockCannotBeExportedFromExternalSampClockSrc',
- -201163: u'PhysChanReservedForInputWhenDesiredForOutput',
- -201162: u'PhysChanReservedForOutputWhenDesiredForInput',
- -201161: u'SpecifiedCDAQSlotNotEmpty',
- -201160: u'DeviceDoesNotSupportSimulation',
- -201159: u'InvalidCDAQSlotNumberSpecd',
- -201158: u'CSeriesModSimMustMatchCDAQChassisSim',
- -201157: u'SCCCabledDevMustNotBeSimWhenSCCCarrierIsNotSim',
- -201156: u'SCCModSimMustMatchSCCCarrierSim',
- -201155: u'SCXIModuleDoesNotSupportSimulation',
- -201154: u'SCXICableDevMustNotBeSimWhenModIsNotSim',
- -201153: u'SCXIDigitizerSimMustNotBeSimWhenModIsNotSim',
- -201152: u'SCXIModSimMustMatchSCXIChassisSim',
- -201151: u'SimPXIDevReqSlotAndChassisSpecd',
- -201150: u'SimDevConflictWithRealDev',
- -201149: u'InsufficientDataForCalibration',
- -201148: u'TriggerChannelMustBeEnabled',
- -201147: u'CalibrationDataConflictCouldNotBeResolved',
- -201146: u'SoftwareTooNewForSelfCalibrationData',
- -201145: u'SoftwareTooNewForExtCalibrationData',
- -201144: u'SelfCalibrationDataTooNewForSoftware',
- -201143: u'ExtCalibrationDataTooNewForSoftware',
- -201142: u'SoftwareTooNewForEEPROM',
- -201141: u'EEPROMTooNewForSoftware',
- -201140: u'SoftwareTooNewForHardware',
- -201139: u'HardwareTooNewForSoftware',
- -201138: u'TaskCannotRestartFirstSampNotAvailToGenerate',
- -201137: u'OnlyUseStartTrigSrcPrptyWithDevDataLines',
- -201136: u'OnlyUsePauseTrigSrcPrptyWithDevDataLines',
- -201135: u'OnlyUseRefTrigSrcPrptyWithDevDataLines',
- -201134: u'PauseTrigDigPatternSizeDoesNotMatchSrcSize',
- -201133: u'LineConflictCDAQ',
- -201132: u'CannotWriteBeyondFinalFiniteSample',
- -201131: u'RefAndStartTriggerSrcCantBeSame',
- -201130: u'MemMappingIncompatibleWithPhysChansInTask',
- -201129: u'OutputDriveTypeMemMappingConflict',
- -201128: u'CAPIDeviceIndexInvalid',
- -201127: u'RatiometricDevicesMustUseExcitationForScaling',
- -201126: u'PropertyRequiresPerDeviceCfg',
- -201125: u'AICouplingAndAIInputSourceConflict',
- -201124: u'OnlyOneTaskCanPerformDOMemoryMappingAtATime',
- -201123: u'TooManyChansForAnalogRefTrigCDAQ',
- -201122: u'SpecdPropertyValueIsIncompatibleWithSampleTimingType',
- -201121: u'CPUNotSupportedRequireSSE',
- -201120: u'SpecdPropertyValueIsIncompatibleWithSampleTimingResponseMode',
- -201119: u'ConflictingNextWriteIsLastAndRegenModeProperties',
- -201118: u'MStudioOperationDoesNotSupportDeviceContext',
- -201117: u'PropertyValueInChannelExpansionContextInvalid',
- -201116: u'HWTimedNonBufferedAONotSupported',
- -201115: u'WaveformLengthNotMultOfQuantum',
- -201114: u'DSAExpansionMixedBoardsWrongOrderInPXIChassis',
- -201113: u'PowerLevelTooLowForOOK',
- -201112: u'DeviceComponentTestFailure',
- -201111: u'UserDefinedWfmWithOOKUnsupported',
- -201110: u'InvalidDigitalModulationUserDefinedWaveform',
- -201109: u'BothRefInAndRefOutEnabled',
- -201108: u'BothAnalogAndDigitalModulationEnabled',
- -201107: u'BufferedOpsNotSupportedInSpecdSlotForCDAQ',
- -201106: u'PhysChanNotSupportedInSpecdSlotForCDAQ',
- -201105: u'ResourceReservedWithConflictingSettings',
- -201104: u'InconsistentAnalogTrigSettingsCDAQ',
- -201103: u'TooManyChansForAnalogPauseTrigCDAQ',
- -201102: u'AnalogTrigNotFirstInScanListCDAQ',
- -201101: u'TooManyChansGivenTimingType',
- -201100: u'SampClkTimebaseDivWithExtSampClk',
- -201099: u'CantSaveTaskWithPerDeviceTimingProperties',
- -201098: u'ConflictingAutoZeroMode',
- -201097: u'SampClkRateNotSupportedWithEAREnabled',
- -201096: u'SampClkTimebaseRateNotSpecd',
- -201095: u'SessionCorruptedByDLLReload',
- -201094: u'ActiveDevNotSupportedWithChanExpansion',
- -201093: u'SampClkRateInvalid',
- -201092: u'ExtSyncPulseSrcCannotBeExported',
- -201091: u'SyncPulseMinDelayToStartNeededForExtSyncPulseSrc',
- -201090: u'SyncPulseSrcInvalid',
- -201089: u'SampClkTimebaseRateInvalid',
- -201088: u'SampClkTimebaseSrcInvalid',
- -201087: u'SampClkRateMustBeSpecd',
- -201086: u'InvalidAttributeName',
- -201085: u'CJCChanNameMustBeSetWhenCJCSrcIsScannableChan',
- -201084: u'HiddenChanMissingInChansPropertyInCfgFile',
- -201083: u'ChanNamesNotSpecdInCfgFile',
- -201082: u'DuplicateHiddenChanNamesInCfgFile',
- -201081: u'DuplicateChanNameInCfgFile',
- -201080: u'InvalidSCCModuleForSlotSpecd',
- -201079: u'InvalidSCCSlotNumberSpecd',
- -201078: u'InvalidSectionIdentifier',
- -201077: u'InvalidSectionName',
- -201076: u'DAQmxVersionNotSupported',
- -201075: u'SWObjectsFoundInFile',
- -201074: u'HWObjectsFoundInFile',
- -201073: u'LocalChannelSpecdWithNoParentTask',
- -201072: u'TaskReferencesMissingLocalChannel',
- -201071: u'TaskReferencesLocalChannelFromOtherTask',
- -201070: u'TaskMissingChannelProperty',
- -201069: u'InvalidLocalChanName',
- -201068: u'InvalidEscapeCharacterInString',
- -201067: u'InvalidTableIdentifier',
- -201066: u'ValueFoundInInvalidColumn',
- -201065: u'MissingStartOfTable',
- -201064: u'FileMissingRequiredDAQmxHeader',
- -201063: u'DeviceIDDoesNotMatch',
- -201062: u'BufferedOperationsNotSupportedOnSelectedLines',
- -201061: u'PropertyConflictsWithScale',
- -201060: u'InvalidINIFileSyntax',
- -201059: u'DeviceInfoFailedPXIChassisNotIdentified',
- -201058: u'InvalidHWProductNumber',
- -201057: u'InvalidHWProductType',
- -201056: u'InvalidNumericFormatSpecd',
- -201055: u'DuplicatePropertyInObject',
- -201054: u'InvalidEnumValueSpecd',
- -201053: u'TEDSSensorPhysicalChannelConflict',
- -201052: u'TooManyPhysicalChansForTEDSInterfaceSpecd',
- -201051: u'IncapableTEDSInterfaceControllingDeviceSpecd',
- -201050: u'SCCCarrierSpecdIsMissing',
- -201049: u'IncapableSCCDigitizingDeviceSpecd',
- -201048: u'AccessorySettingNotApplicable',
- -201047: u'DeviceAndConnectorSpecdAlreadyOccupied',
- -201046: u'IllegalAccessoryTypeForDeviceSpecd',
- -201045: u'InvalidDeviceConnectorNumberSpecd',
- -201044: u'InvalidAccessoryName',
- -201043: u'MoreThanOneMatchForSpecdDevice',
- -201042: u'NoMatchForSpecdDevice',
- -201041: u'ProductTypeAndProductNumberConflict',
- -201040: u'ExtraPropertyDetectedInSpecdObject',
- -201039: u'RequiredPropertyMissing',
- -201038: u'CantSetAuthorForLocalChan',
- -201037: u'InvalidTimeValue',
- -201036: u'InvalidTimeFormat',
- -201035: u'DigDevChansSpecdInModeOtherThanParallel',
- -201034: u'CascadeDigitizationModeNotSupported',
- -201033: u'SpecdSlotAlreadyOccupied',
- -201032: u'InvalidSCXISlotNumberSpecd',
- -201031: u'AddressAlreadyInUse',
- -201030: u'SpecdDeviceDoesNotSupportRTSI',
- -201029: u'SpecdDeviceIsAlreadyOnRTSIBus',
- -201028: u'IdentifierInUse',
- -201027: u'WaitForNextSampleClockOrReadDetected3OrMoreMissedSampClks',
- -201026: u'HWTimedAndDataXferPIO',
- -201025: u'NonBufferedAndHWTimed',
- -201024: u'CTROutSampClkPeriodShorterThanGenPulseTrainPeriodPolled',
- -201023: u'CTROutSampClkPeriodShorterThanGenPulseTrainPeriod2',
- -201022: u'COCannotKeepUpInHWTimedSinglePointPolled',
- -201021: u'WriteRecoveryCannotKeepUpInHWTimedSinglePoint',
- -201020: u'NoChangeDetectionOnSelectedLineForDevice',
- -201019: u'SMIOPauseTriggersNotSupportedWithChannelExpansion',
- -201018: u'ClockMasterForExternalClockNotLongestPipeline',
- -201017: u'UnsupportedUnicodeByteOrderMarker',
- -201016: u'TooManyInstructionsInLoopInScript',
- -201015: u'PLLNotLocked',
- -201014: u'IfElseBlockNotAllowedInFiniteRepeatLoopInScript',
- -201013: u'IfElseBlockNotAllowedInConditionalRepeatLoopInScript',
- -201012: u'ClearIsLastInstructionInIfElseBlockInScript',
- -201011: u'InvalidWaitDurationBeforeIfElseBlockInScript',
- -201010: u'MarkerPosInvalidBeforeIfElseBlockInScript',
- -201009: u'InvalidSubsetLengthBeforeIfElseBlockInScript',
- -201008: u'InvalidWaveformLengthBeforeIfElseBlockInScript',
- -201007: u'GenerateOrFiniteWaitInstructionExpectedBeforeIfElseBlockInScript',
- -201006: u'CalPasswordNotSupported',
- -201005: u'SetupCalNeededBeforeAdjustCal',
- -201004: u'MultipleChansNotSupportedDuringCalSetup',
- -201003: u'DevCannotBeAccessed',
- -201002: u'SampClkRateDoesntMatchSampClkSrc',
- -201001: u'SampClkRateNotSupportedWithEARDisabled',
- -201000: u'LabVIEWVersionDoesntSupportDAQmxEvents',
- -200999: u'COReadyForNewValNotSupportedWithOnDemand',
- -200998: u'CIHWTimedSinglePointNotSupportedForMeasType',
- -200997: u'OnDemandNotSupportedWithHWTimedSinglePoint',
- -200996: u'HWTimedSinglePointAndDataXferNotProgIO',
- -200995: u'MemMapAndHWTimedSinglePoint',
- -200994: u'CannotSetPropertyWhenHWTimedSinglePointTaskIsRunning',
- -200993: u'CTROutSampClkPeriodShorterThanGenPulseTrainPeriod',
- -200992: u'TooManyEventsGenerated',
- -200991: u'MStudioCppRemoveEventsBeforeStop',
- -200990: u'CAPICannotRegisterSyncEventsFromMultipleThreads',
- -200989: u'ReadWaitNextSampClkWaitMismatchTwo',
- -200988: u'ReadWaitNextSampClkWaitMismatchOne',
- -200987: u'DAQmxSignalEventTypeNotSupportedByChanTypesOrDevicesInTask',
- -200986: u'CannotUnregisterDAQmxSoftwareEventWhileTaskIsRunning',
- -200985: u'AutoStartWriteNotAllowedEventRegistered',
- -200984: u'AutoStartReadNotAllowedEventRegistered',
- -200983: u'CannotGetPropertyWhenTaskNotReservedCommittedOrRunning',
- -200982: u'SignalEventsNotSupportedByDevice',
- -200981: u'EveryNSamplesAcqIntoBufferEventNotSupportedByDevice',
- -200980: u'EveryNSampsTransferredFromBufferEventNotSupportedByDevice',
- -200979: u'CAPISyncEventsTaskStateChangeNotAllowedFromDifferentThread',
- -200978: u'DAQmxSWEventsWithDifferentCallMechanisms',
- -200977: u'CantSaveChanWithPolyCalScaleAndAllowInteractiveEdit',
- -200976: u'ChanDoesNotSupportCJC',
- -200975: u'COReadyForNewValNotSupportedWithHWTimedSinglePoint',
- -200974: u'DACAllowConnToGndNotSupportedByDevWhenRefSrcExt',
- -200973: u'CantGetPropertyTaskNotRunning',
- -200972: u'CantSetPropertyTaskNotRunning',
- -200971: u'CantSetPropertyTaskNotRunningCommitted',
- -200970: u'AIEveryNSampsEventIntervalNotMultipleOf2',
- -200969: u'InvalidTEDSPhysChanNotAI',
- -200968: u'CAPICannotPerformTaskOperationInAsyncCallback',
- -200967: u'EveryNSampsTransferredFromBufferEventAlreadyRegistered',
- -200966: u'EveryNSampsAcqIntoBufferEventAlreadyRegistered',
- -200965: u'EveryNSampsTransferredFromBufferNotForInput',
- -200964: u'EveryNSampsAcqIntoBufferNotForOutput',
- -200963: u'AOSampTimingTypeDifferentIn2Tasks',
- -200962: u'CouldNotDownloadFirmwareHWDamaged',
- -200961: u'CouldNotDownloadFirmwareFileMissingOrDamaged',
- -200960: u'CannotRegisterDAQmxSoftwareEventWhileTaskIsRunning',
- -200959: u'DifferentRawDataCompression',
- -200958: u'ConfiguredTEDSInterfaceDevNotDetected',
- -200957: u'CompressedSampSizeExceedsResolution',
- -200956: u'ChanDoesNotSupportCompression',
- -200955: u'DifferentRawDataFormats',
- -200954: u'SampClkOutputTermIncludesStartTrigSrc',
- -200953: u'StartTrigSrcEqualToSampClkSrc',
- -200952: u'EventOutputTermIncludesTrigSrc',
- -200951: u'COMultipleWritesBetweenSampClks',
- -200950: u'DoneEventAlreadyRegistered',
- -200949: u'SignalEventAlreadyRegistered',
- -200948: u'CannotHaveTimedLoopAndDAQmxSignalEventsInSameTask',
- -200947: u'NeedLabVIEW711PatchToUseDAQmxEvents',
- -200946: u'StartFailedDueToWriteFailure',
- -200945: u'DataXferCustomThresholdNotDMAXferMethodSpecifiedForDev',
- -200944: u'DataXferRequestConditionNotSpecifiedForCustomThreshold',
- -200943: u'DataXferCustomThresholdNotSpecified',
- -200942: u'CAPISyncCallbackNotSupportedOnThisPlatform',
- -200941: u'CalChanReversePolyCoefNotSpecd',
- -200940: u'CalChanForwardPolyCoefNotSpecd',
- -200939: u'ChanCalRepeatedNumberInPreScaledVals',
- -200938: u'ChanCalTableNumScaledNotEqualNumPrescaledVals',
- -200937: u'ChanCalTableScaledValsNotSpecd',
- -200936: u'ChanCalTablePreScaledValsNotSpecd',
- -200935: u'ChanCalScaleTypeNotSet',
- -200934: u'ChanCalExpired',
- -200933: u'ChanCalExpirationDateNotSet',
- -200932: u'3OutputPortCombinationGivenSampTimingType653x',
- -200931: u'3InputPortCombinationGivenSampTimingType653x',
- -200930: u'2OutputPortCombinationGivenSampTimingType653x',
- -200929: u'2InputPortCombinationGivenSampTimingType653x',
- -200928: u'PatternMatcherMayBeUsedByOneTrigOnly',
- -200927: u'NoChansSpecdForPatternSource',
- -200926: u'ChangeDetectionChanNotInTask',
- -200925: u'ChangeDetectionChanNotTristated',
- -200924: u'WaitModeValueNotSupportedNonBuffered',
- -200923: u'WaitModePropertyNotSupportedNonBuffered',
- -200922: u'CantSavePerLineConfigDigChanSoInteractiveEditsAllowed',
- -200921: u'CantSaveNonPortMultiLineDigChanSoInteractiveEditsAllowed',
- -200920: u'BufferSizeNotMultipleOfEveryNSampsEventIntervalNoIrqOnDev',
- -200919: u'GlobalTaskNameAlreadyChanName',
- -200918: u'GlobalChanNameAlreadyTaskName',
- -200917: u'AOEveryNSampsEventIntervalNotMultipleOf2',
- -200916: u'SampleTimebaseDivisorNotSupportedGivenTimingType',
- -200915: u'HandshakeEventOutputTermNotSupportedGivenTimingType',
- -200914: u'ChangeDetectionOutputTermNotSupportedGivenTimingType',
- -200913: u'ReadyForTransferOutputTermNotSupportedGivenTimingType',
- -200912: u'RefTrigOutputTermNotSupportedGivenTimingType',
- -200911: u'StartTrigOutputTermNotSupportedGivenTimingType',
- -200910: u'SampClockOutputTermNotSupportedGivenTimingType',
- -200909: u'20MhzTimebaseNotSupportedGivenTimingType',
- -200908: u'SampClockSourceNotSupportedGivenTimingType',
- -200907: u'RefTrigTypeNotSupportedGivenTimingType',
- -200906: u'PauseTrigTypeNotSupportedGivenTimingType',
- -200905: u'HandshakeTrigTypeNotSupportedGivenTimingType',
- -200904: u'StartTrigTypeNotSupportedGivenTimingType',
- -200903: u'RefClkSrcNotSupported',
- -200902: u'DataVoltageLowAndHighIncompatible',
- -200901: u'InvalidCharInDigPatternString',
- -200900: u'CantUsePort3AloneGivenSampTimingTypeOn653x',
- -200899: u'CantUsePort1AloneGivenSampTimingTypeOn653x',
- -200898: u'PartialUseOfPhysicalLinesWithinPortNotSupported653x',
- -200897: u'PhysicalChanNotSupportedGivenSampTimingType653x',
- -200896: u'CanExportOnlyDigEdgeTrigs',
- -200895: u'RefTrigDigPatternSizeDoesNotMatchSourceSize',
- -200894: u'StartTrigDigPatternSizeDoesNotMatchSourceSize',
- -200893: u'ChangeDetectionRisingAndFallingEdgeChanDontMatch',
- -200892: u'PhysicalChansForChangeDetectionAndPatternMatch653x',
- -200891: u'CanExportOnlyOnboardSampClk',
- -200890: u'InternalSampClkNotRisingEdge',
- -200889: u'RefTrigDigPatternChanNotInTask',
- -200888: u'RefTrigDigPatternChanNotTristated',
- -200887: u'StartTrigDigPatternChanNotInTask',
- -200886: u'StartTrigDigPatternChanNotTristated',
- -200885: u'PXIStarAndClock10Sync',
- -200884: u'GlobalChanCannotBeSavedSoInteractiveEditsAllowed',
- -200883: u'TaskCannotBeSavedSoInteractiveEditsAllowed',
- -200882: u'InvalidGlobalChan',
- -200881: u'EveryNSampsEventAlreadyRegistered',
- -200880: u'EveryNSampsEventIntervalZeroNotSupported',
- -200879: u'ChanSizeTooBigForU16PortWrite',
- -200878: u'ChanSizeTooBigForU16PortRead',
- -200877: u'BufferSizeNotMultipleOfEveryNSampsEventIntervalWhenDMA',
- -200876: u'WriteWhenTaskNotRunningCOTicks',
- -200875: u'WriteWhenTaskNotRunningCOFreq',
- -200874: u'WriteWhenTaskNotRunningCOTime',
- -200873: u'AOMinMaxNotSupportedDACRangeTooSmall',
- -200872: u'AOMinMaxNotSupportedGivenDACRange',
- -200871: u'AOMinMaxNotSupportedGivenDACRangeAndOffsetVal',
- -200870: u'AOMinMaxNotSupportedDACOffsetValInappropriate',
- -200869: u'AOMinMaxNotSupportedGivenDACOffsetVal',
- -200868: u'AOMinMaxNotSupportedDACRefValTooSmall',
- -200867: u'AOMinMaxNotSupportedGivenDACRefVal',
- -200866: u'AOMinMaxNotSupportedGivenDACRefAndOffsetVal',
- -200865: u'WhenAcqCompAndNumSampsPerChanExceedsOnBrdBufSize',
- -200864: u'WhenAcqCompAndNoRefTrig',
- -200863: u'WaitForNextSampClkNotSupported',
- -200862: u'DevInUnidentifiedPXIChassis',
- -200861: u'MaxSoundPressureMicSensitivitRelatedAIPropertiesNotSupportedByDev',
- -200860: u'MaxSoundPressureAndMicSensitivityNotSupportedByDev',
- -200859: u'AOBufferSizeZeroForSampClkTimingType',
- -200858: u'AOCallWriteBeforeStartForSampClkTimingType',
- -200857: u'InvalidCalLowPassCutoffFreq',
- -200856: u'SimulationCannotBeDisabledForDevCreatedAsSimulatedDev',
- -200855: u'CannotAddNewDevsAfterTaskConfiguration',
- -200854: u'DifftSyncPulseSrcAndSampClkTimebaseSrcDevMultiDevTask',
- -200853: u'TermWithoutDevInMultiDevTask',
- -200852: u'SyncNoDevSampClkTimebaseOrSyncPulseInPXISlot2',
- -200851: u'PhysicalChanNotOnThisConnector',
- -200850: u'NumSampsToWaitNotGreaterThanZeroInScript',
- -200849: u'NumSampsToWaitNotMultipleOfAlignmentQuantumInScript',
- -200848: u'EveryNSamplesEventNotSupportedForNonBufferedTasks',
- -200847: u'BufferedAndDataXferPIO',
- -200846: u'CannotWriteWhenAutoStartFalseAndTaskNotRunning',
- -200845: u'NonBufferedAndDataXferInterrupts',
- -200844: u'WriteFailedMultipleCtrsWithFREQOUT',
- -200843: u'ReadNotCompleteBefore3SampClkEdges',
- -200842: u'CtrHWTimedSinglePointAndDataXferNotProgIO',
- -200841: u'PrescalerNot1ForInputTerminal',
- -200840: u'PrescalerNot1ForTimebaseSrc',
- -200839: u'SampClkTimingTypeWhenTristateIsFalse',
- -200838: u'OutputBufferSizeNotMultOfXferSize',
- -200837: u'SampPerChanNotMultOfXferSize',
- -200836: u'WriteToTEDSFailed',
- -200835: u'SCXIDevNotUsablePowerTurnedOff',
- -200834: u'CannotReadWhenAutoStartFalseBufSizeZeroAndTaskNotRunning',
- -200833: u'CannotReadWhenAutoStartFalseHWTimedSinglePtAndTaskNotRunning',
- -200832: u'CannotReadWhenAutoStartFalseOnDemandAndTaskNotRunning',
- -200831: u'SimultaneousAOWhenNotOnDemandTiming',
- -200830: u'MemMapAndSimultaneousAO',
- -200829: u'WriteFailedMultipleCOOutputTypes',
- -200828: u'WriteToTEDSNotSupportedOnRT',
- -200827: u'VirtualTEDSDataFileError',
- -200826: u'TEDSSensorDataError',
- -200825: u'DataSizeMoreThanSizeOfEEPROMOnTEDS',
- -200824: u'PROMOnTEDSContainsBasicTEDSData',
- -200823: u'PROMOnTEDSAlreadyWritten',
- -200822: u'TEDSDoesNotContainPROM',
- -200821: u'HWTimedSinglePointNotSupportedAI',
- -200820: u'HWTimedSinglePointOddNumChansInAITask',
- -200819: u'CantUseOnlyOnBoardMemWithProgrammedIO',
- -200818: u'SwitchDevShutDownDueToHighTemp',
- -200817: u'ExcitationNotSupportedWhenTermCfgDiff',
- -200816: u'TEDSMinElecValGEMaxElecVal',
- -200815: u'TEDSMinPhysValGEMaxPhysVal',
- -200814: u'CIOnboardClockNotSupportedAsInputTerm',
- -200813: u'InvalidSampModeForPositionMeas',
- -200812: u'TrigWhenAOHWTimedSinglePtSampMode',
- -200811: u'DAQmxCantUseStringDueToUnknownChar',
- -200810: u'DAQmxCantRetrieveStringDueToUnknownChar',
- -200809: u'ClearTEDSNotSupportedOnRT',
- -200808: u'CfgTEDSNotSupportedOnRT',
- -200807: u'ProgFilterClkCfgdToDifferentMinPulseWidthBySameTask1PerDev',
- -200806: u'ProgFilterClkCfgdToDifferentMinPulseWidthByAnotherTask1PerDev',
- -200804: u'NoLastExtCalDateTimeLastExtCalNotDAQmx',
- -200803: u'CannotWriteNotStartedAutoStartFalseNotOnDemandHWTimedSglPt',
- -200802: u'CannotWriteNotStartedAutoStartFalseNotOnDemandBufSizeZero',
- -200801: u'COInvalidTimingSrcDueToSignal',
- -200800: u'CIInvalidTimingSrcForSampClkDueToSampTimingType',
- -200799: u'CIInvalidTimingSrcForEventCntDueToSampMode',
- -200798: u'NoChangeDetectOnNonInputDigLineForDev',
- -200797: u'EmptyStringTermNameNotSupported',
- -200796: u'MemMapEnabledForHWTimedNonBufferedAO',
- -200795: u'DevOnboardMemOverflowDuringHWTimedNonBufferedGen',
- -200794: u'CODAQmxWriteMultipleChans',
- -200793: u'CantMaintainExistingValueAOSync',
- -200792: u'MStudioMultiplePhysChansNotSupported',
- -200791: u'CantConfigureTEDSForChan',
- -200790: u'WriteDataTypeTooSmall',
- -200789: u'ReadDataTypeTooSmall',
- -200788: u'MeasuredBridgeOffsetTooHigh',
- -200787: u'StartTrigConflictWithCOHWTimedSinglePt',
- -200786: u'SampClkRateExtSampClkTimebaseRateMismatch',
- -200785: u'InvalidTimingSrcDueToSampTimingType',
- -200784: u'VirtualTEDSFileNotFound',
- -200783: u'MStudioNoForwardPolyScaleCoeffs',
- -200782: u'MStudioNoReversePolyScaleCoeffs',
- -200781: u'MStudioNoPolyScaleCoeffsUseCalc',
- -200780: u'MStudioNoForwardPolyScaleCoeffsUseCalc',
- -200779: u'MStudioNoReversePolyScaleCoeffsUseCalc',
- -200778: u'COSampModeSampTimingTypeSampClkConflict',
- -200777: u'DevCannotProduceMinPulseWidth',
- -200776: u'CannotProduceMinPulseWidthGivenPropertyValues',
- -200775: u'TermCfgdToDifferentMinPulseWidthByAnotherTask',
- -200774: u'TermCfgdToDifferentMinPulseWidthByAnotherProperty',
- -200773: u'DigSyncNotAvailableOnTerm',
- -200772: u'DigFilterNotAvailableOnTerm',
- -200771: u'DigFilterEnabledMinPulseWidthNotCfg',
- -200770: u'DigFilterAndSyncBothEnabled',
- -200769: u'HWTimedSinglePointAOAndDataXferNotProgIO',
- -200768: u'NonBufferedAOAndDataXferNotProgIO',
- -200767: u'ProgIODataXferForBufferedAO',
- -200766: u'TEDSLegacyTemplateIDInvalidOrUnsupported',
- -200765: u'TEDSMappingMethodInvalidOrUnsupported',
- -200764: u'TEDSLinearMappingSlopeZero',
- -200763: u'AIInputBufferSizeNotMultOfXferSize',
- -200762: u'NoSyncPulseExtSampClkTimebase',
- -200761: u'NoSyncPulseAnotherTaskRunning',
- -200760: u'AOMinMaxNotInGainRange',
- -200759: u'AOMinMaxNotInDACRange',
- -200758: u'DevOnlySupportsSampClkTimingAO',
- -200757: u'DevOnlySupportsSampClkTimingAI',
- -200756: u'TEDSIncompatibleSensorAndMeasType',
- -200755: u'TEDSMultipleCalTemplatesNotSupported',
- -200754: u'TEDSTemplateParametersNotSupported',
- -200753: u'ParsingTEDSData',
- -200752: u'MultipleActivePhysChansNotSupported',
- -200751: u'NoChansSpecdForChangeDetect',
- -200750: u'InvalidCalVoltageForGivenGain',
- -200749: u'InvalidCalGain',
- -200748: u'MultipleWritesBetweenSampClks',
- -200747: u'InvalidAcqTypeForFREQOUT',
- -200746: u'SuitableTimebaseNotFoundTimeCombo2',
- -200745: u'SuitableTimebaseNotFoundFrequencyCombo2',
- -200744: u'RefClkRateRefClkSrcMismatch',
- -200743: u'NoTEDSTerminalBlock',
- -200742: u'CorruptedTEDSMemory',
- -200741: u'TEDSNotSupported',
- -200740: u'TimingSrcTaskStartedBeforeTimedLoop',
- -200739: u'PropertyNotSupportedForTimingSrc',
- -200738: u'TimingSrcDoesNotExist',
- -200737: u'InputBufferSizeNotEqualSampsPerChanForFiniteSampMode',
- -200736: u'FREQOUTCannotProduceDesiredFrequency2',
- -200735: u'ExtRefClkRateNotSpecified',
- -200734: u'DeviceDoesNotSupportDMADataXferForNonBufferedAcq',
- -200733: u'DigFilterMinPulseWidthSetWhenTristateIsFalse',
- -200732: u'DigFilterEnableSetWhenTristateIsFalse',
- -200731: u'NoHWTimingWithOnDemand',
- -200730: u'CannotDetectChangesWhenTristateIsFalse',
- -200729: u'CannotHandshakeWhenTristateIsFalse',
- -200728: u'LinesUsedForStaticInputNotForHandshakingControl',
- -200727: u'LinesUsedForHandshakingControlNotForStaticInput',
- -200726: u'LinesUsedForStaticInputNotForHandshakingInput',
- -200725: u'LinesUsedForHandshakingInputNotForStaticInput',
- -200724: u'DifferentDITristateValsForChansInTask',
- -200723: u'TimebaseCalFreqVarianceTooLarge',
- -200722: u'TimebaseCalFailedToConverge',
- -200721: u'InadequateResolutionForTimebaseCal',
- -200720: u'InvalidAOGainCalConst',
- -200719: u'InvalidAOOffsetCalConst',
- -200718: u'InvalidAIGainCalConst',
- -200717: u'InvalidAIOffsetCalConst',
- -200716: u'DigOutputOverrun',
- -200715: u'DigInputOverrun',
- -200714: u'AcqStoppedDriverCantXferDataFastEnough',
- -200713: u'ChansCantAppearInSameTask',
- -200712: u'InputCfgFailedBecauseWatchdogExpired',
- -200711: u'AnalogTrigChanNotExternal',
- -200710: u'TooManyChansForInternalAIInputSrc',
- -200709: u'TEDSSensorNotDetected',
- -200708: u'PrptyGetSpecdActiveItemFailedDueToDifftValues',
- -200706: u'RoutingDestTermPXIClk10InNotInSlot2',
- -200705: u'RoutingDestTermPXIStarXNotInSlot2',
- -200704: u'RoutingSrcTermPXIStarXNotInSlot2',
- -200703: u'RoutingSrcTermPXIStarInSlot16AndAbove',
- -200702: u'RoutingDestTermPXIStarInSlot16AndAbove',
- -200701: u'RoutingDestTermPXIStarInSlot2',
- -200700: u'RoutingSrcTermPXIStarInSlot2',
- -200699: u'RoutingDestTermPXIChassisNotIdentified',
- -200698: u'RoutingSrcTermPXIChassisNotIdentified',
- -200697: u'FailedToAcquireCalData',
- -200696: u'BridgeOffsetNullingCalNotSupported',
- -200695: u'AIMaxNotSpecified',
- -200694: u'AIMinNotSpecified',
- -200693: u'OddTotalBufferSizeToWrite',
- -200692: u'OddTotalNumSampsToWrite',
- -200691: u'BufferWithWaitMode',
- -200690: u'BufferWithHWTimedSinglePointSampMode',
- -200689: u'COWritePulseLowTicksNotSupported',
- -200688: u'COWritePulseHighTicksNotSupported',
- -200687: u'COWritePulseLowTimeOutOfRange',
- -200686: u'COWritePulseHighTimeOutOfRange',
- -200685: u'COWriteFreqOutOfRange',
- -200684: u'COWriteDutyCycleOutOfRange',
- -200683: u'InvalidInstallation',
- -200682: u'RefTrigMasterSessionUnavailable',
- -200681: u'RouteFailedBecauseWatchdogExpired',
- -200680: u'DeviceShutDownDueToHighTemp',
- -200679: u'NoMemMapWhenHWTimedSinglePoint',
- -200678: u'WriteFailedBecauseWatchdogExpired',
- -200677: u'DifftInternalAIInputSrcs',
- -200676: u'DifftAIInputSrcInOneChanGroup',
- -200675: u'InternalAIInputSrcInMultChanGroups',
- -200674: u'SwitchOpFailedDueToPrevError',
- -200673: u'WroteMultiSampsUsingSingleSampWrite',
- -200672: u'MismatchedInputArraySizes',
- -200671: u'CantExceedRelayDriveLimit',
- -200670: u'DACRngLowNotEqualToMinusRefVal',
- -200669: u'CantAllowConnectDACToGnd',
- -200668: u'WatchdogTimeoutOutOfRangeAndNotSpecialVal',
- -200667: u'NoWatchdogOutputOnPortReservedForInput',
- -200666: u'NoInputOnPortCfgdForWatchdogOutput',
- -200665: u'WatchdogExpirationStateNotEqualForLinesInPort',
- -200664: u'CannotPerformOpWhenTaskNotReserved',
- -200663: u'PowerupStateNotSupported',
- -200662: u'WatchdogTimerNotSupported',
- -200661: u'OpNotSupportedWhenRefClkSrcNone',
- -200660: u'SampClkRateUnavailable',
- -200659: u'PrptyGetSpecdSingleActiveChanFailedDueToDifftVals',
- -200658: u'PrptyGetImpliedActiveChanFailedDueToDifftVals',
- -200657: u'PrptyGetSpecdActiveChanFailedDueToDifftVals',
- -200656: u'NoRegenWhenUsingBrdMem',
- -200655: u'NonbufferedReadMoreThanSampsPerChan',
- -200654: u'WatchdogExpirationTristateNotSpecdForEntirePort',
- -200653: u'PowerupTristateNotSpecdForEntirePort',
- -200652: u'PowerupStateNotSpecdForEntirePort',
- -200651: u'CantSetWatchdogExpirationOnDigInChan',
- -200650: u'CantSetPowerupStateOnDigInChan',
- -200649: u'PhysChanNotInTask',
- -200648: u'PhysChanDevNotInTask',
- -200647: u'DigInputNotSupported',
- -200646: u'DigFilterIntervalNotEqualForLines',
- -200645: u'DigFilterIntervalAlreadyCfgd',
- -200644: u'CantResetExpiredWatchdog',
- -200643: u'ActiveChanTooManyLinesSpecdWhenGettingPrpty',
- -200642: u'ActiveChanNotSpecdWhenGetting1LinePrpty',
- -200641: u'DigPrptyCannotBeSetPerLine',
- -200640: u'SendAdvCmpltAfterWaitForTrigInScanlist',
- -200639: u'DisconnectionRequiredInScanlist',
- -200638: u'TwoWaitForTrigsAfterConnectionInScanlist',
- -200637: u'ActionSeparatorRequiredAfterBreakingConnectionInScanlist',
- -200636: u'ConnectionInScanlistMustWaitForTrig',
- -200635: u'ActionNotSupportedTaskNotWatchdog',
- -200634: u'WfmNameSameAsScriptName',
- -200633: u'ScriptNameSameAsWfmName',
- -200632: u'DSFStopClock',
- -200631: u'DSFReadyForStartClock',
- -200630: u'WriteOffsetNotMultOfIncr',
- -200629: u'DifferentPrptyValsNotSupportedOnDev',
- -200628: u'RefAndPauseTrigConfigured',
- -200627: u'FailedToEnableHighSpeedInputClock',
- -200626: u'EmptyPhysChanInPowerUpStatesArray',
- -200625: u'ActivePhysChanTooManyLinesSpecdWhenGettingPrpty',
- -200624: u'ActivePhysChanNotSpecdWhenGetting1LinePrpty',
- -200623: u'PXIDevTempCausedShutDown',
- -200622: u'InvalidNumSampsToWrite',
- -200621: u'OutputFIFOUnderflow2',
- -200620: u'RepeatedAIPhysicalChan',
- -200619: u'MultScanOpsInOneChassis',
- -200618: u'InvalidAIChanOrder',
- -200617: u'ReversePowerProtectionActivated',
- -200616: u'InvalidAsynOpHandle',
- -200615: u'FailedToEnableHighSpeedOutput',
- -200614: u'CannotReadPastEndOfRecord',
- -200613: u'AcqStoppedToPreventInputBufferOverwriteOneDataXferMech',
- -200612: u'ZeroBasedChanIndexInvalid',
- -200611: u'NoChansOfGivenTypeInTask',
- -200610: u'SampClkSrcInvalidForOutputValidForInput',
- -200609: u'OutputBufSizeTooSmallToStartGen',
- -200608: u'InputBufSizeTooSmallToStartAcq',
- -200607: u'ExportTwoSignalsOnSameTerminal',
- -200606: u'ChanIndexInvalid',
- -200605: u'RangeSyntaxNumberTooBig',
- -200604: u'NULLPtr',
- -200603: u'ScaledMinEqualMax',
- -200602: u'PreScaledMinEqualMax',
- -200601: u'PropertyNotSupportedForScaleType',
- -200600: u'ChannelNameGenerationNumberTooBig',
- -200599: u'RepeatedNumberInScaledValues',
- -200598: u'RepeatedNumberInPreScaledValues',
- -200597: u'LinesAlreadyReservedForOutput',
- -200596: u'SwitchOperationChansSpanMultipleDevsInList',
- -200595: u'InvalidIDInListAtBeginningOfSwitchOperation',
- -200594: u'MStudioInvalidPolyDirection',
- -200593: u'MStudioPropertyGetWhileTaskNotVerified',
- -200592: u'RangeWithTooManyObjects',
- -200591: u'CppDotNetAPINegativeBufferSize',
- -200590: u'CppCantRemoveInvalidEventHandler',
- -200589: u'CppCantRemoveEventHandlerTwice',
- -200588: u'CppCantRemoveOtherObjectsEventHandler',
- -200587: u'DigLinesReservedOrUnavailable',
- -200586: u'DSFFailedToResetStream',
- -200585: u'DSFReadyForOutputNotAsserted',
- -200584: u'SampToWritePerChanNotMultipleOfIncr',
- -200583: u'AOPropertiesCauseVoltageBelowMin',
- -200582: u'AOPropertiesCauseVoltageOverMax',
- -200581: u'PropertyNotSupportedWhenRefClkSrcNone',
- -200580: u'AIMaxTooSmall',
- -200579: u'AIMaxTooLarge',
- -200578: u'AIMinTooSmall',
- -200577: u'AIMinTooLarge',
- -200576: u'BuiltInCJCSrcNotSupported',
- -200575: u'TooManyPostTrigSampsPerChan',
- -200574: u'TrigLineNotFoundSingleDevRoute',
- -200573: u'DifferentInternalAIInputSources',
- -200572: u'DifferentAIInputSrcInOneChanGroup',
- -200571: u'InternalAIInputSrcInMultipleChanGroups',
- -200570: u'CAPIChanIndexInvalid',
- -200569: u'CollectionDoesNotMatchChanType',
- -200568: u'OutputCantStartChangedRegenerationMode',
- -200567: u'OutputCantStartChangedBufferSize',
- -200566: u'ChanSizeTooBigForU32PortWrite',
- -200565: u'ChanSizeTooBigForU8PortWrite',
- -200564: u'ChanSizeTooBigForU32PortRead',
- -200563: u'ChanSizeTooBigForU8PortRead',
- -200562: u'InvalidDigDataWrite',
- -200561: u'InvalidAODataWrite',
- -200560: u'WaitUntilDoneDoesNotIndicateDone',
- -200559: u'MultiChanTypesInTask',
- -200558: u'MultiDevsInTask',
- -200557: u'CannotSetPropertyWhenTaskRunning',
- -200556: u'CannotGetPropertyWhenTaskNotCommittedOrRunning',
- -200555: u'LeadingUnderscoreInString',
- -200554: u'TrailingSpaceInString',
- -200553: u'LeadingSpaceInString',
- -200552: u'InvalidCharInString',
- -200551: u'DLLBecameUnlocked',
- -200550: u'DLLLock',
- -200549: u'SelfCalConstsInvalid',
- -200548: u'InvalidTrigCouplingExceptForExtTrigChan',
- -200547: u'WriteFailsBufferSizeAutoConfigured',
- -200546: u'ExtCalAdjustExtRefVoltageFailed',
- -200545: u'SelfCalFailedExtNoiseOrRefVoltageOutOfCal',
- -200544: u'ExtCalTemperatureNotDAQmx',
- -200543: u'ExtCalDateTimeNotDAQmx',
- -200542: u'SelfCalTemperatureNotDAQmx',
- -200541: u'SelfCalDateTimeNotDAQmx',
- -200540: u'DACRefValNotSet',
- -200539: u'AnalogMultiSampWriteNotSupported',
- -200538: u'InvalidActionInControlTask',
- -200537: u'PolyCoeffsInconsistent',
- -200536: u'SensorValTooLow',
- -200535: u'SensorValTooHigh',
- -200534: u'WaveformNameTooLong',
- -200533: u'IdentifierTooLongInScript',
- -200532: u'UnexpectedIDFollowingSwitchChanName',
- -200531: u'RelayNameNotSpecifiedInList',
- -200530: u'UnexpectedIDFollowingRelayNameInList',
- -200529: u'UnexpectedIDFollowingSwitchOpInList',
- -200528: u'InvalidLineGrouping',
- -200527: u'CtrMinMax',
- -200526: u'WriteChanTypeMismatch',
- -200525: u'ReadChanTypeMismatch',
- -200524: u'WriteNumChansMismatch',
- -200523: u'OneChanReadForMultiChanTask',
- -200522: u'CannotSelfCalDuringExtCal',
- -200521: u'MeasCalAdjustOscillatorPhaseDAC',
- -200520: u'InvalidCalConstCalADCAdjustment',
- -200519: u'InvalidCalConstOscillatorFreqDACValue',
- -200518: u'InvalidCalConstOscillatorPhaseDACValue',
- -200517: u'InvalidCalConstOffsetDACValue',
- -200516: u'InvalidCalConstGainDACValue',
- -200515: u'InvalidNumCalADCReadsToAverage',
- -200514: u'InvalidCfgCalAdjustDirectPathOutputImpedance',
- -200513: u'InvalidCfgCalAdjustMainPathOutputImpedance',
- -200512: u'InvalidCfgCalAdjustMainPathPostAmpGainAndOffset',
- -200511: u'InvalidCfgCalAdjustMainPathPreAmpGain',
- -200510: u'InvalidCfgCalAdjustMainPreAmpOffset',
- -200509: u'MeasCalAdjustCalADC',
- -200508: u'MeasCalAdjustOscillatorFrequency',
- -200507: u'MeasCalAdjustDirectPathOutputImpedance',
- -200506: u'MeasCalAdjustMainPathOutputImpedance',
- -200505: u'MeasCalAdjustDirectPathGain',
- -200504: u'MeasCalAdjustMainPathPostAmpGainAndOffset',
- -200503: u'MeasCalAdjustMainPathPreAmpGain',
- -200502: u'MeasCalAdjustMainPathPreAmpOffset',
- -200501: u'InvalidDateTimeInEEPROM',
- -200500: u'UnableToLocateErrorResources',
- -200499: u'DotNetAPINotUnsigned32BitNumber',
- -200498: u'InvalidRangeOfObjectsSyntaxInString',
- -200497: u'AttemptToEnableLineNotPreviouslyDisabled',
- -200496: u'InvalidCharInPattern',
- -200495: u'IntermediateBufferFull',
- -200494: u'LoadTaskFailsBecauseNoTimingOnDev',
- -200493: u'CAPIReservedParamNotNULLNorEmpty',
- -200492: u'CAPIReservedParamNotNULL',
- -200491: u'CAPIReservedParamNotZero',
- -200490: u'SampleValueOutOfRange',
- -200489: u'ChanAlreadyInTask',
- -200488: u'VirtualChanDoesNotExist',
- -200486: u'ChanNotInTask',
- -200485: u'TaskNotInDataNeighborhood',
- -200484: u'CantSaveTaskWithoutReplace',
- -200483: u'CantSaveChanWithoutReplace',
- -200482: u'DevNotInTask',
- -200481: u'DevAlreadyInTask',
- -200479: u'CanNotPerformOpWhileTaskRunning',
- -200478: u'CanNotPerformOpWhenNoChansInTask',
- -200477: u'CanNotPerformOpWhenNoDevInTask',
- -200475: u'CannotPerformOpWhenTaskNotRunning',
- -200474: u'OperationTimedOut',
- -200473: u'CannotReadWhenAutoStartFalseAndTaskNotRunningOrCommitted',
- -200472: u'CannotWriteWhenAutoStartFalseAndTaskNotRunningOrCommitted',
- -200470: u'TaskVersionNew',
- -200469: u'ChanVersionNew',
- -200467: u'EmptyString',
- -200466: u'ChannelSizeTooBigForPortReadType',
- -200465: u'ChannelSizeTooBigForPortWriteType',
- -200464: u'ExpectedNumberOfChannelsVerificationFailed',
- -200463: u'NumLinesMismatchInReadOrWrite',
- -200462: u'OutputBufferEmpty',
- -200461: u'InvalidChanName',
- -200460: u'ReadNoInputChansInTask',
- -200459: u'WriteNoOutputChansInTask',
- -200457: u'PropertyNotSupportedNotInputTask',
- -200456: u'PropertyNotSupportedNotOutputTask',
- -200455: u'GetPropertyNotInputBufferedTask',
- -200454: u'GetPropertyNotOutputBufferedTask',
- -200453: u'InvalidTimeoutVal',
- -200452: u'AttributeNotSupportedInTaskContext',
- -200451: u'AttributeNotQueryableUnlessTaskIsCommitted',
- -200450: u'AttributeNotSettableWhenTaskIsRunning',
- -200449: u'DACRngLowNotMinusRefValNorZero',
- -200448: u'DACRngHighNotEqualRefVal',
- -200447: u'UnitsNotFromCustomScale',
- -200446: u'InvalidVoltageReadingDuringExtCal',
- -200445: u'CalFunctionNotSupported',
- -200444: u'InvalidPhysicalChanForCal',
- -200443: u'ExtCalNotComplete',
- -200442: u'CantSyncToExtStimulusFreqDuringCal',
- -200441: u'UnableToDetectExtStimulusFreqDuringCal',
- -200440: u'InvalidCloseAction',
- -200439: u'ExtCalFunctionOutsideExtCalSession',
- -200438: u'InvalidCalArea',
- -200437: u'ExtCalConstsInvalid',
- -200436: u'StartTrigDelayWithExtSampClk',
- -200435: u'DelayFromSampClkWithExtConv',
- -200434: u'FewerThan2PreScaledVals',
- -200433: u'FewerThan2ScaledValues',
- -200432: u'PhysChanOutputType',
- -200431: u'PhysChanMeasType',
- -200430: u'InvalidPhysChanType',
- -200429: u'LabVIEWEmptyTaskOrChans',
- -200428: u'LabVIEWInvalidTaskOrChans',
- -200427: u'InvalidRefClkRate',
- -200426: u'InvalidExtTrigImpedance',
- -200425: u'HystTrigLevelAIMax',
- -200424: u'LineNumIncompatibleWithVideoSignalFormat',
- -200423: u'TrigWindowAIMinAIMaxCombo',
- -200422: u'TrigAIMinAIMax',
- -200421: u'HystTrigLevelAIMin',
- -200420: u'InvalidSampRateConsiderRIS',
- -200419: u'InvalidReadPosDuringRIS',
- -200418: u'ImmedTrigDuringRISMode',
- -200417: u'TDCNotEnabledDuringRISMode',
- -200416: u'MultiRecWithRIS',
- -200415: u'InvalidRefClkSrc',
- -200414: u'InvalidSampClkSrc',
- -200413: u'InsufficientOnBoardMemForNumRecsAndSamps',
- -200412: u'InvalidAIAttenuation',
- -200411: u'ACCouplingNotAllowedWith50OhmImpedance',
- -200410: u'InvalidRecordNum',
- -200409: u'ZeroSlopeLinearScale',
- -200408: u'ZeroReversePolyScaleCoeffs',
- -200407: u'ZeroForwardPolyScaleCoeffs',
- -200406: u'NoReversePolyScaleCoeffs',
- -200405: u'NoForwardPolyScaleCoeffs',
- -200404: u'NoPolyScaleCoeffs',
- -200403: u'ReversePolyOrderLessThanNumPtsToCompute',
- -200402: u'ReversePolyOrderNotPositive',
- -200401: u'NumPtsToComputeNotPositive',
- -200400: u'WaveformLengthNotMultipleOfIncr',
- -200399: u'CAPINoExtendedErrorInfoAvailable',
- -200398: u'CVIFunctionNotFoundInDAQmxDLL',
- -200397: u'CVIFailedToLoadDAQmxDLL',
- -200396: u'NoCommonTrigLineForImmedRoute',
- -200395: u'NoCommonTrigLineForTaskRoute',
- -200394: u'F64PrptyValNotUnsignedInt',
- -200393: u'RegisterNotWritable',
- -200392: u'InvalidOutputVoltageAtSampClkRate',
- -200391: u'StrobePhaseShiftDCMBecameUnlocked',
- -200390: u'DrivePhaseShiftDCMBecameUnlocked',
- -200389: u'ClkOutPhaseShiftDCMBecameUnlocked',
- -200388: u'OutputBoardClkDCMBecameUnlocked',
- -200387: u'InputBoardClkDCMBecameUnlocked',
- -200386: u'InternalClkDCMBecameUnlocked',
- -200385: u'DCMLock',
- -200384: u'DataLineReservedForDynamicOutput',
- -200383: u'InvalidRefClkSrcGivenSampClkSrc',
- -200382: u'NoPatternMatcherAvailable',
- -200381: u'InvalidDelaySampRateBelowPhaseShiftDCMThresh',
- -200380: u'StrainGageCalibration',
- -200379: u'InvalidExtClockFreqAndDivCombo',
- -200378: u'CustomScaleDoesNotExist',
- -200377: u'OnlyFrontEndChanOpsDuringScan',
- -200376: u'InvalidOptionForDigitalPortChannel',
- -200375: u'UnsupportedSignalTypeExportSignal',
- -200374: u'InvalidSignalTypeExportSignal',
- -200373: u'UnsupportedTrigTypeSendsSWTrig',
- -200372: u'InvalidTrigTypeSendsSWTrig',
- -200371: u'RepeatedPhysicalChan',
- -200370: u'ResourcesInUseForRouteInTask',
- -200369: u'ResourcesInUseForRoute',
- -200368: u'RouteNotSupportedByHW',
- -200367: u'ResourcesInUseForExportSignalPolarity',
- -200366: u'ResourcesInUseForInversionInTask',
- -200365: u'ResourcesInUseForInversion',
- -200364: u'ExportSignalPolarityNotSupportedByHW',
- -200363: u'InversionNotSupportedByHW',
- -200362: u'OverloadedChansExistNotRead',
- -200361: u'InputFIFOOverflow2',
- -200360: u'CJCChanNotSpecd',
- -200359: u'CtrExportSignalNotPossible',
- -200358: u'RefTrigWhenContinuous',
- -200357: u'IncompatibleSensorOutputAndDeviceInputRanges',
- -200356: u'CustomScaleNameUsed',
- -200355: u'PropertyValNotSupportedByHW',
- -200354: u'PropertyValNotValidTermName',
- -200353: u'ResourcesInUseForProperty',
- -200352: u'CJCChanAlreadyUsed',
- -200351: u'ForwardPolynomialCoefNotSpecd',
- -200350: u'TableScaleNumPreScaledAndScaledValsNotEqual',
- -200349: u'TableScalePreScaledValsNotSpecd',
- -200348: u'TableScaleScaledValsNotSpecd',
- -200347: u'IntermediateBufferSizeNotMultipleOfIncr',
- -200346: u'EventPulseWidthOutOfRange',
- -200345: u'EventDelayOutOfRange',
- -200344: u'SampPerChanNotMultipleOfIncr',
- -200343: u'CannotCalculateNumSampsTaskNotStarted',
- -200342: u'ScriptNotInMem',
- -200341: u'OnboardMemTooSmall',
- -200340: u'ReadAllAvailableDataWithoutBuffer',
- -200339: u'PulseActiveAtStart',
- -200338: u'CalTempNotSupported',
- -200337: u'DelayFromSampClkTooLong',
- -200336: u'DelayFromSampClkTooShort',
- -200335: u'AIConvRateTooHigh',
- -200334: u'DelayFromStartTrigTooLong',
- -200333: u'DelayFromStartTrigTooShort',
- -200332: u'SampRateTooHigh',
- -200331: u'SampRateTooLow',
- -200330: u'PFI0UsedForAnalogAndDigitalSrc',
- -200329: u'PrimingCfgFIFO',
- -200328: u'CannotOpenTopologyCfgFile',
- -200327: u'InvalidDTInsideWfmDataType',
- -200326: u'RouteSrcAndDestSame',
- -200325: u'ReversePolynomialCoefNotSpecd',
- -200324: u'DevAbsentOrUnavailable',
- -200323: u'NoAdvTrigForMultiDevScan',
- -200322: u'InterruptsInsufficientDataXferMech',
- -200321: u'InvalidAttentuationBasedOnMinMax',
- -200320: u'CabledModuleCannotRouteSSH',
- -200319: u'CabledModuleCannotRouteConvClk',
- -200318: u'InvalidExcitValForScaling',
- -200317: u'NoDevMemForScript',
- -200316: u'ScriptDataUnderflow',
- -200315: u'NoDevMemForWaveform',
- -200314: u'StreamDCMBecameUnlocked',
- -200313: u'StreamDCMLock',
- -200312: u'WaveformNotInMem',
- -200311: u'WaveformWriteOutOfBounds',
- -200310: u'WaveformPreviouslyAllocated',
- -200309: u'SampClkTbMasterTbDivNotAppropriateForSampTbSrc',
- -200308: u'SampTbRateSampTbSrcMismatch',
- -200307: u'MasterTbRateMasterTbSrcMismatch',
- -200306: u'SampsPerChanTooBig',
- -200305: u'FinitePulseTrainNotPossible',
- -200304: u'ExtMasterTimebaseRateNotSpecified',
- -200303: u'ExtSampClkSrcNotSpecified',
- -200302: u'InputSignalSlowerThanMeasTime',
- -200301: u'CannotUpdatePulseGenProperty',
- -200300: u'InvalidTimingType',
- -200297: u'PropertyUnavailWhenUsingOnboardMemory',
- -200295: u'CannotWriteAfterStartWithOnboardMemory',
- -200294: u'NotEnoughSampsWrittenForInitialXferRqstCondition',
- -200293: u'NoMoreSpace',
- -200292: u'SamplesCanNotYetBeWritten',
- -200291: u'GenStoppedToPreventIntermediateBufferRegenOfOldSamples',
- -200290: u'GenStoppedToPreventRegenOfOldSamples',
- -200289: u'SamplesNoLongerWriteable',
- -200288: u'SamplesWillNeverBeGenerated',
- -200287: u'NegativeWriteSampleNumber',
- -200286: u'NoAcqStarted',
- -200284: u'SamplesNotYetAvailable',
- -200283: u'AcqStoppedToPreventIntermediateBufferOverflow',
- -200282: u'NoRefTrigConfigured',
- -200281: u'CannotReadRelativeToRefTrigUntilDone',
- -200279: u'SamplesNoLongerAvailable',
- -200278: u'SamplesWillNeverBeAvailable',
- -200277: u'NegativeReadSampleNumber',
- -200276: u'ExternalSampClkAndRefClkThruSameTerm',
- -200275: u'ExtSampClkRateTooLowForClkIn',
- -200274: u'ExtSampClkRateTooHighForBackplane',
- -200273: u'SampClkRateAndDivCombo',
- -200272: u'SampClkRateTooLowForDivDown',
- -200271: u'ProductOfAOMinAndGainTooSmall',
- -200270: u'InterpolationRateNotPossible',
- -200269: u'OffsetTooLarge',
- -200268: u'OffsetTooSmall',
- -200267: u'ProductOfAOMaxAndGainTooLarge',
- -200266: u'MinAndMaxNotSymmetric',
- -200265: u'InvalidAnalogTrigSrc',
- -200264: u'TooManyChansForAnalogRefTrig',
- -200263: u'TooManyChansForAnalogPauseTrig',
- -200262: u'TrigWhenOnDemandSampTiming',
- -200261: u'InconsistentAnalogTrigSettings',
- -200260: u'MemMapDataXferModeSampTimingCombo',
- -200259: u'InvalidJumperedAttr',
- -200258: u'InvalidGainBasedOnMinMax',
- -200257: u'InconsistentExcit',
- -200256: u'TopologyNotSupportedByCfgTermBlock',
- -200255: u'BuiltInTempSensorNotSupported',
- -200254: u'InvalidTerm',
- -200253: u'CannotTristateTerm',
- -200252: u'CannotTristateBusyTerm',
- -200251: u'NoDMAChansAvailable',
- -200250: u'InvalidWaveformLengthWithinLoopInScript',
- -200249: u'InvalidSubsetLengthWithinLoopInScript',
- -200248: u'MarkerPosInvalidForLoopInScript',
- -200247: u'IntegerExpectedInScript',
- -200246: u'PLLBecameUnlocked',
- -200245: u'PLLLock',
- -200244: u'DDCClkOutDCMBecameUnlocked',
- -200243: u'DDCClkOutDCMLock',
- -200242: u'ClkDoublerDCMBecameUnlocked',
- -200241: u'ClkDoublerDCMLock',
- -200240: u'SampClkDCMBecameUnlocked',
- -200239: u'SampClkDCMLock',
- -200238: u'SampClkTimebaseDCMBecameUnlocked',
- -200237: u'SampClkTimebaseDCMLock',
- -200236: u'AttrCannotBeReset',
- -200235: u'ExplanationNotFound',
- -200234: u'WriteBufferTooSmall',
- -200233: u'SpecifiedAttrNotValid',
- -200232: u'AttrCannotBeRead',
- -200231: u'AttrCannotBeSet',
- -200230: u'NULLPtrForC_Api',
- -200229: u'ReadBufferTooSmall',
- -200228: u'BufferTooSmallForString',
- -200227: u'NoAvailTrigLinesOnDevice',
- -200226: u'TrigBusLineNotAvail',
- -200225: u'CouldNotReserveRequestedTrigLine',
- -200224: u'TrigLineNotFound',
- -200223: u'SCXI1126ThreshHystCombination',
- -200222: u'AcqStoppedToPreventInputBufferOverwrite',
- -200221: u'TimeoutExceeded',
- -200220: u'InvalidDeviceID',
- -200219: u'InvalidAOChanOrder',
- -200218: u'SampleTimingTypeAndDataXferMode',
- -200217: u'BufferWithOnDemandSampTiming',
- -200216: u'BufferAndDataXferMode',
- -200215: u'MemMapAndBuffer',
- -200214: u'NoAnalogTrigHW',
- -200213: u'TooManyPretrigPlusMinPostTrigSamps',
- -200212: u'InconsistentUnitsSpecified',
- -200211: u'MultipleRelaysForSingleRelayOp',
- -200210: u'MultipleDevIDsPerChassisSpecifiedInList',
- -200209: u'DuplicateDevIDInList',
- -200208: u'InvalidRangeStatementCharInList',
- -200207: u'InvalidDeviceIDInList',
- -200206: u'TriggerPolarityConflict',
- -200205: u'CannotScanWithCurrentTopology',
- -200204: u'UnexpectedIdentifierInFullySpecifiedPathInList',
- -200203: u'SwitchCannotDriveMultipleTrigLines',
- -200202: u'InvalidRelayName',
- -200201: u'SwitchScanlistTooBig',
- -200200: u'SwitchChanInUse',
- -200199: u'SwitchNotResetBeforeScan',
- -200198: u'InvalidTopology',
- -200197: u'AttrNotSupported',
- -200196: u'UnexpectedEndOfActionsInList',
- -200195: u'PowerLimitExceeded',
- -200194: u'HWUnexpectedlyPoweredOffAndOn',
- -200193: u'SwitchOperationNotSupported',
- -200192: u'OnlyContinuousScanSupported',
- -200191: u'SwitchDifferentTopologyWhenScanning',
- -200190: u'DisconnectPathNotSameAsExistingPath',
- -200189: u'ConnectionNotPermittedOnChanReservedForRouting',
- -200188: u'CannotConnectSrcChans',
- -200187: u'CannotConnectChannelToItself',
- -200186: u'ChannelNotReservedForRouting',
- -200185: u'CannotConnectChansDirectly',
- -200184: u'ChansAlreadyConnected',
- -200183: u'ChanDuplicatedInPath',
- -200182: u'NoPathToDisconnect',
- -200181: u'InvalidSwitchChan',
- -200180: u'NoPathAvailableBetween2SwitchChans',
- -200179: u'ExplicitConnectionExists',
- -200178: u'SwitchDifferentSettlingTimeWhenScanning',
- -200177: u'OperationOnlyPermittedWhileScanning',
- -200176: u'OperationNotPermittedWhileScanning',
- -200175: u'HardwareNotResponding',
- -200173: u'InvalidSampAndMasterTimebaseRateCombo',
- -200172: u'NonZeroBufferSizeInProgIOXfer',
- -200171: u'VirtualChanNameUsed',
- -200170: u'PhysicalChanDoesNotExist',
- -200169: u'MemMapOnlyForProgIOXfer',
- -200168: u'TooManyChans',
- -200167: u'CannotHaveCJTempWithOtherChans',
- -200166: u'OutputBufferUnderwrite',
- -200163: u'SensorInvalidCompletionResistance',
- -200162: u'VoltageExcitIncompatibleWith2WireCfg',
- -200161: u'IntExcitSrcNotAvailable',
- -200160: u'CannotCreateChannelAfterTaskVerified',
- -200159: u'LinesReservedForSCXIControl',
- -200158: u'CouldNotReserveLinesForSCXIControl',
- -200157: u'CalibrationFailed',
- -200156: u'ReferenceFrequencyInvalid',
- -200155: u'ReferenceResistanceInvalid',
- -200154: u'ReferenceCurrentInvalid',
- -200153: u'ReferenceVoltageInvalid',
- -200152: u'EEPROMDataInvalid',
- -200151: u'CabledModuleNotCapableOfRoutingAI',
- -200150: u'ChannelNotAvailableInParallelMode',
- -200149: u'ExternalTimebaseRateNotKnownForDelay',
- -200148: u'FREQOUTCannotProduceDesiredFrequency',
- -200147: u'MultipleCounterInputTask',
- -200146: u'CounterStartPauseTriggerConflict',
- -200145: u'CounterInputPauseTriggerAndSampleClockInvalid',
- -200144: u'CounterOutputPauseTriggerInvalid',
- -200143: u'CounterTimebaseRateNotSpecified',
- -200142: u'CounterTimebaseRateNotFound',
- -200141: u'CounterOverflow',
- -200140: u'CounterNoTimebaseEdgesBetweenGates',
- -200139: u'CounterMaxMinRangeFreq',
- -200138: u'CounterMaxMinRangeTime',
- -200137: u'SuitableTimebaseNotFoundTimeCombo',
- -200136: u'SuitableTimebaseNotFoundFrequencyCombo',
- -200135: u'InternalTimebaseSourceDivisorCombo',
- -200134: u'InternalTimebaseSourceRateCombo',
- -200133: u'InternalTimebaseRateDivisorSourceCombo',
- -200132: u'ExternalTimebaseRateNotknownForRate',
- -200131: u'AnalogTrigChanNotFirstInScanList',
- -200130: u'NoDivisorForExternalSignal',
- -200128: u'AttributeInconsistentAcrossRepeatedPhysicalChannels',
- -200127: u'CannotHandshakeWithPort0',
- -200126: u'ControlLineConflictOnPortC',
- -200125: u'Lines4To7ConfiguredForOutput',
- -200124: u'Lines4To7ConfiguredForInput',
- -200123: u'Lines0To3ConfiguredForOutput',
- -200122: u'Lines0To3ConfiguredForInput',
- -200121: u'PortConfiguredForOutput',
- -200120: u'PortConfiguredForInput',
- -200119: u'PortConfiguredForStaticDigitalOps',
- -200118: u'PortReservedForHandshaking',
- -200117: u'PortDoesNotSupportHandshakingDataIO',
- -200116: u'CannotTristate8255OutputLines',
- -200113: u'TemperatureOutOfRangeForCalibration',
- -200112: u'CalibrationHandleInvalid',
- -200111: u'PasswordRequired',
- -200110: u'IncorrectPassword',
- -200109: u'PasswordTooLong',
- -200108: u'CalibrationSessionAlreadyOpen',
- -200107: u'SCXIModuleIncorrect',
- -200106: u'AttributeInconsistentAcrossChannelsOnDevice',
- -200105: u'SCXI1122ResistanceChanNotSupportedForCfg',
- -200104: u'BracketPairingMismatchInList',
- -200103: u'InconsistentNumSamplesToWrite',
- -200102: u'IncorrectDigitalPattern',
- -200101: u'IncorrectNumChannelsToWrite',
- -200100: u'IncorrectReadFunction',
- -200099: u'PhysicalChannelNotSpecified',
- -200098: u'MoreThanOneTerminal',
- -200097: u'MoreThanOneActiveChannelSpecified',
- -200096: u'InvalidNumberSamplesToRead',
- -200095: u'AnalogWaveformExpected',
- -200094: u'DigitalWaveformExpected',
- -200093: u'ActiveChannelNotSpecified',
- -200092: u'FunctionNotSupportedForDeviceTasks',
- -200091: u'FunctionNotInLibrary',
- -200090: u'LibraryNotPresent',
- -200089: u'DuplicateTask',
- -200088: u'InvalidTask',
- -200087: u'InvalidChannel',
- -200086: u'InvalidSyntaxForPhysicalChannelRange',
- -200082: u'MinNotLessThanMax',
- -200081: u'SampleRateNumChansConvertPeriodCombo',
- -200079: u'AODuringCounter1DMAConflict',
- -200078: u'AIDuringCounter0DMAConflict',
- -200077: u'InvalidAttributeValue',
- -200076: u'SuppliedCurrentDataOutsideSpecifiedRange',
- -200075: u'SuppliedVoltageDataOutsideSpecifiedRange',
- -200074: u'CannotStoreCalConst',
- -200073: u'SCXIModuleNotFound',
- -200072: u'DuplicatePhysicalChansNotSupported',
- -200071: u'TooManyPhysicalChansInList',
- -200070: u'InvalidAdvanceEventTriggerType',
- -200069: u'DeviceIsNotAValidSwitch',
- -200068: u'DeviceDoesNotSupportScanning',
- -200067: u'ScanListCannotBeTimed',
- -200066: u'ConnectOperatorInvalidAtPointInList',
- -200065: u'UnexpectedSwitchActionInList',
- -200064: u'UnexpectedSeparatorInList',
- -200063: u'ExpectedTerminatorInList',
- -200062: u'ExpectedConnectOperatorInList',
- -200061: u'ExpectedSeparatorInList',
- -200060: u'FullySpecifiedPathInListContainsRange',
- -200059: u'ConnectionSeparatorAtEndOfList',
- -200058: u'IdentifierInListTooLong',
- -200057: u'DuplicateDeviceIDInListWhenSettling',
- -200056: u'ChannelNameNotSpecifiedInList',
- -200055: u'DeviceIDNotSpecifiedInList',
- -200054: u'SemicolonDoesNotFollowRangeInList',
- -200053: u'SwitchActionInListSpansMultipleDevices',
- -200052: u'RangeWithoutAConnectActionInList',
- -200051: u'InvalidIdentifierFollowingSeparatorInList',
- -200050: u'InvalidChannelNameInList',
- -200049: u'InvalidNumberInRepeatStatementInList',
- -200048: u'InvalidTriggerLineInList',
- -200047: u'InvalidIdentifierInListFollowingDeviceID',
- -200046: u'InvalidIdentifierInListAtEndOfSwitchAction',
- -200045: u'DeviceRemoved',
- -200044: u'RoutingPathNotAvailable',
- -200043: u'RoutingHardwareBusy',
- -200042: u'RequestedSignalInversionForRoutingNotPossible',
- -200041: u'InvalidRoutingDestinationTerminalName',
- -200040: u'InvalidRoutingSourceTerminalName',
- -200039: u'RoutingNotSupportedForDevice',
- -200038: u'WaitIsLastInstructionOfLoopInScript',
- -200037: u'ClearIsLastInstructionOfLoopInScript',
- -200036: u'InvalidLoopIterationsInScript',
- -200035: u'RepeatLoopNestingTooDeepInScript',
- -200034: u'MarkerPositionOutsideSubsetInScript',
- -200033: u'SubsetStartOffsetNotAlignedInScript',
- -200032: u'InvalidSubsetLengthInScript',
- -200031: u'MarkerPositionNotAlignedInScript',
- -200030: u'SubsetOutsideWaveformInScript',
- -200029: u'MarkerOutsideWaveformInScript',
- -200028: u'WaveformInScriptNotInMem',
- -200027: u'KeywordExpectedInScript',
- -200026: u'BufferNameExpectedInScript',
- -200025: u'ProcedureNameExpectedInScript',
- -200024: u'ScriptHasInvalidIdentifier',
- -200023: u'ScriptHasInvalidCharacter',
- -200022: u'ResourceAlreadyReserved',
- -200020: u'SelfTestFailed',
- -200019: u'ADCOverrun',
- -200018: u'DACUnderflow',
- -200017: u'InputFIFOUnderflow',
- -200016: u'OutputFIFOUnderflow',
- -200015: u'SCXISerialCommunication',
- -200014: u'DigitalTerminalSpecifiedMoreThanOnce',
- -200012: u'DigitalOutputNotSupported',
- -200011: u'InconsistentChannelDirections',
- -200010: u'InputFIFOOverflow',
- -200009: u'TimeStampOverwritten',
- -200008: u'StopTriggerHasNotOccurred',
- -200007: u'RecordNotAvailable',
- -200006: u'RecordOverwritten',
- -200005: u'DataNotAvailable',
- -200004: u'DataOverwrittenInDeviceMemory',
- -200003: u'DuplicatedChannel',
- -89167: u'RoutingDestTermPXIDStarXNotInSystemTimingSlot_Routing',
- -89166: u'RoutingSrcTermPXIDStarXNotInSystemTimingSlot_Routing',
- -89165: u'RoutingSrcTermPXIDStarInNonDStarTriggerSlot_Routing',
- -89164: u'RoutingDestTermPXIDStarInNonDStarTriggerSlot_Routing',
- -89162: u'RoutingDestTermPXIClk10InNotInStarTriggerSlot_Routing',
- -89161: u'RoutingDestTermPXIClk10InNotInSystemTimingSlot_Routing',
- -89160: u'RoutingDestTermPXIStarXNotInStarTriggerSlot_Routing',
- -89159: u'RoutingDestTermPXIStarXNotInSystemTimingSlot_Routing',
- -89158: u'RoutingSrcTermPXIStarXNotInStarTriggerSlot_Routing',
- -89157: u'RoutingSrcTermPXIStarXNotInSystemTimingSlot_Routing',
- -89156: u'RoutingSrcTermPXIStarInNonStarTriggerSlot_Routing',
- -89155: u'RoutingDestTermPXIStarInNonStarTriggerSlot_Routing',
- -89154: u'RoutingDestTermPXIStarInStarTriggerSlot_Routing',
- -89153: u'RoutingDestTermPXIStarInSystemTimingSlot_Routing',
- -89152: u'RoutingSrcTermPXIStarInStarTriggerSlot_Routing',
- -89151: u'RoutingSrcTermPXIStarInSystemTimingSlot_Routing',
- -89150: u'InvalidSignalModifier_Routing',
- -89149: u'RoutingDestTermPXIClk10InNotInSlot2_Routing',
- -89148: u'RoutingDestTermPXIStarXNotInSlot2_Routing',
- -89147: u'RoutingSrcTermPXIStarXNotInSlot2_Routing',
- -89146: u'RoutingSrcTermPXIStarInSlot16AndAbove_Routing',
- -89145: u'RoutingDestTermPXIStarInSlot16AndAbove_Routing',
- -89144: u'RoutingDestTermPXIStarInSlot2_Routing',
- -89143: u'RoutingSrcTermPXIStarInSlot2_Routing',
- -89142: u'RoutingDestTermPXIChassisNotIdentified_Routing',
- -89141: u'RoutingSrcTermPXIChassisNotIdentified_Routing',
- -89140: u'TrigLineNotFoundSingleDevRoute_Routing',
- -89139: u'NoCommonTrigLineForRoute_Routing',
- -89138: u'ResourcesInUseForRouteInTask_Routing',
- -89137: u'ResourcesInUseForRoute_Routing',
- -89136: u'RouteNotSupportedByHW_Routing',
- -89135: u'ResourcesInUseForInversionInTask_Routing',
- -89134: u'ResourcesInUseForInversion_Routing',
- -89133: u'InversionNotSupportedByHW_Routing',
- -89132: u'ResourcesInUseForProperty_Routing',
- -89131: u'RouteSrcAndDestSame_Routing',
- -89130: u'DevAbsentOrUnavailable_Routing',
- -89129: u'InvalidTerm_Routing',
- -89128: u'CannotTristateTerm_Routing',
- -89127: u'CannotTristateBusyTerm_Routing',
- -89126: u'CouldNotReserveRequestedTrigLine_Routing',
- -89125: u'TrigLineNotFound_Routing',
- -89124: u'RoutingPathNotAvailable_Routing',
- -89123: u'RoutingHardwareBusy_Routing',
- -89122: u'RequestedSignalInversionForRoutingNotPossible_Routing',
- -89121: u'InvalidRoutingDestinationTerminalName_Routing',
- -89120: u'InvalidRoutingSourceTerminalName_Routing',
- -88907: u'ServiceLocatorNotAvailable_Routing',
- -88900: u'CouldNotConnectToServer_Routing',
- -88720: u'DeviceNameContainsSpacesOrPunctuation_Routing',
- -88719: u'DeviceNameContainsNonprintableCharacters_Routing',
- -88718: u'DeviceNameIsEmpty_Routing',
- -88717: u'DeviceNameNotFound_Routing',
- -88716: u'LocalRemoteDriverVersionMismatch_Routing',
- -88715: u'DuplicateDeviceName_Routing',
- -88710: u'RuntimeAborting_Routing',
- -88709: u'RuntimeAborted_Routing',
- -88708: u'ResourceNotInPool_Routing',
- -88705: u'DriverDeviceGUIDNotFound_Routing',
- -50808: u'PALUSBTransactionError',
- -50807: u'PALIsocStreamBufferError',
- -50806: u'PALInvalidAddressComponent',
- -50805: u'PALSharingViolation',
- -50804: u'PALInvalidDeviceState',
- -50803: u'PALConnectionReset',
- -50802: u'PALConnectionAborted',
- -50801: u'PALConnectionRefused',
- -50800: u'PALBusResetOccurred',
- -50700: u'PALWaitInterrupted',
- -50651: u'PALMessageUnderflow',
- -50650: u'PALMessageOverflow',
- -50604: u'PALThreadAlreadyDead',
- -50603: u'PALThreadStackSizeNotSupported',
- -50602: u'PALThreadControllerIsNotThreadCreator',
- -50601: u'PALThreadHasNoThreadObject',
- -50600: u'PALThreadCouldNotRun',
- -50551: u'PALSyncAbandoned',
- -50550: u'PALSyncTimedOut',
- -50503: u'PALReceiverSocketInvalid',
- -50502: u'PALSocketListenerInvalid',
- -50501: u'PALSocketListenerAlreadyRegistered',
- -50500: u'PALDispatcherAlreadyExported',
- -50450: u'PALDMALinkEventMissed',
- -50413: u'PALBusError',
- -50412: u'PALRetryLimitExceeded',
- -50411: u'PALTransferOverread',
- -50410: u'PALTransferOverwritten',
- -50409: u'PALPhysicalBufferFull',
- -50408: u'PALPhysicalBufferEmpty',
- -50407: u'PALLogicalBufferFull',
- -50406: u'PALLogicalBufferEmpty',
- -50405: u'PALTransferAborted',
- -50404: u'PALTransferStopped',
- -50403: u'PALTransferInProgress',
- -50402: u'PALTransferNotInProgress',
- -50401: u'PALCommunicationsFault',
- -50400: u'PALTransferTimedOut',
- -50355: u'PALMemoryHeapNotEmpty',
- -50354: u'PALMemoryBlockCheckFailed',
- -50353: u'PALMemoryPageLockFailed',
- -50352: u'PALMemoryFull',
- -50351: u'PALMemoryAlignmentFault',
- -50350: u'PALMemoryConfigurationFault',
- -50303: u'PALDeviceInitializationFault',
- -50302: u'PALDeviceNotSupported',
- -50301: u'PALDeviceUnknown',
- -50300: u'PALDeviceNotFound',
- -50265: u'PALFeatureDisabled',
- -50264: u'PALComponentBusy',
- -50263: u'PALComponentAlreadyInstalled',
- -50262: u'PALComponentNotUnloadable',
- -50261: u'PALComponentNeverLoaded',
- -50260: u'PALComponentAlreadyLoaded',
- -50259: u'PALComponentCircularDependency',
- -50258: u'PALComponentInitializationFault',
- -50257: u'PALComponentImageCorrupt',
- -50256: u'PALFeatureNotSupported',
- -50255: u'PALFunctionNotFound',
- -50254: u'PALFunctionObsolete',
- -50253: u'PALComponentTooNew',
- -50252: u'PALComponentTooOld',
- -50251: u'PALComponentNotFound',
- -50250: u'PALVersionMismatch',
- -50209: u'PALFileFault',
- -50208: u'PALFileWriteFault',
- -50207: u'PALFileReadFault',
- -50206: u'PALFileSeekFault',
- -50205: u'PALFileCloseFault',
- -50204: u'PALFileOpenFault',
- -50203: u'PALDiskFull',
- -50202: u'PALOSFault',
- -50201: u'PALOSInitializationFault',
- -50200: u'PALOSUnsupported',
- -50175: u'PALCalculationOverflow',
- -50152: u'PALHardwareFault',
- -50151: u'PALFirmwareFault',
- -50150: u'PALSoftwareFault',
- -50108: u'PALMessageQueueFull',
- -50107: u'PALResourceAmbiguous',
- -50106: u'PALResourceBusy',
- -50105: u'PALResourceInitialized',
- -50104: u'PALResourceNotInitialized',
- -50103: u'PALResourceReserved',
- -50102: u'PALResourceNotReserved',
- -50101: u'PALResourceNotAvailable',
- -50100: u'PALResourceOwnedBySystem',
- -50020: u'PALBadToken',
- -50019: u'PALBadThreadMultitask',
- -50018: u'PALBadLibrarySpecifier',
- -50017: u'PALBadAddressSpace',
- -50016: u'PALBadWindowType',
- -50015: u'PALBadAddressClass',
- -50014: u'PALBadWriteCount',
- -50013: u'PALBadWriteOffset',
- -50012: u'PALBadWriteMode',
- -50011: u'PALBadReadCount',
- -50010: u'PALBadReadOffset',
- -50009: u'PALBadReadMode',
- -50008: u'PALBadCount',
- -50007: u'PALBadOffset',
- -50006: u'PALBadMode',
- -50005: u'PALBadDataSize',
- -50004: u'PALBadPointer',
- -50003: u'PALBadSelector',
- -50002: u'PALBadDevice',
- -50001: u'PALIrrelevantAttribute',
- -50000: u'PALValueConflict',
- -26853: u'RetryCall',
- -26852: u'FileDoesNotExist',
- -26851: u'GenerationDisabled',
- -26850: u'AlreadyInitialized',
- -26809: u'PXISystemDescriptionParseError',
- -26808: u'PXISAConfigurationLocked',
- -26807: u'NotActiveResourceManager',
- -26806: u'InvalidAttribute',
- -26805: u'InvalidHandle',
- -26804: u'ServiceNotRunning',
- -26803: u'RecursiveCall',
- -26802: u'Timeout',
- -26801: u'UnspecifiedError',
- -26657: u'HandlerNotFound',
- -26656: u'IncorrectDataType',
- -26655: u'InconsistentFileFault',
- -26654: u'ChildNotFound',
- -26653: u'AttributeNotFound',
- -26652: u'IOError',
- -26600: u'PxiResmanMxsPxiSystemNotFound',
- -26550: u'PxiResmanPciDescriptionStringParseError',
- -26500: u'PxiResmanModuleParseError',
- -26403: u'PxiResmanSystemDescriptionSpecLimitation',
- -26402: u'PxiResmanSystemDescriptionWriteError',
- -26401: u'PxiResmanSystemDescriptionParseError',
- -26400: u'PxiResmanSystemDescriptionFileNotFound',
- -26302: u'PxiResmanControllerParseError',
- -26301: u'PxiResmanControllerTypeInvalid',
- -26300: u'PxiResmanControllerFileNotFound',
- -26206: u'PxiResmanChassisTriggerParseError',
- -26205: u'PxiResmanChassisBridgeParseError',
- -26204: u'PxiResmanChassisSlotParseError',
- -26203: u'PxiResmanChassisSegmentParseError',
- -26202: u'PxiResmanChassisParseError',
- -26201: u'PxiResmanChassisBridgeNotFound',
- -26200: u'PxiResmanChassisFileNotFound',
- -26113: u'InsufficientBuffer',
- -26112: u'DirCreateFault',
- -26111: u'AccessDenied',
- -26110: u'PathNotFound',
- -26109: u'FileExists',
- -26107: u'FileDeleteFault',
- -26106: u'FileCopyFault',
- -26105: u'FileCloseFault',
- -26103: u'FileNotFound',
- -26102: u'PxiResmanSystemNotInitialized',
- -26101: u'PxiResmanInvalidConfiguration',
- -26100: u'PxiResmanAllocationError',
- -26010: u'TrigmanDisconnected',
- -26009: u'TrigmanInvalidClient',
- -26008: u'TrigmanConflictingRoute',
- -26007: u'TrigmanConflictingRouteNoUnreserve',
- -26006: u'TrigmanConflictingRouteGeneric',
- -26005: u'TrigmanLineAlreadyReserved',
- -26004: u'TrigmanLineNotReservedUnroutable',
- -26003: u'TrigmanLineNotReserved',
- -26002: u'TrigmanInvalidParameter',
- -26001: u'TrigmanUnsupportedOper',
- -26000: u'TrigmanUnknownError',
- 26000: u'TrigmanUnknownError',
- 26001: u'TrigmanUnsupportedOper',
- 26002: u'TrigmanInvalidParameter',
- 26003: u'TrigmanLineNotReserved',
- 26004: u'TrigmanLineNotReservedUnroutable',
- 26005: u'TrigmanLineAlreadyReserved',
- 26006: u'TrigmanConflictingRouteGeneric',
- 26007: u'TrigmanConflictingRouteNoUnreserve',
- 26008: u'TrigmanConflictingRoute',
- 26009: u'TrigmanInvalidClient',
- 26010: u'TrigmanDisconnected',
- 26100: u'PxiResmanAllocationError',
- 26101: u'PxiResmanInvalidConfiguration',
- 26102: u'PxiResmanSystemNotInitialized',
- 26103: u'FileNotFound',
- 26105: u'FileCloseFault',
- 26106: u'FileCopyFault',
- 26107: u'FileDeleteFault',
- 26109: u'FileExists',
- 26110: u'PathNotFound',
- 26111: u'AccessDenied',
- 26112: u'DirCreateFault',
- 26113: u'InsufficientBuffer',
- 26200: u'PxiResmanChassisFileNotFound',
- 26201: u'PxiResmanChassisBridgeNotFound',
- 26202: u'PxiResmanChassisParseError',
- 26203: u'PxiResmanChassisSegmentParseError',
- 26204: u'PxiResmanChassisSlotParseError',
- 26205: u'PxiResmanChassisBridgeParseError',
- 26206: u'PxiResmanChassisTriggerParseError',
- 26300: u'PxiResmanControllerFileNotFound',
- 26301: u'PxiResmanControllerTypeInvalid',
- 26302: u'PxiResmanControllerParseError',
- 26400: u'PxiResmanSystemDescriptionFileNotFound',
- 26401: u'PxiResmanSystemDescriptionParseError',
- 26402: u'PxiResmanSystemDescriptionWriteError',
- 26403: u'PxiResmanSystemDescriptionSpecLimitation',
- 26500: u'PxiResmanModuleParseError',
- 26550: u'PxiResmanPciDescriptionStringParseError',
- 26600: u'PxiResmanMxsPxiSystemNotFound',
- 26652: u'IOError',
- 26653: u'AttributeNotFound',
- 26654: u'ChildNotFound',
- 26655: u'InconsistentFileFault',
- 26656: u'IncorrectDataType',
- 26657: u'HandlerNotFound',
- 26801: u'UnspecifiedError',
- 26802: u'Timeout',
- 26803: u'RecursiveCall',
- 26804: u'ServiceNotRunning',
- 26805: u'InvalidHandle',
- 26806: u'InvalidAttribute',
- 26807: u'NotActiveResourceManager',
- 26808: u'PXISAConfigurationLocked',
- 26809: u'PXISystemDescriptionParseError',
- 26850: u'AlreadyInitialized',
- 26851: u'GenerationDisabled',
- 26852: u'FileDoesNotExist',
- 26853: u'RetryCall',
- 50000: u'PALValueConflict',
- 50001: u'PALIrrelevantAttribute',
- 50002: u'PALBadDevice',
- 50003: u'PALBadSelector',
- 50004: u'PALBadPointer',
- 50005: u'PALBadDataSize',
- 50006: u'PALBadMode',
- 50007: u'PALBadOffset',
- 50008: u'PALBadCount',
- 50009: u'PALBadReadMode',
- 50010: u'PALBadReadOffset',
- 50011: u'PALBadReadCount',
- 50012: u'PALBadWriteMode',
- 50013: u'PALBadWriteOffset',
- 50014: u'PALBadWriteCount',
- 50015: u'PALBadAddressClass',
- 50016: u'PALBadWindowType',
- 50019: u'PALBadThreadMultitask',
- 50100: u'PALResourceOwnedBySystem',
- 50101: u'PALResourceNotAvailable',
- 50102: u'PALResourceNotReserved',
- 50103: u'PALResourceReserved',
- 50104: u'PALResourceNotInitialized',
- 50105: u'PALResourceInitialized',
- 50106: u'PALResourceBusy',
- 50107: u'PALResourceAmbiguous',
- 50151: u'PALFirmwareFault',
- 50152: u'PALHardwareFault',
- 50200: u'PALOSUnsupported',
- 50202: u'PALOSFault',
- 50254: u'PALFunctionObsolete',
- 50255: u'PALFunctionNotFound',
- 50256: u'PALFeatureNotSupported',
- 50258: u'PALComponentInitializationFault',
- 50260: u'PALComponentAlreadyLoaded',
- 50262: u'PALComponentNotUnloadable',
- 50351: u'PALMemoryAlignmentFault',
- 50355: u'PALMemoryHeapNotEmpty',
- 50402: u'PALTransferNotInProgress',
- 50403: u'PALTransferInProgress',
- 50404: u'PALTransferStopped',
- 50405: u'PALTransferAborted',
- 50406: u'PALLogicalBufferEmpty',
- 50407: u'PALLogicalBufferFull',
- 50408: u'PALPhysicalBufferEmpty',
- 50409: u'PALPhysicalBufferFull',
- 50410: u'PALTransferOverwritten',
- 50411: u'PALTransferOverread',
- 50500: u'PALDispatcherAlreadyExported',
- 50551: u'PALSyncAbandoned',
- 200003: u'TimestampCounterRolledOver',
- 200004: u'InputTerminationOverloaded',
- 200005: u'ADCOverloaded',
- 200007: u'PLLUnlocked',
- 200008: u'Counter0DMADuringAIConflict',
- 200009: u'Counter1DMADuringAOConflict',
- 200010: u'StoppedBeforeDone',
- 200011: u'RateViolatesSettlingTime',
- 200012: u'RateViolatesMaxADCRate',
- 200013: u'UserDefInfoStringTooLong',
- 200014: u'TooManyInterruptsPerSecond',
- 200015: u'PotentialGlitchDuringWrite',
- 200016: u'DevNotSelfCalibratedWithDAQmx',
- 200017: u'AISampRateTooLow',
- 200018: u'AIConvRateTooLow',
- 200019: u'ReadOffsetCoercion',
- 200020: u'PretrigCoercion',
- 200021: u'SampValCoercedToMax',
- 200022: u'SampValCoercedToMin',
- 200024: u'PropertyVersionNew',
- 200025: u'UserDefinedInfoTooLong',
- 200026: u'CAPIStringTruncatedToFitBuffer',
- 200027: u'SampClkRateTooLow',
- 200028: u'PossiblyInvalidCTRSampsInFiniteDMAAcq',
- 200029: u'RISAcqCompletedSomeBinsNotFilled',
- 200030: u'PXIDevTempExceedsMaxOpTemp',
- 200031: u'OutputGainTooLowForRFFreq',
- 200032: u'OutputGainTooHighForRFFreq',
- 200033: u'MultipleWritesBetweenSampClks',
- 200034: u'DeviceMayShutDownDueToHighTemp',
- 200035: u'RateViolatesMinADCRate',
- 200036: u'SampClkRateAboveDevSpecs',
- 200037: u'COPrevDAQmxWriteSettingsOverwrittenForHWTimedSinglePoint',
- 200038: u'LowpassFilterSettlingTimeExceedsUserTimeBetween2ADCConversions',
- 200039: u'LowpassFilterSettlingTimeExceedsDriverTimeBetween2ADCConversions',
- 200040: u'SampClkRateViolatesSettlingTimeForGen',
- 200041: u'InvalidCalConstValueForAI',
- 200042: u'InvalidCalConstValueForAO',
- 200043: u'ChanCalExpired',
- 200044: u'UnrecognizedEnumValueEncounteredInStorage',
- 200045: u'TableCRCNotCorrect',
- 200046: u'ExternalCRCNotCorrect',
- 200047: u'SelfCalCRCNotCorrect',
- 200048: u'DeviceSpecExceeded',
- 200049: u'OnlyGainCalibrated',
- 200050: u'ReversePowerProtectionActivated',
- 200051: u'OverVoltageProtectionActivated',
- 200052: u'BufferSizeNotMultipleOfSectorSize',
- 200053: u'SampleRateMayCauseAcqToFail',
- 200054: u'UserAreaCRCNotCorrect',
- 200055: u'PowerUpInfoCRCNotCorrect',
- 200056: u'ConnectionCountHasExceededRecommendedLimit',
- 200057: u'NetworkDeviceAlreadyAdded',
- 200058: u'AccessoryConnectionCountIsInvalid',
- 200059: u'UnableToDisconnectPorts',
- 200060: u'ReadRepeatedData',
- 200061: u'PXI5600_NotConfigured',
- 200062: u'PXI5661_IncorrectlyConfigured',
- 200063: u'PXIe5601_NotConfigured',
- 200064: u'PXIe5663_IncorrectlyConfigured',
- 200065: u'PXIe5663E_IncorrectlyConfigured',
- 200066: u'PXIe5603_NotConfigured',
- 200067: u'PXIe5665_5603_IncorrectlyConfigured',
- 200068: u'PXIe5667_5603_IncorrectlyConfigured',
- 200069: u'PXIe5605_NotConfigured',
- 200070: u'PXIe5665_5605_IncorrectlyConfigured',
- 200071: u'PXIe5667_5605_IncorrectlyConfigured',
- 200072: u'PXIe5606_NotConfigured',
- 200073: u'PXIe5665_5606_IncorrectlyConfigured',
- 200074: u'PXI5610_NotConfigured',
- 200075: u'PXI5610_IncorrectlyConfigured',
- 200076: u'PXIe5611_NotConfigured',
- 200077: u'PXIe5611_IncorrectlyConfigured',
- 200078: u'USBHotfixForDAQ',
- 209800: u'ReadNotCompleteBeforeSampClk',
- 209801: u'WriteNotCompleteBeforeSampClk',
- 209802: u'WaitForNextSampClkDetectedMissedSampClk'}
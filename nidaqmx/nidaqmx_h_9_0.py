@@ -1,2812 +0,0 @@
-# This file is auto-generated. Do not edit!
-
-from collections import namedtuple
-
-_d = {'AIConv_ActiveEdge': 6227,
- 'AIConv_DigFltr_Enable': 11996,
- 'AIConv_DigFltr_MinPulseWidth': 11997,
- 'AIConv_DigFltr_TimebaseRate': 11999,
- 'AIConv_DigFltr_TimebaseSrc': 11998,
- 'AIConv_DigSync_Enable': 12000,
- 'AIConv_MaxRate': 8905,
- 'AIConv_Rate': 6216,
- 'AIConv_Src': 5378,
- 'AIConv_TimebaseDiv': 4917,
- 'AIConv_Timebase_Src': 4921,
- 'AI_ACExcit_Freq': 257,
- 'AI_ACExcit_SyncEnable': 258,
- 'AI_ACExcit_WireMode': 6349,
- 'AI_ADCTimingMode': 10745,
- 'AI_Accel_Sensitivity': 1682,
- 'AI_Accel_SensitivityUnits': 8604,
- 'AI_Accel_Units': 1651,
- 'AI_Accel_dBRef': 10674,
- 'AI_Atten': 6145,
- 'AI_AutoZeroMode': 5984,
- 'AI_Bridge_Balance_CoarsePot': 6129,
- 'AI_Bridge_Balance_FinePot': 6388,
- 'AI_Bridge_Cfg': 135,
- 'AI_Bridge_InitialVoltage': 6125,
- 'AI_Bridge_NomResistance': 6124,
- 'AI_Bridge_ShuntCal_Enable': 148,
- 'AI_Bridge_ShuntCal_GainAdjust': 6463,
- 'AI_Bridge_ShuntCal_Select': 8661,
- 'AI_ChanCal_ApplyCalIfExp': 8857,
- 'AI_ChanCal_Desc': 8868,
- 'AI_ChanCal_EnableCal': 8856,
- 'AI_ChanCal_HasValidCalInfo': 8855,
- 'AI_ChanCal_OperatorName': 8867,
- 'AI_ChanCal_Poly_ForwardCoeff': 8863,
- 'AI_ChanCal_Poly_ReverseCoeff': 8864,
- 'AI_ChanCal_ScaleType': 8860,
- 'AI_ChanCal_Table_PreScaledVals': 8861,
- 'AI_ChanCal_Table_ScaledVals': 8862,
- 'AI_ChanCal_Verif_AcqVals': 8866,
- 'AI_ChanCal_Verif_RefVals': 8865,
- 'AI_Coupling': 100,
- 'AI_CurrentShunt_Loc': 6130,
- 'AI_CurrentShunt_Resistance': 6131,
- 'AI_Current_ACRMS_Units': 6115,
- 'AI_Current_Units': 1793,
- 'AI_CustomScaleName': 6112,
- 'AI_DCOffset': 10889,
- 'AI_DataXferCustomThreshold': 8972,
- 'AI_DataXferMech': 6177,
- 'AI_DataXferReqCond': 6283,
- 'AI_DevScalingCoeff': 6448,
- 'AI_Dither_Enable': 104,
- 'AI_EddyCurrentProxProbe_Sensitivity': 10942,
- 'AI_EddyCurrentProxProbe_SensitivityUnits': 10943,
- 'AI_EddyCurrentProxProbe_Units': 10944,
- 'AI_EnhancedAliasRejectionEnable': 8852,
- 'AI_Excit_ActualVal': 6275,
- 'AI_Excit_DCorAC': 6139,
- 'AI_Excit_Src': 6132,
- 'AI_Excit_UseForScaling': 6140,
- 'AI_Excit_UseMultiplexed': 8576,
- 'AI_Excit_Val': 6133,
- 'AI_Excit_VoltageOrCurrent': 6134,
- 'AI_ForceReadFromChan': 6392,
- 'AI_Freq_Hyst': 2068,
- 'AI_Freq_ThreshVoltage': 2069,
- 'AI_Freq_Units': 2054,
- 'AI_Gain': 6168,
- 'AI_Impedance': 98,
- 'AI_InputSrc': 8600,
- 'AI_Is_TEDS': 10627,
- 'AI_LVDT_Sensitivity': 2361,
- 'AI_LVDT_SensitivityUnits': 8602,
- 'AI_LVDT_Units': 2320,
- 'AI_LeadWireResistance': 6126,
- 'AI_LossyLSBRemoval_CompressedSampSize': 8921,
- 'AI_Lowpass_CutoffFreq': 6147,
- 'AI_Lowpass_Enable': 6146,
- 'AI_Lowpass_SwitchCap_ClkSrc': 6276,
- 'AI_Lowpass_SwitchCap_ExtClkDiv': 6278,
- 'AI_Lowpass_SwitchCap_ExtClkFreq': 6277,
- 'AI_Lowpass_SwitchCap_OutClkDiv': 6279,
- 'AI_Max': 6109,
- 'AI_MeasType': 1685,
- 'AI_MemMapEnable': 6284,
- 'AI_Microphone_Sensitivity': 5430,
- 'AI_Min': 6110,
- 'AI_ProbeAtten': 10888,
- 'AI_RTD_A': 4112,
- 'AI_RTD_B': 4113,
- 'AI_RTD_C': 4115,
- 'AI_RTD_R0': 4144,
- 'AI_RTD_Type': 4146,
- 'AI_RVDT_Sensitivity': 2307,
- 'AI_RVDT_SensitivityUnits': 8603,
- 'AI_RVDT_Units': 2167,
- 'AI_RawDataCompressionType': 8920,
- 'AI_RawSampJustification': 80,
- 'AI_RawSampSize': 8922,
- 'AI_ResistanceCfg': 6273,
- 'AI_Resistance_Units': 2389,
- 'AI_Resolution': 5989,
- 'AI_ResolutionUnits': 5988,
- 'AI_Rng_High': 6165,
- 'AI_Rng_Low': 6166,
- 'AI_SampAndHold_Enable': 6170,
- 'AI_SoundPressure_MaxSoundPressureLvl': 8762,
- 'AI_SoundPressure_Units': 5416,
- 'AI_SoundPressure_dBRef': 10673,
- 'AI_StrainGage_Cfg': 2434,
- 'AI_StrainGage_GageFactor': 2452,
- 'AI_StrainGage_PoissonRatio': 2456,
- 'AI_Strain_Units': 2433,
- 'AI_TEDS_Units': 8672,
- 'AI_Temp_Units': 4147,
- 'AI_TermCfg': 4247,
- 'AI_Thrmcpl_CJCChan': 4148,
- 'AI_Thrmcpl_CJCSrc': 4149,
- 'AI_Thrmcpl_CJCVal': 4150,
- 'AI_Thrmcpl_ScaleType': 10704,
- 'AI_Thrmcpl_Type': 4176,
- 'AI_Thrmstr_A': 6345,
- 'AI_Thrmstr_B': 6347,
- 'AI_Thrmstr_C': 6346,
- 'AI_Thrmstr_R1': 4193,
- 'AI_UsbXferReqSize': 10894,
- 'AI_Voltage_ACRMS_Units': 6114,
- 'AI_Voltage_Units': 4244,
- 'AI_Voltage_dBRef': 10672,
- 'AO_Current_Units': 4361,
- 'AO_CustomScaleName': 4488,
- 'AO_DAC_Offset_ExtSrc': 8788,
- 'AO_DAC_Offset_Src': 8787,
- 'AO_DAC_Offset_Val': 8789,
- 'AO_DAC_Ref_AllowConnToGnd': 6192,
- 'AO_DAC_Ref_ConnToGnd': 304,
- 'AO_DAC_Ref_ExtSrc': 8786,
- 'AO_DAC_Ref_Src': 306,
- 'AO_DAC_Ref_Val': 6194,
- 'AO_DAC_Rng_High': 6190,
- 'AO_DAC_Rng_Low': 6189,
- 'AO_DataXferMech': 308,
- 'AO_DataXferReqCond': 6204,
- 'AO_DevScalingCoeff': 6449,
- 'AO_EnhancedImageRejectionEnable': 8769,
- 'AO_FuncGen_Amplitude': 10778,
- 'AO_FuncGen_FMDeviation': 10787,
- 'AO_FuncGen_Freq': 10777,
- 'AO_FuncGen_ModulationType': 10786,
- 'AO_FuncGen_Offset': 10779,
- 'AO_FuncGen_Square_DutyCycle': 10780,
- 'AO_FuncGen_Type': 10776,
- 'AO_Gain': 280,
- 'AO_IdleOutputBehavior': 8768,
- 'AO_LoadImpedance': 289,
- 'AO_Max': 4486,
- 'AO_MemMapEnable': 6287,
- 'AO_Min': 4487,
- 'AO_OutputImpedance': 5264,
- 'AO_OutputType': 4360,
- 'AO_ReglitchEnable': 307,
- 'AO_Resolution': 6188,
- 'AO_ResolutionUnits': 6187,
- 'AO_TermCfg': 6286,
- 'AO_UsbXferReqSize': 10895,
- 'AO_UseOnlyOnBrdMem': 6202,
- 'AO_Voltage_CurrentLimit': 10781,
- 'AO_Voltage_Units': 4484,
- 'AdvTrig_Type': 4965,
- 'AnlgEdge_RefTrig_Coupling': 8757,
- 'AnlgEdge_RefTrig_DigFltr_Enable': 12006,
- 'AnlgEdge_RefTrig_DigFltr_MinPulseWidth': 12007,
- 'AnlgEdge_RefTrig_DigFltr_TimebaseRate': 12009,
- 'AnlgEdge_RefTrig_DigFltr_TimebaseSrc': 12008,
- 'AnlgEdge_RefTrig_DigSync_Enable': 12010,
- 'AnlgEdge_RefTrig_Hyst': 5153,
- 'AnlgEdge_RefTrig_Lvl': 5154,
- 'AnlgEdge_RefTrig_Slope': 5155,
- 'AnlgEdge_RefTrig_Src': 5156,
- 'AnlgEdge_StartTrig_Coupling': 8755,
- 'AnlgEdge_StartTrig_DigFltr_Enable': 12001,
- 'AnlgEdge_StartTrig_DigFltr_MinPulseWidth': 12002,
- 'AnlgEdge_StartTrig_DigFltr_TimebaseRate': 12004,
- 'AnlgEdge_StartTrig_DigFltr_TimebaseSrc': 12003,
- 'AnlgEdge_StartTrig_DigSync_Enable': 12005,
- 'AnlgEdge_StartTrig_Hyst': 5013,
- 'AnlgEdge_StartTrig_Lvl': 5014,
- 'AnlgEdge_StartTrig_Slope': 5015,
- 'AnlgEdge_StartTrig_Src': 5016,
- 'AnlgLvl_PauseTrig_Coupling': 8758,
- 'AnlgLvl_PauseTrig_DigFltr_Enable': 12016,
- 'AnlgLvl_PauseTrig_DigFltr_MinPulseWidth': 12017,
- 'AnlgLvl_PauseTrig_DigFltr_TimebaseRate': 12019,
- 'AnlgLvl_PauseTrig_DigFltr_TimebaseSrc': 12018,
- 'AnlgLvl_PauseTrig_DigSync_Enable': 12020,
- 'AnlgLvl_PauseTrig_Hyst': 4968,
- 'AnlgLvl_PauseTrig_Lvl': 4969,
- 'AnlgLvl_PauseTrig_Src': 4976,
- 'AnlgLvl_PauseTrig_When': 4977,
- 'AnlgWin_PauseTrig_Btm': 4981,
- 'AnlgWin_PauseTrig_Coupling': 8759,
- 'AnlgWin_PauseTrig_DigFltr_Enable': 12021,
- 'AnlgWin_PauseTrig_DigFltr_MinPulseWidth': 12022,
- 'AnlgWin_PauseTrig_DigFltr_TimebaseRate': 12024,
- 'AnlgWin_PauseTrig_DigFltr_TimebaseSrc': 12023,
- 'AnlgWin_PauseTrig_DigSync_Enable': 12025,
- 'AnlgWin_PauseTrig_Src': 4979,
- 'AnlgWin_PauseTrig_Top': 4982,
- 'AnlgWin_PauseTrig_When': 4980,
- 'AnlgWin_RefTrig_Btm': 5160,
- 'AnlgWin_RefTrig_Coupling': 6231,
- 'AnlgWin_RefTrig_DigFltr_Enable': 12011,
- 'AnlgWin_RefTrig_DigFltr_MinPulseWidth': 12012,
- 'AnlgWin_RefTrig_DigFltr_TimebaseRate': 12014,
- 'AnlgWin_RefTrig_DigFltr_TimebaseSrc': 12013,
- 'AnlgWin_RefTrig_DigSync_Enable': 12015,
- 'AnlgWin_RefTrig_Src': 5158,
- 'AnlgWin_RefTrig_Top': 5161,
- 'AnlgWin_RefTrig_When': 5159,
- 'AnlgWin_StartTrig_Btm': 5122,
- 'AnlgWin_StartTrig_Coupling': 8756,
- 'AnlgWin_StartTrig_DigFltr_Enable': 12031,
- 'AnlgWin_StartTrig_DigFltr_MinPulseWidth': 12032,
- 'AnlgWin_StartTrig_DigFltr_TimebaseRate': 12034,
- 'AnlgWin_StartTrig_DigFltr_TimebaseSrc': 12033,
- 'AnlgWin_StartTrig_DigSync_Enable': 12035,
- 'AnlgWin_StartTrig_Src': 5120,
- 'AnlgWin_StartTrig_Top': 5123,
- 'AnlgWin_StartTrig_When': 5121,
- 'ArmStartTrig_Type': 5140,
- 'Buf_Input_BufSize': 6252,
- 'Buf_Input_OnbrdBufSize': 8970,
- 'Buf_Output_BufSize': 6253,
- 'Buf_Output_OnbrdBufSize': 8971,
- 'CI_AngEncoder_InitialAngle': 2177,
- 'CI_AngEncoder_PulsesPerRev': 2165,
- 'CI_AngEncoder_Units': 6310,
- 'CI_Count': 328,
- 'CI_CountEdges_ActiveEdge': 1687,
- 'CI_CountEdges_CountDir_DigFltr_Enable': 8689,
- 'CI_CountEdges_CountDir_DigFltr_MinPulseWidth': 8690,
- 'CI_CountEdges_CountDir_DigFltr_TimebaseRate': 8692,
- 'CI_CountEdges_CountDir_DigFltr_TimebaseSrc': 8691,
- 'CI_CountEdges_CountDir_DigSync_Enable': 8693,
- 'CI_CountEdges_DigFltr_Enable': 8694,
- 'CI_CountEdges_DigFltr_MinPulseWidth': 8695,
- 'CI_CountEdges_DigFltr_TimebaseRate': 8697,
- 'CI_CountEdges_DigFltr_TimebaseSrc': 8696,
- 'CI_CountEdges_DigSync_Enable': 8698,
- 'CI_CountEdges_Dir': 1686,
- 'CI_CountEdges_DirTerm': 8673,
- 'CI_CountEdges_InitialCnt': 1688,
- 'CI_CountEdges_Term': 6343,
- 'CI_CtrTimebaseActiveEdge': 322,
- 'CI_CtrTimebaseMasterTimebaseDiv': 6323,
- 'CI_CtrTimebaseRate': 6322,
- 'CI_CtrTimebaseSrc': 323,
- 'CI_CtrTimebase_DigFltr_Enable': 8817,
- 'CI_CtrTimebase_DigFltr_MinPulseWidth': 8818,
- 'CI_CtrTimebase_DigFltr_TimebaseRate': 8820,
- 'CI_CtrTimebase_DigFltr_TimebaseSrc': 8819,
- 'CI_CtrTimebase_DigSync_Enable': 8821,
- 'CI_CustomScaleName': 6302,
- 'CI_DataXferMech': 512,
- 'CI_DataXferReqCond': 12027,
- 'CI_DupCountPrevent': 8620,
- 'CI_Encoder_AInputTerm': 8605,
- 'CI_Encoder_AInput_DigFltr_Enable': 8699,
- 'CI_Encoder_AInput_DigFltr_MinPulseWidth': 8700,
- 'CI_Encoder_AInput_DigFltr_TimebaseRate': 8702,
- 'CI_Encoder_AInput_DigFltr_TimebaseSrc': 8701,
- 'CI_Encoder_AInput_DigSync_Enable': 8703,
- 'CI_Encoder_BInputTerm': 8606,
- 'CI_Encoder_BInput_DigFltr_Enable': 8704,
- 'CI_Encoder_BInput_DigFltr_MinPulseWidth': 8705,
- 'CI_Encoder_BInput_DigFltr_TimebaseRate': 8707,
- 'CI_Encoder_BInput_DigFltr_TimebaseSrc': 8706,
- 'CI_Encoder_BInput_DigSync_Enable': 8708,
- 'CI_Encoder_DecodingType': 8678,
- 'CI_Encoder_ZIndexEnable': 2192,
- 'CI_Encoder_ZIndexPhase': 2185,
- 'CI_Encoder_ZIndexVal': 2184,
- 'CI_Encoder_ZInputTerm': 8607,
- 'CI_Encoder_ZInput_DigFltr_Enable': 8709,
- 'CI_Encoder_ZInput_DigFltr_MinPulseWidth': 8710,
- 'CI_Encoder_ZInput_DigFltr_TimebaseRate': 8712,
- 'CI_Encoder_ZInput_DigFltr_TimebaseSrc': 8711,
- 'CI_Encoder_ZInput_DigSync_Enable': 8713,
- 'CI_Freq_DigFltr_Enable': 8679,
- 'CI_Freq_DigFltr_MinPulseWidth': 8680,
- 'CI_Freq_DigFltr_TimebaseRate': 8682,
- 'CI_Freq_DigFltr_TimebaseSrc': 8681,
- 'CI_Freq_DigSync_Enable': 8683,
- 'CI_Freq_Div': 327,
- 'CI_Freq_EnableAveraging': 11984,
- 'CI_Freq_MeasMeth': 324,
- 'CI_Freq_MeasTime': 325,
- 'CI_Freq_StartingEdge': 1945,
- 'CI_Freq_Term': 6306,
- 'CI_Freq_Units': 6305,
- 'CI_GPS_SyncMethod': 4242,
- 'CI_GPS_SyncSrc': 4243,
- 'CI_LinEncoder_DistPerPulse': 2321,
- 'CI_LinEncoder_InitialPos': 2325,
- 'CI_LinEncoder_Units': 6313,
- 'CI_Max': 6300,
- 'CI_MeasType': 6304,
- 'CI_MemMapEnable': 11986,
- 'CI_Min': 6301,
- 'CI_NumPossiblyInvalidSamps': 6460,
- 'CI_OutputState': 329,
- 'CI_Period_DigFltr_Enable': 8684,
- 'CI_Period_DigFltr_MinPulseWidth': 8685,
- 'CI_Period_DigFltr_TimebaseRate': 8687,
- 'CI_Period_DigFltr_TimebaseSrc': 8686,
- 'CI_Period_DigSync_Enable': 8688,
- 'CI_Period_Div': 6446,
- 'CI_Period_EnableAveraging': 11985,
- 'CI_Period_MeasMeth': 6444,
- 'CI_Period_MeasTime': 6445,
- 'CI_Period_StartingEdge': 2130,
- 'CI_Period_Term': 6308,
- 'CI_Period_Units': 6307,
- 'CI_Prescaler': 8761,
- 'CI_PulseWidth_DigFltr_Enable': 8714,
- 'CI_PulseWidth_DigFltr_MinPulseWidth': 8715,
- 'CI_PulseWidth_DigFltr_TimebaseRate': 8717,
- 'CI_PulseWidth_DigFltr_TimebaseSrc': 8716,
- 'CI_PulseWidth_DigSync_Enable': 8718,
- 'CI_PulseWidth_StartingEdge': 2085,
- 'CI_PulseWidth_Term': 6314,
- 'CI_PulseWidth_Units': 2083,
- 'CI_Pulse_Freq_DigFltr_Enable': 12038,
- 'CI_Pulse_Freq_DigFltr_MinPulseWidth': 12039,
- 'CI_Pulse_Freq_DigFltr_TimebaseRate': 12041,
- 'CI_Pulse_Freq_DigFltr_TimebaseSrc': 12040,
- 'CI_Pulse_Freq_DigSync_Enable': 12042,
- 'CI_Pulse_Freq_Start_Edge': 12037,
- 'CI_Pulse_Freq_Term': 12036,
- 'CI_Pulse_Freq_Units': 12043,
- 'CI_Pulse_Ticks_DigFltr_Enable': 12054,
- 'CI_Pulse_Ticks_DigFltr_MinPulseWidth': 12055,
- 'CI_Pulse_Ticks_DigFltr_TimebaseRate': 12057,
- 'CI_Pulse_Ticks_DigFltr_TimebaseSrc': 12056,
- 'CI_Pulse_Ticks_DigSync_Enable': 12058,
- 'CI_Pulse_Ticks_StartEdge': 12053,
- 'CI_Pulse_Ticks_Term': 12052,
- 'CI_Pulse_Time_DigFltr_Enable': 12046,
- 'CI_Pulse_Time_DigFltr_MinPulseWidth': 12047,
- 'CI_Pulse_Time_DigFltr_TimebaseRate': 12049,
- 'CI_Pulse_Time_DigFltr_TimebaseSrc': 12048,
- 'CI_Pulse_Time_DigSync_Enable': 12050,
- 'CI_Pulse_Time_StartEdge': 12045,
- 'CI_Pulse_Time_Term': 12044,
- 'CI_Pulse_Time_Units': 12051,
- 'CI_SemiPeriod_DigFltr_Enable': 8729,
- 'CI_SemiPeriod_DigFltr_MinPulseWidth': 8730,
- 'CI_SemiPeriod_DigFltr_TimebaseRate': 8732,
- 'CI_SemiPeriod_DigFltr_TimebaseSrc': 8731,
- 'CI_SemiPeriod_DigSync_Enable': 8733,
- 'CI_SemiPeriod_StartingEdge': 8958,
- 'CI_SemiPeriod_Term': 6320,
- 'CI_SemiPeriod_Units': 6319,
- 'CI_TCReached': 336,
- 'CI_Timestamp_InitialSeconds': 8884,
- 'CI_Timestamp_Units': 8883,
- 'CI_TwoEdgeSep_FirstEdge': 2099,
- 'CI_TwoEdgeSep_FirstTerm': 6317,
- 'CI_TwoEdgeSep_First_DigFltr_Enable': 8719,
- 'CI_TwoEdgeSep_First_DigFltr_MinPulseWidth': 8720,
- 'CI_TwoEdgeSep_First_DigFltr_TimebaseRate': 8722,
- 'CI_TwoEdgeSep_First_DigFltr_TimebaseSrc': 8721,
- 'CI_TwoEdgeSep_First_DigSync_Enable': 8723,
- 'CI_TwoEdgeSep_SecondEdge': 2100,
- 'CI_TwoEdgeSep_SecondTerm': 6318,
- 'CI_TwoEdgeSep_Second_DigFltr_Enable': 8724,
- 'CI_TwoEdgeSep_Second_DigFltr_MinPulseWidth': 8725,
- 'CI_TwoEdgeSep_Second_DigFltr_TimebaseRate': 8727,
- 'CI_TwoEdgeSep_Second_DigFltr_TimebaseSrc': 8726,
- 'CI_TwoEdgeSep_Second_DigSync_Enable': 8728,
- 'CI_TwoEdgeSep_Units': 6316,
- 'CI_UsbXferReqSize': 10898,
- 'CO_AutoIncrCnt': 661,
- 'CO_ConstrainedGenMode': 10738,
- 'CO_Count': 659,
- 'CO_CtrTimebaseActiveEdge': 833,
- 'CO_CtrTimebaseMasterTimebaseDiv': 6339,
- 'CO_CtrTimebaseRate': 6338,
- 'CO_CtrTimebaseSrc': 825,
- 'CO_CtrTimebase_DigFltr_Enable': 8822,
- 'CO_CtrTimebase_DigFltr_MinPulseWidth': 8823,
- 'CO_CtrTimebase_DigFltr_TimebaseRate': 8825,
- 'CO_CtrTimebase_DigFltr_TimebaseSrc': 8824,
- 'CO_CtrTimebase_DigSync_Enable': 8826,
- 'CO_DataXferMech': 11980,
- 'CO_DataXferReqCond': 11981,
- 'CO_EnableInitialDelayOnRetrigger': 11977,
- 'CO_MemMapEnable': 11987,
- 'CO_OutputState': 660,
- 'CO_OutputType': 6325,
- 'CO_Prescaler': 8813,
- 'CO_PulseDone': 6414,
- 'CO_Pulse_DutyCyc': 4470,
- 'CO_Pulse_Freq': 4472,
- 'CO_Pulse_Freq_InitialDelay': 665,
- 'CO_Pulse_Freq_Units': 6357,
- 'CO_Pulse_HighTicks': 4457,
- 'CO_Pulse_HighTime': 6330,
- 'CO_Pulse_IdleState': 4464,
- 'CO_Pulse_LowTicks': 4465,
- 'CO_Pulse_LowTime': 6331,
- 'CO_Pulse_Term': 6369,
- 'CO_Pulse_Ticks_InitialDelay': 664,
- 'CO_Pulse_Time_InitialDelay': 6332,
- 'CO_Pulse_Time_Units': 6358,
- 'CO_RdyForNewVal': 8959,
- 'CO_UsbXferReqSize': 10899,
- 'CO_UseOnlyOnBrdMem': 11979,
- 'Cal_DevTemp': 8763,
- 'Cal_UserDefinedInfo': 6241,
- 'Cal_UserDefinedInfo_MaxSize': 6428,
- 'Carrier_SerialNum': 10890,
- 'ChanDescr': 6438,
- 'ChanIsGlobal': 8964,
- 'ChanType': 6271,
- 'ChangeDetect_DI_FallingEdgePhysicalChans': 8598,
- 'ChangeDetect_DI_RisingEdgePhysicalChans': 8597,
- 'ChangeDetect_DI_Tristate': 12026,
- 'DAQmxSuccess': 0,
- 'DI_AcquireOn': 10598,
- 'DI_DataXferMech': 8803,
- 'DI_DataXferReqCond': 8804,
- 'DI_DigFltr_Enable': 8662,
- 'DI_DigFltr_EnableBusMode': 12030,
- 'DI_DigFltr_MinPulseWidth': 8663,
- 'DI_DigFltr_TimebaseRate': 11989,
- 'DI_DigFltr_TimebaseSrc': 11988,
- 'DI_DigSync_Enable': 11990,
- 'DI_InvertLines': 1939,
- 'DI_LogicFamily': 10605,
- 'DI_MemMapEnable': 10602,
- 'DI_NumLines': 8568,
- 'DI_Tristate': 6288,
- 'DI_UsbXferReqSize': 10896,
- 'DO_DataXferMech': 8806,
- 'DO_DataXferReqCond': 8807,
- 'DO_GenerateOn': 10601,
- 'DO_InvertLines': 4403,
- 'DO_LineStates_DoneState': 10600,
- 'DO_LineStates_PausedState': 10599,
- 'DO_LineStates_StartState': 10610,
- 'DO_LogicFamily': 10606,
- 'DO_MemMapEnable': 10603,
- 'DO_NumLines': 8569,
- 'DO_OutputDriveType': 4407,
- 'DO_Overcurrent_AutoReenable': 10886,
- 'DO_Overcurrent_Limit': 10885,
- 'DO_Overcurrent_ReenablePeriod': 10887,
- 'DO_Tristate': 6387,
- 'DO_UsbXferReqSize': 10897,
- 'DO_UseOnlyOnBrdMem': 8805,
- 'DelayFromSampClk_Delay': 4887,
- 'DelayFromSampClk_DelayUnits': 4868,
- 'Dev_AI_Couplings': 10644,
- 'Dev_AI_CurrentIntExcitDiscreteVals': 10699,
- 'Dev_AI_CurrentRngs': 10641,
- 'Dev_AI_FreqRngs': 10642,
- 'Dev_AI_Gains': 10643,
- 'Dev_AI_LowpassCutoffFreqDiscreteVals': 10645,
- 'Dev_AI_LowpassCutoffFreqRangeVals': 10703,
- 'Dev_AI_MaxMultiChanRate': 10637,
- 'Dev_AI_MaxSingleChanRate': 10636,
- 'Dev_AI_MinRate': 10638,
- 'Dev_AI_PhysicalChans': 8990,
- 'Dev_AI_SimultaneousSamplingSupported': 10639,
- 'Dev_AI_TrigUsage': 10630,
- 'Dev_AI_VoltageIntExcitDiscreteVals': 10697,
- 'Dev_AI_VoltageIntExcitRangeVals': 10698,
- 'Dev_AI_VoltageRngs': 10640,
- 'Dev_AO_CurrentRngs': 10652,
- 'Dev_AO_Gains': 10653,
- 'Dev_AO_MaxRate': 10647,
- 'Dev_AO_MinRate': 10648,
- 'Dev_AO_PhysicalChans': 8991,
- 'Dev_AO_SampClkSupported': 10646,
- 'Dev_AO_TrigUsage': 10631,
- 'Dev_AO_VoltageRngs': 10651,
- 'Dev_AnlgTrigSupported': 10628,
- 'Dev_BusType': 8998,
- 'Dev_CI_MaxSize': 10655,
- 'Dev_CI_MaxTimebase': 10656,
- 'Dev_CI_PhysicalChans': 8996,
- 'Dev_CI_SampClkSupported': 10654,
- 'Dev_CI_TrigUsage': 10634,
- 'Dev_CO_MaxSize': 10657,
- 'Dev_CO_MaxTimebase': 10658,
- 'Dev_CO_PhysicalChans': 8997,
- 'Dev_CO_TrigUsage': 10635,
- 'Dev_Chassis_ModuleDevNames': 10678,
- 'Dev_CompactDAQ_ChassisDevName': 10679,
- 'Dev_CompactDAQ_SlotNum': 10680,
- 'Dev_DI_Lines': 8992,
- 'Dev_DI_MaxRate': 10649,
- 'Dev_DI_Ports': 8993,
- 'Dev_DI_TrigUsage': 10632,
- 'Dev_DO_Lines': 8994,
- 'Dev_DO_MaxRate': 10650,
- 'Dev_DO_Ports': 8995,
- 'Dev_DO_TrigUsage': 10633,
- 'Dev_DigTrigSupported': 10629,
- 'Dev_IsSimulated': 8906,
- 'Dev_NumDMAChans': 9020,
- 'Dev_PCI_BusNum': 8999,
- 'Dev_PCI_DevNum': 9000,
- 'Dev_PXI_ChassisNum': 9001,
- 'Dev_PXI_SlotNum': 9002,
- 'Dev_ProductCategory': 10665,
- 'Dev_ProductNum': 8989,
- 'Dev_ProductType': 1585,
- 'Dev_SerialNum': 1586,
- 'Dev_TCPIP_EthernetIP': 10892,
- 'Dev_TCPIP_Hostname': 10891,
- 'Dev_TCPIP_WirelessIP': 10893,
- 'Dev_Terminals': 10816,
- 'DigEdge_AdvTrig_DigFltr_Enable': 8760,
- 'DigEdge_AdvTrig_Edge': 4960,
- 'DigEdge_AdvTrig_Src': 4962,
- 'DigEdge_ArmStartTrig_DigFltr_Enable': 8749,
- 'DigEdge_ArmStartTrig_DigFltr_MinPulseWidth': 8750,
- 'DigEdge_ArmStartTrig_DigFltr_TimebaseRate': 8752,
- 'DigEdge_ArmStartTrig_DigFltr_TimebaseSrc': 8751,
- 'DigEdge_ArmStartTrig_DigSync_Enable': 8753,
- 'DigEdge_ArmStartTrig_Edge': 5141,
- 'DigEdge_ArmStartTrig_Src': 5143,
- 'DigEdge_RefTrig_DigFltr_Enable': 11991,
- 'DigEdge_RefTrig_DigFltr_MinPulseWidth': 11992,
- 'DigEdge_RefTrig_DigFltr_TimebaseRate': 11994,
- 'DigEdge_RefTrig_DigFltr_TimebaseSrc': 11993,
- 'DigEdge_RefTrig_DigSync_Enable': 11995,
- 'DigEdge_RefTrig_Edge': 5168,
- 'DigEdge_RefTrig_Src': 5172,
- 'DigEdge_StartTrig_DigFltr_Enable': 8739,
- 'DigEdge_StartTrig_DigFltr_MinPulseWidth': 8740,
- 'DigEdge_StartTrig_DigFltr_TimebaseRate': 8742,
- 'DigEdge_StartTrig_DigFltr_TimebaseSrc': 8741,
- 'DigEdge_StartTrig_DigSync_Enable': 8743,
- 'DigEdge_StartTrig_Edge': 5124,
- 'DigEdge_StartTrig_Src': 5127,
- 'DigEdge_WatchdogExpirTrig_Edge': 8613,
- 'DigEdge_WatchdogExpirTrig_Src': 8612,
- 'DigLvl_PauseTrig_DigFltr_Enable': 8744,
- 'DigLvl_PauseTrig_DigFltr_MinPulseWidth': 8745,
- 'DigLvl_PauseTrig_DigFltr_TimebaseRate': 8747,
- 'DigLvl_PauseTrig_DigFltr_TimebaseSrc': 8746,
- 'DigLvl_PauseTrig_DigSync_Enable': 8748,
- 'DigLvl_PauseTrig_Src': 4985,
- 'DigLvl_PauseTrig_When': 4992,
- 'DigPattern_PauseTrig_Pattern': 8584,
- 'DigPattern_PauseTrig_Src': 8559,
- 'DigPattern_PauseTrig_When': 8560,
- 'DigPattern_RefTrig_Pattern': 8583,
- 'DigPattern_RefTrig_Src': 5175,
- 'DigPattern_RefTrig_When': 5176,
- 'DigPattern_StartTrig_Pattern': 8582,
- 'DigPattern_StartTrig_Src': 5136,
- 'DigPattern_StartTrig_When': 5137,
- 'Exported_10MHzRefClk_OutputTerm': 8814,
- 'Exported_20MHzTimebase_OutputTerm': 5719,
- 'Exported_AIConvClk_OutputTerm': 5767,
- 'Exported_AIConvClk_Pulse_Polarity': 5768,
- 'Exported_AIHoldCmpltEvent_OutputTerm': 6381,
- 'Exported_AIHoldCmpltEvent_PulsePolarity': 6382,
- 'Exported_AdvCmpltEvent_Delay': 5975,
- 'Exported_AdvCmpltEvent_OutputTerm': 5713,
- 'Exported_AdvCmpltEvent_Pulse_Polarity': 5714,
- 'Exported_AdvCmpltEvent_Pulse_Width': 5716,
- 'Exported_AdvTrig_OutputTerm': 5701,
- 'Exported_AdvTrig_Pulse_Polarity': 5702,
- 'Exported_AdvTrig_Pulse_Width': 5704,
- 'Exported_AdvTrig_Pulse_WidthUnits': 5703,
- 'Exported_ChangeDetectEvent_OutputTerm': 8599,
- 'Exported_ChangeDetectEvent_Pulse_Polarity': 8963,
- 'Exported_CtrOutEvent_OutputBehavior': 5967,
- 'Exported_CtrOutEvent_OutputTerm': 5911,
- 'Exported_CtrOutEvent_Pulse_Polarity': 5912,
- 'Exported_CtrOutEvent_Toggle_IdleState': 6250,
- 'Exported_DataActiveEvent_Lvl_ActiveLvl': 5684,
- 'Exported_DataActiveEvent_OutputTerm': 5683,
- 'Exported_DividedSampClkTimebase_OutputTerm': 8609,
- 'Exported_HshkEvent_Delay': 8892,
- 'Exported_HshkEvent_Interlocked_AssertOnStart': 8894,
- 'Exported_HshkEvent_Interlocked_AssertedLvl': 8893,
- 'Exported_HshkEvent_Interlocked_DeassertDelay': 8895,
- 'Exported_HshkEvent_OutputBehavior': 8891,
- 'Exported_HshkEvent_OutputTerm': 8890,
- 'Exported_HshkEvent_Pulse_Polarity': 8896,
- 'Exported_HshkEvent_Pulse_Width': 8897,
- 'Exported_PauseTrig_Lvl_ActiveLvl': 5654,
- 'Exported_PauseTrig_OutputTerm': 5653,
- 'Exported_RdyForStartEvent_Lvl_ActiveLvl': 5969,
- 'Exported_RdyForStartEvent_OutputTerm': 5641,
- 'Exported_RdyForXferEvent_DeassertCond': 10595,
- 'Exported_RdyForXferEvent_DeassertCondCustomThreshold': 10596,
- 'Exported_RdyForXferEvent_Lvl_ActiveLvl': 8886,
- 'Exported_RdyForXferEvent_OutputTerm': 8885,
- 'Exported_RefTrig_OutputTerm': 1424,
- 'Exported_RefTrig_Pulse_Polarity': 1425,
- 'Exported_SampClkTimebase_OutputTerm': 6393,
- 'Exported_SampClk_DelayOffset': 8644,
- 'Exported_SampClk_OutputBehavior': 6251,
- 'Exported_SampClk_OutputTerm': 5731,
- 'Exported_SampClk_Pulse_Polarity': 5732,
- 'Exported_StartTrig_OutputTerm': 1412,
- 'Exported_StartTrig_Pulse_Polarity': 1413,
- 'Exported_SyncPulseEvent_OutputTerm': 8764,
- 'Exported_WatchdogExpiredEvent_OutputTerm': 8618,
- 'ExtCal_LastTemp': 6247,
- 'ExtCal_RecommendedInterval': 6248,
- 'HshkTrig_Type': 8887,
- 'Hshk_DelayAfterXfer': 8898,
- 'Hshk_SampleInputDataWhen': 8900,
- 'Hshk_StartCond': 8899,
- 'Implicit_UnderflowBehavior': 12029,
- 'Interlocked_HshkTrig_AssertedLvl': 8889,
- 'Interlocked_HshkTrig_Src': 8888,
- 'Logging_FilePath': 11972,
- 'Logging_Mode': 11973,
- 'Logging_TDMS_GroupName': 11974,
- 'Logging_TDMS_Operation': 11975,
- 'MasterTimebase_Rate': 5269,
- 'MasterTimebase_Src': 4931,
- 'OnDemand_SimultaneousAOEnable': 8608,
- 'PauseTrig_Term': 12064,
- 'PauseTrig_Type': 4966,
- 'PersistedChan_AllowInteractiveDeletion': 8914,
- 'PersistedChan_AllowInteractiveEditing': 8913,
- 'PersistedChan_Author': 8912,
- 'PersistedScale_AllowInteractiveDeletion': 8918,
- 'PersistedScale_AllowInteractiveEditing': 8917,
- 'PersistedScale_Author': 8916,
- 'PersistedTask_AllowInteractiveDeletion': 8910,
- 'PersistedTask_AllowInteractiveEditing': 8909,
- 'PersistedTask_Author': 8908,
- 'PhysicalChanName': 6389,
- 'PhysicalChan_AI_TermCfgs': 9026,
- 'PhysicalChan_AO_ManualControlAmplitude': 10783,
- 'PhysicalChan_AO_ManualControlEnable': 10782,
- 'PhysicalChan_AO_ManualControlFreq': 10784,
- 'PhysicalChan_AO_ManualControl_ShortDetected': 11971,
- 'PhysicalChan_AO_TermCfgs': 10659,
- 'PhysicalChan_DI_ChangeDetectSupported': 10662,
- 'PhysicalChan_DI_PortWidth': 10660,
- 'PhysicalChan_DI_SampClkSupported': 10661,
- 'PhysicalChan_DO_PortWidth': 10663,
- 'PhysicalChan_DO_SampClkSupported': 10664,
- 'PhysicalChan_TEDS_BitStream': 8671,
- 'PhysicalChan_TEDS_MfgID': 8666,
- 'PhysicalChan_TEDS_ModelNum': 8667,
- 'PhysicalChan_TEDS_SerialNum': 8668,
- 'PhysicalChan_TEDS_TemplateIDs': 8847,
- 'PhysicalChan_TEDS_VersionLetter': 8670,
- 'PhysicalChan_TEDS_VersionNum': 8669,
- 'ReadWaitMode': 8754,
- 'Read_AutoStart': 6182,
- 'Read_AvailSampPerChan': 4643,
- 'Read_ChangeDetect_HasOverflowed': 8596,
- 'Read_ChannelsToRead': 6179,
- 'Read_CommonModeRangeErrorChans': 10905,
- 'Read_CommonModeRangeErrorChansExist': 10904,
- 'Read_CurrReadPos': 4641,
- 'Read_DigitalLines_BytesPerChan': 8572,
- 'Read_NumChans': 8571,
- 'Read_Offset': 6411,
- 'Read_OpenCurrentLoopChans': 10762,
- 'Read_OpenCurrentLoopChansExist': 10761,
- 'Read_OpenThrmcplChans': 10903,
- 'Read_OpenThrmcplChansExist': 10902,
- 'Read_OverWrite': 4625,
- 'Read_OvercurrentChans': 10727,
- 'Read_OvercurrentChansExist': 10726,
- 'Read_OverloadedChans': 8565,
- 'Read_OverloadedChansExist': 8564,
- 'Read_RawDataWidth': 8570,
- 'Read_ReadAllAvailSamp': 4629,
- 'Read_RelativeTo': 6410,
- 'Read_SleepTime': 8880,
- 'Read_TotalSampPerChanAcquired': 6442,
- 'Read_WaitMode': 8754,
- 'RealTime_ConvLateErrorsToWarnings': 8942,
- 'RealTime_NumOfWarmupIters': 8941,
- 'RealTime_ReportMissedSamp': 8985,
- 'RealTime_WaitForNextSampClkWaitMode': 8943,
- 'RealTime_WriteRecoveryMode': 8986,
- 'RefClk_Rate': 4885,
- 'RefClk_Src': 4886,
- 'RefTrig_AutoTrigEnable': 11969,
- 'RefTrig_AutoTriggered': 11970,
- 'RefTrig_PretrigSamples': 5189,
- 'RefTrig_Term': 12063,
- 'RefTrig_Type': 5145,
- 'SampClkTimebase_Term': 12060,
- 'SampClk_ActiveEdge': 4865,
- 'SampClk_DigFltr_Enable': 8734,
- 'SampClk_DigFltr_MinPulseWidth': 8735,
- 'SampClk_DigFltr_TimebaseRate': 8737,
- 'SampClk_DigFltr_TimebaseSrc': 8736,
- 'SampClk_DigSync_Enable': 8738,
- 'SampClk_MaxRate': 8904,
- 'SampClk_OverrunBehavior': 12028,
- 'SampClk_Rate': 4932,
- 'SampClk_Src': 6226,
- 'SampClk_Term': 12059,
- 'SampClk_TimebaseDiv': 6379,
- 'SampClk_Timebase_ActiveEdge': 6380,
- 'SampClk_Timebase_MasterTimebaseDiv': 4869,
- 'SampClk_Timebase_Rate': 4867,
- 'SampClk_Timebase_Src': 4872,
- 'SampClk_UnderflowBehavior': 10593,
- 'SampQuant_SampMode': 4864,
- 'SampQuant_SampPerChan': 4880,
- 'SampTimingEngine': 10790,
- 'SampTimingType': 4935,
- 'Scale_Descr': 4646,
- 'Scale_Lin_Slope': 4647,
- 'Scale_Lin_YIntercept': 4648,
- 'Scale_Map_PreScaledMax': 4657,
- 'Scale_Map_PreScaledMin': 4658,
- 'Scale_Map_ScaledMax': 4649,
- 'Scale_Map_ScaledMin': 4656,
- 'Scale_Poly_ForwardCoeff': 4660,
- 'Scale_Poly_ReverseCoeff': 4661,
- 'Scale_PreScaledUnits': 6391,
- 'Scale_ScaledUnits': 6427,
- 'Scale_Table_PreScaledVals': 4663,
- 'Scale_Table_ScaledVals': 4662,
- 'Scale_Type': 6441,
- 'SelfCal_LastTemp': 6244,
- 'SelfCal_Supported': 6240,
- 'StartTrig_Delay': 6230,
- 'StartTrig_DelayUnits': 6344,
- 'StartTrig_Retriggerable': 6415,
- 'StartTrig_Term': 12062,
- 'StartTrig_Type': 5011,
- 'SwitchChan_Bandwidth': 1600,
- 'SwitchChan_Impedance': 1601,
- 'SwitchChan_MaxACCarryCurrent': 1608,
- 'SwitchChan_MaxACCarryPwr': 1602,
- 'SwitchChan_MaxACSwitchCurrent': 1606,
- 'SwitchChan_MaxACSwitchPwr': 1604,
- 'SwitchChan_MaxACVoltage': 1617,
- 'SwitchChan_MaxDCCarryCurrent': 1607,
- 'SwitchChan_MaxDCCarryPwr': 1603,
- 'SwitchChan_MaxDCSwitchCurrent': 1605,
- 'SwitchChan_MaxDCSwitchPwr': 1609,
- 'SwitchChan_MaxDCVoltage': 1616,
- 'SwitchChan_Usage': 6372,
- 'SwitchChan_WireMode': 6373,
- 'SwitchDev_AutoConnAnlgBus': 6106,
- 'SwitchDev_NumColumns': 6378,
- 'SwitchDev_NumRelays': 6374,
- 'SwitchDev_NumRows': 6377,
- 'SwitchDev_NumSwitchChans': 6376,
- 'SwitchDev_PwrDownLatchRelaysAfterSettling': 8923,
- 'SwitchDev_RelayList': 6108,
- 'SwitchDev_Settled': 4675,
- 'SwitchDev_SettlingTime': 4676,
- 'SwitchDev_SwitchChanList': 6375,
- 'SwitchDev_Topology': 6461,
- 'SwitchScan_BreakMode': 4679,
- 'SwitchScan_RepeatMode': 4680,
- 'SwitchScan_WaitingForAdv': 6105,
- 'SyncPulse_MinDelayToStart': 8767,
- 'SyncPulse_Src': 8765,
- 'SyncPulse_SyncTime': 8766,
- 'Sys_DevNames': 6459,
- 'Sys_GlobalChans': 4709,
- 'Sys_NIDAQMajorVersion': 4722,
- 'Sys_NIDAQMinorVersion': 6435,
- 'Sys_NIDAQUpdateVersion': 12066,
- 'Sys_Scales': 4710,
- 'Sys_Tasks': 4711,
- 'Task_Channels': 4723,
- 'Task_Complete': 4724,
- 'Task_Devices': 8974,
- 'Task_Name': 4726,
- 'Task_NumChans': 8577,
- 'Task_NumDevices': 10682,
- 'Val_100MHzTimebase': 15857,
- 'Val_10MHzRefClock': 12536,
- 'Val_20MHzTimebase': 12537,
- 'Val_20MHzTimebaseClock': 12486,
- 'Val_2Wire': 2,
- 'Val_2point5V': 14620,
- 'Val_3Wire': 3,
- 'Val_3point3V': 14621,
- 'Val_4Wire': 4,
- 'Val_5V': 14619,
- 'Val_5Wire': 5,
- 'Val_80MHzTimebase': 14636,
- 'Val_A': 12513,
- 'Val_AC': 10045,
- 'Val_AHighBHigh': 10040,
- 'Val_AHighBLow': 10041,
- 'Val_AI': 10100,
- 'Val_AIConvertClock': 12484,
- 'Val_AIHoldCmpltEvent': 12493,
- 'Val_ALowBHigh': 10042,
- 'Val_ALowBLow': 10043,
- 'Val_AM': 14756,
- 'Val_AO': 10102,
- 'Val_AOSeries': 14647,
- 'Val_AandB': 12515,
- 'Val_AboveLvl': 10093,
- 'Val_AccelUnit_g': 10186,
- 'Val_Accelerometer': 10356,
- 'Val_Acquired_Into_Buffer': 1,
- 'Val_Action_Cancel': 1,
- 'Val_Action_Commit': 0,
- 'Val_ActiveDrive': 12573,
- 'Val_ActiveHigh': 10095,
- 'Val_ActiveLow': 10096,
- 'Val_AdvCmpltEvent': 12492,
- 'Val_AdvanceTrigger': 12488,
- 'Val_AllowRegen': 10097,
- 'Val_Amps': 10342,
- 'Val_AnlgEdge': 10099,
- 'Val_AnlgLvl': 10101,
- 'Val_AnlgWin': 10103,
- 'Val_Auto': -1,
- 'Val_B': 12514,
- 'Val_BSeriesDAQ': 14662,
- 'Val_B_Type_TC': 10047,
- 'Val_BelowLvl': 10107,
- 'Val_Best50HzRejection': 14713,
- 'Val_Best60HzRejection': 14714,
- 'Val_Bit_CouplingTypes_AC': 1,
- 'Val_Bit_CouplingTypes_DC': 2,
- 'Val_Bit_CouplingTypes_Ground': 4,
- 'Val_Bit_CouplingTypes_HFReject': 8,
- 'Val_Bit_CouplingTypes_LFReject': 16,
- 'Val_Bit_CouplingTypes_NoiseReject': 32,
- 'Val_Bit_TermCfg_Diff': 4,
- 'Val_Bit_TermCfg_NRSE': 2,
- 'Val_Bit_TermCfg_PseudoDIFF': 8,
- 'Val_Bit_TermCfg_RSE': 1,
- 'Val_Bit_TriggerUsageTypes_Advance': 1,
- 'Val_Bit_TriggerUsageTypes_ArmStart': 32,
- 'Val_Bit_TriggerUsageTypes_Handshake': 16,
- 'Val_Bit_TriggerUsageTypes_Pause': 2,
- 'Val_Bit_TriggerUsageTypes_Reference': 4,
- 'Val_Bit_TriggerUsageTypes_Start': 8,
- 'Val_Bits': 10109,
- 'Val_BreakBeforeMake': 10110,
- 'Val_BuiltIn': 10200,
- 'Val_BurstHandshake': 12548,
- 'Val_CI': 10131,
- 'Val_CO': 10132,
- 'Val_CSeriesModule': 14659,
- 'Val_Cfg_Default': -1,
- 'Val_Chan': 10113,
- 'Val_ChanForAllLines': 1,
- 'Val_ChanPerLine': 0,
- 'Val_ChangeDetection': 12504,
- 'Val_ChangeDetectionEvent': 12511,
- 'Val_ChannelCurrent': 1,
- 'Val_ChannelVoltage': 0,
- 'Val_ClearExpiration': 1,
- 'Val_Closed': 10438,
- 'Val_CompactDAQ': 14637,
- 'Val_CompactDAQChassis': 14658,
- 'Val_ConstVal': 10116,
- 'Val_Cont': 10117,
- 'Val_ContSamps': 10123,
- 'Val_CountDown': 10124,
- 'Val_CountEdges': 10125,
- 'Val_CountUp': 10128,
- 'Val_CounterOutputEvent': 12494,
- 'Val_Create': 15848,
- 'Val_CreateOrReplace': 15847,
- 'Val_CurrReadPos': 10425,
- 'Val_CurrWritePos': 10430,
- 'Val_Current': 10134,
- 'Val_CurrentRMS': 10351,
- 'Val_Custom': 10137,
- 'Val_DC': 10050,
- 'Val_DI': 10151,
- 'Val_DMA': 10054,
- 'Val_DO': 10153,
- 'Val_Default': -1,
- 'Val_DegC': 10143,
- 'Val_DegF': 10144,
- 'Val_DegR': 10145,
- 'Val_Degrees': 10146,
- 'Val_Diff': 10106,
- 'Val_DigEdge': 10150,
- 'Val_DigLvl': 10152,
- 'Val_DigPattern': 10398,
- 'Val_DigitalIO': 14648,
- 'Val_DoNotAllowRegen': 10158,
- 'Val_DoNotInvertPolarity': 0,
- 'Val_DoNotOverwriteUnreadSamps': 10159,
- 'Val_DoNotWrite': 12540,
- 'Val_DynamicSignalAcquisition': 14649,
- 'Val_ESeriesDAQ': 14642,
- 'Val_E_Type_TC': 10055,
- 'Val_EnteringWin': 10163,
- 'Val_EverySample': 10164,
- 'Val_ExtControlled': 10326,
- 'Val_External': 10167,
- 'Val_FM': 14757,
- 'Val_Falling': 10171,
- 'Val_FallingSlope': 10171,
- 'Val_Finite': 10172,
- 'Val_FiniteSamps': 10178,
- 'Val_FirstPretrigSamp': 10427,
- 'Val_FirstSample': 10424,
- 'Val_Fixed50PercentDutyCycle': 14711,
- 'Val_FixedHighFreq': 14709,
- 'Val_FixedLowFreq': 14710,
- 'Val_Freq': 10179,
- 'Val_Freq_Voltage': 10181,
- 'Val_FromCustomScale': 10065,
- 'Val_FromTEDS': 12516,
- 'Val_FullBridge': 10182,
- 'Val_FullBridgeI': 10183,
- 'Val_FullBridgeII': 10184,
- 'Val_FullBridgeIII': 10185,
- 'Val_FuncGen': 14750,
- 'Val_GND': 10066,
- 'Val_GPS_Timestamp': 10362,
- 'Val_Ground': 2,
- 'Val_GroupByChannel': 0,
- 'Val_GroupByScanNumber': 1,
- 'Val_HWTimedSinglePoint': 12522,
- 'Val_HalfBridge': 10187,
- 'Val_HalfBridgeI': 10188,
- 'Val_HalfBridgeII': 10189,
- 'Val_HaltOutputAndError': 14615,
- 'Val_Handshake': 10389,
- 'Val_HandshakeTriggerAsserts': 12552,
- 'Val_HandshakeTriggerDeasserts': 12553,
- 'Val_High': 10192,
- 'Val_HighFreq2Ctr': 10157,
- 'Val_HighImpedance': 12527,
- 'Val_HighResolution': 10195,
- 'Val_HighSpeed': 14712,
- 'Val_Hz': 10373,
- 'Val_IRIGB': 10070,
- 'Val_IgnoreOverruns': 15863,
- 'Val_Immediate': 10198,
- 'Val_Implicit': 10451,
- 'Val_Inches': 10379,
- 'Val_InsideWin': 10199,
- 'Val_Interlocked': 12549,
- 'Val_Internal': 10200,
- 'Val_Interrupts': 10204,
- 'Val_InvertPolarity': 1,
- 'Val_J_Type_TC': 10072,
- 'Val_K_Type_TC': 10073,
- 'Val_Kelvins': 10325,
- 'Val_LargeRng2Ctr': 10205,
- 'Val_LeavingWin': 10208,
- 'Val_LeftJustified': 10209,
- 'Val_Linear': 10447,
- 'Val_Load': 10440,
- 'Val_Log': 15844,
- 'Val_LogAndRead': 15842,
- 'Val_Loopback0': 0,
- 'Val_Loopback180': 1,
- 'Val_LosslessPacking': 12555,
- 'Val_LossyLSBRemoval': 12556,
- 'Val_Low': 10214,
- 'Val_LowFreq1Ctr': 10105,
- 'Val_Lvl': 10210,
- 'Val_MSeriesDAQ': 14643,
- 'Val_MaintainExistingValue': 12528,
- 'Val_MapRanges': 10448,
- 'Val_Meters': 10219,
- 'Val_MetersPerSecondSquared': 12470,
- 'Val_MostRecentSamp': 10428,
- 'Val_Multicycle': 14614,
- 'Val_NIELVIS': 14755,
- 'Val_NRSE': 10078,
- 'Val_N_Type_TC': 10077,
- 'Val_NetworkDAQ': 14829,
- 'Val_NoAction': 10227,
- 'Val_NoBridge': 10228,
- 'Val_NoChange': 10160,
- 'Val_None': 10230,
- 'Val_Off': 10231,
- 'Val_Ohms': 10384,
- 'Val_OnBrdMemEmpty': 10235,
- 'Val_OnBrdMemHalfFullOrLess': 10239,
- 'Val_OnBrdMemMoreThanHalfFull': 10237,
- 'Val_OnBrdMemNotEmpty': 10241,
- 'Val_OnBrdMemNotFull': 10242,
- 'Val_OnDemand': 10390,
- 'Val_OnbrdMemCustomThreshold': 12577,
- 'Val_OnbrdMemFull': 10236,
- 'Val_OnbrdMemMoreThanHalfFull': 10237,
- 'Val_Once': 10244,
- 'Val_Open': 10437,
- 'Val_OpenCollector': 12574,
- 'Val_OpenOrCreate': 15846,
- 'Val_OutsideWin': 10251,
- 'Val_OverwriteUnreadSamps': 10252,
- 'Val_PCCard': 12585,
- 'Val_PCI': 12582,
- 'Val_PCIe': 13612,
- 'Val_PPS': 10080,
- 'Val_PXI': 12583,
- 'Val_PXIe': 14706,
- 'Val_Pascals': 10081,
- 'Val_PathStatus_AlreadyExists': 10432,
- 'Val_PathStatus_Available': 10431,
- 'Val_PathStatus_ChannelInUse': 10434,
- 'Val_PathStatus_ChannelReservedForRouting': 10436,
- 'Val_PathStatus_SourceChannelConflict': 10435,
- 'Val_PathStatus_Unsupported': 10433,
- 'Val_PatternDoesNotMatch': 10253,
- 'Val_PatternMatches': 10254,
- 'Val_PauseUntilDataAvailable': 14616,
- 'Val_Period': 10256,
- 'Val_PipelinedSampClk': 14668,
- 'Val_Poll': 12524,
- 'Val_Polynomial': 10449,
- 'Val_Position_AngEncoder': 10360,
- 'Val_Position_EddyCurrentProximityProbe': 14835,
- 'Val_Position_LVDT': 10352,
- 'Val_Position_LinEncoder': 10361,
- 'Val_Position_RVDT': 10353,
- 'Val_ProgrammedIO': 10264,
- 'Val_PseudoDiff': 12529,
- 'Val_Pt3750': 12481,
- 'Val_Pt3851': 10071,
- 'Val_Pt3911': 12482,
- 'Val_Pt3916': 10069,
- 'Val_Pt3920': 10053,
- 'Val_Pt3928': 12483,
- 'Val_Pulse': 10265,
- 'Val_PulseFrequency': 15864,
- 'Val_PulseTicks': 15866,
- 'Val_PulseTime': 15865,
- 'Val_PulseWidth': 10359,
- 'Val_Pulse_Freq': 10119,
- 'Val_Pulse_Ticks': 10268,
- 'Val_Pulse_Time': 10269,
- 'Val_QuarterBridge': 10270,
- 'Val_QuarterBridgeI': 10271,
- 'Val_QuarterBridgeII': 10272,
- 'Val_R1': 12465,
- 'Val_R2': 12466,
- 'Val_R3': 12467,
- 'Val_R4': 14813,
- 'Val_RSE': 10083,
- 'Val_R_Type_TC': 10082,
- 'Val_Radians': 10273,
- 'Val_RefTrig': 10426,
- 'Val_ReferenceTrigger': 12490,
- 'Val_ReservedForRouting': 10441,
- 'Val_ResetTimer': 0,
- 'Val_Resistance': 10278,
- 'Val_RightJustified': 10279,
- 'Val_Rising': 10280,
- 'Val_RisingSlope': 10280,
- 'Val_SCC': 14707,
- 'Val_SCCConnectorBlock': 14704,
- 'Val_SCCModule': 14705,
- 'Val_SCSeriesDAQ': 14645,
- 'Val_SCXI': 12584,
- 'Val_SCXI1124Range0to10V': 14631,
- 'Val_SCXI1124Range0to1V': 14629,
- 'Val_SCXI1124Range0to20mA': 14635,
- 'Val_SCXI1124Range0to5V': 14630,
- 'Val_SCXI1124RangeNeg10to10V': 14634,
- 'Val_SCXI1124RangeNeg1to1V': 14632,
- 'Val_SCXI1124RangeNeg5to5V': 14633,
- 'Val_SCXIModule': 14660,
- 'Val_SSeriesDAQ': 14644,
- 'Val_S_Type_TC': 10085,
- 'Val_SameAsMasterTimebase': 10282,
- 'Val_SameAsSampTimebase': 10284,
- 'Val_SampClk': 10388,
- 'Val_SampClkActiveEdge': 14617,
- 'Val_SampClkInactiveEdge': 14618,
- 'Val_SampClkPeriods': 10286,
- 'Val_SampleClock': 12487,
- 'Val_SampleCompleteEvent': 12530,
- 'Val_Save_AllowInteractiveDeletion': 4,
- 'Val_Save_AllowInteractiveEditing': 2,
- 'Val_Save_Overwrite': 1,
- 'Val_Sawtooth': 14754,
- 'Val_Seconds': 10364,
- 'Val_SemiPeriod': 10289,
- 'Val_Sine': 14751,
- 'Val_SingleCycle': 14613,
- 'Val_Sleep': 12547,
- 'Val_Software': 10292,
- 'Val_SoundPressure_Microphone': 10354,
- 'Val_Source': 10439,
- 'Val_Square': 14753,
- 'Val_StartTrigger': 12491,
- 'Val_StopTaskAndError': 15862,
- 'Val_Strain': 10299,
- 'Val_Strain_Gage': 10300,
- 'Val_Switch_Topology_1127_Independent': '1127/Independent',
- 'Val_Switch_Topology_1128_Independent': '1128/Independent',
- 'Val_Switch_Topology_1130_Independent': '1130/Independent',
- 'Val_Switch_Topology_1160_16_SPDT': '1160/16-SPDT',
- 'Val_Switch_Topology_1161_8_SPDT': '1161/8-SPDT',
- 'Val_Switch_Topology_1166_16_DPDT': '1166/16-DPDT',
- 'Val_Switch_Topology_1166_32_SPDT': '1166/32-SPDT',
- 'Val_Switch_Topology_1167_Independent': '1167/Independent',
- 'Val_Switch_Topology_1169_100_SPST': '1169/100-SPST',
- 'Val_Switch_Topology_1169_50_DPST': '1169/50-DPST',
- 'Val_Switch_Topology_1192_8_SPDT': '1192/8-SPDT',
- 'Val_Switch_Topology_1193_Independent': '1193/Independent',
- 'Val_Switch_Topology_2510_Independent': '2510/Independent',
- 'Val_Switch_Topology_2512_Independent': '2512/Independent',
- 'Val_Switch_Topology_2514_Independent': '2514/Independent',
- 'Val_Switch_Topology_2515_Independent': '2515/Independent',
- 'Val_Switch_Topology_2527_Independent': '2527/Independent',
- 'Val_Switch_Topology_2530_Independent': '2530/Independent',
- 'Val_Switch_Topology_2548_4_SPDT': '2548/4-SPDT',
- 'Val_Switch_Topology_2558_4_SPDT': '2558/4-SPDT',
- 'Val_Switch_Topology_2564_16_SPST': '2564/16-SPST',
- 'Val_Switch_Topology_2564_8_DPST': '2564/8-DPST',
- 'Val_Switch_Topology_2565_16_SPST': '2565/16-SPST',
- 'Val_Switch_Topology_2566_16_SPDT': '2566/16-SPDT',
- 'Val_Switch_Topology_2566_8_DPDT': '2566/8-DPDT',
- 'Val_Switch_Topology_2567_Independent': '2567/Independent',
- 'Val_Switch_Topology_2568_15_DPST': '2568/15-DPST',
- 'Val_Switch_Topology_2568_31_SPST': '2568/31-SPST',
- 'Val_Switch_Topology_2569_100_SPST': '2569/100-SPST',
- 'Val_Switch_Topology_2569_50_DPST': '2569/50-DPST',
- 'Val_Switch_Topology_2570_20_DPDT': '2570/20-DPDT',
- 'Val_Switch_Topology_2570_40_SPDT': '2570/40-SPDT',
- 'Val_Switch_Topology_2576_Independent': '2576/Independent',
- 'Val_Switch_Topology_2584_Independent': '2584/Independent',
- 'Val_Switch_Topology_2586_10_SPST': '2586/10-SPST',
- 'Val_Switch_Topology_2586_5_DPST': '2586/5-DPST',
- 'Val_Switch_Topology_2593_Independent': '2593/Independent',
- 'Val_Switch_Topology_2599_2_SPDT': '2599/2-SPDT',
- 'Val_Switches': 14650,
- 'Val_SynchronousEventCallbacks': 1,
- 'Val_TCPIP': 14828,
- 'Val_TEDS_Sensor': 12531,
- 'Val_TIOSeries': 14661,
- 'Val_T_Type_TC': 10086,
- 'Val_Table': 10450,
- 'Val_Task_Abort': 6,
- 'Val_Task_Commit': 3,
- 'Val_Task_Reserve': 4,
- 'Val_Task_Start': 0,
- 'Val_Task_Stop': 1,
- 'Val_Task_Unreserve': 5,
- 'Val_Task_Verify': 2,
- 'Val_Temp_BuiltInSensor': 10311,
- 'Val_Temp_RTD': 10301,
- 'Val_Temp_TC': 10303,
- 'Val_Temp_Thrmstr': 10302,
- 'Val_Ticks': 10304,
- 'Val_Toggle': 10307,
- 'Val_Transferred_From_Buffer': 2,
- 'Val_Triangle': 14752,
- 'Val_Tristate': 10310,
- 'Val_TwoEdgeSep': 10267,
- 'Val_TwoPulseCounting': 10313,
- 'Val_USB': 12586,
- 'Val_USBDAQ': 14646,
- 'Val_USBbulk': 12590,
- 'Val_Unconstrained': 14708,
- 'Val_Unknown': 12588,
- 'Val_Voltage': 10322,
- 'Val_VoltageRMS': 10350,
- 'Val_Voltage_CustomWithExcitation': 10323,
- 'Val_Volts': 10348,
- 'Val_VoltsPerG': 12510,
- 'Val_VoltsPerMil': 14837,
- 'Val_VoltsPerMillimeter': 14839,
- 'Val_WDTExpiredEvent': 12512,
- 'Val_WaitForHandshakeTriggerAssert': 12550,
- 'Val_WaitForHandshakeTriggerDeassert': 12551,
- 'Val_WaitForInterrupt': 12523,
- 'Val_WaitInfinitely': -1.0,
- 'Val_WhenAcqComplete': 12546,
- 'Val_WriteToEEPROM': 12538,
- 'Val_WriteToPROM': 12539,
- 'Val_X1': 10090,
- 'Val_X2': 10091,
- 'Val_X4': 10092,
- 'Val_XSeriesDAQ': 15858,
- 'Val_Yield': 12525,
- 'Val_ZeroVolts': 12526,
- 'Val_g': 10186,
- 'Val_mVoltsPerG': 12509,
- 'Val_mVoltsPerMicron': 14840,
- 'Val_mVoltsPerMil': 14836,
- 'Val_mVoltsPerMillimeter': 14838,
- 'Val_mVoltsPerVoltPerDegree': 12507,
- 'Val_mVoltsPerVoltPerMilliInch': 12505,
- 'Val_mVoltsPerVoltPerMillimeter': 12506,
- 'Val_mVoltsPerVoltPerRadian': 12508,
- 'WatchdogExpirTrig_Type': 8611,
- 'Watchdog_DO_ExpirState': 8615,
- 'Watchdog_HasExpired': 8616,
- 'Watchdog_Timeout': 8617,
- 'Write_CurrWritePos': 5208,
- 'Write_DigitalLines_BytesPerChan': 8575,
- 'Write_NextWriteIsLast': 10604,
- 'Write_NumChans': 8574,
- 'Write_Offset': 6413,
- 'Write_OpenCurrentLoopChans': 10731,
- 'Write_OpenCurrentLoopChansExist': 10730,
- 'Write_OvercurrentChans': 10729,
- 'Write_OvercurrentChansExist': 10728,
- 'Write_OvertemperatureChansExist': 10884,
- 'Write_PowerSupplyFaultChans': 10733,
- 'Write_PowerSupplyFaultChansExist': 10732,
- 'Write_RawDataWidth': 8573,
- 'Write_RegenMode': 5203,
- 'Write_RelativeTo': 6412,
- 'Write_SleepTime': 8882,
- 'Write_SpaceAvail': 5216,
- 'Write_TotalSampPerChanGenerated': 6443,
- 'Write_WaitMode': 8881}
-DAQmxConstants = namedtuple('DAQmxConstants', _d.keys())
-DAQmx = DAQmxConstants(**_d)
-
-error_map = {-209805: 'COCannotKeepUpInHWTimedSinglePoint',
- -209803: 'WaitForNextSampClkDetected3OrMoreSampClks',
- -209802: 'WaitForNextSampClkDetectedMissedSampClk',
- -209801: 'WriteNotCompleteBeforeSampClk',
- -209800: 'ReadNotCompleteBeforeSampClk',
- -201331: 'MemoryMappedHardwareTimedNonBufferedUnsupported',
- -201330: 'CannotUpdatePulseTrainWithAutoIncrementEnabled',
- -201329: 'HWTimedSinglePointAndDataXferNotDMA',
- -201328: 'SCCSecondStageEmpty',
- -201327: 'SCCInvalidDualStageCombo',
- -201326: 'SCCInvalidSecondStage',
- -201325: 'SCCInvalidFirstStage',
- -201324: 'CounterMultipleSampleClockedChannels',
- -201323: '2CounterMeasurementModeAndSampleClocked',
- -201322: 'CantHaveBothMemMappedAndNonMemMappedTasks',
- -201321: 'MemMappedDataReadByAnotherProcess',
- -201320: 'RetriggeringInvalidForGivenSettings',
- -201319: 'AIOverrun',
- -201318: 'COOverrun',
- -201317: 'CounterMultipleBufferedChannels',
- -201316: 'InvalidTimebaseForCOHWTSP',
- -201315: 'WriteBeforeEvent',
- -201314: 'CIOverrun',
- -201313: 'CounterNonResponsiveAndReset',
- -201312: 'MeasTypeOrChannelNotSupportedForLogging',
- -201311: 'FileAlreadyOpenedForWrite',
- -201310: 'TdmsNotFound',
- -201309: 'GenericFileIO',
- -201308: 'FiniteSTCCounterNotSupportedForLogging',
- -201307: 'MeasurementTypeNotSupportedForLogging',
- -201306: 'FileAlreadyOpened',
- -201305: 'DiskFull',
- -201304: 'FilePathInvalid',
- -201303: 'FileVersionMismatch',
- -201302: 'FileWriteProtected',
- -201301: 'ReadNotSupportedForLoggingMode',
- -201300: 'AttributeNotSupportedWhenLogging',
- -201299: 'LoggingModeNotSupportedNonBuffered',
- -201298: 'PropertyNotSupportedWithConflictingProperty',
- -201297: 'ParallelSSHOnConnector1',
- -201296: 'COOnlyImplicitSampleTimingTypeSupported',
- -201295: 'CalibrationFailedAOOutOfRange',
- -201294: 'CalibrationFailedAIOutOfRange',
- -201293: 'CalPWMLinearityFailed',
- -201292: 'OverrunUnderflowConfigurationCombo',
- -201291: 'CannotWriteToFiniteCOTask',
- -201290: 'NetworkDAQInvalidWEPKeyLength',
- -201289: 'CalInputsShortedNotSupported',
- -201288: 'CannotSetPropertyWhenTaskIsReserved',
- -201287: 'Minus12VFuseBlown',
- -201286: 'Plus12VFuseBlown',
- -201285: 'Plus5VFuseBlown',
- -201284: 'Plus3VFuseBlown',
- -201283: 'DeviceSerialPortError',
- -201282: 'PowerUpStateMachineNotDone',
- -201281: 'TooManyTriggersSpecifiedInTask',
- -201280: 'VerticalOffsetNotSupportedOnDevice',
- -201279: 'InvalidCouplingForMeasurementType',
- -201278: 'DigitalLineUpdateTooFastForDevice',
- -201277: 'CertificateIsTooBigToTransfer',
- -201276: 'OnlyPEMOrDERCertiticatesAccepted',
- -201275: 'CalCouplingNotSupported',
- -201274: 'DeviceNotSupportedIn64Bit',
- -201273: 'NetworkDeviceInUse',
- -201272: 'InvalidIPv4AddressFormat',
- -201271: 'NetworkProductTypeMismatch',
- -201270: 'OnlyPEMCertificatesAccepted',
- -201269: 'CalibrationRequiresPrototypingBoardEnabled',
- -201268: 'AllCurrentLimitingResourcesAlreadyTaken',
- -201267: 'UserDefInfoStringBadLength',
- -201266: 'PropertyNotFound',
- -201265: 'OverVoltageProtectionActivated',
- -201264: 'ScaledIQWaveformTooLarge',
- -201263: 'FirmwareFailedToDownload',
- -201262: 'PropertyNotSupportedForBusType',
- -201261: 'ChangeRateWhileRunningCouldNotBeCompleted',
- -201260: 'CannotQueryManualControlAttribute',
- -201259: 'InvalidNetworkConfiguration',
- -201258: 'InvalidWirelessConfiguration',
- -201257: 'InvalidWirelessCountryCode',
- -201256: 'InvalidWirelessChannel',
- -201255: 'NetworkEEPROMHasChanged',
- -201254: 'NetworkSerialNumberMismatch',
- -201253: 'NetworkStatusDown',
- -201252: 'NetworkTargetUnreachable',
- -201251: 'NetworkTargetNotFound',
- -201250: 'NetworkStatusTimedOut',
- -201249: 'InvalidWirelessSecuritySelection',
- -201248: 'NetworkDeviceConfigurationLocked',
- -201247: 'NetworkDAQDeviceNotSupported',
- -201246: 'NetworkDAQCannotCreateEmptySleeve',
- -201244: 'ModuleTypeDoesNotMatchModuleTypeInDestination',
- -201243: 'InvalidTEDSInterfaceAddress',
- -201242: 'DevDoesNotSupportSCXIComm',
- -201241: 'SCXICommDevConnector0MustBeCabledToModule',
- -201240: 'SCXIModuleDoesNotSupportDigitizationMode',
- -201239: 'DevDoesNotSupportMultiplexedSCXIDigitizationMode',
- -201238: 'DevOrDevPhysChanDoesNotSupportSCXIDigitization',
- -201237: 'InvalidPhysChanName',
- -201236: 'SCXIChassisCommModeInvalid',
- -201235: 'RequiredDependencyNotFound',
- -201234: 'InvalidStorage',
- -201233: 'InvalidObject',
- -201232: 'StorageAlteredPriorToSave',
- -201231: 'TaskDoesNotReferenceLocalChannel',
- -201230: 'ReferencedDevSimMustMatchTarget',
- -201229: 'ProgrammedIOFailsBecauseOfWatchdogTimer',
- -201228: 'WatchdogTimerFailsBecauseOfProgrammedIO',
- -201227: 'CantUseThisTimingEngineWithAPort',
- -201226: 'ProgrammedIOConflict',
- -201225: 'ChangeDetectionIncompatibleWithProgrammedIO',
- -201224: 'TristateNotEnoughLines',
- -201223: 'TristateConflict',
- -201222: 'GenerateOrFiniteWaitExpectedBeforeBreakBlock',
- -201221: 'BreakBlockNotAllowedInLoop',
- -201220: 'ClearTriggerNotAllowedInBreakBlock',
- -201219: 'NestingNotAllowedInBreakBlock',
- -201218: 'IfElseBlockNotAllowedInBreakBlock',
- -201217: 'RepeatUntilTriggerLoopNotAllowedInBreakBlock',
- -201216: 'WaitUntilTriggerNotAllowedInBreakBlock',
- -201215: 'MarkerPosInvalidInBreakBlock',
- -201214: 'InvalidWaitDurationInBreakBlock',
- -201213: 'InvalidSubsetLengthInBreakBlock',
- -201212: 'InvalidWaveformLengthInBreakBlock',
- -201211: 'InvalidWaitDurationBeforeBreakBlock',
- -201210: 'InvalidSubsetLengthBeforeBreakBlock',
- -201209: 'InvalidWaveformLengthBeforeBreakBlock',
- -201208: 'SampleRateTooHighForADCTimingMode',
- -201207: 'ActiveDevNotSupportedWithMultiDevTask',
- -201206: 'RealDevAndSimDevNotSupportedInSameTask',
- -201205: 'RTSISimMustMatchDevSim',
- -201204: 'BridgeShuntCaNotSupported',
- -201203: 'StrainShuntCaNotSupported',
- -201202: 'GainTooLargeForGainCalConst',
- -201201: 'OffsetTooLargeForOffsetCalConst',
- -201200: 'ElvisPrototypingBoardRemoved',
- -201199: 'Elvis2PowerRailFault',
- -201198: 'Elvis2PhysicalChansFault',
- -201197: 'Elvis2PhysicalChansThermalEvent',
- -201196: 'RXBitErrorRateLimitExceeded',
- -201195: 'PHYBitErrorRateLimitExceeded',
- -201194: 'TwoPartAttributeCalledOutOfOrder',
- -201193: 'InvalidSCXIChassisAddress',
- -201192: 'CouldNotConnectToRemoteMXS',
- -201191: 'ExcitationStateRequiredForAttributes',
- -201190: 'DeviceNotUsableUntilUSBReplug',
- -201189: 'InputFIFOOverflowDuringCalibrationOnFullSpeedUSB',
- -201188: 'InputFIFOOverflowDuringCalibration',
- -201187: 'CJCChanConflictsWithNonThermocoupleChan',
- -201186: 'CommDeviceForPXIBackplaneNotInRightmostSlot',
- -201185: 'CommDeviceForPXIBackplaneNotInSameChassis',
- -201184: 'CommDeviceForPXIBackplaneNotPXI',
- -201183: 'InvalidCalExcitFrequency',
- -201182: 'InvalidCalExcitVoltage',
- -201181: 'InvalidAIInputSrc',
- -201180: 'InvalidCalInputRef',
- -201179: 'dBReferenceValueNotGreaterThanZero',
- -201178: 'SampleClockRateIsTooFastForSampleClockTiming',
- -201177: 'DeviceNotUsableUntilColdStart',
- -201176: 'SampleClockRateIsTooFastForBurstTiming',
- -201175: 'DevImportFailedAssociatedResourceIDsNotSupported',
- -201174: 'SCXI1600ImportNotSupported',
- -201173: 'PowerSupplyConfigurationFailed',
- -201172: 'IEPEWithDCNotAllowed',
- -201171: 'MinTempForThermocoupleTypeOutsideAccuracyForPolyScaling',
- -201170: 'DevImportFailedNoDeviceToOverwriteAndSimulationNotSupported',
- -201169: 'DevImportFailedDeviceNotSupportedOnDestination',
- -201168: 'FirmwareIsTooOld',
- -201167: 'FirmwareCouldntUpdate',
- -201166: 'FirmwareIsCorrupt',
- -201165: 'FirmwareTooNew',
- -201164: 'SampClockCannotBeExportedFromExternalSampClockSrc',
- -201163: 'PhysChanReservedForInputWhenDesiredForOutput',
- -201162: 'PhysChanReservedForOutputWhenDesiredForInput',
- -201161: 'SpecifiedCDAQSlotNotEmpty',
- -201160: 'DeviceDoesNotSupportSimulation',
- -201159: 'InvalidCDAQSlotNumberSpecd',
- -201158: 'CSeriesModSimMustMatchCDAQChassisSim',
- -201157: 'SCCCabledDevMustNotBeSimWhenSCCCarrierIsNotSim',
- -201156: 'SCCModSimMustMatchSCCCarrierSim',
- -201155: 'SCXIModuleDoesNotSupportSimulation',
- -201154: 'SCXICableDevMustNotBeSimWhenModIsNotSim',
- -201153: 'SCXIDigitizerSimMustNotBeSimWhenModIsNotSim',
- -201152: 'SCXIModSimMustMatchSCXIChassisSim',
- -201151: 'SimPXIDevReqSlotAndChassisSpecd',
- -201150: 'SimDevConflictWithRealDev',
- -201149: 'InsufficientDataForCalibration',
- -201148: 'TriggerChannelMustBeEnabled',
- -201147: 'CalibrationDataConflictCouldNotBeResolved',
- -201146: 'SoftwareTooNewForSelfCalibrationData',
- -201145: 'SoftwareTooNewForExtCalibrationData',
- -201144: 'SelfCalibrationDataTooNewForSoftware',
- -201143: 'ExtCalibrationDataTooNewForSoftware',
- -201142: 'SoftwareTooNewForEEPROM',
- -201141: 'EEPROMTooNewForSoftware',
- -201140: 'SoftwareTooNewForHardware',
- -201139: 'HardwareTooNewForSoftware',
- -201138: 'TaskCannotRestartFirstSampNotAvailToGenerate',
- -201137: 'OnlyUseStartTrigSrcPrptyWithDevDataLines',
- -201136: 'OnlyUsePauseTrigSrcPrptyWithDevDataLines',
- -201135: 'OnlyUseRefTrigSrcPrptyWithDevDataLines',
- -201134: 'PauseTrigDigPatternSizeDoesNotMatchSrcSize',
- -201133: 'LineConflictCDAQ',
- -201132: 'CannotWriteBeyondFinalFiniteSample',
- -201131: 'RefAndStartTriggerSrcCantBeSame',
- -201130: 'MemMappingIncompatibleWithPhysChansInTask',
- -201129: 'OutputDriveTypeMemMappingConflict',
- -201128: 'CAPIDeviceIndexInvalid',
- -201127: 'RatiometricDevicesMustUseExcitationForScaling',
- -201126: 'PropertyRequiresPerDeviceCfg',
- -201125: 'AICouplingAndAIInputSourceConflict',
- -201124: 'OnlyOneTaskCanPerformDOMemoryMappingAtATime',
- -201123: 'TooManyChansForAnalogRefTrigCDAQ',
- -201122: 'SpecdPropertyValueIsIncompatibleWithSampleTimingType',
- -201121: 'CPUNotSupportedRequireSSE',
- -201120: 'SpecdPropertyValueIsIncompatibleWithSampleTimingResponseMode',
- -201119: 'ConflictingNextWriteIsLastAndRegenModeProperties',
- -201118: 'MStudioOperationDoesNotSupportDeviceContext',
- -201117: 'PropertyValueInChannelExpansionContextInvalid',
- -201116: 'HWTimedNonBufferedAONotSupported',
- -201115: 'WaveformLengthNotMultOfQuantum',
- -201114: 'DSAExpansionMixedBoardsWrongOrderInPXIChassis',
- -201113: 'PowerLevelTooLowForOOK',
- -201112: 'DeviceComponentTestFailure',
- -201111: 'UserDefinedWfmWithOOKUnsupported',
- -201110: 'InvalidDigitalModulationUserDefinedWaveform',
- -201109: 'BothRefInAndRefOutEnabled',
- -201108: 'BothAnalogAndDigitalModulationEnabled',
- -201107: 'BufferedOpsNotSupportedInSpecdSlotForCDAQ',
- -201106: 'PhysChanNotSupportedInSpecdSlotForCDAQ',
- -201105: 'ResourceReservedWithConflictingSettings',
- -201104: 'InconsistentAnalogTrigSettingsCDAQ',
- -201103: 'TooManyChansForAnalogPauseTrigCDAQ',
- -201102: 'AnalogTrigNotFirstInScanListCDAQ',
- -201101: 'TooManyChansGivenTimingType',
- -201100: 'SampClkTimebaseDivWithExtSampClk',
- -201099: 'CantSaveTaskWithPerDeviceTimingProperties',
- -201098: 'ConflictingAutoZeroMode',
- -201097: 'SampClkRateNotSupportedWithEAREnabled',
- -201096: 'SampClkTimebaseRateNotSpecd',
- -201095: 'SessionCorruptedByDLLReload',
- -201094: 'ActiveDevNotSupportedWithChanExpansion',
- -201093: 'SampClkRateInvalid',
- -201092: 'ExtSyncPulseSrcCannotBeExported',
- -201091: 'SyncPulseMinDelayToStartNeededForExtSyncPulseSrc',
- -201090: 'SyncPulseSrcInvalid',
- -201089: 'SampClkTimebaseRateInvalid',
- -201088: 'SampClkTimebaseSrcInvalid',
- -201087: 'SampClkRateMustBeSpecd',
- -201086: 'InvalidAttributeName',
- -201085: 'CJCChanNameMustBeSetWhenCJCSrcIsScannableChan',
- -201084: 'HiddenChanMissingInChansPropertyInCfgFile',
- -201083: 'ChanNamesNotSpecdInCfgFile',
- -201082: 'DuplicateHiddenChanNamesInCfgFile',
- -201081: 'DuplicateChanNameInCfgFile',
- -201080: 'InvalidSCCModuleForSlotSpecd',
- -201079: 'InvalidSCCSlotNumberSpecd',
- -201078: 'InvalidSectionIdentifier',
- -201077: 'InvalidSectionName',
- -201076: 'DAQmxVersionNotSupported',
- -201075: 'SWObjectsFoundInFile',
- -201074: 'HWObjectsFoundInFile',
- -201073: 'LocalChannelSpecdWithNoParentTask',
- -201072: 'TaskReferencesMissingLocalChannel',
- -201071: 'TaskReferencesLocalChannelFromOtherTask',
- -201070: 'TaskMissingChannelProperty',
- -201069: 'InvalidLocalChanName',
- -201068: 'InvalidEscapeCharacterInString',
- -201067: 'InvalidTableIdentifier',
- -201066: 'ValueFoundInInvalidColumn',
- -201065: 'MissingStartOfTable',
- -201064: 'FileMissingRequiredDAQmxHeader',
- -201063: 'DeviceIDDoesNotMatch',
- -201062: 'BufferedOperationsNotSupportedOnSelectedLines',
- -201061: 'PropertyConflictsWithScale',
- -201060: 'InvalidINIFileSyntax',
- -201059: 'DeviceInfoFailedPXIChassisNotIdentified',
- -201058: 'InvalidHWProductNumber',
- -201057: 'InvalidHWProductType',
- -201056: 'InvalidNumericFormatSpecd',
- -201055: 'DuplicatePropertyInObject',
- -201054: 'InvalidEnumValueSpecd',
- -201053: 'TEDSSensorPhysicalChannelConflict',
- -201052: 'TooManyPhysicalChansForTEDSInterfaceSpecd',
- -201051: 'IncapableTEDSInterfaceControllingDeviceSpecd',
- -201050: 'SCCCarrierSpecdIsMissing',
- -201049: 'IncapableSCCDigitizingDeviceSpecd',
- -201048: 'AccessorySettingNotApplicable',
- -201047: 'DeviceAndConnectorSpecdAlreadyOccupied',
- -201046: 'IllegalAccessoryTypeForDeviceSpecd',
- -201045: 'InvalidDeviceConnectorNumberSpecd',
- -201044: 'InvalidAccessoryName',
- -201043: 'MoreThanOneMatchForSpecdDevice',
- -201042: 'NoMatchForSpecdDevice',
- -201041: 'ProductTypeAndProductNumberConflict',
- -201040: 'ExtraPropertyDetectedInSpecdObject',
- -201039: 'RequiredPropertyMissing',
- -201038: 'CantSetAuthorForLocalChan',
- -201037: 'InvalidTimeValue',
- -201036: 'InvalidTimeFormat',
- -201035: 'DigDevChansSpecdInModeOtherThanParallel',
- -201034: 'CascadeDigitizationModeNotSupported',
- -201033: 'SpecdSlotAlreadyOccupied',
- -201032: 'InvalidSCXISlotNumberSpecd',
- -201031: 'AddressAlreadyInUse',
- -201030: 'SpecdDeviceDoesNotSupportRTSI',
- -201029: 'SpecdDeviceIsAlreadyOnRTSIBus',
- -201028: 'IdentifierInUse',
- -201027: 'WaitForNextSampleClockOrReadDetected3OrMoreMissedSampClks',
- -201026: 'HWTimedAndDataXferPIO',
- -201025: 'NonBufferedAndHWTimed',
- -201024: 'CTROutSampClkPeriodShorterThanGenPulseTrainPeriodPolled',
- -201023: 'CTROutSampClkPeriodShorterThanGenPulseTrainPeriod2',
- -201022: 'COCannotKeepUpInHWTimedSinglePointPolled',
- -201021: 'WriteRecoveryCannotKeepUpInHWTimedSinglePoint',
- -201020: 'NoChangeDetectionOnSelectedLineForDevice',
- -201019: 'SMIOPauseTriggersNotSupportedWithChannelExpansion',
- -201018: 'ClockMasterForExternalClockNotLongestPipeline',
- -201017: 'UnsupportedUnicodeByteOrderMarker',
- -201016: 'TooManyInstructionsInLoopInScript',
- -201015: 'PLLNotLocked',
- -201014: 'IfElseBlockNotAllowedInFiniteRepeatLoopInScript',
- -201013: 'IfElseBlockNotAllowedInConditionalRepeatLoopInScript',
- -201012: 'ClearIsLastInstructionInIfElseBlockInScript',
- -201011: 'InvalidWaitDurationBeforeIfElseBlockInScript',
- -201010: 'MarkerPosInvalidBeforeIfElseBlockInScript',
- -201009: 'InvalidSubsetLengthBeforeIfElseBlockInScript',
- -201008: 'InvalidWaveformLengthBeforeIfElseBlockInScript',
- -201007: 'GenerateOrFiniteWaitInstructionExpectedBeforeIfElseBlockInScript',
- -201006: 'CalPasswordNotSupported',
- -201005: 'SetupCalNeededBeforeAdjustCal',
- -201004: 'MultipleChansNotSupportedDuringCalSetup',
- -201003: 'DevCannotBeAccessed',
- -201002: 'SampClkRateDoesntMatchSampClkSrc',
- -201001: 'SampClkRateNotSupportedWithEARDisabled',
- -201000: 'LabVIEWVersionDoesntSupportDAQmxEvents',
- -200999: 'COReadyForNewValNotSupportedWithOnDemand',
- -200998: 'CIHWTimedSinglePointNotSupportedForMeasType',
- -200997: 'OnDemandNotSupportedWithHWTimedSinglePoint',
- -200996: 'HWTimedSinglePointAndDataXferNotProgIO',
- -200995: 'MemMapAndHWTimedSinglePoint',
- -200994: 'CannotSetPropertyWhenHWTimedSinglePointTaskIsRunning',
- -200993: 'CTROutSampClkPeriodShorterThanGenPulseTrainPeriod',
- -200992: 'TooManyEventsGenerated',
- -200991: 'MStudioCppRemoveEventsBeforeStop',
- -200990: 'CAPICannotRegisterSyncEventsFromMultipleThreads',
- -200989: 'ReadWaitNextSampClkWaitMismatchTwo',
- -200988: 'ReadWaitNextSampClkWaitMismatchOne',
- -200987: 'DAQmxSignalEventTypeNotSupportedByChanTypesOrDevicesInTask',
- -200986: 'CannotUnregisterDAQmxSoftwareEventWhileTaskIsRunning',
- -200985: 'AutoStartWriteNotAllowedEventRegistered',
- -200984: 'AutoStartReadNotAllowedEventRegistered',
- -200983: 'CannotGetPropertyWhenTaskNotReservedCommittedOrRunning',
- -200982: 'SignalEventsNotSupportedByDevice',
- -200981: 'EveryNSamplesAcqIntoBufferEventNotSupportedByDevice',
- -200980: 'EveryNSampsTransferredFromBufferEventNotSupportedByDevice',
- -200979: 'CAPISyncEventsTaskStateChangeNotAllowedFromDifferentThread',
- -200978: 'DAQmxSWEventsWithDifferentCallMechanisms',
- -200977: 'CantSaveChanWithPolyCalScaleAndAllowInteractiveEdit',
- -200976: 'ChanDoesNotSupportCJC',
- -200975: 'COReadyForNewValNotSupportedWithHWTimedSinglePoint',
- -200974: 'DACAllowConnToGndNotSupportedByDevWhenRefSrcExt',
- -200973: 'CantGetPropertyTaskNotRunning',
- -200972: 'CantSetPropertyTaskNotRunning',
- -200971: 'CantSetPropertyTaskNotRunningCommitted',
- -200970: 'AIEveryNSampsEventIntervalNotMultipleOf2',
- -200969: 'InvalidTEDSPhysChanNotAI',
- -200968: 'CAPICannotPerformTaskOperationInAsyncCallback',
- -200967: 'EveryNSampsTransferredFromBufferEventAlreadyRegistered',
- -200966: 'EveryNSampsAcqIntoBufferEventAlreadyRegistered',
- -200965: 'EveryNSampsTransferredFromBufferNotForInput',
- -200964: 'EveryNSampsAcqIntoBufferNotForOutput',
- -200963: 'AOSampTimingTypeDifferentIn2Tasks',
- -200962: 'CouldNotDownloadFirmwareHWDamaged',
- -200961: 'CouldNotDownloadFirmwareFileMissingOrDamaged',
- -200960: 'CannotRegisterDAQmxSoftwareEventWhileTaskIsRunning',
- -200959: 'DifferentRawDataCompression',
- -200958: 'ConfiguredTEDSInterfaceDevNotDetected',
- -200957: 'CompressedSampSizeExceedsResolution',
- -200956: 'ChanDoesNotSupportCompression',
- -200955: 'DifferentRawDataFormats',
- -200954: 'SampClkOutputTermIncludesStartTrigSrc',
- -200953: 'StartTrigSrcEqualToSampClkSrc',
- -200952: 'EventOutputTermIncludesTrigSrc',
- -200951: 'COMultipleWritesBetweenSampClks',
- -200950: 'DoneEventAlreadyRegistered',
- -200949: 'SignalEventAlreadyRegistered',
- -200948: 'CannotHaveTimedLoopAndDAQmxSignalEventsInSameTask',
- -200947: 'NeedLabVIEW711PatchToUseDAQmxEvents',
- -200946: 'StartFailedDueToWriteFailure',
- -200945: 'DataXferCustomThresholdNotDMAXferMethodSpecifiedForDev',
- -200944: 'DataXferRequestConditionNotSpecifiedForCustomThreshold',
- -200943: 'DataXferCustomThresholdNotSpecified',
- -200942: 'CAPISyncCallbackNotSupportedOnThisPlatform',
- -200941: 'CalChanReversePolyCoefNotSpecd',
- -200940: 'CalChanForwardPolyCoefNotSpecd',
- -200939: 'ChanCalRepeatedNumberInPreScaledVals',
- -200938: 'ChanCalTableNumScaledNotEqualNumPrescaledVals',
- -200937: 'ChanCalTableScaledValsNotSpecd',
- -200936: 'ChanCalTablePreScaledValsNotSpecd',
- -200935: 'ChanCalScaleTypeNotSet',
- -200934: 'ChanCalExpired',
- -200933: 'ChanCalExpirationDateNotSet',
- -200932: '3OutputPortCombinationGivenSampTimingType653x',
- -200931: '3InputPortCombinationGivenSampTimingType653x',
- -200930: '2OutputPortCombinationGivenSampTimingType653x',
- -200929: '2InputPortCombinationGivenSampTimingType653x',
- -200928: 'PatternMatcherMayBeUsedByOneTrigOnly',
- -200927: 'NoChansSpecdForPatternSource',
- -200926: 'ChangeDetectionChanNotInTask',
- -200925: 'ChangeDetectionChanNotTristated',
- -200924: 'WaitModeValueNotSupportedNonBuffered',
- -200923: 'WaitModePropertyNotSupportedNonBuffered',
- -200922: 'CantSavePerLineConfigDigChanSoInteractiveEditsAllowed',
- -200921: 'CantSaveNonPortMultiLineDigChanSoInteractiveEditsAllowed',
- -200920: 'BufferSizeNotMultipleOfEveryNSampsEventIntervalNoIrqOnDev',
- -200919: 'GlobalTaskNameAlreadyChanName',
- -200918: 'GlobalChanNameAlreadyTaskName',
- -200917: 'AOEveryNSampsEventIntervalNotMultipleOf2',
- -200916: 'SampleTimebaseDivisorNotSupportedGivenTimingType',
- -200915: 'HandshakeEventOutputTermNotSupportedGivenTimingType',
- -200914: 'ChangeDetectionOutputTermNotSupportedGivenTimingType',
- -200913: 'ReadyForTransferOutputTermNotSupportedGivenTimingType',
- -200912: 'RefTrigOutputTermNotSupportedGivenTimingType',
- -200911: 'StartTrigOutputTermNotSupportedGivenTimingType',
- -200910: 'SampClockOutputTermNotSupportedGivenTimingType',
- -200909: '20MhzTimebaseNotSupportedGivenTimingType',
- -200908: 'SampClockSourceNotSupportedGivenTimingType',
- -200907: 'RefTrigTypeNotSupportedGivenTimingType',
- -200906: 'PauseTrigTypeNotSupportedGivenTimingType',
- -200905: 'HandshakeTrigTypeNotSupportedGivenTimingType',
- -200904: 'StartTrigTypeNotSupportedGivenTimingType',
- -200903: 'RefClkSrcNotSupported',
- -200902: 'DataVoltageLowAndHighIncompatible',
- -200901: 'InvalidCharInDigPatternString',
- -200900: 'CantUsePort3AloneGivenSampTimingTypeOn653x',
- -200899: 'CantUsePort1AloneGivenSampTimingTypeOn653x',
- -200898: 'PartialUseOfPhysicalLinesWithinPortNotSupported653x',
- -200897: 'PhysicalChanNotSupportedGivenSampTimingType653x',
- -200896: 'CanExportOnlyDigEdgeTrigs',
- -200895: 'RefTrigDigPatternSizeDoesNotMatchSourceSize',
- -200894: 'StartTrigDigPatternSizeDoesNotMatchSourceSize',
- -200893: 'ChangeDetectionRisingAndFallingEdgeChanDontMatch',
- -200892: 'PhysicalChansForChangeDetectionAndPatternMatch653x',
- -200891: 'CanExportOnlyOnboardSampClk',
- -200890: 'InternalSampClkNotRisingEdge',
- -200889: 'RefTrigDigPatternChanNotInTask',
- -200888: 'RefTrigDigPatternChanNotTristated',
- -200887: 'StartTrigDigPatternChanNotInTask',
- -200886: 'StartTrigDigPatternChanNotTristated',
- -200885: 'PXIStarAndClock10Sync',
- -200884: 'GlobalChanCannotBeSavedSoInteractiveEditsAllowed',
- -200883: 'TaskCannotBeSavedSoInteractiveEditsAllowed',
- -200882: 'InvalidGlobalChan',
- -200881: 'EveryNSampsEventAlreadyRegistered',
- -200880: 'EveryNSampsEventIntervalZeroNotSupported',
- -200879: 'ChanSizeTooBigForU16PortWrite',
- -200878: 'ChanSizeTooBigForU16PortRead',
- -200877: 'BufferSizeNotMultipleOfEveryNSampsEventIntervalWhenDMA',
- -200876: 'WriteWhenTaskNotRunningCOTicks',
- -200875: 'WriteWhenTaskNotRunningCOFreq',
- -200874: 'WriteWhenTaskNotRunningCOTime',
- -200873: 'AOMinMaxNotSupportedDACRangeTooSmall',
- -200872: 'AOMinMaxNotSupportedGivenDACRange',
- -200871: 'AOMinMaxNotSupportedGivenDACRangeAndOffsetVal',
- -200870: 'AOMinMaxNotSupportedDACOffsetValInappropriate',
- -200869: 'AOMinMaxNotSupportedGivenDACOffsetVal',
- -200868: 'AOMinMaxNotSupportedDACRefValTooSmall',
- -200867: 'AOMinMaxNotSupportedGivenDACRefVal',
- -200866: 'AOMinMaxNotSupportedGivenDACRefAndOffsetVal',
- -200865: 'WhenAcqCompAndNumSampsPerChanExceedsOnBrdBufSize',
- -200864: 'WhenAcqCompAndNoRefTrig',
- -200863: 'WaitForNextSampClkNotSupported',
- -200862: 'DevInUnidentifiedPXIChassis',
- -200861: 'MaxSoundPressureMicSensitivitRelatedAIPropertiesNotSupportedByDev',
- -200860: 'MaxSoundPressureAndMicSensitivityNotSupportedByDev',
- -200859: 'AOBufferSizeZeroForSampClkTimingType',
- -200858: 'AOCallWriteBeforeStartForSampClkTimingType',
- -200857: 'InvalidCalLowPassCutoffFreq',
- -200856: 'SimulationCannotBeDisabledForDevCreatedAsSimulatedDev',
- -200855: 'CannotAddNewDevsAfterTaskConfiguration',
- -200854: 'DifftSyncPulseSrcAndSampClkTimebaseSrcDevMultiDevTask',
- -200853: 'TermWithoutDevInMultiDevTask',
- -200852: 'SyncNoDevSampClkTimebaseOrSyncPulseInPXISlot2',
- -200851: 'PhysicalChanNotOnThisConnector',
- -200850: 'NumSampsToWaitNotGreaterThanZeroInScript',
- -200849: 'NumSampsToWaitNotMultipleOfAlignmentQuantumInScript',
- -200848: 'EveryNSamplesEventNotSupportedForNonBufferedTasks',
- -200847: 'BufferedAndDataXferPIO',
- -200846: 'CannotWriteWhenAutoStartFalseAndTaskNotRunning',
- -200845: 'NonBufferedAndDataXferInterrupts',
- -200844: 'WriteFailedMultipleCtrsWithFREQOUT',
- -200843: 'ReadNotCompleteBefore3SampClkEdges',
- -200842: 'CtrHWTimedSinglePointAndDataXferNotProgIO',
- -200841: 'PrescalerNot1ForInputTerminal',
- -200840: 'PrescalerNot1ForTimebaseSrc',
- -200839: 'SampClkTimingTypeWhenTristateIsFalse',
- -200838: 'OutputBufferSizeNotMultOfXferSize',
- -200837: 'SampPerChanNotMultOfXferSize',
- -200836: 'WriteToTEDSFailed',
- -200835: 'SCXIDevNotUsablePowerTurnedOff',
- -200834: 'CannotReadWhenAutoStartFalseBufSizeZeroAndTaskNotRunning',
- -200833: 'CannotReadWhenAutoStartFalseHWTimedSinglePtAndTaskNotRunning',
- -200832: 'CannotReadWhenAutoStartFalseOnDemandAndTaskNotRunning',
- -200831: 'SimultaneousAOWhenNotOnDemandTiming',
- -200830: 'MemMapAndSimultaneousAO',
- -200829: 'WriteFailedMultipleCOOutputTypes',
- -200828: 'WriteToTEDSNotSupportedOnRT',
- -200827: 'VirtualTEDSDataFileError',
- -200826: 'TEDSSensorDataError',
- -200825: 'DataSizeMoreThanSizeOfEEPROMOnTEDS',
- -200824: 'PROMOnTEDSContainsBasicTEDSData',
- -200823: 'PROMOnTEDSAlreadyWritten',
- -200822: 'TEDSDoesNotContainPROM',
- -200821: 'HWTimedSinglePointNotSupportedAI',
- -200820: 'HWTimedSinglePointOddNumChansInAITask',
- -200819: 'CantUseOnlyOnBoardMemWithProgrammedIO',
- -200818: 'SwitchDevShutDownDueToHighTemp',
- -200817: 'ExcitationNotSupportedWhenTermCfgDiff',
- -200816: 'TEDSMinElecValGEMaxElecVal',
- -200815: 'TEDSMinPhysValGEMaxPhysVal',
- -200814: 'CIOnboardClockNotSupportedAsInputTerm',
- -200813: 'InvalidSampModeForPositionMeas',
- -200812: 'TrigWhenAOHWTimedSinglePtSampMode',
- -200811: 'DAQmxCantUseStringDueToUnknownChar',
- -200810: 'DAQmxCantRetrieveStringDueToUnknownChar',
- -200809: 'ClearTEDSNotSupportedOnRT',
- -200808: 'CfgTEDSNotSupportedOnRT',
- -200807: 'ProgFilterClkCfgdToDifferentMinPulseWidthBySameTask1PerDev',
- -200806: 'ProgFilterClkCfgdToDifferentMinPulseWidthByAnotherTask1PerDev',
- -200804: 'NoLastExtCalDateTimeLastExtCalNotDAQmx',
- -200803: 'CannotWriteNotStartedAutoStartFalseNotOnDemandHWTimedSglPt',
- -200802: 'CannotWriteNotStartedAutoStartFalseNotOnDemandBufSizeZero',
- -200801: 'COInvalidTimingSrcDueToSignal',
- -200800: 'CIInvalidTimingSrcForSampClkDueToSampTimingType',
- -200799: 'CIInvalidTimingSrcForEventCntDueToSampMode',
- -200798: 'NoChangeDetectOnNonInputDigLineForDev',
- -200797: 'EmptyStringTermNameNotSupported',
- -200796: 'MemMapEnabledForHWTimedNonBufferedAO',
- -200795: 'DevOnboardMemOverflowDuringHWTimedNonBufferedGen',
- -200794: 'CODAQmxWriteMultipleChans',
- -200793: 'CantMaintainExistingValueAOSync',
- -200792: 'MStudioMultiplePhysChansNotSupported',
- -200791: 'CantConfigureTEDSForChan',
- -200790: 'WriteDataTypeTooSmall',
- -200789: 'ReadDataTypeTooSmall',
- -200788: 'MeasuredBridgeOffsetTooHigh',
- -200787: 'StartTrigConflictWithCOHWTimedSinglePt',
- -200786: 'SampClkRateExtSampClkTimebaseRateMismatch',
- -200785: 'InvalidTimingSrcDueToSampTimingType',
- -200784: 'VirtualTEDSFileNotFound',
- -200783: 'MStudioNoForwardPolyScaleCoeffs',
- -200782: 'MStudioNoReversePolyScaleCoeffs',
- -200781: 'MStudioNoPolyScaleCoeffsUseCalc',
- -200780: 'MStudioNoForwardPolyScaleCoeffsUseCalc',
- -200779: 'MStudioNoReversePolyScaleCoeffsUseCalc',
- -200778: 'COSampModeSampTimingTypeSampClkConflict',
- -200777: 'DevCannotProduceMinPulseWidth',
- -200776: 'CannotProduceMinPulseWidthGivenPropertyValues',
- -200775: 'TermCfgdToDifferentMinPulseWidthByAnotherTask',
- -200774: 'TermCfgdToDifferentMinPulseWidthByAnotherProperty',
- -200773: 'DigSyncNotAvailableOnTerm',
- -200772: 'DigFilterNotAvailableOnTerm',
- -200771: 'DigFilterEnabledMinPulseWidthNotCfg',
- -200770: 'DigFilterAndSyncBothEnabled',
- -200769: 'HWTimedSinglePointAOAndDataXferNotProgIO',
- -200768: 'NonBufferedAOAndDataXferNotProgIO',
- -200767: 'ProgIODataXferForBufferedAO',
- -200766: 'TEDSLegacyTemplateIDInvalidOrUnsupported',
- -200765: 'TEDSMappingMethodInvalidOrUnsupported',
- -200764: 'TEDSLinearMappingSlopeZero',
- -200763: 'AIInputBufferSizeNotMultOfXferSize',
- -200762: 'NoSyncPulseExtSampClkTimebase',
- -200761: 'NoSyncPulseAnotherTaskRunning',
- -200760: 'AOMinMaxNotInGainRange',
- -200759: 'AOMinMaxNotInDACRange',
- -200758: 'DevOnlySupportsSampClkTimingAO',
- -200757: 'DevOnlySupportsSampClkTimingAI',
- -200756: 'TEDSIncompatibleSensorAndMeasType',
- -200755: 'TEDSMultipleCalTemplatesNotSupported',
- -200754: 'TEDSTemplateParametersNotSupported',
- -200753: 'ParsingTEDSData',
- -200752: 'MultipleActivePhysChansNotSupported',
- -200751: 'NoChansSpecdForChangeDetect',
- -200750: 'InvalidCalVoltageForGivenGain',
- -200749: 'InvalidCalGain',
- -200748: 'MultipleWritesBetweenSampClks',
- -200747: 'InvalidAcqTypeForFREQOUT',
- -200746: 'SuitableTimebaseNotFoundTimeCombo2',
- -200745: 'SuitableTimebaseNotFoundFrequencyCombo2',
- -200744: 'RefClkRateRefClkSrcMismatch',
- -200743: 'NoTEDSTerminalBlock',
- -200742: 'CorruptedTEDSMemory',
- -200741: 'TEDSNotSupported',
- -200740: 'TimingSrcTaskStartedBeforeTimedLoop',
- -200739: 'PropertyNotSupportedForTimingSrc',
- -200738: 'TimingSrcDoesNotExist',
- -200737: 'InputBufferSizeNotEqualSampsPerChanForFiniteSampMode',
- -200736: 'FREQOUTCannotProduceDesiredFrequency2',
- -200735: 'ExtRefClkRateNotSpecified',
- -200734: 'DeviceDoesNotSupportDMADataXferForNonBufferedAcq',
- -200733: 'DigFilterMinPulseWidthSetWhenTristateIsFalse',
- -200732: 'DigFilterEnableSetWhenTristateIsFalse',
- -200731: 'NoHWTimingWithOnDemand',
- -200730: 'CannotDetectChangesWhenTristateIsFalse',
- -200729: 'CannotHandshakeWhenTristateIsFalse',
- -200728: 'LinesUsedForStaticInputNotForHandshakingControl',
- -200727: 'LinesUsedForHandshakingControlNotForStaticInput',
- -200726: 'LinesUsedForStaticInputNotForHandshakingInput',
- -200725: 'LinesUsedForHandshakingInputNotForStaticInput',
- -200724: 'DifferentDITristateValsForChansInTask',
- -200723: 'TimebaseCalFreqVarianceTooLarge',
- -200722: 'TimebaseCalFailedToConverge',
- -200721: 'InadequateResolutionForTimebaseCal',
- -200720: 'InvalidAOGainCalConst',
- -200719: 'InvalidAOOffsetCalConst',
- -200718: 'InvalidAIGainCalConst',
- -200717: 'InvalidAIOffsetCalConst',
- -200716: 'DigOutputOverrun',
- -200715: 'DigInputOverrun',
- -200714: 'AcqStoppedDriverCantXferDataFastEnough',
- -200713: 'ChansCantAppearInSameTask',
- -200712: 'InputCfgFailedBecauseWatchdogExpired',
- -200711: 'AnalogTrigChanNotExternal',
- -200710: 'TooManyChansForInternalAIInputSrc',
- -200709: 'TEDSSensorNotDetected',
- -200708: 'PrptyGetSpecdActiveItemFailedDueToDifftValues',
- -200706: 'RoutingDestTermPXIClk10InNotInSlot2',
- -200705: 'RoutingDestTermPXIStarXNotInSlot2',
- -200704: 'RoutingSrcTermPXIStarXNotInSlot2',
- -200703: 'RoutingSrcTermPXIStarInSlot16AndAbove',
- -200702: 'RoutingDestTermPXIStarInSlot16AndAbove',
- -200701: 'RoutingDestTermPXIStarInSlot2',
- -200700: 'RoutingSrcTermPXIStarInSlot2',
- -200699: 'RoutingDestTermPXIChassisNotIdentified',
- -200698: 'RoutingSrcTermPXIChassisNotIdentified',
- -200697: 'FailedToAcquireCalData',
- -200696: 'BridgeOffsetNullingCalNotSupported',
- -200695: 'AIMaxNotSpecified',
- -200694: 'AIMinNotSpecified',
- -200693: 'OddTotalBufferSizeToWrite',
- -200692: 'OddTotalNumSampsToWrite',
- -200691: 'BufferWithWaitMode',
- -200690: 'BufferWithHWTimedSinglePointSampMode',
- -200689: 'COWritePulseLowTicksNotSupported',
- -200688: 'COWritePulseHighTicksNotSupported',
- -200687: 'COWritePulseLowTimeOutOfRange',
- -200686: 'COWritePulseHighTimeOutOfRange',
- -200685: 'COWriteFreqOutOfRange',
- -200684: 'COWriteDutyCycleOutOfRange',
- -200683: 'InvalidInstallation',
- -200682: 'RefTrigMasterSessionUnavailable',
- -200681: 'RouteFailedBecauseWatchdogExpired',
- -200680: 'DeviceShutDownDueToHighTemp',
- -200679: 'NoMemMapWhenHWTimedSinglePoint',
- -200678: 'WriteFailedBecauseWatchdogExpired',
- -200677: 'DifftInternalAIInputSrcs',
- -200676: 'DifftAIInputSrcInOneChanGroup',
- -200675: 'InternalAIInputSrcInMultChanGroups',
- -200674: 'SwitchOpFailedDueToPrevError',
- -200673: 'WroteMultiSampsUsingSingleSampWrite',
- -200672: 'MismatchedInputArraySizes',
- -200671: 'CantExceedRelayDriveLimit',
- -200670: 'DACRngLowNotEqualToMinusRefVal',
- -200669: 'CantAllowConnectDACToGnd',
- -200668: 'WatchdogTimeoutOutOfRangeAndNotSpecialVal',
- -200667: 'NoWatchdogOutputOnPortReservedForInput',
- -200666: 'NoInputOnPortCfgdForWatchdogOutput',
- -200665: 'WatchdogExpirationStateNotEqualForLinesInPort',
- -200664: 'CannotPerformOpWhenTaskNotReserved',
- -200663: 'PowerupStateNotSupported',
- -200662: 'WatchdogTimerNotSupported',
- -200661: 'OpNotSupportedWhenRefClkSrcNone',
- -200660: 'SampClkRateUnavailable',
- -200659: 'PrptyGetSpecdSingleActiveChanFailedDueToDifftVals',
- -200658: 'PrptyGetImpliedActiveChanFailedDueToDifftVals',
- -200657: 'PrptyGetSpecdActiveChanFailedDueToDifftVals',
- -200656: 'NoRegenWhenUsingBrdMem',
- -200655: 'NonbufferedReadMoreThanSampsPerChan',
- -200654: 'WatchdogExpirationTristateNotSpecdForEntirePort',
- -200653: 'PowerupTristateNotSpecdForEntirePort',
- -200652: 'PowerupStateNotSpecdForEntirePort',
- -200651: 'CantSetWatchdogExpirationOnDigInChan',
- -200650: 'CantSetPowerupStateOnDigInChan',
- -200649: 'PhysChanNotInTask',
- -200648: 'PhysChanDevNotInTask',
- -200647: 'DigInputNotSupported',
- -200646: 'DigFilterIntervalNotEqualForLines',
- -200645: 'DigFilterIntervalAlreadyCfgd',
- -200644: 'CantResetExpiredWatchdog',
- -200643: 'ActiveChanTooManyLinesSpecdWhenGettingPrpty',
- -200642: 'ActiveChanNotSpecdWhenGetting1LinePrpty',
- -200641: 'DigPrptyCannotBeSetPerLine',
- -200640: 'SendAdvCmpltAfterWaitForTrigInScanlist',
- -200639: 'DisconnectionRequiredInScanlist',
- -200638: 'TwoWaitForTrigsAfterConnectionInScanlist',
- -200637: 'ActionSeparatorRequiredAfterBreakingConnectionInScanlist',
- -200636: 'ConnectionInScanlistMustWaitForTrig',
- -200635: 'ActionNotSupportedTaskNotWatchdog',
- -200634: 'WfmNameSameAsScriptName',
- -200633: 'ScriptNameSameAsWfmName',
- -200632: 'DSFStopClock',
- -200631: 'DSFReadyForStartClock',
- -200630: 'WriteOffsetNotMultOfIncr',
- -200629: 'DifferentPrptyValsNotSupportedOnDev',
- -200628: 'RefAndPauseTrigConfigured',
- -200627: 'FailedToEnableHighSpeedInputClock',
- -200626: 'EmptyPhysChanInPowerUpStatesArray',
- -200625: 'ActivePhysChanTooManyLinesSpecdWhenGettingPrpty',
- -200624: 'ActivePhysChanNotSpecdWhenGetting1LinePrpty',
- -200623: 'PXIDevTempCausedShutDown',
- -200622: 'InvalidNumSampsToWrite',
- -200621: 'OutputFIFOUnderflow2',
- -200620: 'RepeatedAIPhysicalChan',
- -200619: 'MultScanOpsInOneChassis',
- -200618: 'InvalidAIChanOrder',
- -200617: 'ReversePowerProtectionActivated',
- -200616: 'InvalidAsynOpHandle',
- -200615: 'FailedToEnableHighSpeedOutput',
- -200614: 'CannotReadPastEndOfRecord',
- -200613: 'AcqStoppedToPreventInputBufferOverwriteOneDataXferMech',
- -200612: 'ZeroBasedChanIndexInvalid',
- -200611: 'NoChansOfGivenTypeInTask',
- -200610: 'SampClkSrcInvalidForOutputValidForInput',
- -200609: 'OutputBufSizeTooSmallToStartGen',
- -200608: 'InputBufSizeTooSmallToStartAcq',
- -200607: 'ExportTwoSignalsOnSameTerminal',
- -200606: 'ChanIndexInvalid',
- -200605: 'RangeSyntaxNumberTooBig',
- -200604: 'NULLPtr',
- -200603: 'ScaledMinEqualMax',
- -200602: 'PreScaledMinEqualMax',
- -200601: 'PropertyNotSupportedForScaleType',
- -200600: 'ChannelNameGenerationNumberTooBig',
- -200599: 'RepeatedNumberInScaledValues',
- -200598: 'RepeatedNumberInPreScaledValues',
- -200597: 'LinesAlreadyReservedForOutput',
- -200596: 'SwitchOperationChansSpanMultipleDevsInList',
- -200595: 'InvalidIDInListAtBeginningOfSwitchOperation',
- -200594: 'MStudioInvalidPolyDirection',
- -200593: 'MStudioPropertyGetWhileTaskNotVerified',
- -200592: 'RangeWithTooManyObjects',
- -200591: 'CppDotNetAPINegativeBufferSize',
- -200590: 'CppCantRemoveInvalidEventHandler',
- -200589: 'CppCantRemoveEventHandlerTwice',
- -200588: 'CppCantRemoveOtherObjectsEventHandler',
- -200587: 'DigLinesReservedOrUnavailable',
- -200586: 'DSFFailedToResetStream',
- -200585: 'DSFReadyForOutputNotAsserted',
- -200584: 'SampToWritePerChanNotMultipleOfIncr',
- -200583: 'AOPropertiesCauseVoltageBelowMin',
- -200582: 'AOPropertiesCauseVoltageOverMax',
- -200581: 'PropertyNotSupportedWhenRefClkSrcNone',
- -200580: 'AIMaxTooSmall',
- -200579: 'AIMaxTooLarge',
- -200578: 'AIMinTooSmall',
- -200577: 'AIMinTooLarge',
- -200576: 'BuiltInCJCSrcNotSupported',
- -200575: 'TooManyPostTrigSampsPerChan',
- -200574: 'TrigLineNotFoundSingleDevRoute',
- -200573: 'DifferentInternalAIInputSources',
- -200572: 'DifferentAIInputSrcInOneChanGroup',
- -200571: 'InternalAIInputSrcInMultipleChanGroups',
- -200570: 'CAPIChanIndexInvalid',
- -200569: 'CollectionDoesNotMatchChanType',
- -200568: 'OutputCantStartChangedRegenerationMode',
- -200567: 'OutputCantStartChangedBufferSize',
- -200566: 'ChanSizeTooBigForU32PortWrite',
- -200565: 'ChanSizeTooBigForU8PortWrite',
- -200564: 'ChanSizeTooBigForU32PortRead',
- -200563: 'ChanSizeTooBigForU8PortRead',
- -200562: 'InvalidDigDataWrite',
- -200561: 'InvalidAODataWrite',
- -200560: 'WaitUntilDoneDoesNotIndicateDone',
- -200559: 'MultiChanTypesInTask',
- -200558: 'MultiDevsInTask',
- -200557: 'CannotSetPropertyWhenTaskRunning',
- -200556: 'CannotGetPropertyWhenTaskNotCommittedOrRunning',
- -200555: 'LeadingUnderscoreInString',
- -200554: 'TrailingSpaceInString',
- -200553: 'LeadingSpaceInString',
- -200552: 'InvalidCharInString',
- -200551: 'DLLBecameUnlocked',
- -200550: 'DLLLock',
- -200549: 'SelfCalConstsInvalid',
- -200548: 'InvalidTrigCouplingExceptForExtTrigChan',
- -200547: 'WriteFailsBufferSizeAutoConfigured',
- -200546: 'ExtCalAdjustExtRefVoltageFailed',
- -200545: 'SelfCalFailedExtNoiseOrRefVoltageOutOfCal',
- -200544: 'ExtCalTemperatureNotDAQmx',
- -200543: 'ExtCalDateTimeNotDAQmx',
- -200542: 'SelfCalTemperatureNotDAQmx',
- -200541: 'SelfCalDateTimeNotDAQmx',
- -200540: 'DACRefValNotSet',
- -200539: 'AnalogMultiSampWriteNotSupported',
- -200538: 'InvalidActionInControlTask',
- -200537: 'PolyCoeffsInconsistent',
- -200536: 'SensorValTooLow',
- -200535: 'SensorValTooHigh',
- -200534: 'WaveformNameTooLong',
- -200533: 'IdentifierTooLongInScript',
- -200532: 'UnexpectedIDFollowingSwitchChanName',
- -200531: 'RelayNameNotSpecifiedInList',
- -200530: 'UnexpectedIDFollowingRelayNameInList',
- -200529: 'UnexpectedIDFollowingSwitchOpInList',
- -200528: 'InvalidLineGrouping',
- -200527: 'CtrMinMax',
- -200526: 'WriteChanTypeMismatch',
- -200525: 'ReadChanTypeMismatch',
- -200524: 'WriteNumChansMismatch',
- -200523: 'OneChanReadForMultiChanTask',
- -200522: 'CannotSelfCalDuringExtCal',
- -200521: 'MeasCalAdjustOscillatorPhaseDAC',
- -200520: 'InvalidCalConstCalADCAdjustment',
- -200519: 'InvalidCalConstOscillatorFreqDACValue',
- -200518: 'InvalidCalConstOscillatorPhaseDACValue',
- -200517: 'InvalidCalConstOffsetDACValue',
- -200516: 'InvalidCalConstGainDACValue',
- -200515: 'InvalidNumCalADCReadsToAverage',
- -200514: 'InvalidCfgCalAdjustDirectPathOutputImpedance',
- -200513: 'InvalidCfgCalAdjustMainPathOutputImpedance',
- -200512: 'InvalidCfgCalAdjustMainPathPostAmpGainAndOffset',
- -200511: 'InvalidCfgCalAdjustMainPathPreAmpGain',
- -200510: 'InvalidCfgCalAdjustMainPreAmpOffset',
- -200509: 'MeasCalAdjustCalADC',
- -200508: 'MeasCalAdjustOscillatorFrequency',
- -200507: 'MeasCalAdjustDirectPathOutputImpedance',
- -200506: 'MeasCalAdjustMainPathOutputImpedance',
- -200505: 'MeasCalAdjustDirectPathGain',
- -200504: 'MeasCalAdjustMainPathPostAmpGainAndOffset',
- -200503: 'MeasCalAdjustMainPathPreAmpGain',
- -200502: 'MeasCalAdjustMainPathPreAmpOffset',
- -200501: 'InvalidDateTimeInEEPROM',
- -200500: 'UnableToLocateErrorResources',
- -200499: 'DotNetAPINotUnsigned32BitNumber',
- -200498: 'InvalidRangeOfObjectsSyntaxInString',
- -200497: 'AttemptToEnableLineNotPreviouslyDisabled',
- -200496: 'InvalidCharInPattern',
- -200495: 'IntermediateBufferFull',
- -200494: 'LoadTaskFailsBecauseNoTimingOnDev',
- -200493: 'CAPIReservedParamNotNULLNorEmpty',
- -200492: 'CAPIReservedParamNotNULL',
- -200491: 'CAPIReservedParamNotZero',
- -200490: 'SampleValueOutOfRange',
- -200489: 'ChanAlreadyInTask',
- -200488: 'VirtualChanDoesNotExist',
- -200486: 'ChanNotInTask',
- -200485: 'TaskNotInDataNeighborhood',
- -200484: 'CantSaveTaskWithoutReplace',
- -200483: 'CantSaveChanWithoutReplace',
- -200482: 'DevNotInTask',
- -200481: 'DevAlreadyInTask',
- -200479: 'CanNotPerformOpWhileTaskRunning',
- -200478: 'CanNotPerformOpWhenNoChansInTask',
- -200477: 'CanNotPerformOpWhenNoDevInTask',
- -200475: 'CannotPerformOpWhenTaskNotRunning',
- -200474: 'OperationTimedOut',
- -200473: 'CannotReadWhenAutoStartFalseAndTaskNotRunningOrCommitted',
- -200472: 'CannotWriteWhenAutoStartFalseAndTaskNotRunningOrCommitted',
- -200470: 'TaskVersionNew',
- -200469: 'ChanVersionNew',
- -200467: 'EmptyString',
- -200466: 'ChannelSizeTooBigForPortReadType',
- -200465: 'ChannelSizeTooBigForPortWriteType',
- -200464: 'ExpectedNumberOfChannelsVerificationFailed',
- -200463: 'NumLinesMismatchInReadOrWrite',
- -200462: 'OutputBufferEmpty',
- -200461: 'InvalidChanName',
- -200460: 'ReadNoInputChansInTask',
- -200459: 'WriteNoOutputChansInTask',
- -200457: 'PropertyNotSupportedNotInputTask',
- -200456: 'PropertyNotSupportedNotOutputTask',
- -200455: 'GetPropertyNotInputBufferedTask',
- -200454: 'GetPropertyNotOutputBufferedTask',
- -200453: 'InvalidTimeoutVal',
- -200452: 'AttributeNotSupportedInTaskContext',
- -200451: 'AttributeNotQueryableUnlessTaskIsCommitted',
- -200450: 'AttributeNotSettableWhenTaskIsRunning',
- -200449: 'DACRngLowNotMinusRefValNorZero',
- -200448: 'DACRngHighNotEqualRefVal',
- -200447: 'UnitsNotFromCustomScale',
- -200446: 'InvalidVoltageReadingDuringExtCal',
- -200445: 'CalFunctionNotSupported',
- -200444: 'InvalidPhysicalChanForCal',
- -200443: 'ExtCalNotComplete',
- -200442: 'CantSyncToExtStimulusFreqDuringCal',
- -200441: 'UnableToDetectExtStimulusFreqDuringCal',
- -200440: 'InvalidCloseAction',
- -200439: 'ExtCalFunctionOutsideExtCalSession',
- -200438: 'InvalidCalArea',
- -200437: 'ExtCalConstsInvalid',
- -200436: 'StartTrigDelayWithExtSampClk',
- -200435: 'DelayFromSampClkWithExtConv',
- -200434: 'FewerThan2PreScaledVals',
- -200433: 'FewerThan2ScaledValues',
- -200432: 'PhysChanOutputType',
- -200431: 'PhysChanMeasType',
- -200430: 'InvalidPhysChanType',
- -200429: 'LabVIEWEmptyTaskOrChans',
- -200428: 'LabVIEWInvalidTaskOrChans',
- -200427: 'InvalidRefClkRate',
- -200426: 'InvalidExtTrigImpedance',
- -200425: 'HystTrigLevelAIMax',
- -200424: 'LineNumIncompatibleWithVideoSignalFormat',
- -200423: 'TrigWindowAIMinAIMaxCombo',
- -200422: 'TrigAIMinAIMax',
- -200421: 'HystTrigLevelAIMin',
- -200420: 'InvalidSampRateConsiderRIS',
- -200419: 'InvalidReadPosDuringRIS',
- -200418: 'ImmedTrigDuringRISMode',
- -200417: 'TDCNotEnabledDuringRISMode',
- -200416: 'MultiRecWithRIS',
- -200415: 'InvalidRefClkSrc',
- -200414: 'InvalidSampClkSrc',
- -200413: 'InsufficientOnBoardMemForNumRecsAndSamps',
- -200412: 'InvalidAIAttenuation',
- -200411: 'ACCouplingNotAllowedWith50OhmImpedance',
- -200410: 'InvalidRecordNum',
- -200409: 'ZeroSlopeLinearScale',
- -200408: 'ZeroReversePolyScaleCoeffs',
- -200407: 'ZeroForwardPolyScaleCoeffs',
- -200406: 'NoReversePolyScaleCoeffs',
- -200405: 'NoForwardPolyScaleCoeffs',
- -200404: 'NoPolyScaleCoeffs',
- -200403: 'ReversePolyOrderLessThanNumPtsToCompute',
- -200402: 'ReversePolyOrderNotPositive',
- -200401: 'NumPtsToComputeNotPositive',
- -200400: 'WaveformLengthNotMultipleOfIncr',
- -200399: 'CAPINoExtendedErrorInfoAvailable',
- -200398: 'CVIFunctionNotFoundInDAQmxDLL',
- -200397: 'CVIFailedToLoadDAQmxDLL',
- -200396: 'NoCommonTrigLineForImmedRoute',
- -200395: 'NoCommonTrigLineForTaskRoute',
- -200394: 'F64PrptyValNotUnsignedInt',
- -200393: 'RegisterNotWritable',
- -200392: 'InvalidOutputVoltageAtSampClkRate',
- -200391: 'StrobePhaseShiftDCMBecameUnlocked',
- -200390: 'DrivePhaseShiftDCMBecameUnlocked',
- -200389: 'ClkOutPhaseShiftDCMBecameUnlocked',
- -200388: 'OutputBoardClkDCMBecameUnlocked',
- -200387: 'InputBoardClkDCMBecameUnlocked',
- -200386: 'InternalClkDCMBecameUnlocked',
- -200385: 'DCMLock',
- -200384: 'DataLineReservedForDynamicOutput',
- -200383: 'InvalidRefClkSrcGivenSampClkSrc',
- -200382: 'NoPatternMatcherAvailable',
- -200381: 'InvalidDelaySampRateBelowPhaseShiftDCMThresh',
- -200380: 'StrainGageCalibration',
- -200379: 'InvalidExtClockFreqAndDivCombo',
- -200378: 'CustomScaleDoesNotExist',
- -200377: 'OnlyFrontEndChanOpsDuringScan',
- -200376: 'InvalidOptionForDigitalPortChannel',
- -200375: 'UnsupportedSignalTypeExportSignal',
- -200374: 'InvalidSignalTypeExportSignal',
- -200373: 'UnsupportedTrigTypeSendsSWTrig',
- -200372: 'InvalidTrigTypeSendsSWTrig',
- -200371: 'RepeatedPhysicalChan',
- -200370: 'ResourcesInUseForRouteInTask',
- -200369: 'ResourcesInUseForRoute',
- -200368: 'RouteNotSupportedByHW',
- -200367: 'ResourcesInUseForExportSignalPolarity',
- -200366: 'ResourcesInUseForInversionInTask',
- -200365: 'ResourcesInUseForInversion',
- -200364: 'ExportSignalPolarityNotSupportedByHW',
- -200363: 'InversionNotSupportedByHW',
- -200362: 'OverloadedChansExistNotRead',
- -200361: 'InputFIFOOverflow2',
- -200360: 'CJCChanNotSpecd',
- -200359: 'CtrExportSignalNotPossible',
- -200358: 'RefTrigWhenContinuous',
- -200357: 'IncompatibleSensorOutputAndDeviceInputRanges',
- -200356: 'CustomScaleNameUsed',
- -200355: 'PropertyValNotSupportedByHW',
- -200354: 'PropertyValNotValidTermName',
- -200353: 'ResourcesInUseForProperty',
- -200352: 'CJCChanAlreadyUsed',
- -200351: 'ForwardPolynomialCoefNotSpecd',
- -200350: 'TableScaleNumPreScaledAndScaledValsNotEqual',
- -200349: 'TableScalePreScaledValsNotSpecd',
- -200348: 'TableScaleScaledValsNotSpecd',
- -200347: 'IntermediateBufferSizeNotMultipleOfIncr',
- -200346: 'EventPulseWidthOutOfRange',
- -200345: 'EventDelayOutOfRange',
- -200344: 'SampPerChanNotMultipleOfIncr',
- -200343: 'CannotCalculateNumSampsTaskNotStarted',
- -200342: 'ScriptNotInMem',
- -200341: 'OnboardMemTooSmall',
- -200340: 'ReadAllAvailableDataWithoutBuffer',
- -200339: 'PulseActiveAtStart',
- -200338: 'CalTempNotSupported',
- -200337: 'DelayFromSampClkTooLong',
- -200336: 'DelayFromSampClkTooShort',
- -200335: 'AIConvRateTooHigh',
- -200334: 'DelayFromStartTrigTooLong',
- -200333: 'DelayFromStartTrigTooShort',
- -200332: 'SampRateTooHigh',
- -200331: 'SampRateTooLow',
- -200330: 'PFI0UsedForAnalogAndDigitalSrc',
- -200329: 'PrimingCfgFIFO',
- -200328: 'CannotOpenTopologyCfgFile',
- -200327: 'InvalidDTInsideWfmDataType',
- -200326: 'RouteSrcAndDestSame',
- -200325: 'ReversePolynomialCoefNotSpecd',
- -200324: 'DevAbsentOrUnavailable',
- -200323: 'NoAdvTrigForMultiDevScan',
- -200322: 'InterruptsInsufficientDataXferMech',
- -200321: 'InvalidAttentuationBasedOnMinMax',
- -200320: 'CabledModuleCannotRouteSSH',
- -200319: 'CabledModuleCannotRouteConvClk',
- -200318: 'InvalidExcitValForScaling',
- -200317: 'NoDevMemForScript',
- -200316: 'ScriptDataUnderflow',
- -200315: 'NoDevMemForWaveform',
- -200314: 'StreamDCMBecameUnlocked',
- -200313: 'StreamDCMLock',
- -200312: 'WaveformNotInMem',
- -200311: 'WaveformWriteOutOfBounds',
- -200310: 'WaveformPreviouslyAllocated',
- -200309: 'SampClkTbMasterTbDivNotAppropriateForSampTbSrc',
- -200308: 'SampTbRateSampTbSrcMismatch',
- -200307: 'MasterTbRateMasterTbSrcMismatch',
- -200306: 'SampsPerChanTooBig',
- -200305: 'FinitePulseTrainNotPossible',
- -200304: 'ExtMasterTimebaseRateNotSpecified',
- -200303: 'ExtSampClkSrcNotSpecified',
- -200302: 'InputSignalSlowerThanMeasTime',
- -200301: 'CannotUpdatePulseGenProperty',
- -200300: 'InvalidTimingType',
- -200297: 'PropertyUnavailWhenUsingOnboardMemory',
- -200295: 'CannotWriteAfterStartWithOnboardMemory',
- -200294: 'NotEnoughSampsWrittenForInitialXferRqstCondition',
- -200293: 'NoMoreSpace',
- -200292: 'SamplesCanNotYetBeWritten',
- -200291: 'GenStoppedToPreventIntermediateBufferRegenOfOldSamples',
- -200290: 'GenStoppedToPreventRegenOfOldSamples',
- -200289: 'SamplesNoLongerWriteable',
- -200288: 'SamplesWillNeverBeGenerated',
- -200287: 'NegativeWriteSampleNumber',
- -200286: 'NoAcqStarted',
- -200284: 'SamplesNotYetAvailable',
- -200283: 'AcqStoppedToPreventIntermediateBufferOverflow',
- -200282: 'NoRefTrigConfigured',
- -200281: 'CannotReadRelativeToRefTrigUntilDone',
- -200279: 'SamplesNoLongerAvailable',
- -200278: 'SamplesWillNeverBeAvailable',
- -200277: 'NegativeReadSampleNumber',
- -200276: 'ExternalSampClkAndRefClkThruSameTerm',
- -200275: 'ExtSampClkRateTooLowForClkIn',
- -200274: 'ExtSampClkRateTooHighForBackplane',
- -200273: 'SampClkRateAndDivCombo',
- -200272: 'SampClkRateTooLowForDivDown',
- -200271: 'ProductOfAOMinAndGainTooSmall',
- -200270: 'InterpolationRateNotPossible',
- -200269: 'OffsetTooLarge',
- -200268: 'OffsetTooSmall',
- -200267: 'ProductOfAOMaxAndGainTooLarge',
- -200266: 'MinAndMaxNotSymmetric',
- -200265: 'InvalidAnalogTrigSrc',
- -200264: 'TooManyChansForAnalogRefTrig',
- -200263: 'TooManyChansForAnalogPauseTrig',
- -200262: 'TrigWhenOnDemandSampTiming',
- -200261: 'InconsistentAnalogTrigSettings',
- -200260: 'MemMapDataXferModeSampTimingCombo',
- -200259: 'InvalidJumperedAttr',
- -200258: 'InvalidGainBasedOnMinMax',
- -200257: 'InconsistentExcit',
- -200256: 'TopologyNotSupportedByCfgTermBlock',
- -200255: 'BuiltInTempSensorNotSupported',
- -200254: 'InvalidTerm',
- -200253: 'CannotTristateTerm',
- -200252: 'CannotTristateBusyTerm',
- -200251: 'NoDMAChansAvailable',
- -200250: 'InvalidWaveformLengthWithinLoopInScript',
- -200249: 'InvalidSubsetLengthWithinLoopInScript',
- -200248: 'MarkerPosInvalidForLoopInScript',
- -200247: 'IntegerExpectedInScript',
- -200246: 'PLLBecameUnlocked',
- -200245: 'PLLLock',
- -200244: 'DDCClkOutDCMBecameUnlocked',
- -200243: 'DDCClkOutDCMLock',
- -200242: 'ClkDoublerDCMBecameUnlocked',
- -200241: 'ClkDoublerDCMLock',
- -200240: 'SampClkDCMBecameUnlocked',
- -200239: 'SampClkDCMLock',
- -200238: 'SampClkTimebaseDCMBecameUnlocked',
- -200237: 'SampClkTimebaseDCMLock',
- -200236: 'AttrCannotBeReset',
- -200235: 'ExplanationNotFound',
- -200234: 'WriteBufferTooSmall',
- -200233: 'SpecifiedAttrNotValid',
- -200232: 'AttrCannotBeRead',
- -200231: 'AttrCannotBeSet',
- -200230: 'NULLPtrForC_Api',
- -200229: 'ReadBufferTooSmall',
- -200228: 'BufferTooSmallForString',
- -200227: 'NoAvailTrigLinesOnDevice',
- -200226: 'TrigBusLineNotAvail',
- -200225: 'CouldNotReserveRequestedTrigLine',
- -200224: 'TrigLineNotFound',
- -200223: 'SCXI1126ThreshHystCombination',
- -200222: 'AcqStoppedToPreventInputBufferOverwrite',
- -200221: 'TimeoutExceeded',
- -200220: 'InvalidDeviceID',
- -200219: 'InvalidAOChanOrder',
- -200218: 'SampleTimingTypeAndDataXferMode',
- -200217: 'BufferWithOnDemandSampTiming',
- -200216: 'BufferAndDataXferMode',
- -200215: 'MemMapAndBuffer',
- -200214: 'NoAnalogTrigHW',
- -200213: 'TooManyPretrigPlusMinPostTrigSamps',
- -200212: 'InconsistentUnitsSpecified',
- -200211: 'MultipleRelaysForSingleRelayOp',
- -200210: 'MultipleDevIDsPerChassisSpecifiedInList',
- -200209: 'DuplicateDevIDInList',
- -200208: 'InvalidRangeStatementCharInList',
- -200207: 'InvalidDeviceIDInList',
- -200206: 'TriggerPolarityConflict',
- -200205: 'CannotScanWithCurrentTopology',
- -200204: 'UnexpectedIdentifierInFullySpecifiedPathInList',
- -200203: 'SwitchCannotDriveMultipleTrigLines',
- -200202: 'InvalidRelayName',
- -200201: 'SwitchScanlistTooBig',
- -200200: 'SwitchChanInUse',
- -200199: 'SwitchNotResetBeforeScan',
- -200198: 'InvalidTopology',
- -200197: 'AttrNotSupported',
- -200196: 'UnexpectedEndOfActionsInList',
- -200195: 'PowerBudgetExceeded',
- -200194: 'HWUnexpectedlyPoweredOffAndOn',
- -200193: 'SwitchOperationNotSupported',
- -200192: 'OnlyContinuousScanSupported',
- -200191: 'SwitchDifferentTopologyWhenScanning',
- -200190: 'DisconnectPathNotSameAsExistingPath',
- -200189: 'ConnectionNotPermittedOnChanReservedForRouting',
- -200188: 'CannotConnectSrcChans',
- -200187: 'CannotConnectChannelToItself',
- -200186: 'ChannelNotReservedForRouting',
- -200185: 'CannotConnectChansDirectly',
- -200184: 'ChansAlreadyConnected',
- -200183: 'ChanDuplicatedInPath',
- -200182: 'NoPathToDisconnect',
- -200181: 'InvalidSwitchChan',
- -200180: 'NoPathAvailableBetween2SwitchChans',
- -200179: 'ExplicitConnectionExists',
- -200178: 'SwitchDifferentSettlingTimeWhenScanning',
- -200177: 'OperationOnlyPermittedWhileScanning',
- -200176: 'OperationNotPermittedWhileScanning',
- -200175: 'HardwareNotResponding',
- -200173: 'InvalidSampAndMasterTimebaseRateCombo',
- -200172: 'NonZeroBufferSizeInProgIOXfer',
- -200171: 'VirtualChanNameUsed',
- -200170: 'PhysicalChanDoesNotExist',
- -200169: 'MemMapOnlyForProgIOXfer',
- -200168: 'TooManyChans',
- -200167: 'CannotHaveCJTempWithOtherChans',
- -200166: 'OutputBufferUnderwrite',
- -200163: 'SensorInvalidCompletionResistance',
- -200162: 'VoltageExcitIncompatibleWith2WireCfg',
- -200161: 'IntExcitSrcNotAvailable',
- -200160: 'CannotCreateChannelAfterTaskVerified',
- -200159: 'LinesReservedForSCXIControl',
- -200158: 'CouldNotReserveLinesForSCXIControl',
- -200157: 'CalibrationFailed',
- -200156: 'ReferenceFrequencyInvalid',
- -200155: 'ReferenceResistanceInvalid',
- -200154: 'ReferenceCurrentInvalid',
- -200153: 'ReferenceVoltageInvalid',
- -200152: 'EEPROMDataInvalid',
- -200151: 'CabledModuleNotCapableOfRoutingAI',
- -200150: 'ChannelNotAvailableInParallelMode',
- -200149: 'ExternalTimebaseRateNotKnownForDelay',
- -200148: 'FREQOUTCannotProduceDesiredFrequency',
- -200147: 'MultipleCounterInputTask',
- -200146: 'CounterStartPauseTriggerConflict',
- -200145: 'CounterInputPauseTriggerAndSampleClockInvalid',
- -200144: 'CounterOutputPauseTriggerInvalid',
- -200143: 'CounterTimebaseRateNotSpecified',
- -200142: 'CounterTimebaseRateNotFound',
- -200141: 'CounterOverflow',
- -200140: 'CounterNoTimebaseEdgesBetweenGates',
- -200139: 'CounterMaxMinRangeFreq',
- -200138: 'CounterMaxMinRangeTime',
- -200137: 'SuitableTimebaseNotFoundTimeCombo',
- -200136: 'SuitableTimebaseNotFoundFrequencyCombo',
- -200135: 'InternalTimebaseSourceDivisorCombo',
- -200134: 'InternalTimebaseSourceRateCombo',
- -200133: 'InternalTimebaseRateDivisorSourceCombo',
- -200132: 'ExternalTimebaseRateNotknownForRate',
- -200131: 'AnalogTrigChanNotFirstInScanList',
- -200130: 'NoDivisorForExternalSignal',
- -200128: 'AttributeInconsistentAcrossRepeatedPhysicalChannels',
- -200127: 'CannotHandshakeWithPort0',
- -200126: 'ControlLineConflictOnPortC',
- -200125: 'Lines4To7ConfiguredForOutput',
- -200124: 'Lines4To7ConfiguredForInput',
- -200123: 'Lines0To3ConfiguredForOutput',
- -200122: 'Lines0To3ConfiguredForInput',
- -200121: 'PortConfiguredForOutput',
- -200120: 'PortConfiguredForInput',
- -200119: 'PortConfiguredForStaticDigitalOps',
- -200118: 'PortReservedForHandshaking',
- -200117: 'PortDoesNotSupportHandshakingDataIO',
- -200116: 'CannotTristate8255OutputLines',
- -200113: 'TemperatureOutOfRangeForCalibration',
- -200112: 'CalibrationHandleInvalid',
- -200111: 'PasswordRequired',
- -200110: 'IncorrectPassword',
- -200109: 'PasswordTooLong',
- -200108: 'CalibrationSessionAlreadyOpen',
- -200107: 'SCXIModuleIncorrect',
- -200106: 'AttributeInconsistentAcrossChannelsOnDevice',
- -200105: 'SCXI1122ResistanceChanNotSupportedForCfg',
- -200104: 'BracketPairingMismatchInList',
- -200103: 'InconsistentNumSamplesToWrite',
- -200102: 'IncorrectDigitalPattern',
- -200101: 'IncorrectNumChannelsToWrite',
- -200100: 'IncorrectReadFunction',
- -200099: 'PhysicalChannelNotSpecified',
- -200098: 'MoreThanOneTerminal',
- -200097: 'MoreThanOneActiveChannelSpecified',
- -200096: 'InvalidNumberSamplesToRead',
- -200095: 'AnalogWaveformExpected',
- -200094: 'DigitalWaveformExpected',
- -200093: 'ActiveChannelNotSpecified',
- -200092: 'FunctionNotSupportedForDeviceTasks',
- -200091: 'FunctionNotInLibrary',
- -200090: 'LibraryNotPresent',
- -200089: 'DuplicateTask',
- -200088: 'InvalidTask',
- -200087: 'InvalidChannel',
- -200086: 'InvalidSyntaxForPhysicalChannelRange',
- -200082: 'MinNotLessThanMax',
- -200081: 'SampleRateNumChansConvertPeriodCombo',
- -200079: 'AODuringCounter1DMAConflict',
- -200078: 'AIDuringCounter0DMAConflict',
- -200077: 'InvalidAttributeValue',
- -200076: 'SuppliedCurrentDataOutsideSpecifiedRange',
- -200075: 'SuppliedVoltageDataOutsideSpecifiedRange',
- -200074: 'CannotStoreCalConst',
- -200073: 'SCXIModuleNotFound',
- -200072: 'DuplicatePhysicalChansNotSupported',
- -200071: 'TooManyPhysicalChansInList',
- -200070: 'InvalidAdvanceEventTriggerType',
- -200069: 'DeviceIsNotAValidSwitch',
- -200068: 'DeviceDoesNotSupportScanning',
- -200067: 'ScanListCannotBeTimed',
- -200066: 'ConnectOperatorInvalidAtPointInList',
- -200065: 'UnexpectedSwitchActionInList',
- -200064: 'UnexpectedSeparatorInList',
- -200063: 'ExpectedTerminatorInList',
- -200062: 'ExpectedConnectOperatorInList',
- -200061: 'ExpectedSeparatorInList',
- -200060: 'FullySpecifiedPathInListContainsRange',
- -200059: 'ConnectionSeparatorAtEndOfList',
- -200058: 'IdentifierInListTooLong',
- -200057: 'DuplicateDeviceIDInListWhenSettling',
- -200056: 'ChannelNameNotSpecifiedInList',
- -200055: 'DeviceIDNotSpecifiedInList',
- -200054: 'SemicolonDoesNotFollowRangeInList',
- -200053: 'SwitchActionInListSpansMultipleDevices',
- -200052: 'RangeWithoutAConnectActionInList',
- -200051: 'InvalidIdentifierFollowingSeparatorInList',
- -200050: 'InvalidChannelNameInList',
- -200049: 'InvalidNumberInRepeatStatementInList',
- -200048: 'InvalidTriggerLineInList',
- -200047: 'InvalidIdentifierInListFollowingDeviceID',
- -200046: 'InvalidIdentifierInListAtEndOfSwitchAction',
- -200045: 'DeviceRemoved',
- -200044: 'RoutingPathNotAvailable',
- -200043: 'RoutingHardwareBusy',
- -200042: 'RequestedSignalInversionForRoutingNotPossible',
- -200041: 'InvalidRoutingDestinationTerminalName',
- -200040: 'InvalidRoutingSourceTerminalName',
- -200039: 'RoutingNotSupportedForDevice',
- -200038: 'WaitIsLastInstructionOfLoopInScript',
- -200037: 'ClearIsLastInstructionOfLoopInScript',
- -200036: 'InvalidLoopIterationsInScript',
- -200035: 'RepeatLoopNestingTooDeepInScript',
- -200034: 'MarkerPositionOutsideSubsetInScript',
- -200033: 'SubsetStartOffsetNotAlignedInScript',
- -200032: 'InvalidSubsetLengthInScript',
- -200031: 'MarkerPositionNotAlignedInScript',
- -200030: 'SubsetOutsideWaveformInScript',
- -200029: 'MarkerOutsideWaveformInScript',
- -200028: 'WaveformInScriptNotInMem',
- -200027: 'KeywordExpectedInScript',
- -200026: 'BufferNameExpectedInScript',
- -200025: 'ProcedureNameExpectedInScript',
- -200024: 'ScriptHasInvalidIdentifier',
- -200023: 'ScriptHasInvalidCharacter',
- -200022: 'ResourceAlreadyReserved',
- -200020: 'SelfTestFailed',
- -200019: 'ADCOverrun',
- -200018: 'DACUnderflow',
- -200017: 'InputFIFOUnderflow',
- -200016: 'OutputFIFOUnderflow',
- -200015: 'SCXISerialCommunication',
- -200014: 'DigitalTerminalSpecifiedMoreThanOnce',
- -200012: 'DigitalOutputNotSupported',
- -200011: 'InconsistentChannelDirections',
- -200010: 'InputFIFOOverflow',
- -200009: 'TimeStampOverwritten',
- -200008: 'StopTriggerHasNotOccurred',
- -200007: 'RecordNotAvailable',
- -200006: 'RecordOverwritten',
- -200005: 'DataNotAvailable',
- -200004: 'DataOverwrittenInDeviceMemory',
- -200003: 'DuplicatedChannel',
- -89167: 'RoutingDestTermPXIDStarXNotInSystemTimingSlot_Routing',
- -89166: 'RoutingSrcTermPXIDStarXNotInSystemTimingSlot_Routing',
- -89165: 'RoutingSrcTermPXIDStarInNonDStarTriggerSlot_Routing',
- -89164: 'RoutingDestTermPXIDStarInNonDStarTriggerSlot_Routing',
- -89162: 'RoutingDestTermPXIClk10InNotInStarTriggerSlot_Routing',
- -89161: 'RoutingDestTermPXIClk10InNotInSystemTimingSlot_Routing',
- -89160: 'RoutingDestTermPXIStarXNotInStarTriggerSlot_Routing',
- -89159: 'RoutingDestTermPXIStarXNotInSystemTimingSlot_Routing',
- -89158: 'RoutingSrcTermPXIStarXNotInStarTriggerSlot_Routing',
- -89157: 'RoutingSrcTermPXIStarXNotInSystemTimingSlot_Routing',
- -89156: 'RoutingSrcTermPXIStarInNonStarTriggerSlot_Routing',
- -89155: 'RoutingDestTermPXIStarInNonStarTriggerSlot_Routing',
- -89154: 'RoutingDestTermPXIStarInStarTriggerSlot_Routing',
- -89153: 'RoutingDestTermPXIStarInSystemTimingSlot_Routing',
- -89152: 'RoutingSrcTermPXIStarInStarTriggerSlot_Routing',
- -89151: 'RoutingSrcTermPXIStarInSystemTimingSlot_Routing',
- -89150: 'InvalidSignalModifier_Routing',
- -89149: 'RoutingDestTermPXIClk10InNotInSlot2_Routing',
- -89148: 'RoutingDestTermPXIStarXNotInSlot2_Routing',
- -89147: 'RoutingSrcTermPXIStarXNotInSlot2_Routing',
- -89146: 'RoutingSrcTermPXIStarInSlot16AndAbove_Routing',
- -89145: 'RoutingDestTermPXIStarInSlot16AndAbove_Routing',
- -89144: 'RoutingDestTermPXIStarInSlot2_Routing',
- -89143: 'RoutingSrcTermPXIStarInSlot2_Routing',
- -89142: 'RoutingDestTermPXIChassisNotIdentified_Routing',
- -89141: 'RoutingSrcTermPXIChassisNotIdentified_Routing',
- -89140: 'TrigLineNotFoundSingleDevRoute_Routing',
- -89139: 'NoCommonTrigLineForRoute_Routing',
- -89138: 'ResourcesInUseForRouteInTask_Routing',
- -89137: 'ResourcesInUseForRoute_Routing',
- -89136: 'RouteNotSupportedByHW_Routing',
- -89135: 'ResourcesInUseForInversionInTask_Routing',
- -89134: 'ResourcesInUseForInversion_Routing',
- -89133: 'InversionNotSupportedByHW_Routing',
- -89132: 'ResourcesInUseForProperty_Routing',
- -89131: 'RouteSrcAndDestSame_Routing',
- -89130: 'DevAbsentOrUnavailable_Routing',
- -89129: 'InvalidTerm_Routing',
- -89128: 'CannotTristateTerm_Routing',
- -89127: 'CannotTristateBusyTerm_Routing',
- -89126: 'CouldNotReserveRequestedTrigLine_Routing',
- -89125: 'TrigLineNotFound_Routing',
- -89124: 'RoutingPathNotAvailable_Routing',
- -89123: 'RoutingHardwareBusy_Routing',
- -89122: 'RequestedSignalInversionForRoutingNotPossible_Routing',
- -89121: 'InvalidRoutingDestinationTerminalName_Routing',
- -89120: 'InvalidRoutingSourceTerminalName_Routing',
- -88907: 'ServiceLocatorNotAvailable_Routing',
- -88900: 'CouldNotConnectToServer_Routing',
- -88720: 'DeviceNameContainsSpacesOrPunctuation_Routing',
- -88719: 'DeviceNameContainsNonprintableCharacters_Routing',
- -88718: 'DeviceNameIsEmpty_Routing',
- -88717: 'DeviceNameNotFound_Routing',
- -88716: 'LocalRemoteDriverVersionMismatch_Routing',
- -88715: 'DuplicateDeviceName_Routing',
- -88710: 'RuntimeAborting_Routing',
- -88709: 'RuntimeAborted_Routing',
- -88708: 'ResourceNotInPool_Routing',
- -88705: 'DriverDeviceGUIDNotFound_Routing',
- -50807: 'PALIsocStreamBufferError',
- -50806: 'PALInvalidAddressComponent',
- -50805: 'PALSharingViolation',
- -50804: 'PALInvalidDeviceState',
- -50803: 'PALConnectionReset',
- -50802: 'PALConnectionAborted',
- -50801: 'PALConnectionRefused',
- -50800: 'PALBusResetOccurred',
- -50700: 'PALWaitInterrupted',
- -50651: 'PALMessageUnderflow',
- -50650: 'PALMessageOverflow',
- -50604: 'PALThreadAlreadyDead',
- -50603: 'PALThreadStackSizeNotSupported',
- -50602: 'PALThreadControllerIsNotThreadCreator',
- -50601: 'PALThreadHasNoThreadObject',
- -50600: 'PALThreadCouldNotRun',
- -50551: 'PALSyncAbandoned',
- -50550: 'PALSyncTimedOut',
- -50503: 'PALReceiverSocketInvalid',
- -50502: 'PALSocketListenerInvalid',
- -50501: 'PALSocketListenerAlreadyRegistered',
- -50500: 'PALDispatcherAlreadyExported',
- -50450: 'PALDMALinkEventMissed',
- -50413: 'PALBusError',
- -50412: 'PALRetryLimitExceeded',
- -50411: 'PALTransferOverread',
- -50410: 'PALTransferOverwritten',
- -50409: 'PALPhysicalBufferFull',
- -50408: 'PALPhysicalBufferEmpty',
- -50407: 'PALLogicalBufferFull',
- -50406: 'PALLogicalBufferEmpty',
- -50405: 'PALTransferAborted',
- -50404: 'PALTransferStopped',
- -50403: 'PALTransferInProgress',
- -50402: 'PALTransferNotInProgress',
- -50401: 'PALCommunicationsFault',
- -50400: 'PALTransferTimedOut',
- -50355: 'PALMemoryHeapNotEmpty',
- -50354: 'PALMemoryBlockCheckFailed',
- -50353: 'PALMemoryPageLockFailed',
- -50352: 'PALMemoryFull',
- -50351: 'PALMemoryAlignmentFault',
- -50350: 'PALMemoryConfigurationFault',
- -50303: 'PALDeviceInitializationFault',
- -50302: 'PALDeviceNotSupported',
- -50301: 'PALDeviceUnknown',
- -50300: 'PALDeviceNotFound',
- -50265: 'PALFeatureDisabled',
- -50264: 'PALComponentBusy',
- -50263: 'PALComponentAlreadyInstalled',
- -50262: 'PALComponentNotUnloadable',
- -50261: 'PALComponentNeverLoaded',
- -50260: 'PALComponentAlreadyLoaded',
- -50259: 'PALComponentCircularDependency',
- -50258: 'PALComponentInitializationFault',
- -50257: 'PALComponentImageCorrupt',
- -50256: 'PALFeatureNotSupported',
- -50255: 'PALFunctionNotFound',
- -50254: 'PALFunctionObsolete',
- -50253: 'PALComponentTooNew',
- -50252: 'PALComponentTooOld',
- -50251: 'PALComponentNotFound',
- -50250: 'PALVersionMismatch',
- -50209: 'PALFileFault',
- -50208: 'PALFileWriteFault',
- -50207: 'PALFileReadFault',
- -50206: 'PALFileSeekFault',
- -50205: 'PALFileCloseFault',
- -50204: 'PALFileOpenFault',
- -50203: 'PALDiskFull',
- -50202: 'PALOSFault',
- -50201: 'PALOSInitializationFault',
- -50200: 'PALOSUnsupported',
- -50175: 'PALCalculationOverflow',
- -50152: 'PALHardwareFault',
- -50151: 'PALFirmwareFault',
- -50150: 'PALSoftwareFault',
- -50108: 'PALMessageQueueFull',
- -50107: 'PALResourceAmbiguous',
- -50106: 'PALResourceBusy',
- -50105: 'PALResourceInitialized',
- -50104: 'PALResourceNotInitialized',
- -50103: 'PALResourceReserved',
- -50102: 'PALResourceNotReserved',
- -50101: 'PALResourceNotAvailable',
- -50100: 'PALResourceOwnedBySystem',
- -50020: 'PALBadToken',
- -50019: 'PALBadThreadMultitask',
- -50018: 'PALBadLibrarySpecifier',
- -50017: 'PALBadAddressSpace',
- -50016: 'PALBadWindowType',
- -50015: 'PALBadAddressClass',
- -50014: 'PALBadWriteCount',
- -50013: 'PALBadWriteOffset',
- -50012: 'PALBadWriteMode',
- -50011: 'PALBadReadCount',
- -50010: 'PALBadReadOffset',
- -50009: 'PALBadReadMode',
- -50008: 'PALBadCount',
- -50007: 'PALBadOffset',
- -50006: 'PALBadMode',
- -50005: 'PALBadDataSize',
- -50004: 'PALBadPointer',
- -50003: 'PALBadSelector',
- -50002: 'PALBadDevice',
- -50001: 'PALIrrelevantAttribute',
- -50000: 'PALValueConflict',
- 50000: 'PALValueConflict',
- 50001: 'PALIrrelevantAttribute',
- 50002: 'PALBadDevice',
- 50003: 'PALBadSelector',
- 50004: 'PALBadPointer',
- 50005: 'PALBadDataSize',
- 50006: 'PALBadMode',
- 50007: 'PALBadOffset',
- 50008: 'PALBadCount',
- 50009: 'PALBadReadMode',
- 50010: 'PALBadReadOffset',
- 50011: 'PALBadReadCount',
- 50012: 'PALBadWriteMode',
- 50013: 'PALBadWriteOffset',
- 50014: 'PALBadWriteCount',
- 50015: 'PALBadAddressClass',
- 50016: 'PALBadWindowType',
- 50019: 'PALBadThreadMultitask',
- 50100: 'PALResourceOwnedBySystem',
- 50101: 'PALResourceNotAvailable',
- 50102: 'PALResourceNotReserved',
- 50103: 'PALResourceReserved',
- 50104: 'PALResourceNotInitialized',
- 50105: 'PALResourceInitialized',
- 50106: 'PALResourceBusy',
- 50107: 'PALResourceAmbiguous',
- 50151: 'PALFirmwareFault',
- 50152: 'PALHardwareFault',
- 50200: 'PALOSUnsupported',
- 50202: 'PALOSFault',
- 50254: 'PALFunctionObsolete',
- 50255: 'PALFunctionNotFound',
- 50256: 'PALFeatureNotSupported',
- 50258: 'PALComponentInitializationFault',
- 50260: 'PALComponentAlreadyLoaded',
- 50262: 'PALComponentNotUnloadable',
- 50351: 'PALMemoryAlignmentFault',
- 50355: 'PALMemoryHeapNotEmpty',
- 50402: 'PALTransferNotInProgress',
- 50403: 'PALTransferInProgress',
- 50404: 'PALTransferStopped',
- 50405: 'PALTransferAborted',
- 50406: 'PALLogicalBufferEmpty',
- 50407: 'PALLogicalBufferFull',
- 50408: 'PALPhysicalBufferEmpty',
- 50409: 'PALPhysicalBufferFull',
- 50410: 'PALTransferOverwritten',
- 50411: 'PALTransferOverread',
- 50500: 'PALDispatcherAlreadyExported',
- 50551: 'PALSyncAbandoned',
- 200003: 'TimestampCounterRolledOver',
- 200004: 'InputTerminationOverloaded',
- 200005: 'ADCOverloaded',
- 200007: 'PLLUnlocked',
- 200008: 'Counter0DMADuringAIConflict',
- 200009: 'Counter1DMADuringAOConflict',
- 200010: 'StoppedBeforeDone',
- 200011: 'RateViolatesSettlingTime',
- 200012: 'RateViolatesMaxADCRate',
- 200013: 'UserDefInfoStringTooLong',
- 200014: 'TooManyInterruptsPerSecond',
- 200015: 'PotentialGlitchDuringWrite',
- 200016: 'DevNotSelfCalibratedWithDAQmx',
- 200017: 'AISampRateTooLow',
- 200018: 'AIConvRateTooLow',
- 200019: 'ReadOffsetCoercion',
- 200020: 'PretrigCoercion',
- 200021: 'SampValCoercedToMax',
- 200022: 'SampValCoercedToMin',
- 200024: 'PropertyVersionNew',
- 200025: 'UserDefinedInfoTooLong',
- 200026: 'CAPIStringTruncatedToFitBuffer',
- 200027: 'SampClkRateTooLow',
- 200028: 'PossiblyInvalidCTRSampsInFiniteDMAAcq',
- 200029: 'RISAcqCompletedSomeBinsNotFilled',
- 200030: 'PXIDevTempExceedsMaxOpTemp',
- 200031: 'OutputGainTooLowForRFFreq',
- 200032: 'OutputGainTooHighForRFFreq',
- 200033: 'MultipleWritesBetweenSampClks',
- 200034: 'DeviceMayShutDownDueToHighTemp',
- 200035: 'RateViolatesMinADCRate',
- 200036: 'SampClkRateAboveDevSpecs',
- 200037: 'COPrevDAQmxWriteSettingsOverwrittenForHWTimedSinglePoint',
- 200038: 'LowpassFilterSettlingTimeExceedsUserTimeBetween2ADCConversions',
- 200039: 'LowpassFilterSettlingTimeExceedsDriverTimeBetween2ADCConversions',
- 200040: 'SampClkRateViolatesSettlingTimeForGen',
- 200041: 'InvalidCalConstValueForAI',
- 200042: 'InvalidCalConstValueForAO',
- 200043: 'ChanCalExpired',
- 200044: 'UnrecognizedEnumValueEncounteredInStorage',
- 200045: 'TableCRCNotCorrect',
- 200046: 'ExternalCRCNotCorrect',
- 200047: 'SelfCalCRCNotCorrect',
- 200048: 'DeviceSpecExceeded',
- 200049: 'OnlyGainCalibrated',
- 200050: 'ReversePowerProtectionActivated',
- 200051: 'OverVoltageProtectionActivated',
- 200052: 'BufferSizeNotMultipleOfSectorSize',
- 200053: 'SampleRateMayCauseAcqToFail',
- 200054: 'UserAreaCRCNotCorrect',
- 200055: 'PowerUpInfoCRCNotCorrect',
- 209800: 'ReadNotCompleteBeforeSampClk',
- 209801: 'WriteNotCompleteBeforeSampClk',
- 209802: 'WaitForNextSampClkDetectedMissedSampClk'}
@@ -0,0 +1,249 @@
+# This file lists the prototypes of the NI-DAQmx functions that
+# libnidaqmx calls, in the format that libnidaqmx._convert_header
+# generates from NIDAQmx.h. It is used for versions in the constant
+# store (see nidaqmx.constants) that were added without prototypes.
+
+prototypes = {
+    # Task configuration and control
+    'CreateTask': ('int32', ('const char[]', 'TaskHandle*')),
+    'ClearTask': ('int32', ('TaskHandle',)),
+    'StartTask': ('int32', ('TaskHandle',)),
+    'StopTask': ('int32', ('TaskHandle',)),
+    'TaskControl': ('int32', ('TaskHandle', 'int32')),
+    'IsTaskDone': ('int32', ('TaskHandle', 'bool32*')),
+    'WaitUntilTaskDone': ('int32', ('TaskHandle', 'float64')),
+    'WaitForNextSampleClock': ('int32', ('TaskHandle', 'float64', 'bool32*')),
+    'GetTaskName': ('int32', ('TaskHandle', 'char*', 'uInt32')),
+    'GetTaskNumChans': ('int32', ('TaskHandle', 'uInt32*')),
+    'GetTaskChannels': ('int32', ('TaskHandle', 'char*', 'uInt32')),
+    'GetTaskDevices': ('int32', ('TaskHandle', 'char*', 'uInt32')),
+
+    # Events
+    'RegisterEveryNSamplesEvent': ('int32', ('TaskHandle', 'int32', 'uInt32', 'uInt32',
+                                             'DAQmxEveryNSamplesEventCallbackPtr', 'void*')),
+    'RegisterDoneEvent': ('int32', ('TaskHandle', 'uInt32', 'DAQmxDoneEventCallbackPtr', 'void*')),
+    'RegisterSignalEvent': ('int32', ('TaskHandle', 'int32', 'uInt32',
+                                      'DAQmxSignalEventCallbackPtr', 'void*')),
+
+    # Channel creation
+    'CreateAIVoltageChan': ('int32', ('TaskHandle', 'const char[]', 'const char[]', 'int32',
+                                      'float64', 'float64', 'int32', 'const char[]')),
+    'CreateAOVoltageChan': ('int32', ('TaskHandle', 'const char[]', 'const char[]',
+                                      'float64', 'float64', 'int32', 'const char[]')),
+    'CreateDIChan': ('int32', ('TaskHandle', 'const char[]', 'const char[]', 'int32')),
+    'CreateDOChan': ('int32', ('TaskHandle', 'const char[]', 'const char[]', 'int32')),
+    'CreateCICountEdgesChan': ('int32', ('TaskHandle', 'const char[]', 'const char[]', 'int32',
+                                         'uInt32', 'int32')),
+    'CreateCILinEncoderChan': ('int32', ('TaskHandle', 'const char[]', 'const char[]', 'int32',
+                                         'bool32', 'float64', 'int32', 'int32', 'float64',
+                                         'float64', 'const char[]')),
+    'CreateCIFreqChan': ('int32', ('TaskHandle', 'const char[]', 'const char[]', 'float64',
+                                   'float64', 'int32', 'int32', 'int32', 'float64', 'uInt32',
+                                   'const char[]')),
+    'CreateCOPulseChanFreq': ('int32', ('TaskHandle', 'const char[]', 'const char[]', 'int32',
+                                        'int32', 'float64', 'float64', 'float64')),
+    'CreateCOPulseChanTicks': ('int32', ('TaskHandle', 'const char[]', 'const char[]',
+                                         'const char[]', 'int32', 'int32', 'int32', 'int32')),
+    'CreateCOPulseChanTime': ('int32', ('TaskHandle', 'const char[]', 'const char[]', 'int32',
+                                        'int32', 'float64', 'float64', 'float64')),
+
+    # Timing
+    'CfgSampClkTiming': ('int32', ('TaskHandle', 'const char[]', 'float64', 'int32', 'int32',
+                                   'uInt64')),
+    'CfgHandshakingTiming': ('int32', ('TaskHandle', 'int32', 'uInt64')),
+    'CfgImplicitTiming': ('int32', ('TaskHandle', 'int32', 'uInt64')),
+    'CfgChangeDetectionTiming': ('int32', ('TaskHandle', 'const char[]', 'const char[]',
+                                           'int32', 'uInt64')),
+
+    # Triggering
+    'CfgAnlgEdgeStartTrig': ('int32', ('TaskHandle', 'const char[]', 'int32', 'float64')),
+    'CfgAnlgWindowStartTrig': ('int32', ('TaskHandle', 'const char[]', 'int32', 'float64',
+                                         'float64')),
+    'CfgDigEdgeStartTrig': ('int32', ('TaskHandle', 'const char[]', 'int32')),
+    'CfgDigPatternStartTrig': ('int32', ('TaskHandle', 'const char[]', 'const char[]', 'int32')),
+    'DisableStartTrig': ('int32', ('TaskHandle',)),
+    'CfgAnlgEdgeRefTrig': ('int32', ('TaskHandle', 'const char[]', 'int32', 'float64',
+                                     'uInt32')),
+    'CfgAnlgWindowRefTrig': ('int32', ('TaskHandle', 'const char[]', 'int32', 'float64',
+                                       'float64', 'uInt32')),
+    'CfgDigEdgeRefTrig': ('int32', ('TaskHandle', 'const char[]', 'int32', 'uInt32')),
+    'CfgDigPatternRefTrig': ('int32', ('TaskHandle', 'const char[]', 'const char[]', 'int32',
+                                       'uInt32')),
+    'DisableRefTrig': ('int32', ('TaskHandle',)),
+
+    # Read and write
+    'ReadAnalogF64': ('int32', ('TaskHandle', 'int32', 'float64', 'bool32', 'float64[]',
+                                'uInt32', 'int32*', 'bool32*')),
+    'ReadAnalogScalarF64': ('int32', ('TaskHandle', 'float64', 'float64*', 'bool32*')),
+    'ReadBinaryI16': ('int32', ('TaskHandle', 'int32', 'float64', 'bool32', 'int16[]',
+                                'uInt32', 'int32*', 'bool32*')),
+    'ReadBinaryI32': ('int32', ('TaskHandle', 'int32', 'float64', 'bool32', 'int32[]',
+                                'uInt32', 'int32*', 'bool32*')),
+    'ReadDigitalLines': ('int32', ('TaskHandle', 'int32', 'float64', 'bool32', 'uInt8[]',
+                                   'uInt32', 'int32*', 'int32*', 'bool32*')),
+    'ReadDigitalU8': ('int32', ('TaskHandle', 'int32', 'float64', 'bool32', 'uInt8[]',
+                                'uInt32', 'int32*', 'bool32*')),
+    'ReadDigitalU16': ('int32', ('TaskHandle', 'int32', 'float64', 'bool32', 'uInt16[]',
+                                 'uInt32', 'int32*', 'bool32*')),
+    'ReadDigitalU32': ('int32', ('TaskHandle', 'int32', 'float64', 'bool32', 'uInt32[]',
+                                 'uInt32', 'int32*', 'bool32*')),
+    'ReadCounterU32': ('int32', ('TaskHandle', 'int32', 'float64', 'uInt32[]', 'uInt32',
+                                 'int32*', 'bool32*')),
+    'ReadCounterF64': ('int32', ('TaskHandle', 'int32', 'float64', 'float64[]', 'uInt32',
+                                 'int32*', 'bool32*')),
+    'ReadCounterScalarF64': ('int32', ('TaskHandle', 'float64', 'float64*', 'bool32*')),
+    'WriteAnalogF64': ('int32', ('TaskHandle', 'int32', 'bool32', 'float64', 'bool32',
+                                 'const float64[]', 'int32*', 'bool32*')),
+    'WriteAnalogScalarF64': ('int32', ('TaskHandle', 'bool32', 'float64', 'float64',
+                                       'bool32*')),
+    'WriteDigitalLines': ('int32', ('TaskHandle', 'int32', 'bool32', 'float64', 'bool32',
+                                    'const uInt8[]', 'int32*', 'bool32*')),
+    'WriteDigitalU8': ('int32', ('TaskHandle', 'int32', 'bool32', 'float64', 'bool32',
+                                 'const uInt8[]', 'int32*', 'bool32*')),
+    'WriteDigitalU16': ('int32', ('TaskHandle', 'int32', 'bool32', 'float64', 'bool32',
+                                  'const uInt16[]', 'int32*', 'bool32*')),
+    'WriteDigitalU32': ('int32', ('TaskHandle', 'int32', 'bool32', 'float64', 'bool32',
+                                  'const uInt32[]', 'int32*', 'bool32*')),
+    'WriteDigitalScalarU32': ('int32', ('TaskHandle', 'bool32', 'float64', 'uInt32',
+                                        'bool32*')),
+    'WriteCtrTicks': ('int32', ('TaskHandle', 'int32', 'bool32', 'float64', 'bool32',
+                                'const uInt32[]', 'const uInt32[]', 'int32*', 'bool32*')),
+
+    # Buffer
+    'CfgInputBuffer': ('int32', ('TaskHandle', 'uInt32')),
+    'CfgOutputBuffer': ('int32', ('TaskHandle', 'uInt32')),
+    'GetBufInputBufSize': ('int32', ('TaskHandle', 'uInt32*')),
+    'SetBufInputBufSize': ('int32', ('TaskHandle', 'uInt32')),
+    'ResetBufInputBufSize': ('int32', ('TaskHandle',)),
+    'GetBufInputOnbrdBufSize': ('int32', ('TaskHandle', 'uInt32*')),
+    'GetBufOutputBufSize': ('int32', ('TaskHandle', 'uInt32*')),
+    'SetBufOutputBufSize': ('int32', ('TaskHandle', 'uInt32')),
+    'ResetBufOutputBufSize': ('int32', ('TaskHandle',)),
+    'GetBufOutputOnbrdBufSize': ('int32', ('TaskHandle', 'uInt32*')),
+
+    # Channel properties
+    'GetPhysicalChanName': ('int32', ('TaskHandle', 'const char[]', 'char*', 'uInt32')),
+    'GetChanType': ('int32', ('TaskHandle', 'const char[]', 'int32*')),
+    'GetChanIsGlobal': ('int32', ('TaskHandle', 'const char[]', 'bool32*')),
+    'GetAIMax': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'SetAIMax': ('int32', ('TaskHandle', 'const char[]', 'float64')),
+    'ResetAIMax': ('int32', ('TaskHandle', 'const char[]')),
+    'GetAIMin': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'SetAIMin': ('int32', ('TaskHandle', 'const char[]', 'float64')),
+    'ResetAIMin': ('int32', ('TaskHandle', 'const char[]')),
+    'GetAOMax': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'SetAOMax': ('int32', ('TaskHandle', 'const char[]', 'float64')),
+    'ResetAOMax': ('int32', ('TaskHandle', 'const char[]')),
+    'GetAOMin': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'SetAOMin': ('int32', ('TaskHandle', 'const char[]', 'float64')),
+    'ResetAOMin': ('int32', ('TaskHandle', 'const char[]')),
+    'GetCOCtrTimebaseRate': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'GetCIMeasType': ('int32', ('TaskHandle', 'const char[]', 'int32*')),
+    'GetCIMax': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'SetCIMax': ('int32', ('TaskHandle', 'const char[]', 'float64')),
+    'ResetCIMax': ('int32', ('TaskHandle', 'const char[]')),
+    'GetCIMin': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'SetCIMin': ('int32', ('TaskHandle', 'const char[]', 'float64')),
+    'ResetCIMin': ('int32', ('TaskHandle', 'const char[]')),
+    'GetAIRngHigh': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'GetAIRngLow': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'GetAIRawSampSize': ('int32', ('TaskHandle', 'const char[]', 'uInt32*')),
+    'GetAIDevScalingCoeff': ('int32', ('TaskHandle', 'const char[]', 'float64[]', 'uInt32')),
+    'GetAORngHigh': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'GetAORngLow': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'GetAIGain': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'GetAOGain': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'GetAIMeasType': ('int32', ('TaskHandle', 'const char[]', 'int32*')),
+    'GetAOOutputType': ('int32', ('TaskHandle', 'const char[]', 'int32*')),
+    'GetAIVoltageUnits': ('int32', ('TaskHandle', 'const char[]', 'int32*')),
+    'GetAOVoltageUnits': ('int32', ('TaskHandle', 'const char[]', 'int32*')),
+    'GetAIAutoZeroMode': ('int32', ('TaskHandle', 'const char[]', 'int32*')),
+    'GetAIDataXferMech': ('int32', ('TaskHandle', 'const char[]', 'int32*')),
+    'GetAODataXferMech': ('int32', ('TaskHandle', 'const char[]', 'int32*')),
+    'GetDINumLines': ('int32', ('TaskHandle', 'const char[]', 'uInt32*')),
+    'GetDONumLines': ('int32', ('TaskHandle', 'const char[]', 'uInt32*')),
+    'SetDOOutputDriveType': ('int32', ('TaskHandle', 'const char[]', 'int32')),
+    'ResetDOOutputDriveType': ('int32', ('TaskHandle', 'const char[]')),
+    'SetCICountEdgesTerm': ('int32', ('TaskHandle', 'const char[]', 'const char[]')),
+    'GetCIDupCountPrevent': ('int32', ('TaskHandle', 'const char[]', 'bool32*')),
+    'SetCIDupCountPrevent': ('int32', ('TaskHandle', 'const char[]', 'bool32')),
+    'ResetCIDupCountPrevent': ('int32', ('TaskHandle', 'const char[]')),
+    'GetCICtrTimebaseRate': ('int32', ('TaskHandle', 'const char[]', 'float64*')),
+    'SetCICtrTimebaseRate': ('int32', ('TaskHandle', 'const char[]', 'float64')),
+    'ResetCICtrTimebaseRate': ('int32', ('TaskHandle', 'const char[]')),
+    'SetCOPulseTerm': ('int32', ('TaskHandle', 'const char[]', 'const char[]')),
+
+    # Timing and trigger properties
+    'GetSampClkRate': ('int32', ('TaskHandle', 'float64*')),
+    'SetSampClkRate': ('int32', ('TaskHandle', 'float64')),
+    'ResetSampClkRate': ('int32', ('TaskHandle',)),
+    'GetSampClkMaxRate': ('int32', ('TaskHandle', 'float64*')),
+    'GetAIConvRate': ('int32', ('TaskHandle', 'float64*')),
+    'SetAIConvRate': ('int32', ('TaskHandle', 'float64')),
+    'ResetAIConvRate': ('int32', ('TaskHandle',)),
+    'GetAIConvMaxRate': ('int32', ('TaskHandle', 'float64*')),
+    'GetArmStartTrigType': ('int32', ('TaskHandle', 'int32*')),
+    'SetArmStartTrigType': ('int32', ('TaskHandle', 'int32')),
+    'ResetArmStartTrigType': ('int32', ('TaskHandle',)),
+    'SetDigEdgeArmStartTrigSrc': ('int32', ('TaskHandle', 'const char[]')),
+    'SetDigEdgeArmStartTrigEdge': ('int32', ('TaskHandle', 'int32')),
+    'SetPauseTrigType': ('int32', ('TaskHandle', 'int32')),
+    'SetDigLvlPauseTrigSrc': ('int32', ('TaskHandle', 'const char[]')),
+    'SetAnlgLvlPauseTrigSrc': ('int32', ('TaskHandle', 'const char[]')),
+    'SetAnlgWinPauseTrigSrc': ('int32', ('TaskHandle', 'const char[]')),
+    'SetDigLvlPauseTrigWhen': ('int32', ('TaskHandle', 'int32')),
+    'SetAnlgLvlPauseTrigWhen': ('int32', ('TaskHandle', 'int32')),
+    'SetAnlgWinPauseTrigWhen': ('int32', ('TaskHandle', 'int32')),
+
+    # Read and write properties
+    'GetReadCurrReadPos': ('int32', ('TaskHandle', 'uInt64*')),
+    'GetReadAvailSampPerChan': ('int32', ('TaskHandle', 'uInt32*')),
+    'GetReadTotalSampPerChanAcquired': ('int32', ('TaskHandle', 'uInt64*')),
+    'GetReadRelativeTo': ('int32', ('TaskHandle', 'int32*')),
+    'SetReadRelativeTo': ('int32', ('TaskHandle', 'int32')),
+    'ResetReadRelativeTo': ('int32', ('TaskHandle',)),
+    'GetReadOverWrite': ('int32', ('TaskHandle', 'int32*')),
+    'SetReadOverWrite': ('int32', ('TaskHandle', 'int32')),
+    'ResetReadOverWrite': ('int32', ('TaskHandle',)),
+    'GetReadOffset': ('int32', ('TaskHandle', 'int32*')),
+    'SetReadOffset': ('int32', ('TaskHandle', 'int32')),
+    'ResetReadOffset': ('int32', ('TaskHandle',)),
+    'GetWriteCurrWritePos': ('int32', ('TaskHandle', 'uInt64*')),
+    'GetWriteTotalSampPerChanGenerated': ('int32', ('TaskHandle', 'uInt64*')),
+    'GetWriteSpaceAvail': ('int32', ('TaskHandle', 'uInt32*')),
+    'GetWriteRegenMode': ('int32', ('TaskHandle', 'int32*')),
+    'SetWriteRegenMode': ('int32', ('TaskHandle', 'int32')),
+    'ResetWriteRegenMode': ('int32', ('TaskHandle',)),
+
+    # Devices
+    'ResetDevice': ('int32', ('const char[]',)),
+    'GetDevProductType': ('int32', ('const char[]', 'char*', 'uInt32')),
+    'GetDevProductNum': ('int32', ('const char[]', 'uInt32*')),
+    'GetDevSerialNum': ('int32', ('const char[]', 'uInt32*')),
+    'GetDevAIPhysicalChans': ('int32', ('const char[]', 'char*', 'uInt32')),
+    'GetDevAOPhysicalChans': ('int32', ('const char[]', 'char*', 'uInt32')),
+    'GetDevDILines': ('int32', ('const char[]', 'char*', 'uInt32')),
+    'GetDevDIPorts': ('int32', ('const char[]', 'char*', 'uInt32')),
+    'GetDevDOLines': ('int32', ('const char[]', 'char*', 'uInt32')),
+    'GetDevDOPorts': ('int32', ('const char[]', 'char*', 'uInt32')),
+    'GetPhysicalChanDIPortWidth': ('int32', ('const char[]', 'uInt32*')),
+    'GetPhysicalChanDOPortWidth': ('int32', ('const char[]', 'uInt32*')),
+    'GetDevCIPhysicalChans': ('int32', ('const char[]', 'char*', 'uInt32')),
+    'GetDevCOPhysicalChans': ('int32', ('const char[]', 'char*', 'uInt32')),
+    'GetDevBusType': ('int32', ('const char[]', 'int32*')),
+    'GetDevPCIBusNum': ('int32', ('const char[]', 'uInt32*')),
+    'GetDevPCIDevNum': ('int32', ('const char[]', 'uInt32*')),
+    'GetDevPXISlotNum': ('int32', ('const char[]', 'uInt32*')),
+    'GetDevPXIChassisNum': ('int32', ('const char[]', 'uInt32*')),
+
+    # System
+    'GetSysNIDAQMajorVersion': ('int32', ('uInt32*',)),
+    'GetSysNIDAQMinorVersion': ('int32', ('uInt32*',)),
+    'GetSysDevNames': ('int32', ('char*', 'uInt32')),
+    'GetSysTasks': ('int32', ('char*', 'uInt32')),
+    'GetSysGlobalChans': ('int32', ('char*', 'uInt32')),
+
+    # Error handling
+    'GetErrorString': ('int32', ('int32', 'char[]', 'uInt32')),
+    'GetExtendedErrorInfo': ('int32', ('char[]', 'uInt32')),
+}
@@ -0,0 +1,122 @@
+"""
+Conversion of raw analog input samples to volts.
+
+`AnalogInputTask.read_raw` returns the unscaled integers of the
+analog-to-digital converter, a quarter of the size of the float64
+samples of `AnalogInputTask.read`. `PolynomialScaler` converts them
+to volts with the device scaling polynomial of each channel, when
+and where the volts are needed::
+
+  scaler = task.get_scaler()
+  raw = task.read_raw(10000)
+  ...
+  volts = scaler.scale(raw)
+
+The polynomials convert to the native units of the device, before
+any custom scale of the channel is applied.
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import numpy as np
+
+__all__ = ['PolynomialScaler']
+
+class PolynomialScaler(object):
+    """
+    Converts raw samples to volts with one polynomial per channel.
+
+    Parameters
+    ----------
+
+    coefficients : sequence
+      The polynomial coefficients of each channel, lowest order
+      first, as returned by
+      `AnalogInputTask.get_device_scaling_coefficients`. Channels may
+      have different numbers of coefficients.
+
+    Attributes
+    ----------
+
+    coefficients : numpy.ndarray
+      The coefficients with shape ``(channels, order + 1)``, padded
+      with zeros. Trailing coefficients that are zero for all
+      channels are dropped, so that linear scaling costs one
+      multiplication and one addition per sample.
+    """
+
+    def __init__(self, coefficients):
+        coefficients = [np.asarray(c, dtype=np.float64).ravel() for c in coefficients]
+        order = max([len(c) for c in coefficients] + [1])
+        self.coefficients = np.zeros((len(coefficients), order))
+        for i, c in enumerate(coefficients):
+            self.coefficients[i, :len(c)] = c
+        while self.coefficients.shape[1] > 1 and not self.coefficients[:, -1].any():
+            self.coefficients = self.coefficients[:, :-1]
+
+    @property
+    def number_of_channels(self):
+        return self.coefficients.shape[0]
+
+    def __call__(self, raw, fill_mode='group_by_scan_number', out=None, dtype=np.float64):
+        return self.scale(raw, fill_mode, out, dtype)
+
+    def scale(self, raw, fill_mode='group_by_scan_number', out=None, dtype=np.float64):
+        """
+        Returns raw samples converted to volts.
+
+        Parameters
+        ----------
+
+        raw : numpy.ndarray
+          Raw samples of all channels, organized according to
+          `fill_mode`, with shape ``(samples, channels)`` for
+          'group_by_scan_number' or ``(channels, samples)`` for
+          'group_by_channel', or a 1-d array holding the same number
+          of elements.
+
+        fill_mode : {'group_by_scan_number', 'group_by_channel'}
+          See `AnalogInputTask.read`.
+
+        out : {numpy.ndarray, None}
+          A floating point array with the shape of `raw` to store the
+          volts in. By default a new array is returned.
+
+        dtype : {numpy.float64, numpy.float32}
+          The dtype of the new array when `out` is None. Scaling to
+          float32 creates no float64 intermediates.
+
+        Returns
+        -------
+
+        volts : numpy.ndarray
+          The volts with the shape of `raw`.
+        """
+        raw = np.asarray(raw)
+        number_of_channels = self.number_of_channels
+        if fill_mode == 'group_by_scan_number':
+            view = raw.reshape(-1, number_of_channels)
+            coefficients = self.coefficients.T
+        elif fill_mode == 'group_by_channel':
+            view = raw.reshape(number_of_channels, -1)
+            coefficients = self.coefficients.T[:, :, None]
+        else:
+            raise ValueError('Expected fill_mode group_by_channel|group_by_scan_number but got %r'
+                             % (fill_mode))
+        if out is None:
+            out = np.empty(raw.shape, dtype=dtype)
+        elif out.shape != raw.shape or not out.flags.c_contiguous:
+            raise ValueError('Expected C-contiguous out array with shape %s but got %s'
+                             % (raw.shape, out.shape))
+        result = out.reshape(view.shape)
+        # Horner's scheme, from the highest order coefficient down.
+        order = len(coefficients) - 1
+        if order == 0:
+            result[...] = coefficients[0]
+            return out
+        np.multiply(view, coefficients[order], out=result)
+        result += coefficients[order - 1]
+        for k in range(order - 2, -1, -1):
+            result *= view
+            result += coefficients[k]
+        return out
@@ -14,6 +14,7 @@ def configuration(parent_package='',top_path=None):
 
     config = Configuration(package_name,parent_package,top_path)
     config.make_svn_version_py()
+    config.add_data_files('daqmx_constants.dat')
 
     wininst = 'bdist_wininst' in sys.argv
 
@@ -0,0 +1,1466 @@
+"""
+Simulated NI-DAQmx library.
+
+When the environment variable ``NIDAQMX_SIMULATE`` is set,
+`libnidaqmx._find_library` loads `SimulatedLibrary` instead of the
+installed NI-DAQmx library, so that tasks can be created, timed,
+started, read and written on any machine::
+
+  NIDAQMX_SIMULATE=1 python benchmarks/bench_tdms.py
+
+The value is ``1`` for one device named Dev1, or a comma separated
+list of device names. Every device is modelled after an X Series
+PCIe-6368: 16 analog inputs sampled simultaneously at up to 2 MS/s,
+4 analog outputs, 3 digital ports and 4 counters.
+
+The simulated functions are C callbacks with the prototypes of
+`nidaqmx.prototypes`, so calls go through the same ctypes argument
+conversion as calls into the real library. Sample clocks run on the
+monotonic clock of the host: reads wait until the requested samples
+have been clocked, writes wait for buffer space, unread samples are
+overwritten by the clock, and Every N Samples and Done events are
+called from a thread at the times a device would signal them.
+
+Input samples are computed from signals at the sample times. By
+default, analog input ``aiK`` sees a 1 V sine wave of ``10 * (K + 1)``
+Hz, digital line ``L`` of a port toggles at ``1000 / 2**L`` Hz and
+counter ``ctrK`` counts edges at ``1000 * (K + 1)`` Hz. Use
+`SimulatedLibrary.set_signal` to change signals and
+`SimulatedLibrary.connect` to loop an output back to an input::
+
+  import nidaqmx
+  lib = nidaqmx.get_simulated_library()
+  lib.set_signal('Dev1/ai1', lambda t: np.sign(np.sin(2 * np.pi * 5 * t)))
+  lib.connect('Dev1/ao0', 'Dev1/ai0')
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import os
+import re
+import math
+import time
+import ctypes
+import threading
+import traceback
+
+import numpy as np
+
+from .prototypes import prototypes
+
+__all__ = ['SimulatedLibrary', 'SimulatedDevice', 'environment_variable']
+
+environment_variable = 'NIDAQMX_SIMULATE'
+
+monotonic = getattr(time, 'monotonic', time.time)
+
+_scalar_types = dict(int8=ctypes.c_int8, uInt8=ctypes.c_uint8, int16=ctypes.c_int16,
+                     uInt16=ctypes.c_uint16, int32=ctypes.c_int32, uInt32=ctypes.c_uint32,
+                     bool32=ctypes.c_uint32, int64=ctypes.c_int64, uInt64=ctypes.c_uint64,
+                     float32=ctypes.c_float, float64=ctypes.c_double,
+                     TaskHandle=ctypes.c_void_p, CalHandle=ctypes.c_uint32)
+
+def _get_callback_argtype(decl):
+    """
+    Returns the ctypes type of a simulated function argument declared
+    as ``decl`` in `nidaqmx.prototypes`. Pointers, arrays and strings
+    are received as addresses.
+    """
+    if decl.endswith(('*', '[]', 'Ptr')):
+        return ctypes.c_void_p
+    return _scalar_types[decl.replace('const ', '')]
+
+def _get_string(address):
+    if not address:
+        return ''
+    return ctypes.string_at(address).decode('utf-8')
+
+def _get_array(ctype, address, size):
+    if not size:
+        return np.zeros(0, dtype=ctype)
+    return np.ctypeslib.as_array((ctype * size).from_address(address))
+
+def _set_value(ctype, address, value):
+    if address:
+        ctype.from_address(address).value = value
+
+def expand_channels(names):
+    """
+    Returns the list of channel names of a channel specification such
+    as ``'Dev1/ai0:3, Dev1/ai5'``.
+    """
+    result = []
+    for name in names.split(','):
+        name = name.strip().lstrip('/')
+        if not name:
+            continue
+        m = re.match(r'(.*?)(\d+):(\d+)$', name)
+        if m is None:
+            result.append(name)
+            continue
+        prefix, first, last = m.group(1), int(m.group(2)), int(m.group(3))
+        step = 1 if last >= first else -1
+        result.extend('%s%d' % (prefix, i) for i in range(first, last + step, step))
+    return result
+
+class SimulatedError(Exception):
+    """
+    Error of a simulated function, with the DAQmx error name, e.g.
+    'SamplesNotYetAvailable'.
+    """
+
+    def __init__(self, name, message):
+        Exception.__init__(self, message)
+        self.name = name
+        self.message = message
+
+class SimulatedDevice(object):
+    """
+    A simulated X Series PCIe-6368 device named ``name``.
+    """
+
+    product_type = 'PCIe-6368'
+    product_number = 0x7428
+    max_rates = dict(AI=2e6, AO=3.3e6, DI=10e6, DO=10e6, CI=100e6, CO=100e6)
+    port_widths = [32, 8, 8]
+    timebase_rate = 100e6
+
+    def __init__(self, name, serial_number):
+        self.name = name
+        self.ai = ['%s/ai%d' % (name, i) for i in range(16)]
+        self.ao = ['%s/ao%d' % (name, i) for i in range(4)]
+        self.ports = ['%s/port%d' % (name, i) for i in range(len(self.port_widths))]
+        self.lines = dict((port, ['%s/line%d' % (port, i) for i in range(width)])
+                          for port, width in zip(self.ports, self.port_widths))
+        self.counters = ['%s/ctr%d' % (name, i) for i in range(4)]
+        all_lines = [line for port in self.ports for line in self.lines[port]]
+        self.props = dict(DevProductType=self.product_type,
+                          DevProductNum=self.product_number,
+                          DevSerialNum=serial_number,
+                          DevPCIBusNum=serial_number & 0xff, DevPCIDevNum=0,
+                          DevPXISlotNum=0, DevPXIChassisNum=0,
+                          DevAIPhysicalChans=', '.join(self.ai),
+                          DevAOPhysicalChans=', '.join(self.ao),
+                          DevDIPorts=', '.join(self.ports), DevDOPorts=', '.join(self.ports),
+                          DevDILines=', '.join(all_lines), DevDOLines=', '.join(all_lines),
+                          DevCIPhysicalChans=', '.join(self.counters),
+                          DevCOPhysicalChans=', '.join(self.counters))
+
+    def get_lines(self, name):
+        """
+        Returns the lines of physical channel ``name``, a port or a
+        line, or None if the device has no such channel.
+        """
+        if name in self.lines:
+            return self.lines[name]
+        for lines in self.lines.values():
+            if name in lines:
+                return [name]
+        return None
+
+class _Channel(object):
+
+    def __init__(self, name, physical_name, signals, props):
+        self.name = name
+        self.physical_name = physical_name
+        # Physical names of the values in a sample of the channel: the
+        # channel itself, or its lines for digital channels.
+        self.signals = signals
+        self.props = props
+
+class _Task(object):
+    """
+    State of a simulated task.
+    """
+
+    def __init__(self, handle, name, do_not_allow_regen):
+        self.handle = handle
+        self.name = name
+        self.do_not_allow_regen = do_not_allow_regen
+        self.channel_type = None
+        self.channels = []
+        self.props = {}
+        # Timing
+        self.timed = False
+        self.single_point = False
+        self.rate = None
+        self.finite = False
+        self.samples_per_channel = 0
+        self.clock_source = None
+        self.start_trigger = None
+        # Run state: t0 is the time of the first sample clock edge,
+        # None while not started or waiting for a master task.
+        self.running = False
+        self.t0 = None
+        self.stop_time = None
+        self.status = 0
+        self.read_position = 0
+        self.written = 0
+        self.buffer = None
+        self.static = {}
+        self.pulse_edges = None
+        # Events
+        self.every_n = None
+        self.done_event = None
+        self.event_thread = None
+        self.stopping = threading.Event()
+
+    @property
+    def is_input(self):
+        return self.channel_type in ('AI', 'DI', 'CI')
+
+    @property
+    def signals(self):
+        return [s for c in self.channels for s in c.signals]
+
+    def get_buffer_size(self):
+        key = 'BufInputBufSize' if self.is_input else 'BufOutputBufSize'
+        return self.props.get(key, 0)
+
+    def clocked(self, now):
+        """
+        Returns the number of sample clock edges of the task until
+        ``now``.
+        """
+        if self.t0 is None or now < self.t0:
+            return 0
+        if self.stop_time is not None:
+            now = min(now, self.stop_time)
+        if self.pulse_edges is not None:
+            n = int(np.searchsorted(self.pulse_edges, now - self.t0, side='right'))
+        else:
+            n = int(math.floor((now - self.t0) * self.rate + 1e-9))
+        if self.finite:
+            n = min(n, self.samples_per_channel)
+        if not self.is_input and self.channel_type != 'CO' and not self.regenerate:
+            n = min(n, self.written)
+        return n
+
+    def time_of_sample(self, n):
+        """
+        Returns the time of sample clock edge ``n``, counted from 1.
+        """
+        if self.pulse_edges is not None:
+            if n > len(self.pulse_edges):
+                return float('inf')
+            return self.t0 + self.pulse_edges[n - 1]
+        return self.t0 + n / self.rate
+
+    @property
+    def regenerate(self):
+        return self.props.get('WriteRegenMode') != self.do_not_allow_regen
+
+    def get_output(self, column, indices):
+        """
+        Returns the output values of buffer ``column`` at sample
+        indices ``indices``.
+        """
+        if self.written == 0:
+            return np.zeros(len(indices))
+        size = len(self.buffer)
+        if self.regenerate and self.written <= size:
+            indices = indices % self.written
+        else:
+            indices = np.minimum(indices, self.written - 1)
+        return self.buffer[indices % size, column]
+
+class SimulatedLibrary(object):
+    """
+    Stand-in for the NI-DAQmx library, see the module documentation.
+
+    Functions ``DAQmx<name>`` for the names in `nidaqmx.prototypes`
+    are created on first access.
+
+    Parameters
+    ----------
+
+    devices : list
+      Names of the simulated devices.
+
+    version : {str, None}
+      The NI-DAQmx version that the library reports, by default the
+      latest version in the constant store.
+    """
+
+    def __init__(self, devices=('Dev1',), version=None):
+        from .constants import ConstantStore
+        store = ConstantStore()
+        if version is None:
+            version = store.versions[-1]
+        self.version = version
+        self.DAQmx, error_map, _ = store.load(version)
+        self._error_codes = dict((name, code) for code, name in error_map.items())
+        self._error_names = error_map
+        self.devices = dict((name, SimulatedDevice(name, 0x1000000 + i))
+                            for i, name in enumerate(devices))
+        self.tasks = {}
+        self.signals = {}
+        self.connections = {}
+        self.t_origin = monotonic()
+        self._lock = threading.RLock()
+        self._next_handle = 1
+        self._errors = threading.local()
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Returns a library with the devices listed in the environment
+        variable, or None when it is not set.
+        """
+        value = os.environ.get(environment_variable, '').strip()
+        if value in ('', '0'):
+            return None
+        if value == '1':
+            return cls()
+        return cls([name.strip() for name in value.split(',') if name.strip()])
+
+    def __getattr__(self, name):
+        if not name.startswith('DAQmx') or name[5:] not in prototypes:
+            raise AttributeError('%s is not simulated' % (name))
+        restype, argtypes = prototypes[name[5:]]
+        func = self._make_function(name[5:], argtypes)
+        func_type = ctypes.CFUNCTYPE(_scalar_types[restype],
+                                     *[_get_callback_argtype(decl) for decl in argtypes])
+        func = func_type(func)
+        setattr(self, name, func)
+        return func
+
+    # Signals
+
+    def set_signal(self, channel, func):
+        """
+        Sets the signal of a physical input channel. ``func(t)``
+        returns the values at the times ``t``, an array of seconds: the
+        voltage for analog inputs, 0 or 1 for digital lines and the
+        number of counted edges for counters. None restores the
+        default signal.
+        """
+        with self._lock:
+            if func is None:
+                self.signals.pop(channel, None)
+            else:
+                self.signals[channel] = func
+
+    def connect(self, output_channel, input_channel):
+        """
+        Loops the physical output channel ``output_channel``, an
+        analog output or a digital line, back to the input channel
+        ``input_channel``. None as ``output_channel`` disconnects the
+        input.
+        """
+        with self._lock:
+            if output_channel is None:
+                self.connections.pop(input_channel, None)
+            else:
+                self.connections[input_channel] = output_channel
+
+    def _default_signal(self, channel, t):
+        kind, index = re.match(r'.*/([a-z]+)(\d+)$', channel).groups()
+        index = int(index)
+        if kind == 'ai':
+            return np.sin(2 * np.pi * 10 * (index + 1) * t)
+        if kind == 'line':
+            return (np.floor(t * 2000 / 2 ** index) % 2).astype(np.uint8)
+        if kind == 'ctr':
+            return np.floor(t * 1000 * (index + 1))
+        return np.zeros(len(t))
+
+    def _get_output(self, channel, times):
+        """
+        Returns the values of the physical output ``channel`` at
+        ``times``, from the task generating on it or from its last
+        static value.
+        """
+        # Tasks that are not cleared keep their channels, so prefer
+        # the task that generates on the channel, then the newest.
+        tasks = [task for task in self.tasks.values()
+                 if not task.is_input and channel in task.signals]
+        if not tasks:
+            return np.zeros(len(times))
+        task = max(tasks, key=lambda task: (task.t0 is not None and task.timed, task.handle))
+        column = task.signals.index(channel)
+        if task.t0 is not None and task.timed and not task.single_point:
+            # An input sampling on an edge of the output clock sees the
+            # sample generated on the previous edge. The tolerance
+            # keeps rounding errors of the times from moving them
+            # across an edge.
+            indices = np.ceil((times - task.t0) * task.rate - 1e-6).astype(np.int64) - 1
+            values = task.get_output(column, np.maximum(indices, 0))
+            before = indices < 0
+            if before.any():
+                values = np.where(before, task.static.get(channel, 0.0), values)
+            return values
+        return np.repeat(float(task.static.get(channel, 0.0)), len(times))
+
+    def _get_input(self, channel, times):
+        """
+        Returns the values of the physical input ``channel`` at the
+        host times ``times``.
+        """
+        if channel in self.connections:
+            return self._get_output(self.connections[channel], times)
+        func = self.signals.get(channel)
+        t = times - self.t_origin
+        if func is None:
+            return self._default_signal(channel, t)
+        return np.asarray(func(t))
+
+    # Errors
+
+    def _error(self, name, message=''):
+        return SimulatedError(name, message or name)
+
+    def _set_error(self, name, message):
+        self._errors.message = '%s\n\nStatus Code: %d' % (message, self._error_codes[name])
+
+    def _make_function(self, name, argtypes):
+        handler = getattr(self, '_' + name, None)
+        if handler is None:
+            if name.startswith(('Get', 'Set', 'Reset')):
+                handler = self._make_property_function(name, argtypes)
+            else:
+                # Configuration without effect on the simulation.
+                handler = lambda *args: 0
+        def func(*args):
+            try:
+                return handler(*args) or 0
+            except SimulatedError as error:
+                self._set_error(error.name, error.message)
+                return self._error_codes[error.name]
+            except Exception: # pylint: disable=broad-except
+                name = 'OperationNotSupportedOnSimulatedDevice'
+                self._set_error(name, traceback.format_exc())
+                return self._error_codes[name]
+        return func
+
+    def _write_string(self, address, size, value):
+        data = value.encode('utf-8')
+        if size == 0:
+            return len(data) + 1
+        if len(data) + 1 > size:
+            raise self._error('BufferTooSmallForString')
+        ctypes.memmove(address, data + b'\0', len(data) + 1)
+        return 0
+
+    def _GetExtendedErrorInfo(self, address, size):
+        return self._write_string(address, size, getattr(self._errors, 'message', ''))
+
+    def _GetErrorString(self, code, address, size):
+        return self._write_string(address, size, self._error_names.get(code, str(code)))
+
+    # Properties
+
+    def _make_property_function(self, name, argtypes):
+        """
+        Returns a handler of property function ``name``, for example
+        GetAIMax, that gets, sets or resets a value of the property
+        dictionary of a task, channel or device, or of the system.
+        """
+        action = re.match('Get|Set|Reset', name).group(0)
+        prop = name[len(action):]
+        argtypes = list(argtypes)
+        is_string = argtypes[-2:] == ['char*', 'uInt32']
+        n_keys = len(argtypes) - (2 if is_string else 0 if action == 'Reset' else 1)
+        value_type = None
+        if not is_string and action != 'Reset':
+            value_type = _scalar_types[argtypes[n_keys].rstrip('*')]
+        def handler(*args):
+            with self._lock:
+                targets = self._get_property_targets(argtypes[:n_keys], args[:n_keys])
+                if action == 'Reset':
+                    for props in targets:
+                        props.pop(prop, None)
+                elif action == 'Set':
+                    value = args[n_keys]
+                    if is_string:
+                        value = _get_string(value)
+                    for props in targets:
+                        props[prop] = value
+                else:
+                    value = targets[0].get(prop)
+                    if is_string:
+                        return self._write_string(args[-2], args[-1], value or '')
+                    if value is None:
+                        value = self._get_default_property(prop, args[:n_keys])
+                    _set_value(value_type, args[n_keys], value)
+            return 0
+        return handler
+
+    def _get_property_targets(self, argtypes, args):
+        if not argtypes:
+            return [{}]
+        if argtypes[0] == 'TaskHandle':
+            task = self._get_task(args[0])
+            if len(argtypes) == 1:
+                return [task.props]
+            return [c.props for c in self._get_channels(task, _get_string(args[1]))]
+        return [self._get_device(_get_string(args[0])).props]
+
+    def _get_default_property(self, prop, args):
+        task = self.tasks.get(args[0]) if args else None
+        if prop in ('SampClkMaxRate', 'AIConvMaxRate'):
+            return self._get_device_of(task).max_rates[task.channel_type]
+        if prop == 'AIConvRate':
+            return (task.rate or 0) * len(task.channels)
+        defaults = dict(ReadRelativeTo=self.DAQmx.Val_CurrReadPos,
+                        ReadOverWrite=self.DAQmx.Val_DoNotOverwriteUnreadSamps,
+                        WriteRegenMode=self.DAQmx.Val_AllowRegen,
+                        ArmStartTrigType=self.DAQmx.Val_None,
+                        DevBusType=self.DAQmx.Val_PCIe,
+                        BufInputOnbrdBufSize=4095, BufOutputOnbrdBufSize=8191)
+        return defaults.get(prop, 0)
+
+    # System
+
+    def _GetSysNIDAQMajorVersion(self, address):
+        _set_value(ctypes.c_uint32, address, int(self.version.split('.')[0]))
+
+    def _GetSysNIDAQMinorVersion(self, address):
+        _set_value(ctypes.c_uint32, address, int(self.version.split('.')[1]))
+
+    def _GetSysDevNames(self, address, size):
+        return self._write_string(address, size, ', '.join(sorted(self.devices)))
+
+    def _GetSysTasks(self, address, size):
+        with self._lock:
+            names = [t.name for t in self.tasks.values()]
+        return self._write_string(address, size, ', '.join(names))
+
+    def _GetSysGlobalChans(self, address, size):
+        return self._write_string(address, size, '')
+
+    def _get_device(self, name):
+        device = self.devices.get(name.strip('/'))
+        if device is None:
+            raise self._error('InvalidDeviceID', 'Device %r does not exist' % (name))
+        return device
+
+    def _get_device_of(self, task):
+        name = task.channels[0].physical_name.split('/')[0]
+        return self.devices[name]
+
+    def _get_port_width(self, name):
+        name = _get_string(name).strip().lstrip('/')
+        device = self._get_device(name.split('/')[0])
+        port = '/'.join(name.split('/')[:2])
+        if port not in device.ports:
+            raise self._error('PhysicalChanDoesNotExist', 'Port %r does not exist' % (name))
+        return device.port_widths[device.ports.index(port)]
+
+    def _GetPhysicalChanDIPortWidth(self, name, address):
+        _set_value(ctypes.c_uint32, address, self._get_port_width(name))
+
+    def _GetPhysicalChanDOPortWidth(self, name, address):
+        _set_value(ctypes.c_uint32, address, self._get_port_width(name))
+
+    def _ResetDevice(self, name):
+        device = self._get_device(_get_string(name))
+        with self._lock:
+            tasks = [t for t in self.tasks.values()
+                     if t.channels and self._get_device_of(t) is device]
+        for task in tasks:
+            self._stop(task)
+
+    # Tasks
+
+    def _get_task(self, handle):
+        task = self.tasks.get(handle)
+        if task is None:
+            raise self._error('InvalidTask', 'Task handle %r is invalid' % (handle))
+        return task
+
+    def _CreateTask(self, name, address):
+        name = _get_string(name)
+        with self._lock:
+            handle = self._next_handle
+            self._next_handle += 1
+            if not name:
+                name = '_unnamedTask<%d>' % (handle - 1)
+            if any(t.name == name for t in self.tasks.values()):
+                raise self._error('DuplicateTask', 'Task %r already exists' % (name))
+            self.tasks[handle] = _Task(handle, name, self.DAQmx.Val_DoNotAllowRegen)
+        _set_value(ctypes.c_void_p, address, handle)
+
+    def _ClearTask(self, handle):
+        task = self._get_task(handle)
+        self._stop(task)
+        with self._lock:
+            del self.tasks[handle]
+
+    def _GetTaskName(self, handle, address, size):
+        return self._write_string(address, size, self._get_task(handle).name)
+
+    def _GetTaskNumChans(self, handle, address):
+        _set_value(ctypes.c_uint32, address, len(self._get_task(handle).channels))
+
+    def _GetTaskChannels(self, handle, address, size):
+        names = [c.name for c in self._get_task(handle).channels]
+        return self._write_string(address, size, ', '.join(names))
+
+    def _GetTaskDevices(self, handle, address, size):
+        names = []
+        for channel in self._get_task(handle).channels:
+            name = channel.physical_name.split('/')[0]
+            if name not in names:
+                names.append(name)
+        return self._write_string(address, size, ', '.join(names))
+
+    def _get_channels(self, task, names):
+        if not names:
+            return task.channels
+        names = names.strip().lstrip('/')
+        for channel in task.channels:
+            if names in (channel.name, channel.physical_name):
+                return [channel]
+        channels = []
+        for name in expand_channels(names):
+            for channel in task.channels:
+                if name in (channel.name, channel.physical_name):
+                    channels.append(channel)
+                    break
+            else:
+                raise self._error('PhysicalChanDoesNotExist',
+                                  'Channel %r is not in task %r' % (name, task.name))
+        return channels
+
+    def _GetChanType(self, handle, name, address):
+        channel = self._get_channels(self._get_task(handle), _get_string(name))[0]
+        _set_value(ctypes.c_int32, address, channel.props['ChanType'])
+
+    def _GetPhysicalChanName(self, handle, name, address, size):
+        channel = self._get_channels(self._get_task(handle), _get_string(name))[0]
+        return self._write_string(address, size, channel.physical_name)
+
+    # Channels
+
+    def _add_channels(self, handle, channel_type, physical_names, name, props,
+                      line_grouping=None):
+        task = self._get_task(handle)
+        spec = _get_string(physical_names).strip().lstrip('/')
+        physical_names = expand_channels(spec)
+        name = _get_string(name)
+        kinds = dict(AI='ai', AO='ao', CI='ctr', CO='ctr')
+        channels = []
+        for physical_name in physical_names:
+            device = self._get_device(physical_name.split('/')[0])
+            if channel_type in kinds:
+                valid = physical_name in dict(ai=device.ai, ao=device.ao,
+                                              ctr=device.counters)[kinds[channel_type]]
+                signals = [physical_name]
+            else:
+                signals = device.get_lines(physical_name)
+                valid = signals is not None
+            if not valid:
+                raise self._error('PhysicalChanDoesNotExist',
+                                  'Physical channel %r does not exist' % (physical_name))
+            channels.append((physical_name, signals))
+        if channel_type in ('DI', 'DO') and line_grouping == self.DAQmx.Val_ChanForAllLines:
+            # The channel is named after the lines as specified.
+            channels = [(spec, [s for p, signals in channels for s in signals])]
+        elif channel_type in ('DI', 'DO'):
+            channels = [(s, [s]) for p, signals in channels for s in signals]
+        with self._lock:
+            if task.channel_type not in (None, channel_type):
+                raise self._error('PhysicalChanDoesNotExist',
+                                  'Cannot add %s channels to a %s task' % (channel_type, task.channel_type))
+            task.channel_type = channel_type
+            for i, (physical_name, signals) in enumerate(channels):
+                if not name:
+                    channel_name = physical_name
+                elif len(channels) == 1:
+                    channel_name = name
+                else:
+                    channel_name = '%s%d' % (name, i)
+                if any(c.physical_name == physical_name for c in task.channels):
+                    raise self._error('ChanAlreadyInTask',
+                                      'Channel %r is already in the task' % (physical_name))
+                channel_props = dict(props, ChanType=getattr(self.DAQmx, 'Val_' + channel_type))
+                if channel_type in ('DI', 'DO'):
+                    channel_props['%sNumLines' % (channel_type)] = len(signals)
+                task.channels.append(_Channel(channel_name, physical_name, signals, channel_props))
+
+    def _CreateAIVoltageChan(self, handle, physical, name, terminal, min_val, max_val,
+                             units, custom_scale):
+        props = dict(AIMin=min_val, AIMax=max_val, AIRngLow=min(min_val, -10.0),
+                     AIRngHigh=max(max_val, 10.0), AIGain=1.0, AITermCfg=terminal,
+                     AIMeasType=self.DAQmx.Val_Voltage, AIVoltageUnits=units,
+                     AIAutoZeroMode=self.DAQmx.Val_None, AIDataXferMech=self.DAQmx.Val_DMA,
+                     AIResolution=16, AIRawSampSize=16)
+        self._add_channels(handle, 'AI', physical, name, props)
+
+    def _CreateAOVoltageChan(self, handle, physical, name, min_val, max_val, units,
+                             custom_scale):
+        props = dict(AOMin=min_val, AOMax=max_val, AORngLow=min(min_val, -10.0),
+                     AORngHigh=max(max_val, 10.0), AOGain=1.0,
+                     AOOutputType=self.DAQmx.Val_Voltage, AOVoltageUnits=units,
+                     AODataXferMech=self.DAQmx.Val_DMA)
+        self._add_channels(handle, 'AO', physical, name, props)
+
+    def _CreateDIChan(self, handle, lines, name, line_grouping):
+        self._add_channels(handle, 'DI', lines, name, {}, line_grouping)
+
+    def _CreateDOChan(self, handle, lines, name, line_grouping):
+        self._add_channels(handle, 'DO', lines, name, {}, line_grouping)
+
+    def _counter_props(self, meas_type, **props):
+        return dict(props, CIMeasType=meas_type, CICtrTimebaseRate=SimulatedDevice.timebase_rate)
+
+    def _CreateCICountEdgesChan(self, handle, counter, name, edge, initial_count, direction):
+        props = self._counter_props(self.DAQmx.Val_CountEdges, CICountEdgesInitialCnt=initial_count,
+                                    CICountEdgesDir=direction)
+        self._add_channels(handle, 'CI', counter, name, props)
+
+    def _CreateCILinEncoderChan(self, handle, counter, name, decoding, z_enable, z_value,
+                                z_phase, units, distance_per_pulse, initial_position, scale):
+        props = self._counter_props(self.DAQmx.Val_Position_LinEncoder,
+                                    CIEncoderDecodingType=decoding,
+                                    CILinEncoderDistPerPulse=distance_per_pulse,
+                                    CILinEncoderInitialPos=initial_position)
+        self._add_channels(handle, 'CI', counter, name, props)
+
+    def _CreateCIFreqChan(self, handle, counter, name, min_val, max_val, units, edge,
+                          method, meas_time, divisor, scale):
+        props = self._counter_props(self.DAQmx.Val_Freq, CIMin=min_val, CIMax=max_val)
+        self._add_channels(handle, 'CI', counter, name, props)
+
+    def _CreateCOPulseChanFreq(self, handle, counter, name, units, idle_state, initial_delay,
+                               freq, duty_cycle):
+        props = dict(COPulseFreq=freq, COPulseDutyCyc=duty_cycle,
+                     COPulseHighTime=duty_cycle / freq, COPulseLowTime=(1 - duty_cycle) / freq,
+                     COCtrTimebaseRate=SimulatedDevice.timebase_rate)
+        self._add_channels(handle, 'CO', counter, name, props)
+
+    def _CreateCOPulseChanTime(self, handle, counter, name, units, idle_state, initial_delay,
+                               low_time, high_time):
+        props = dict(COPulseFreq=1.0 / (low_time + high_time), COPulseHighTime=high_time,
+                     COPulseLowTime=low_time, COCtrTimebaseRate=SimulatedDevice.timebase_rate)
+        self._add_channels(handle, 'CO', counter, name, props)
+
+    def _CreateCOPulseChanTicks(self, handle, counter, name, source, idle_state, initial_delay,
+                                low_ticks, high_ticks):
+        rate = self._get_timebase_rate(_get_string(source))
+        props = dict(COPulseFreq=rate / (low_ticks + high_ticks), COPulseHighTicks=high_ticks,
+                     COPulseLowTicks=low_ticks, COCtrTimebaseRate=rate)
+        self._add_channels(handle, 'CO', counter, name, props)
+
+    def _get_timebase_rate(self, source):
+        m = re.search(r'(\d+)(k|M)?HzTimebase', source)
+        if m is None:
+            return SimulatedDevice.timebase_rate
+        return int(m.group(1)) * dict(k=1e3, M=1e6).get(m.group(2), 1)
+
+    # Timing and triggering
+
+    def _CfgSampClkTiming(self, handle, source, rate, active_edge, sample_mode, samples):
+        task = self._get_task(handle)
+        if not task.channels:
+            raise self._error('InvalidAttributeValue', 'The task has no channels')
+        max_rate = self._get_device_of(task).max_rates[task.channel_type]
+        if not 0 < rate <= max_rate:
+            raise self._error('InvalidAttributeValue',
+                              'Sample clock rate %s is not in (0, %s]' % (rate, max_rate))
+        with self._lock:
+            task.timed = True
+            task.single_point = sample_mode == self.DAQmx.Val_HWTimedSinglePoint
+            task.rate = rate
+            task.finite = sample_mode == self.DAQmx.Val_FiniteSamps
+            task.samples_per_channel = samples
+            source = _get_string(source)
+            task.clock_source = None if source in ('', 'OnboardClock') else source
+            task.props['SampClkRate'] = rate
+            if task.single_point:
+                size = 0
+            elif task.finite:
+                size = samples
+            else:
+                # The automatic buffer sizes of DAQmx.
+                default = 1000 if rate <= 100 else 10000 if rate <= 10000 else \
+                    100000 if rate <= 1e6 else 1000000
+                size = max(samples, default)
+            task.props['BufInputBufSize' if task.is_input else 'BufOutputBufSize'] = size
+
+    def _CfgImplicitTiming(self, handle, sample_mode, samples):
+        task = self._get_task(handle)
+        with self._lock:
+            task.timed = True
+            task.finite = sample_mode == self.DAQmx.Val_FiniteSamps
+            task.samples_per_channel = samples
+            if task.channel_type == 'CO':
+                task.rate = task.channels[0].props['COPulseFreq']
+
+    def _CfgInputBuffer(self, handle, size):
+        self._get_task(handle).props['BufInputBufSize'] = size
+
+    def _CfgOutputBuffer(self, handle, size):
+        self._get_task(handle).props['BufOutputBufSize'] = size
+
+    def _CfgDigEdgeStartTrig(self, handle, source, edge):
+        self._get_task(handle).start_trigger = _get_string(source)
+
+    def _DisableStartTrig(self, handle):
+        self._get_task(handle).start_trigger = None
+
+    def _get_master(self, task, terminal):
+        """
+        Returns the running task whose sample clock or start trigger
+        terminal is ``terminal``, e.g. '/Dev1/ai/SampleClock', or None.
+        """
+        parts = terminal.strip('/').split('/')
+        if len(parts) < 2:
+            return None
+        kind = parts[-2].upper()
+        device = parts[-3] if len(parts) > 2 else self._get_device_of(task).name
+        for other in self.tasks.values():
+            if (other is not task and other.running and other.channel_type == kind
+                    and self._get_device_of(other).name == device):
+                return other
+        return None
+
+    def _get_master_of(self, task):
+        for terminal in (task.clock_source, task.start_trigger):
+            if terminal:
+                return self._get_master(task, terminal)
+        return None
+
+    # Task control
+
+    def _StartTask(self, handle):
+        task = self._get_task(handle)
+        with self._lock:
+            if task.running:
+                return
+            now = monotonic()
+            task.running = True
+            task.status = 0
+            task.stop_time = None
+            task.read_position = 0
+            task.stopping.clear()
+            master = self._get_master_of(task)
+            if master is None:
+                if task.clock_source or task.start_trigger:
+                    # An unknown terminal never clocks or triggers.
+                    task.t0 = None
+                else:
+                    task.t0 = now
+            elif master.t0 is None:
+                task.t0 = None
+            elif task.clock_source:
+                # Sample on the next edge of the running master clock.
+                edges = math.ceil((now - master.t0) * master.rate)
+                task.t0 = master.t0 + edges / master.rate
+            else:
+                # The start trigger of the master is gone.
+                task.t0 = None
+            if task.channel_type == 'CO' and task.pulse_edges is None and task.rate is None:
+                task.rate = task.channels[0].props['COPulseFreq']
+            if task.t0 is not None:
+                for other in self.tasks.values():
+                    if (other.running and other.t0 is None
+                            and self._get_master_of(other) is task):
+                        other.t0 = task.t0
+            if task.every_n is not None or task.done_event is not None:
+                task.event_thread = threading.Thread(target=self._run_events, args=(task,),
+                                                     name='DAQmx events %s' % (task.name))
+                task.event_thread.daemon = True
+                task.event_thread.start()
+
+    def _stop(self, task):
+        with self._lock:
+            if not task.running:
+                return
+            task.running = False
+            task.stop_time = monotonic()
+            if not task.is_input and task.t0 is not None and task.timed and task.written:
+                # Outputs hold the last generated sample.
+                n = task.clocked(task.stop_time)
+                for column, signal in enumerate(task.signals):
+                    task.static[signal] = task.get_output(column, np.array([max(n - 1, 0)]))[0]
+            task.t0 = None
+            task.written = 0
+            task.stopping.set()
+            thread = task.event_thread
+            task.event_thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _StopTask(self, handle):
+        self._stop(self._get_task(handle))
+
+    def _TaskControl(self, handle, action):
+        task = self._get_task(handle)
+        if action == self.DAQmx.Val_Task_Start:
+            return self._StartTask(handle)
+        if action in (self.DAQmx.Val_Task_Stop, self.DAQmx.Val_Task_Abort):
+            return self._stop(task)
+
+    def _is_done(self, task, now):
+        if not task.running or task.status < 0:
+            return True
+        if not task.timed or not task.finite or task.t0 is None:
+            return False
+        return task.clocked(now) >= task.samples_per_channel
+
+    def _IsTaskDone(self, handle, address):
+        _set_value(ctypes.c_uint32, address, self._is_done(self._get_task(handle), monotonic()))
+
+    def _WaitUntilTaskDone(self, handle, timeout):
+        task = self._get_task(handle)
+        deadline = None if timeout < 0 else monotonic() + timeout
+        while not self._is_done(task, monotonic()):
+            if task.finite and task.t0 is not None:
+                wake = task.time_of_sample(task.samples_per_channel)
+            else:
+                wake = monotonic() + 0.01
+            if deadline is not None and wake > deadline:
+                time.sleep(max(0.0, deadline - monotonic()))
+                if not self._is_done(task, monotonic()):
+                    raise self._error('WaitUntilDoneDoesNotIndicateDone',
+                                      'The task did not complete in %s s' % (timeout))
+                break
+            time.sleep(max(0.0, wake - monotonic()))
+        if task.status < 0:
+            raise self._error(self._error_names[task.status])
+
+    # Events
+
+    def _RegisterEveryNSamplesEvent(self, handle, event_type, samples, options, callback, data):
+        task = self._get_task(handle)
+        if task.running:
+            raise self._error('InvalidAttributeValue',
+                              'Events must be registered while the task is not running')
+        if callback:
+            function_type = ctypes.CFUNCTYPE(ctypes.c_int32, ctypes.c_void_p, ctypes.c_int32,
+                                             ctypes.c_uint32, ctypes.c_void_p)
+            task.every_n = (samples, event_type, function_type(callback), data)
+        else:
+            task.every_n = None
+
+    def _RegisterDoneEvent(self, handle, options, callback, data):
+        task = self._get_task(handle)
+        if callback:
+            function_type = ctypes.CFUNCTYPE(ctypes.c_int32, ctypes.c_void_p, ctypes.c_int32,
+                                             ctypes.c_void_p)
+            task.done_event = (function_type(callback), data)
+        else:
+            task.done_event = None
+
+    def _get_error_time(self, task):
+        """
+        Returns the time at which a running task fails, when unread
+        samples are overwritten or a generation without regeneration
+        runs out of samples, and the error name.
+        """
+        if not task.timed or task.single_point or task.t0 is None:
+            return float('inf'), None
+        if task.is_input:
+            n = task.read_position + task.get_buffer_size() + 1
+            if task.finite and n > task.samples_per_channel:
+                return float('inf'), None
+            return task.time_of_sample(n), 'SamplesNoLongerAvailable'
+        if task.channel_type == 'CO' or task.regenerate:
+            return float('inf'), None
+        if task.finite and task.written >= task.samples_per_channel:
+            return float('inf'), None
+        return task.time_of_sample(task.written + 1), 'GenStoppedToPreventRegenOfOldSamples'
+
+    def _run_events(self, task):
+        fired = 0
+        while not task.stopping.is_set():
+            with self._lock:
+                if task.t0 is None:
+                    wait, action = 0.001, None
+                else:
+                    now = monotonic()
+                    times = []
+                    if task.every_n is not None:
+                        n = (fired + 1) * task.every_n[0]
+                        if not task.finite or n <= task.samples_per_channel:
+                            times.append((task.time_of_sample(n), 'every_n'))
+                    if task.finite and task.timed:
+                        times.append((task.time_of_sample(task.samples_per_channel), 'done'))
+                    error_time, error = self._get_error_time(task)
+                    times.append((error_time, error))
+                    event_time, action = min(times, key=lambda x: x[0])
+                    if event_time == float('inf'):
+                        wait, action = 0.1, None
+                    else:
+                        wait = event_time - now
+                        if wait > 0:
+                            wait, action = min(wait, 0.1), None
+                    if action == 'every_n':
+                        fired += 1
+                        samples, event_type, callback, data = task.every_n
+                        args = (task.handle, event_type, samples, data)
+                    elif action is not None:
+                        status = 0 if action == 'done' else self._error_codes[action]
+                        task.status = status
+                        if status < 0:
+                            task.stop_time = monotonic()
+                        callback = task.done_event and task.done_event[0]
+                        args = (task.handle, status, task.done_event and task.done_event[1])
+            if action is None:
+                task.stopping.wait(wait)
+                continue
+            if callback:
+                callback(*args)
+            if action != 'every_n':
+                return
+
+    # Reading
+
+    def _check_read(self, task, channel_type):
+        if task.channel_type != channel_type:
+            raise self._error('ReadNoInputChansInTask', 'The task has no %s channels' % (channel_type))
+        if task.status < 0:
+            raise self._error(self._error_names[task.status])
+        if task.timed and not task.running:
+            self._StartTask(task.handle)
+
+    def _wait_for_samples(self, task, samples, timeout):
+        """
+        Waits until ``samples`` samples per channel can be read and
+        returns the sample indices to read. Raises an error when
+        samples were overwritten or after ``timeout`` seconds.
+        """
+        now = monotonic()
+        available = task.clocked(now) - task.read_position
+        if available > task.get_buffer_size():
+            raise self._error('SamplesNoLongerAvailable',
+                              'Samples were overwritten before they were read')
+        if samples == -1:
+            if task.finite:
+                samples = task.samples_per_channel - task.read_position
+            else:
+                samples = available
+        if task.finite:
+            samples = min(samples, task.samples_per_channel - task.read_position)
+        error = None
+        if available < samples:
+            if task.t0 is None:
+                sample_time = float('inf')
+            else:
+                sample_time = task.time_of_sample(task.read_position + samples)
+            if timeout >= 0 and sample_time > now + timeout:
+                time.sleep(timeout)
+                error = 'SamplesNotYetAvailable'
+            else:
+                time.sleep(max(0.0, sample_time - now))
+            samples = min(samples, task.clocked(monotonic()) - task.read_position)
+        indices = np.arange(task.read_position, task.read_position + samples)
+        task.read_position += samples
+        return indices, error
+
+    def _get_sample_times(self, task, indices):
+        if not task.timed:
+            return np.repeat(monotonic(), len(indices))
+        return task.t0 + (indices + 1) / task.rate
+
+    def _wait_for_latest_sample(self, task, timeout):
+        """
+        Returns the index of the latest sample of a hardware-timed
+        single point task, waiting for the first sample clock edge.
+        """
+        if task.t0 is None:
+            time.sleep(max(0.0, timeout))
+            return np.zeros(0, dtype=np.int64), 'SamplesNotYetAvailable'
+        n = task.clocked(monotonic())
+        if n == 0:
+            time.sleep(max(0.0, task.time_of_sample(1) - monotonic()))
+            n = 1
+        return np.array([n - 1]), None
+
+    def _WaitForNextSampleClock(self, handle, timeout, late_address):
+        task = self._get_task(handle)
+        if not task.single_point:
+            raise self._error('WaitForNextSampClkNotSupported')
+        if not task.running:
+            raise self._error('CannotPerformOpWhenTaskNotRunning')
+        _set_value(ctypes.c_uint32, late_address, 0)
+        now = monotonic()
+        if task.t0 is None:
+            time.sleep(max(0.0, timeout))
+            raise self._error('SamplesNotYetAvailable', 'No sample clock edge in %s s' % (timeout))
+        n = task.clocked(now)
+        # read_position holds the sample clock edge of the last wait.
+        if n > task.read_position + 1:
+            missed = n - task.read_position - 1
+            task.read_position = n
+            _set_value(ctypes.c_uint32, late_address, 1)
+            raise self._error('WaitForNextSampClkDetectedMissedSampClk',
+                              'Missed %d sample clock edges' % (missed))
+        task.read_position += 1
+        wake = task.time_of_sample(task.read_position)
+        if timeout >= 0 and wake > now + timeout:
+            time.sleep(timeout)
+            task.read_position -= 1
+            raise self._error('SamplesNotYetAvailable', 'No sample clock edge in %s s' % (timeout))
+        time.sleep(max(0.0, wake - now))
+
+    def _read(self, task, samples, timeout):
+        """
+        Returns the input values with shape ``(samples, signals)`` of
+        the next samples, and an error name or None.
+        """
+        if task.single_point:
+            indices, error = self._wait_for_latest_sample(task, timeout)
+        elif task.timed:
+            indices, error = self._wait_for_samples(task, samples, timeout)
+        else:
+            indices, error = np.zeros(1 if samples == -1 else samples, dtype=np.int64), None
+        times = self._get_sample_times(task, indices)
+        with self._lock:
+            values = np.empty((len(indices), len(task.signals)))
+            for column, signal in enumerate(task.signals):
+                values[:, column] = self._get_input(signal, times)
+        return values, error
+
+    def _store(self, values, address, size, dtype, fill_mode, samples):
+        """
+        Stores ``values`` with shape ``(samples read, values per
+        sample)`` into the array at ``address``.
+        """
+        out = _get_array(dtype, address, size)
+        n, m = values.shape
+        if fill_mode == self.DAQmx.Val_GroupByScanNumber:
+            out[:n * m] = values.ravel()
+        else:
+            stride = max(samples, n)
+            out[:stride * m].reshape(m, stride)[:, :n] = values.T
+
+    def _ReadAnalogF64(self, handle, samples, timeout, fill_mode, address, size,
+                       read_address, reserved):
+        task = self._get_task(handle)
+        self._check_read(task, 'AI')
+        values, error = self._read(task, samples, timeout)
+        for column, channel in enumerate(task.channels):
+            np.clip(values[:, column], channel.props['AIMin'], channel.props['AIMax'],
+                    out=values[:, column])
+        self._store(values, address, size, ctypes.c_double, fill_mode, samples)
+        _set_value(ctypes.c_int32, read_address, len(values))
+        if error:
+            raise self._error(error, 'Some or all of the samples requested have not yet been acquired')
+
+    def _ReadAnalogScalarF64(self, handle, timeout, address, reserved):
+        task = self._get_task(handle)
+        self._check_read(task, 'AI')
+        values, error = self._read(task, 1, timeout)
+        channel = task.channels[0]
+        _set_value(ctypes.c_double, address,
+                   min(max(values[0, 0], channel.props['AIMin']), channel.props['AIMax']))
+
+    def _get_scaling_coefficients(self, channel):
+        """
+        Returns the coefficients of the polynomial that scales raw
+        samples of an analog input ``channel`` to volts: a linear
+        mapping of the codes of a 16 bit converter to the input range,
+        offset by a quarter code.
+        """
+        props = channel.props
+        gain = (props['AIRngHigh'] - props['AIRngLow']) / 65536.0
+        return np.array([0.25 * gain, gain, 0.0, 0.0])
+
+    def _GetAIDevScalingCoeff(self, handle, name, address, size):
+        channel = self._get_channels(self._get_task(handle), _get_string(name))[0]
+        coefficients = self._get_scaling_coefficients(channel)
+        if size == 0:
+            return len(coefficients)
+        out = _get_array(ctypes.c_double, address, size)
+        n = min(size, len(coefficients))
+        out[:n] = coefficients[:n]
+
+    def _read_binary(self, ctype, handle, samples, timeout, fill_mode, address, size,
+                     read_address):
+        task = self._get_task(handle)
+        self._check_read(task, 'AI')
+        values, error = self._read(task, samples, timeout)
+        for column, channel in enumerate(task.channels):
+            coefficients = self._get_scaling_coefficients(channel)
+            values[:, column] = np.clip(np.round((values[:, column] - coefficients[0])
+                                                 / coefficients[1]), -32768, 32767)
+        self._store(values, address, size, ctype, fill_mode, samples)
+        _set_value(ctypes.c_int32, read_address, len(values))
+        if error:
+            raise self._error(error, 'Some or all of the samples requested have not yet been acquired')
+
+    def _ReadBinaryI16(self, handle, samples, timeout, fill_mode, address, size,
+                       read_address, reserved):
+        self._read_binary(ctypes.c_int16, handle, samples, timeout, fill_mode, address, size,
+                          read_address)
+
+    def _ReadBinaryI32(self, handle, samples, timeout, fill_mode, address, size,
+                       read_address, reserved):
+        self._read_binary(ctypes.c_int32, handle, samples, timeout, fill_mode, address, size,
+                          read_address)
+
+    def _ReadDigitalLines(self, handle, samples, timeout, fill_mode, address, size,
+                          read_address, bytes_address, reserved):
+        task = self._get_task(handle)
+        self._check_read(task, 'DI')
+        values, error = self._read(task, samples, timeout)
+        bytes_per_sample = max(len(c.signals) for c in task.channels)
+        n = len(values)
+        lines = np.zeros((n, len(task.channels), bytes_per_sample), dtype=np.uint8)
+        column = 0
+        for i, channel in enumerate(task.channels):
+            k = len(channel.signals)
+            lines[:, i, :k] = values[:, column:column + k] != 0
+            column += k
+        lines = lines.reshape(n, -1)
+        out = _get_array(ctypes.c_uint8, address, size)
+        if fill_mode == self.DAQmx.Val_GroupByScanNumber:
+            out[:lines.size] = lines.ravel()
+        else:
+            stride = max(samples, n)
+            by_channel = lines.reshape(n, len(task.channels), bytes_per_sample).transpose(1, 0, 2)
+            out[:stride * lines.shape[1]].reshape(len(task.channels), stride,
+                                                  bytes_per_sample)[:, :n] = by_channel
+        _set_value(ctypes.c_int32, read_address, n)
+        _set_value(ctypes.c_int32, bytes_address, bytes_per_sample)
+        if error:
+            raise self._error(error, 'Some or all of the samples requested have not yet been acquired')
+
+    def _read_digital_port(self, ctype, handle, samples, timeout, fill_mode, address, size,
+                           read_address):
+        task = self._get_task(handle)
+        self._check_read(task, 'DI')
+        values, error = self._read(task, samples, timeout)
+        packed = np.zeros((len(values), len(task.channels)), dtype=np.uint64)
+        column = 0
+        for i, channel in enumerate(task.channels):
+            for signal in channel.signals:
+                line = int(re.search(r'line(\d+)$', signal).group(1))
+                packed[:, i] |= (values[:, column] != 0).astype(np.uint64) << np.uint64(line)
+                column += 1
+        self._store(packed, address, size, ctype, fill_mode, samples)
+        _set_value(ctypes.c_int32, read_address, len(values))
+        if error:
+            raise self._error(error, 'Some or all of the samples requested have not yet been acquired')
+
+    def _ReadDigitalU8(self, handle, samples, timeout, fill_mode, address, size,
+                       read_address, reserved):
+        self._read_digital_port(ctypes.c_uint8, handle, samples, timeout, fill_mode, address,
+                                size, read_address)
+
+    def _ReadDigitalU16(self, handle, samples, timeout, fill_mode, address, size,
+                        read_address, reserved):
+        self._read_digital_port(ctypes.c_uint16, handle, samples, timeout, fill_mode, address,
+                                size, read_address)
+
+    def _ReadDigitalU32(self, handle, samples, timeout, fill_mode, address, size,
+                        read_address, reserved):
+        self._read_digital_port(ctypes.c_uint32, handle, samples, timeout, fill_mode, address,
+                                size, read_address)
+
+    def _get_counts(self, task, values):
+        channel = task.channels[0]
+        counts = values[:, 0]
+        if task.t0 is not None:
+            counts = counts - self._get_input(channel.physical_name, np.array([task.t0]))[0]
+        return counts + channel.props.get('CICountEdgesInitialCnt', 0)
+
+    def _ReadCounterU32(self, handle, samples, timeout, address, size, read_address, reserved):
+        task = self._get_task(handle)
+        self._check_read(task, 'CI')
+        values, error = self._read(task, samples, timeout)
+        counts = np.floor(self._get_counts(task, values)).astype(np.int64) % (1 << 32)
+        _get_array(ctypes.c_uint32, address, size)[:len(counts)] = counts
+        _set_value(ctypes.c_int32, read_address, len(counts))
+        if error:
+            raise self._error(error, 'Some or all of the samples requested have not yet been acquired')
+
+    def _ReadCounterF64(self, handle, samples, timeout, address, size, read_address, reserved):
+        task = self._get_task(handle)
+        self._check_read(task, 'CI')
+        values, error = self._read(task, samples, timeout)
+        channel = task.channels[0]
+        if channel.props['CIMeasType'] == self.DAQmx.Val_Freq and task.timed:
+            # Frequency over each sample clock period.
+            n = len(values)
+            times = self._get_sample_times(task, np.arange(task.read_position - n,
+                                                           task.read_position))
+            previous = self._get_input(channel.physical_name, times - 1.0 / task.rate)
+            measured = (values[:, 0] - previous) * task.rate
+        else:
+            measured = self._get_counts(task, values)
+        _get_array(ctypes.c_double, address, size)[:len(measured)] = measured
+        _set_value(ctypes.c_int32, read_address, len(measured))
+        if error:
+            raise self._error(error, 'Some or all of the samples requested have not yet been acquired')
+
+    def _ReadCounterScalarF64(self, handle, timeout, address, reserved):
+        task = self._get_task(handle)
+        self._check_read(task, 'CI')
+        channel = task.channels[0]
+        now = monotonic()
+        counts = self._get_input(channel.physical_name, np.array([now - 0.01, now]))
+        if channel.props['CIMeasType'] == self.DAQmx.Val_Freq:
+            value = (counts[1] - counts[0]) / 0.01
+        else:
+            value = self._get_counts(task, counts[1:, None])[0]
+        _set_value(ctypes.c_double, address, value)
+
+    def _GetReadAvailSampPerChan(self, handle, address):
+        task = self._get_task(handle)
+        available = task.clocked(monotonic()) - task.read_position if task.timed else 0
+        _set_value(ctypes.c_uint32, address, min(available, task.get_buffer_size()))
+
+    def _GetReadTotalSampPerChanAcquired(self, handle, address):
+        task = self._get_task(handle)
+        _set_value(ctypes.c_uint64, address, task.clocked(monotonic()))
+
+    def _GetReadCurrReadPos(self, handle, address):
+        _set_value(ctypes.c_uint64, address, self._get_task(handle).read_position)
+
+    # Writing
+
+    def _write(self, task, values, auto_start, timeout):
+        """
+        Writes ``values`` with shape ``(samples, signals)`` and
+        returns the number of samples written.
+        """
+        if task.status < 0:
+            raise self._error(self._error_names[task.status])
+        if not task.timed or task.single_point:
+            with self._lock:
+                for column, signal in enumerate(task.signals):
+                    task.static[signal] = values[-1, column]
+            if auto_start and task.timed and not task.running:
+                self._StartTask(task.handle)
+            return len(values)
+        samples = len(values)
+        with self._lock:
+            size = task.get_buffer_size()
+            if not task.running and task.written == 0 and samples > size:
+                size = task.props['BufOutputBufSize'] = samples
+            if task.buffer is None or task.buffer.shape != (size, len(task.signals)):
+                task.buffer = np.zeros((size, len(task.signals)))
+        if samples > size:
+            raise self._error('InvalidNumSampsToWrite',
+                              'Writing %s samples exceeds the buffer of %s samples' % (samples, size))
+        error = None
+        if task.running and task.t0 is not None:
+            needed = task.written + samples - size
+            generated = task.clocked(monotonic())
+            if generated < needed:
+                wake = task.time_of_sample(needed)
+                now = monotonic()
+                if timeout >= 0 and wake > now + timeout:
+                    time.sleep(timeout)
+                    error = 'SamplesCanNotYetBeWritten'
+                else:
+                    time.sleep(max(0.0, wake - now))
+                samples = max(0, min(samples, size - task.written + task.clocked(monotonic())))
+        elif task.running and task.written + samples > size:
+            samples = size - task.written
+            error = 'SamplesCanNotYetBeWritten'
+        with self._lock:
+            indices = np.arange(task.written, task.written + samples) % size
+            task.buffer[indices] = values[:samples]
+            task.written += samples
+        if auto_start and not task.running:
+            self._StartTask(task.handle)
+        if error:
+            raise self._error(error if error in self._error_codes else 'SamplesNotYetAvailable',
+                              'Not all samples could be written in %s s' % (timeout))
+        return samples
+
+    def _get_values(self, address, samples, columns, dtype, layout):
+        data = _get_array(dtype, address, samples * columns).astype(np.float64)
+        if layout == self.DAQmx.Val_GroupByScanNumber:
+            return data.reshape(samples, columns)
+        return data.reshape(columns, samples).T
+
+    def _WriteAnalogF64(self, handle, samples, auto_start, timeout, layout, address,
+                        written_address, reserved):
+        task = self._get_task(handle)
+        values = self._get_values(address, samples, len(task.channels), ctypes.c_double, layout)
+        _set_value(ctypes.c_int32, written_address, 0)
+        written = self._write(task, values, auto_start, timeout)
+        _set_value(ctypes.c_int32, written_address, written)
+
+    def _WriteAnalogScalarF64(self, handle, auto_start, timeout, value, reserved):
+        task = self._get_task(handle)
+        self._write(task, np.array([[value]]), auto_start, timeout)
+
+    def _WriteDigitalLines(self, handle, samples, auto_start, timeout, layout, address,
+                           written_address, reserved):
+        task = self._get_task(handle)
+        lines_per_channel = max(len(c.signals) for c in task.channels)
+        data = self._get_values(address, samples, len(task.channels) * lines_per_channel,
+                                ctypes.c_uint8, self.DAQmx.Val_GroupByScanNumber)
+        if layout != self.DAQmx.Val_GroupByScanNumber:
+            data = data.T.reshape(len(task.channels), samples, lines_per_channel)
+            data = data.transpose(1, 0, 2).reshape(samples, -1)
+        data = data.reshape(samples, len(task.channels), lines_per_channel)
+        values = np.concatenate([data[:, i, :len(c.signals)] for i, c in enumerate(task.channels)],
+                                axis=1)
+        _set_value(ctypes.c_int32, written_address, 0)
+        written = self._write(task, values, auto_start, timeout)
+        _set_value(ctypes.c_int32, written_address, written)
+
+    def _write_digital_port(self, ctype, handle, samples, auto_start, timeout, layout, address,
+                            written_address):
+        task = self._get_task(handle)
+        packed = self._get_values(address, samples, len(task.channels), ctype,
+                                  layout).astype(np.uint64)
+        columns = []
+        for i, channel in enumerate(task.channels):
+            for signal in channel.signals:
+                line = np.uint64(int(re.search(r'line(\d+)$', signal).group(1)))
+                columns.append((packed[:, i] >> line) & np.uint64(1))
+        values = np.array(columns, dtype=np.float64).T.reshape(samples, len(columns))
+        _set_value(ctypes.c_int32, written_address, 0)
+        written = self._write(task, values, auto_start, timeout)
+        _set_value(ctypes.c_int32, written_address, written)
+
+    def _WriteDigitalU8(self, handle, samples, auto_start, timeout, layout, address,
+                        written_address, reserved):
+        self._write_digital_port(ctypes.c_uint8, handle, samples, auto_start, timeout, layout,
+                                 address, written_address)
+
+    def _WriteDigitalU16(self, handle, samples, auto_start, timeout, layout, address,
+                         written_address, reserved):
+        self._write_digital_port(ctypes.c_uint16, handle, samples, auto_start, timeout, layout,
+                                 address, written_address)
+
+    def _WriteDigitalU32(self, handle, samples, auto_start, timeout, layout, address,
+                         written_address, reserved):
+        self._write_digital_port(ctypes.c_uint32, handle, samples, auto_start, timeout, layout,
+                                 address, written_address)
+
+    def _WriteDigitalScalarU32(self, handle, auto_start, timeout, value, reserved):
+        value = ctypes.c_uint32(value)
+        self._write_digital_port(ctypes.c_uint32, handle, 1, auto_start, timeout,
+                                 self.DAQmx.Val_GroupByScanNumber, ctypes.addressof(value), None)
+
+    def _WriteCtrTicks(self, handle, samples, auto_start, timeout, layout, high_address,
+                       low_address, written_address, reserved):
+        task = self._get_task(handle)
+        high = _get_array(ctypes.c_uint32, high_address, samples).astype(np.float64)
+        low = _get_array(ctypes.c_uint32, low_address, samples).astype(np.float64)
+        rate = task.channels[0].props['COCtrTimebaseRate']
+        with self._lock:
+            periods = (high + low) / rate
+            edges = np.cumsum(periods)
+            if task.running and task.pulse_edges is not None:
+                edges += task.pulse_edges[-1]
+                task.pulse_edges = np.concatenate([task.pulse_edges, edges])
+            else:
+                task.pulse_edges = edges
+            task.finite = False
+            task.timed = True
+        _set_value(ctypes.c_int32, written_address, samples)
+        if auto_start and not task.running:
+            self._StartTask(handle)
+
+    def _GetWriteTotalSampPerChanGenerated(self, handle, address):
+        task = self._get_task(handle)
+        _set_value(ctypes.c_uint64, address, task.clocked(monotonic()))
+
+    def _GetWriteCurrWritePos(self, handle, address):
+        _set_value(ctypes.c_uint64, address, self._get_task(handle).written)
+
+    def _GetWriteSpaceAvail(self, handle, address):
+        task = self._get_task(handle)
+        space = task.get_buffer_size() - task.written + task.clocked(monotonic())
+        _set_value(ctypes.c_uint32, address, max(0, min(space, task.get_buffer_size())))
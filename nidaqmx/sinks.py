@@ -0,0 +1,243 @@
+"""
+Disk sinks for data read from input tasks.
+
+`NpySink` captures samples into a growing ``.npy`` file through a
+memory map, so that reads store samples directly in the file. The
+file can be opened while or after capturing with
+``np.load(filename, mmap_mode='r')``. Channel information from the
+task is stored in a sidecar ``.json`` file, see `get_task_metadata`.
+With ``raw=True`` the unscaled samples of `AnalogInputTask.read_raw`
+are captured instead, a quarter of the size, and the sidecar file
+holds the coefficients to scale them, see `nidaqmx.scaling`.
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import os
+import json
+
+import numpy as np
+
+from .libnidaqmx import _get_or_none
+
+__all__ = ['NpySink', 'get_task_metadata']
+
+def get_task_metadata(task):
+    """
+    Returns a dictionary of task properties that describe the data
+    read from ``task``: the task name, the sample clock rate and the
+    name, units and minimum and maximum value of each channel.
+    Properties that the task does not support are None.
+    """
+    channels = []
+    has_range = task.channel_type in ('AI', 'AO', 'CI', 'CO')
+    for name in task.get_names_of_channels():
+        # get_units knows the units of voltage channels only.
+        has_units = (task.channel_type in ('AI', 'AO')
+                     and _get_or_none(task.get_measurment_type, name) == 'voltage')
+        channels.append(dict(name=name,
+                             units=_get_or_none(task.get_units, name) if has_units else None,
+                             min=_get_or_none(task.get_min, name) if has_range else None,
+                             max=_get_or_none(task.get_max, name) if has_range else None))
+    return dict(task=task.name,
+                sample_clock_rate=_get_or_none(task.get_sample_clock_rate),
+                channels=channels)
+
+class NpySink(object):
+    """
+    Captures samples of an analog input task into a ``.npy`` file
+    with shape ``(samples, channels)``.
+
+    The file is extended through a memory map as samples arrive, in
+    steps of at least `grow_samples` samples per channel. On `close`,
+    the file is truncated to the samples captured and its header is
+    updated. The header is written with room to spare, so that the
+    shape can be updated in place.
+
+    Parameters
+    ----------
+
+    filename : str
+      Name of the ``.npy`` file, created or overwritten.
+
+    task : AnalogInputTask
+      The task to read from. Its channels must be created.
+
+    samples_per_channel : int
+      The number of samples, per channel, to preallocate, for
+      example the length of a finite acquisition.
+
+    grow_samples : int
+      The minimum number of samples, per channel, by which the file
+      is extended when it is full.
+
+    metadata_filename : {str, None}
+      Name of the sidecar file of `get_task_metadata`, by default
+      `filename` with a ``.json`` extension.
+
+    raw : bool
+      If True then raw samples are captured with
+      `AnalogInputTask.read_raw`, and the scaling coefficients of the
+      channels are stored in the sidecar file under
+      ``'scaling_coefficients'``.
+
+    dtype : {numpy.float64, numpy.float32}
+      The dtype of the samples when `raw` is False. float32 samples
+      take half the space, see `AnalogInputTask.read_into`.
+
+    Examples
+    --------
+
+    ::
+
+      with NpySink('capture.npy', task) as sink:
+          task.start()
+          while ...:
+              sink.read(10000)
+      data = np.load('capture.npy', mmap_mode='r')
+    """
+
+    header_size = 128
+
+    def __init__(self, filename, task, samples_per_channel=0, grow_samples=1 << 20,
+                 metadata_filename=None, raw=False, dtype=np.float64):
+        self.filename = filename
+        self.task = task
+        self.grow_samples = grow_samples
+        if metadata_filename is None:
+            metadata_filename = os.path.splitext(filename)[0] + '.json'
+        self.metadata_filename = metadata_filename
+        self.raw = raw
+        self.number_of_channels = task._get_cached_number_of_channels()
+        self.samples_written = 0
+        self.metadata = get_task_metadata(task)
+        if raw:
+            self.dtype = task._get_raw_dtype()
+            self.metadata['scaling_coefficients'] = task.get_scaler().coefficients.tolist()
+        else:
+            self.dtype = task._check_read_dtype(dtype)
+        self._write_metadata()
+        self._file = open(filename, 'w+b')
+        self._map = None
+        self._capacity = 0
+        self._write_header(0)
+        self._reserve(samples_per_channel)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_header(self, samples):
+        header = "{'descr': %r, 'fortran_order': False, 'shape': (%d, %d), }" % (
+            str(np.lib.format.dtype_to_descr(self.dtype)), samples, self.number_of_channels)
+        header = header.encode('latin1')
+        size = self.header_size - 10
+        if len(header) >= size:
+            raise ValueError('.npy header of %s bytes does not fit into %s bytes'
+                             % (len(header) + 11, self.header_size))
+        magic = np.lib.format.magic(1, 0)
+        self._file.seek(0)
+        self._file.write(magic + np.array([size], dtype='<u2').tobytes()
+                         + header.ljust(size - 1) + b'\n')
+        self._file.flush()
+
+    def _write_metadata(self, **extra):
+        metadata = dict(self.metadata, dtype=self.dtype.str,
+                        fill_mode='group_by_scan_number', **extra)
+        with open(self.metadata_filename, 'w') as f:
+            f.write(json.dumps(metadata, indent=2, sort_keys=True))
+
+    def _reserve(self, samples_per_channel):
+        """
+        Makes room in the file for ``samples_per_channel`` samples
+        after the samples written.
+        """
+        needed = self.samples_written + samples_per_channel
+        if needed <= self._capacity and self._map is not None:
+            return
+        capacity = max(needed, self._capacity + self.grow_samples, 1)
+        row_size = self.number_of_channels * self.dtype.itemsize
+        if self._map is not None:
+            self._map.flush()
+            self._map = None
+        self._file.truncate(self.header_size + capacity * row_size)
+        self._map = np.memmap(self._file, dtype=self.dtype, mode='r+', offset=self.header_size,
+                              shape=(capacity, self.number_of_channels))
+        self._capacity = capacity
+
+    @property
+    def data(self):
+        """
+        View of the samples captured so far.
+        """
+        return self._map[:self.samples_written]
+
+    def read(self, samples_per_channel=None, timeout=10.0):
+        """
+        Reads samples from the task directly into the file.
+
+        Parameters
+        ----------
+
+        samples_per_channel : {int, None}
+          The number of samples, per channel, to read. If None or -1
+          then the samples currently available are read.
+
+        timeout : float
+          See `AnalogInputTask.read`.
+
+        Returns
+        -------
+
+        samples_read : int
+          The number of samples, per channel, read.
+        """
+        if samples_per_channel is None or samples_per_channel == -1:
+            samples_per_channel = self.task.get_samples_per_channel_available()
+        if not samples_per_channel:
+            return 0
+        self._reserve(samples_per_channel)
+        start = self.samples_written
+        read = self.task.read_raw if self.raw else self.task.read
+        data = read(samples_per_channel, timeout,
+                    out=self._map[start:start + samples_per_channel])
+        self.samples_written += len(data)
+        return len(data)
+
+    def write(self, data):
+        """
+        Appends samples read elsewhere, for example blocks of
+        `Task.iter_blocks` or `StreamingReader.read_blocks` read in
+        'group_by_scan_number' fill mode.
+        """
+        data = np.asarray(data).reshape(-1, self.number_of_channels)
+        self._reserve(len(data))
+        start = self.samples_written
+        self._map[start:start + len(data)] = data
+        self.samples_written += len(data)
+
+    def flush(self):
+        """
+        Flushes the samples captured and updates the header, so that
+        the file can be loaded while capturing continues.
+        """
+        self._map.flush()
+        self._write_header(self.samples_written)
+
+    def close(self):
+        """
+        Truncates the file to the samples captured, updates its header
+        and the sidecar file, and closes the file.
+        """
+        if self._file is None:
+            return
+        self._map.flush()
+        self._map = None
+        row_size = self.number_of_channels * self.dtype.itemsize
+        self._file.truncate(self.header_size + self.samples_written * row_size)
+        self._write_header(self.samples_written)
+        self._file.close()
+        self._file = None
+        self._write_metadata(samples_per_channel=self.samples_written)
@@ -0,0 +1,497 @@
+"""
+Background acquisition of continuous input tasks.
+
+`StreamingReader` owns a thread that reads fixed-size blocks from an
+input task into a preallocated ring buffer, so that the driver
+buffer is drained at the acquisition rate independently of how fast
+the consumers of the data are.
+
+`StreamingWriter` owns a thread that writes blocks from a generator
+or queue to a non-regenerating analog output task, keeping the output
+buffer filled ahead of the generation.
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import threading
+
+try:
+    from queue import Empty
+except ImportError:
+    from Queue import Empty
+
+import numpy as np
+
+__all__ = ['StreamingReader', 'StreamingWriter']
+
+class StreamingReader(object):
+    """
+    Reads blocks of samples from a running input task on a background
+    thread into a ring buffer of `n_blocks` blocks.
+
+    Each block read gets a sequence number, starting from 0. Blocks
+    are handed out by `read_blocks`, the most recent samples by
+    `get_latest`. When a consumer of `read_blocks` falls behind by
+    more than ``n_blocks - 1`` blocks, the oldest blocks are dropped
+    and counted in `overruns`; the reading thread never waits for
+    consumers.
+
+    Parameters
+    ----------
+
+    task : {AnalogInputTask, DigitalInputTask, CounterInputTask}
+      A task with channels and continuous sample clock timing
+      configured. `start` and `stop` start and stop the task.
+
+    samples_per_block : int
+      The number of samples, per channel, in one block.
+
+    n_blocks : int
+      The number of blocks in the ring buffer, at least 2. One block
+      is always being written, so ``n_blocks - 1`` blocks are
+      available to consumers.
+
+    timeout : float
+      Timeout, in seconds, of reading one block, see
+      `AnalogInputTask.read`.
+
+    fill_mode : {'group_by_scan_number', 'group_by_channel'}
+      Layout of a block: ``(samples_per_block, channels)`` for
+      'group_by_scan_number', ``(channels, samples_per_block)`` for
+      'group_by_channel'. Blocks of counter input tasks have shape
+      ``(samples_per_block,)``.
+
+    dtype : {None, numpy.dtype}
+      The dtype of the ring buffer, see `AnalogInputTask.read_into`
+      and `CounterInputTask.read_into`. By default, the dtype that
+      `Task.iter_blocks` uses for the task.
+
+    Examples
+    --------
+
+    ::
+
+      task = AnalogInputTask()
+      task.create_voltage_channel('Dev1/ai0:3', min_val=-10.0, max_val=10.0)
+      task.configure_timing_sample_clock(rate=100000.0)
+      with StreamingReader(task, 10000) as reader:
+          while ...:
+              sequence_numbers, blocks = reader.read_blocks(timeout=1.0)
+              ...
+    """
+
+    def __init__(self, task, samples_per_block, n_blocks=16, timeout=10.0,
+                 fill_mode='group_by_scan_number', dtype=None):
+        if n_blocks < 2:
+            raise ValueError('StreamingReader needs at least 2 blocks, got %s' % (n_blocks))
+        self.task = task
+        self.samples_per_block = samples_per_block
+        self.n_blocks = n_blocks
+        self.timeout = timeout
+        self.fill_mode = fill_mode
+        if fill_mode not in ('group_by_scan_number', 'group_by_channel'):
+            raise ValueError('Unknown fill_mode %r' % (fill_mode))
+        block = task._new_read_block(samples_per_block, fill_mode, dtype)
+        self.buffer = np.zeros((n_blocks,) + block.shape, dtype=block.dtype)
+        # The axis of the samples in a block.
+        self._axis = 1 if block.ndim == 2 and fill_mode == 'group_by_channel' else 0
+        # Sequence number of the block being read by the thread, that
+        # is, the number of complete blocks.
+        self.blocks_read = 0
+        self.overruns = 0
+        self.error = None
+        self._next_block = 0
+        self._condition = threading.Condition()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def running(self):
+        """
+        True while the reading thread is alive.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        Starts the task and the reading thread.
+        """
+        if self.running:
+            raise RuntimeError('StreamingReader is already running')
+        self._stopping.clear()
+        self.task.start()
+        self._thread = threading.Thread(target=self._run, name='StreamingReader(%s)' % (self.task))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the reading thread, waiting for the block being read,
+        and stops the task. Blocks already read can still be
+        retrieved.
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.task.stop()
+        with self._condition:
+            self._condition.notify_all()
+
+    def _run(self):
+        task = self.task
+        buf = self.buffer
+        try:
+            while not self._stopping.is_set():
+                task._read_block(buf[self.blocks_read % self.n_blocks], self.samples_per_block,
+                                 self.timeout, self.fill_mode)
+                with self._condition:
+                    self.blocks_read += 1
+                    self._condition.notify_all()
+        except Exception as msg: # pylint: disable=broad-except
+            with self._condition:
+                self.error = msg
+                self._condition.notify_all()
+
+    def _first_valid(self):
+        # The block with sequence number blocks_read - n_blocks is
+        # being overwritten by the thread.
+        return self.blocks_read - self.n_blocks + 1
+
+    def _check_error(self):
+        if self.error is not None:
+            raise self.error
+
+    def read_blocks(self, max_blocks=None, timeout=None):
+        """
+        Returns the blocks read since the previous call.
+
+        Parameters
+        ----------
+
+        max_blocks : {int, None}
+          The maximum number of blocks to return.
+
+        timeout : {float, None}
+          The time, in seconds, to wait for a block when none is
+          available. None waits until a block is read or the reader
+          is stopped.
+
+        Returns
+        -------
+
+        sequence_numbers : numpy.ndarray
+          Sequence numbers of the returned blocks. Gaps correspond to
+          blocks counted in `overruns`.
+
+        blocks : numpy.ndarray
+          Copies of the blocks with shape ``(len(sequence_numbers),)
+          + block shape``.
+
+        Raises the exception of the reading thread once all blocks
+        read before the exception have been returned.
+        """
+        with self._condition:
+            if self._next_block >= self.blocks_read and self.error is None and self.running:
+                self._condition.wait(timeout)
+            end = self.blocks_read
+            start = max(self._next_block, self._first_valid())
+            if start >= end:
+                self._check_error()
+        if max_blocks is not None:
+            end = min(end, start + max_blocks)
+        sequence_numbers = np.arange(start, max(start, end))
+        blocks = self.buffer[sequence_numbers % self.n_blocks]
+        with self._condition:
+            first_valid = self._first_valid()
+        if first_valid > start:
+            # Blocks were overwritten while copying them.
+            dropped = min(first_valid, end) - start
+            sequence_numbers = sequence_numbers[dropped:]
+            blocks = blocks[dropped:]
+            start += dropped
+        self.overruns += start - self._next_block
+        self._next_block = max(start, end)
+        return sequence_numbers, blocks
+
+    def get_latest(self, samples_per_channel):
+        """
+        Returns a copy of the most recently read samples, without
+        affecting `read_blocks`.
+
+        Parameters
+        ----------
+
+        samples_per_channel : int
+          The number of samples, per channel, to return, at most
+          ``(n_blocks - 1) * samples_per_block``. Fewer samples are
+          returned while fewer have been read.
+
+        Returns
+        -------
+
+        data : numpy.ndarray
+          Samples organized according to `fill_mode`.
+        """
+        n = samples_per_channel
+        spb = self.samples_per_block
+        if n > (self.n_blocks - 1) * spb:
+            raise ValueError('Ring buffer holds %s samples per channel but %s were requested'
+                             % ((self.n_blocks - 1) * spb, n))
+        axis = self._axis
+        while True:
+            with self._condition:
+                end = self.blocks_read
+                if end == 0:
+                    self._check_error()
+            start = max(0, end - (n + spb - 1) // spb)
+            blocks = [self.buffer[s % self.n_blocks] for s in range(start, end)]
+            if not blocks:
+                data = self.buffer[0][:0] if axis == 0 else self.buffer[0][:, :0]
+                return data.copy()
+            data = np.concatenate(blocks, axis=axis)
+            with self._condition:
+                if self._first_valid() <= start:
+                    break
+        if axis == 0:
+            return data[-n:] if n else data[:0]
+        return data[:, -n:] if n else data[:, :0]
+
+class StreamingWriter(object):
+    """
+    Writes blocks of samples from a generator or a queue to a running
+    analog output task on a background thread.
+
+    Regeneration is disabled, so every sample is generated once. The
+    thread polls the number of samples written,
+    `Task.get_write_current_position`, and generated,
+    `Task.get_samples_per_channel_generated`, and writes the next
+    block whenever the samples written but not yet generated, the
+    headroom, leave room for it below `fill_level`. Otherwise it
+    sleeps until they will. The smallest headroom seen before the
+    source is exhausted is kept in `min_headroom`. Headroom that drops
+    to zero before the source is exhausted, and underflow errors of
+    the driver, are counted in `underflows`. An error of the writing
+    thread ends it and is raised by `join` and `stop`.
+
+    Parameters
+    ----------
+
+    task : AnalogOutputTask
+      A task with channels and continuous sample clock timing
+      configured. `start` and `stop` start and stop the task.
+
+    source : {iterable, queue.Queue}
+      Yields blocks of samples of all channels, arrays that
+      `AnalogOutputTask.write` accepts with `layout`, of at most
+      `samples_per_block` samples per channel. A queue is read until
+      it returns None. `start` waits for its first block but
+      prefills the output buffer only with the blocks already queued
+      after that.
+
+    samples_per_block : int
+      The maximum number of samples, per channel, in one block.
+
+    n_blocks : int
+      The size of the output buffer, in blocks.
+
+    fill_level : {int, None}
+      The number of samples per channel to keep written ahead of the
+      generation, at most the size of the output buffer, which is
+      also the default.
+
+    timeout : float
+      Timeout, in seconds, of writing one block, see
+      `AnalogOutputTask.write`.
+
+    layout : {'group_by_scan_number', 'group_by_channel'}
+      See `AnalogOutputTask.write`.
+
+    Examples
+    --------
+
+    ::
+
+      def blocks():
+          phase = 0
+          while True:
+              yield np.sin(phase + np.arange(10000) * 2 * np.pi * f / rate)
+              phase += 10000 * 2 * np.pi * f / rate
+
+      task = AnalogOutputTask()
+      task.create_voltage_channel('Dev1/ao0', min_val=-10.0, max_val=10.0)
+      task.configure_timing_sample_clock(rate=rate)
+      with StreamingWriter(task, blocks(), 10000) as writer:
+          ...
+      print(writer.min_headroom, writer.underflows)
+    """
+
+    # Error codes of output underflows: GenStoppedToPreventRegenOfOldSamples,
+    # OutputFIFOUnderflow2 and DACUnderflow.
+    underflow_codes = (-200290, -200621, -200018)
+
+    def __init__(self, task, source, samples_per_block, n_blocks=8, fill_level=None,
+                 timeout=10.0, layout='group_by_scan_number'):
+        if n_blocks < 2:
+            raise ValueError('StreamingWriter needs at least 2 blocks, got %s' % (n_blocks))
+        buffer_size = n_blocks * samples_per_block
+        if fill_level is None:
+            fill_level = buffer_size
+        elif not samples_per_block <= fill_level <= buffer_size:
+            raise ValueError('Expected fill_level between %s and %s but got %s'
+                             % (samples_per_block, buffer_size, fill_level))
+        self.task = task
+        self.source = source
+        self.samples_per_block = samples_per_block
+        self.fill_level = fill_level
+        self.timeout = timeout
+        self.layout = layout
+        self.rate = task.get_sample_clock_rate()
+        task.set_regeneration(False)
+        task.set_buffer_size(buffer_size)
+        self._next = getattr(source, 'get', None)
+        if self._next is None:
+            self._iterator = iter(source)
+        self.blocks_written = 0
+        self.samples_written = 0
+        self.min_headroom = None
+        self.underflows = 0
+        self.exhausted = False
+        self.error = None
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop()
+        if exc_type is None:
+            self._check_error()
+
+    @property
+    def running(self):
+        """
+        True while the writing thread is alive.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def _check_error(self):
+        if self.error is not None:
+            raise self.error
+
+    def _get_block(self, timeout):
+        """
+        Returns the next block of the source, or None when the source
+        is exhausted or the queue stays empty for `timeout` seconds,
+        0 for not waiting.
+        """
+        if self._next is None:
+            block = next(self._iterator, None)
+        else:
+            try:
+                block = self._next(timeout=timeout)
+            except Empty:
+                return None
+        if block is None:
+            self.exhausted = True
+        return block
+
+    def _write(self, block):
+        samples = self.task.write(block, auto_start=False, timeout=self.timeout,
+                                  layout=self.layout)
+        self.blocks_written += 1
+        self.samples_written += samples
+
+    def start(self):
+        """
+        Fills the output buffer to `fill_level`, starts the task and
+        the writing thread.
+        """
+        if self.running:
+            raise RuntimeError('StreamingWriter is already running')
+        self._stopping.clear()
+        while (self.samples_written + self.samples_per_block <= self.fill_level
+               and not self.exhausted):
+            block = self._get_block(0 if self.blocks_written else self.timeout)
+            if block is None:
+                break
+            self._write(block)
+        self.task.start()
+        self._thread = threading.Thread(target=self._run, name='StreamingWriter(%s)' % (self.task))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def join(self, timeout=None):
+        """
+        Waits until the source is exhausted and all samples have been
+        generated, or for `timeout` seconds. Returns True when the
+        writing thread has ended, raising its error if it had one.
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self.running:
+            return False
+        self._check_error()
+        return True
+
+    def stop(self):
+        """
+        Stops the writing thread, waiting for the block being written,
+        and stops the task. Raises the error of the thread if it had
+        one.
+        """
+        self._stop()
+        self._check_error()
+
+    def _stop(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.task.stop()
+
+    def _run(self):
+        task = self.task
+        rate = self.rate
+        samples_per_block = self.samples_per_block
+        stalled = False
+        try:
+            while not self._stopping.is_set():
+                headroom = (task.get_write_current_position()
+                            - task.get_samples_per_channel_generated())
+                if self.exhausted:
+                    # Draining the buffer after the last block.
+                    if headroom <= 0:
+                        break
+                elif self.min_headroom is None or headroom < self.min_headroom:
+                    self.min_headroom = headroom
+                if headroom <= 0 and not self.exhausted:
+                    if not stalled:
+                        self.underflows += 1
+                    stalled = True
+                else:
+                    stalled = False
+                if not self.exhausted and headroom + samples_per_block <= self.fill_level:
+                    block = self._get_block(max(headroom / (2.0 * rate), 1e-3))
+                    if block is not None:
+                        self._write(block)
+                    continue
+                # Sleep until the generation has made room for a block,
+                # or until the last sample has been generated.
+                if self.exhausted:
+                    wait = headroom / rate
+                else:
+                    wait = (headroom + samples_per_block - self.fill_level) / rate
+                self._stopping.wait(max(wait, 1e-3))
+        except Exception as msg: # pylint: disable=broad-except
+            # The underflow may have been counted as a stall already.
+            if getattr(msg, 'code', None) in self.underflow_codes and not stalled:
+                self.underflows += 1
+            self.error = msg
@@ -0,0 +1,298 @@
+"""
+Streaming TDMS writer for data read from input tasks.
+
+`TdmsWriter` writes the samples of an analog, digital or counter
+input task to a TDMS file as they are read, in the TDMS 2.0 format
+that NI software and other TDMS readers understand. The channel
+properties are written once in the first segment. Every further
+segment holds only raw data and a lead-in, and reuses the metadata
+of the first, so that the cost per segment is a single lead-in
+write next to the samples.
+
+Files are laid out as one group named after the task, with one
+channel per virtual channel of the task.
+"""
+
+from __future__ import print_function, division, unicode_literals, absolute_import
+
+import struct
+
+import numpy as np
+
+from .sinks import get_task_metadata
+
+__all__ = ['TdmsWriter']
+
+# Segment table of contents flags.
+kTocMetaData = 1 << 1
+kTocNewObjList = 1 << 2
+kTocRawData = 1 << 3
+kTocInterleavedData = 1 << 5
+
+tdms_version = 4713
+no_raw_data = 0xFFFFFFFF
+
+# TDMS data types of numpy types.
+tdms_types = {
+    np.dtype(np.int8): 1, np.dtype(np.int16): 2, np.dtype(np.int32): 3,
+    np.dtype(np.int64): 4, np.dtype(np.uint8): 5, np.dtype(np.uint16): 6,
+    np.dtype(np.uint32): 7, np.dtype(np.uint64): 8, np.dtype(np.float32): 9,
+    np.dtype(np.float64): 10,
+}
+tdsTypeString = 0x20
+
+def _pack_string(s):
+    s = s.encode('utf-8')
+    return struct.pack('<I', len(s)) + s
+
+def _pack_property(name, value):
+    if isinstance(value, float):
+        encoded = struct.pack('<Id', tdms_types[np.dtype(np.float64)], value)
+    elif isinstance(value, int) and not isinstance(value, bool):
+        encoded = struct.pack('<Iq', tdms_types[np.dtype(np.int64)], value)
+    else:
+        encoded = struct.pack('<I', tdsTypeString) + _pack_string('%s' % (value,))
+    return _pack_string(name) + encoded
+
+def _object_path(*names):
+    return '/' + '/'.join("'%s'" % (name.replace("'", "''")) for name in names)
+
+class TdmsWriter(object):
+    """
+    Writes the samples read from an input task to a TDMS file.
+
+    Samples are collected in a segment buffer of `chunks_per_segment`
+    chunks of `samples_per_chunk` samples per channel, which `read`
+    fills directly from the task, one chunk per read. A full buffer
+    is written as one segment. The raw data index written with the
+    first segment describes one chunk, so segments that follow need
+    no metadata. Only `close` may write a segment
+    with a different index, for the samples that do not fill a
+    chunk.
+
+    Parameters
+    ----------
+
+    filename : str
+      Name of the TDMS file, created or overwritten.
+
+    task : {AnalogInputTask, DigitalInputTask, CounterInputTask}
+      The task to read from. Its channels and timing must be
+      configured.
+
+    samples_per_chunk : int
+      The number of samples, per channel, in one read from the task.
+
+    chunks_per_segment : int
+      The number of chunks in one segment. Larger segments take
+      fewer writes.
+
+    fill_mode : {'group_by_scan_number', 'group_by_channel'}
+      Layout of the samples in the file and of arrays passed to
+      `write`, see `AnalogInputTask.read`. Samples are stored
+      interleaved for 'group_by_scan_number'. Counter input tasks
+      ignore `fill_mode`.
+
+    group_name : {str, None}
+      Name of the TDMS group, by default the task name.
+
+    dtype : {numpy.dtype, None}
+      The dtype of the samples, see `Task.iter_blocks`. For example,
+      analog input samples are stored as float32 with
+      ``dtype=numpy.float32``.
+
+    Examples
+    --------
+
+    ::
+
+      with TdmsWriter('capture.tdms', task, 10000) as writer:
+          task.start()
+          while ...:
+              writer.read()
+    """
+
+    def __init__(self, filename, task, samples_per_chunk, chunks_per_segment=16,
+                 fill_mode='group_by_scan_number', group_name=None, dtype=None):
+        self.filename = filename
+        self.task = task
+        self.samples_per_chunk = samples_per_chunk
+        self.chunks_per_segment = chunks_per_segment
+        self.fill_mode = fill_mode
+        self.metadata = get_task_metadata(task)
+        if group_name is None:
+            group_name = self.metadata['task'] or 'Task'
+        self.group_name = group_name
+        block = task._new_read_block(samples_per_chunk, fill_mode, dtype)
+        self.dtype = block.dtype
+        if self.dtype not in tdms_types:
+            raise TypeError('No TDMS data type for samples of type %s' % (self.dtype))
+        self.buffer = np.zeros((chunks_per_segment,) + block.shape, dtype=self.dtype)
+        if block.ndim == 1:
+            self.interleaved = False
+            self._chunks = self.buffer.reshape(chunks_per_segment, 1, samples_per_chunk)
+        else:
+            self.interleaved = fill_mode == 'group_by_scan_number'
+            self._chunks = self.buffer
+        self.number_of_channels = self._chunks.shape[2 if self.interleaved else 1]
+        self.samples_written = 0
+        self.segments_written = 0
+        # Samples per channel in the buffer and in the raw data index
+        # of the file.
+        self._position = 0
+        self._indexed_samples = None
+        self._file = open(filename, 'wb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_channel_paths(self):
+        return [_object_path(self.group_name, c['name']) for c in self.metadata['channels']]
+
+    def _get_raw_data_index(self, samples_per_chunk):
+        return struct.pack('<IIIQ', 20, tdms_types[self.dtype], 1, samples_per_chunk)
+
+    def _get_metadata(self, samples_per_chunk):
+        """
+        Returns the metadata of a segment whose chunks have
+        ``samples_per_chunk`` samples per channel: all objects with
+        their properties for the first segment, otherwise the new raw
+        data index of the channels.
+        """
+        index = self._get_raw_data_index(samples_per_chunk)
+        paths = self._get_channel_paths()
+        if self._indexed_samples is not None:
+            objects = [_pack_string(path) + index + struct.pack('<I', 0) for path in paths]
+            return struct.pack('<I', len(objects)) + b''.join(objects)
+        rate = self.metadata['sample_clock_rate']
+        objects = [
+            _pack_string('/') + struct.pack('<II', no_raw_data, 0),
+            _pack_string(_object_path(self.group_name)) + struct.pack('<II', no_raw_data, 0),
+        ]
+        for path, channel in zip(paths, self.metadata['channels']):
+            properties = [('NI_ChannelName', channel['name'])]
+            if channel['units'] is not None:
+                properties.append(('unit_string', channel['units']))
+            for name, key in [('minimum', 'min'), ('maximum', 'max')]:
+                if channel[key] is not None:
+                    properties.append((name, float(channel[key])))
+            if rate:
+                properties += [('wf_increment', 1.0 / rate), ('wf_start_offset', 0.0)]
+            objects.append(_pack_string(path) + index + struct.pack('<I', len(properties))
+                           + b''.join(_pack_property(*p) for p in properties))
+        return struct.pack('<I', len(objects)) + b''.join(objects)
+
+    def _write_segment(self, data, samples_per_chunk):
+        """
+        Writes the C-contiguous array ``data`` of chunks of
+        ``samples_per_chunk`` samples per channel as one segment.
+        """
+        toc = kTocRawData
+        if self.interleaved:
+            toc |= kTocInterleavedData
+        metadata = b''
+        if samples_per_chunk != self._indexed_samples:
+            toc |= kTocMetaData
+            if self._indexed_samples is None:
+                toc |= kTocNewObjList
+            metadata = self._get_metadata(samples_per_chunk)
+            self._indexed_samples = samples_per_chunk
+        self._file.write(b'TDSm' + struct.pack('<IIQQ', toc, tdms_version,
+                                               len(metadata) + data.nbytes, len(metadata))
+                         + metadata)
+        self._file.write(data)
+        self.segments_written += 1
+
+    def _flush_chunks(self):
+        full_chunks = self._position // self.samples_per_chunk
+        if full_chunks:
+            self._write_segment(self.buffer[:full_chunks], self.samples_per_chunk)
+        remainder = self._position - full_chunks * self.samples_per_chunk
+        if remainder:
+            chunk = self._chunks[full_chunks]
+            chunk = chunk[:remainder] if self.interleaved else chunk[:, :remainder]
+            self._write_segment(np.ascontiguousarray(chunk), remainder)
+        self._position = 0
+
+    def _advance(self, samples_per_channel):
+        self._position += samples_per_channel
+        self.samples_written += samples_per_channel
+        if self._position == self.chunks_per_segment * self.samples_per_chunk:
+            self._write_segment(self.buffer, self.samples_per_chunk)
+            self._position = 0
+
+    def read(self, timeout=10.0):
+        """
+        Reads one chunk of samples from the task into the segment
+        buffer, and writes the segment when the buffer is full.
+
+        Parameters
+        ----------
+
+        timeout : float
+          See `AnalogInputTask.read`.
+
+        Returns
+        -------
+
+        samples_read : int
+          The number of samples, per channel, read.
+        """
+        spc = self.samples_per_chunk
+        chunk, offset = divmod(self._position, spc)
+        if offset:
+            # A partial read or `write` left the chunk partially filled.
+            data = self.task._new_read_block(spc - offset, self.fill_mode, self.dtype)
+            samples_read = self.task._read_block(data, spc - offset, timeout, self.fill_mode)
+            self.write(data[:samples_read] if self.interleaved or data.ndim == 1
+                       else data[:, :samples_read])
+            return samples_read
+        samples_read = self.task._read_block(self.buffer[chunk], spc, timeout, self.fill_mode)
+        self._advance(samples_read)
+        return samples_read
+
+    def write(self, data):
+        """
+        Appends samples read elsewhere, for example blocks of
+        `Task.iter_blocks` read with the same `fill_mode`.
+        """
+        data = np.asarray(data)
+        if self.interleaved:
+            data = data.reshape(-1, self.number_of_channels)
+            n = data.shape[0]
+        else:
+            data = data.reshape(self.number_of_channels, -1)
+            n = data.shape[1]
+        spc = self.samples_per_chunk
+        start = 0
+        while start < n:
+            chunk, offset = divmod(self._position, spc)
+            count = min(spc - offset, n - start)
+            if self.interleaved:
+                self._chunks[chunk, offset:offset + count] = data[start:start + count]
+            else:
+                self._chunks[chunk, :, offset:offset + count] = data[:, start:start + count]
+            start += count
+            self._advance(count)
+
+    def flush(self):
+        """
+        Writes the samples in the segment buffer and flushes the
+        file. Samples that do not fill a chunk are written with a new
+        raw data index, so frequent flushing makes the file larger.
+        """
+        self._flush_chunks()
+        self._file.flush()
+
+    def close(self):
+        """
+        Writes the samples in the segment buffer and closes the file.
+        """
+        if self._file is None:
+            return
+        self._flush_chunks()
+        self._file.close()
+        self._file = None
@@ -0,0 +1,106 @@
+"""
+Tests of the asyncio support, see `nidaqmx.aio`, against the
+simulated NI-DAQmx library. Requires Python 3.
+
+Run with pytest.
+"""
+
+import os
+import time
+import asyncio
+
+# The library is loaded on first use, after this is set.
+os.environ.setdefault('NIDAQMX_SIMULATE', '1')
+
+import numpy as np
+
+from nidaqmx import AnalogInputTask, AnalogOutputTask, get_simulated_library
+
+def make_ai_task(channels='Dev1/ai0:1', rate=10000.0, **kws):
+    task = AnalogInputTask()
+    task.create_voltage_channel(channels, min_val=-10.0, max_val=10.0)
+    task.configure_timing_sample_clock(rate=rate, **kws)
+    return task
+
+def test_read_async():
+    task = make_ai_task()
+    async def main():
+        first = await task.read_async(1000)
+        # Half the event interval, due by the sample clock.
+        second = await task.read_async(500)
+        return first, second, task.get_samples_per_channel_acquired()
+    try:
+        first, second, acquired = asyncio.run(main())
+    finally:
+        task.clear()
+    assert first.shape == (1000, 2) and second.shape == (500, 2)
+    assert np.abs(second).max() <= 1.0
+    # The read returns before the next event, after 2000 samples.
+    assert 1500 <= acquired < 2000
+
+def test_write_async():
+    lib = get_simulated_library()
+    lib.connect('Dev1/ao0', 'Dev1/ai15')
+    task = AnalogOutputTask()
+    task.create_voltage_channel('Dev1/ao0', min_val=-10.0, max_val=10.0)
+    task.configure_timing_sample_clock(rate=10000.0)
+    task.set_regeneration(False)
+    task.set_buffer_size(1000)
+    ai = AnalogInputTask()
+    ai.create_voltage_channel('Dev1/ai15', min_val=-10.0, max_val=10.0)
+    async def main():
+        written = []
+        for i in range(6):
+            written.append(await task.write_async(np.full(500, 0.5 * i)))
+        return written
+    try:
+        t0 = time.time()
+        written = asyncio.run(main())
+        elapsed = time.time() - t0
+        generated = task.get_samples_per_channel_generated()
+        value = ai.read_scalar()
+    finally:
+        task.clear()
+        ai.clear()
+        lib.connect(None, 'Dev1/ai15')
+    assert written == [500] * 6
+    # Writes wait for room in the 1000 sample buffer, which the
+    # sample clock makes at 10000 samples per second.
+    assert elapsed > 0.15
+    assert 2000 <= generated <= 3000
+    assert value in [0.5 * i for i in range(6)]
+
+def test_stream_finite():
+    lib = get_simulated_library()
+    lib.set_signal('Dev1/ai6', lambda t: t % 1.0)
+    task = make_ai_task('Dev1/ai6', rate=5000.0, sample_mode='finite',
+                        samples_per_channel=250)
+    async def main():
+        return [block.copy() async for block in task.stream(100)]
+    try:
+        blocks = asyncio.run(main())
+    finally:
+        task.clear()
+        lib.set_signal('Dev1/ai6', None)
+    assert [block.shape for block in blocks] == [(100, 1), (100, 1), (50, 1)]
+    data = np.concatenate(blocks)[:, 0]
+    assert np.allclose(np.diff(data) % 1.0, 2e-4)
+
+def test_stream_started_task(monkeypatch):
+    from nidaqmx.aio import get_task_events
+    task = make_ai_task('Dev1/ai0', rate=10000.0)
+    starts = []
+    monkeypatch.setattr(task, 'start', lambda start=task.start: starts.append(1) or start())
+    async def main():
+        events, created = get_task_events(task, 100)
+        task.start()
+        first = [block.shape async for block in task.stream(100, max_blocks=2)]
+        # The first stream stopped the task, the second starts it.
+        second = [block.shape async for block in task.stream(100, max_blocks=2)]
+        return first, second
+    try:
+        first, second = asyncio.run(main())
+    finally:
+        task.clear()
+    assert first == second == [(100, 1), (100, 1)]
+    assert len(starts) == 2
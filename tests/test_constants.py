@@ -0,0 +1,98 @@
+"""
+Tests of the NI-DAQmx constant store, see `nidaqmx.constants`.
+
+Run with pytest.
+"""
+
+from __future__ import print_function, division
+
+import json
+import hashlib
+
+import pytest
+
+from nidaqmx.constants import ConstantStore
+
+# SHA-256 of the constants and error_map of the nidaqmx_h_<version>.py
+# modules that the store replaced, see `_digest`.
+source_digests = {
+    '8.0': '5d1aac7c29426e85ddac16e58267b6ecb2519b2cb852d74ab89890bf705eaa52',
+    '8.8': '82c604933fe13fff9a14c468dc8078e58ba794d37356e68fc9124a3a99e23cc8',
+    '8.9': '45b4bef01a1263f262d3ac2c8a88408e2d2c1e1996daf64a9e32cafa99caf355',
+    '9.0': '3dd6373cdb510bc7dd69d004547f10c5a9eb25608f23951fa13441b313d61079',
+    '9.1': 'ff7fc4cc08f98850b135162cf1a93dfb13cdc89e6cdda5140b18825c30f484a8',
+    '9.3': 'bf7a1eb0f3cfeef0308eb26c7186cb547e304f2a3399801e06087fb157aa89ce',
+    '9.5': '947e8047fa6a5e21544034297870a229edbd5a9fbff2ec0fdff088f8d23481e4',
+    '9.6': 'e33d9e59fcb3432912b88826e8e82ffba4aa35e6026e6525c946ae877581c2ed',
+    '9.8': '8430f668bb733284451ae808577228c1ba9a5e92306d78e7640b08e03ce33b71',
+    '14.0': '106504ab88e40f5c5ef35abc32803741671792e8cb811068bf1587a0e5d81b67',
+    '15.0': 'deaada459f1e6b26ebc0cfd0f05d2f7cfcf95e2f34164a755e75dc0a56b21bc5',
+    '15.1': '4a1b8c176f2203e040b3079cfcbbb521d860c3632974dbb26d885efa57d79389',
+    '15.5': '685d977344e9fcf44f8731755e00d6f6c16eed32f9da5387267a079845b54a6b',
+    }
+
+def _digest(constants, error_map):
+    """
+    Returns the SHA-256 of the sorted items of ``constants`` and
+    ``error_map`` dictionaries.
+    """
+    s = json.dumps([sorted(constants.items()), sorted(error_map.items())])
+    return hashlib.sha256(s.encode('ascii')).hexdigest()
+
+def _resolve(store, version, names):
+    """
+    Returns the constants and error map dictionaries of ``version``
+    as resolved through `ConstantStore.load`.
+    """
+    DAQmx, error_map, prototypes = store.load(version)
+    constants = {}
+    for name in names:
+        try:
+            constants[name] = getattr(DAQmx, name)
+        except AttributeError:
+            pass
+    return constants, dict(error_map)
+
+@pytest.mark.parametrize('version', sorted(source_digests))
+def test_versions_match_sources(version):
+    store = ConstantStore()
+    names = set()
+    for constants, error_map, prototypes in store._read_all().values():
+        names.update(constants)
+    assert _digest(*_resolve(store, version, names)) == source_digests[version]
+
+def test_add_version_round_trip(tmpdir):
+    store = ConstantStore()
+    data = store._read_all()
+    assert sorted(data) == sorted(source_digests)
+
+    path = str(tmpdir.join('constants.dat'))
+    copy = ConstantStore(path)
+    for version in store.versions:
+        copy.add_version(version, *data[version])
+    new = dict(data['15.5'][0], Val_Test=1, Val_Volts=12345)
+    new_errors = dict(data['15.5'][1])
+    new_errors[-1] = 'Test'
+    copy.add_version('16.0', new, new_errors, {'DAQmxTest': ('int32', ('uInt32',))})
+    assert copy.versions == store.versions + ['16.0']
+
+    names = set(new)
+    for constants, error_map, prototypes in data.values():
+        names.update(constants)
+    for version in store.versions:
+        assert _resolve(copy, version, names) == data[version][:2]
+        assert copy.load(version)[2] == data[version][2]
+    assert _resolve(copy, '16.0', names) == (new, new_errors)
+    assert copy.load('16.0')[2] == {'DAQmxTest': ('int32', ('uInt32',))}
+    assert ConstantStore().versions == store.versions
+
+def test_add_version_path(tmpdir):
+    path = str(tmpdir.join('constants.dat'))
+    other = str(tmpdir.join('other.dat'))
+    store = ConstantStore(path)
+    store.add_version('1.0', {'Val_A': 1}, {-1: 'A'})
+    store.add_version('1.1', {'Val_A': 2, 'Val_B': 'x'}, {-1: 'A'}, path=other)
+    assert store.versions == ['1.0']
+    assert ConstantStore(other).versions == ['1.0', '1.1']
+    DAQmx, error_map, prototypes = ConstantStore(other).load('1.1')
+    assert (DAQmx.Val_A, DAQmx.Val_B, dict(error_map)) == (2, 'x', {-1: 'A'})
@@ -0,0 +1,53 @@
+"""
+Import time regression test: ``import nidaqmx`` must not find or load
+the NI-DAQmx library or its constants, and must stay fast.
+
+Run with pytest or as a script.
+"""
+
+from __future__ import print_function, division
+
+import os
+import sys
+import subprocess
+
+# Import time budget in seconds, not counting numpy.
+budget = 0.15
+
+measure_code = '''
+from __future__ import print_function
+import sys, time
+import numpy
+t0 = time.time()
+import nidaqmx
+t1 = time.time()
+from nidaqmx import libnidaqmx
+print(t1 - t0)
+print(libnidaqmx._library_loaded, libnidaqmx._header is not None)
+print(' '.join(m for m in ['ctypes.util', 'nidaqmx.constants', 'nidaqmx.prototypes']
+               if m in sys.modules))
+'''
+
+def measure_import():
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([root] + [p for p in [env.get('PYTHONPATH')] if p])
+    output = subprocess.check_output([sys.executable, '-c', measure_code], env=env)
+    lines = output.decode('ascii').splitlines()
+    return float(lines[0]), lines[1].split(), lines[2].split()
+
+def test_import_does_no_driver_work():
+    t, (library_loaded, header_loaded), modules = measure_import()
+    assert library_loaded == 'False'
+    assert header_loaded == 'False'
+    assert modules == []
+
+def test_import_time():
+    # The first run may compile the modules.
+    t = min(measure_import()[0] for i in range(3))
+    assert t < budget, 'import nidaqmx took %.3f s, budget is %.3f s' % (t, budget)
+
+if __name__ == '__main__':
+    t, loaded, modules = measure_import()
+    print('import nidaqmx: %.1f ms, library/header loaded: %s, modules: %s'
+          % (1e3 * t, '/'.join(loaded), ' '.join(modules) or '-'))
@@ -0,0 +1,828 @@
+"""
+Tests of the task classes against the simulated NI-DAQmx library,
+see `nidaqmx.simulated`. They need no hardware.
+
+Run with pytest.
+"""
+
+from __future__ import print_function, division
+
+import os
+import time
+
+# The library is loaded on first use, after this is set.
+os.environ.setdefault('NIDAQMX_SIMULATE', '1')
+
+import numpy as np
+import pytest
+
+from nidaqmx import AnalogInputTask, AnalogOutputTask, get_simulated_library
+from nidaqmx.libnidaqmx import NIDAQmxRuntimeError
+
+def make_ai_task(channels='Dev1/ai0:3', rate=10000.0, **kws):
+    task = AnalogInputTask()
+    task.create_voltage_channel(channels, min_val=-10.0, max_val=10.0)
+    task.configure_timing_sample_clock(rate=rate, **kws)
+    return task
+
+def test_read_waits_for_sample_clock():
+    task = make_ai_task()
+    task.start()
+    t0 = time.time()
+    data = task.read(1000)
+    elapsed = time.time() - t0
+    task.clear()
+    assert data.shape == (1000, 4)
+    assert 0.09 < elapsed < 0.3
+    assert np.abs(data).max() <= 1.0
+
+def test_read_all_available_into_out():
+    task = make_ai_task('Dev1/ai0', rate=10000.0)
+    task.start()
+    time.sleep(0.03)
+    out = np.full((100, 1), -99.0)
+    data = task.read(-1, out=out)
+    assert len(data) == 100
+    assert np.abs(data).max() <= 1.0
+    with pytest.raises(ValueError, match='samples_per_channel'):
+        task.read(-2, out=out)
+    with pytest.raises(ValueError, match='samples_per_channel'):
+        task.read_into(out, -5)
+    task.clear()
+    from nidaqmx import CounterInputTask, DigitalInputTask
+    di = DigitalInputTask()
+    di.create_channel('Dev1/port0/line0:3', grouping='for_all_lines')
+    ci = CounterInputTask()
+    ci.create_channel_count_edges('Dev1/ctr0')
+    for read, out in [(di.read, np.zeros((10, 1), dtype=np.uint8)),
+                      (di.read_port, np.zeros((10, 1), dtype=np.uint32)),
+                      (ci.read, np.zeros(10, dtype=np.uint32))]:
+        with pytest.raises(ValueError, match='samples_per_channel'):
+            read(-5, out=out)
+    di.clear()
+    ci.clear()
+
+def test_channel_cache_invalidation():
+    task = make_ai_task('Dev1/ai0', rate=10000.0)
+    task.start()
+    assert task.read(100).shape == (100, 1)
+    assert task.read_raw(10).shape == (10, 1)
+    task.stop()
+    task.create_voltage_channel('Dev1/ai1', min_val=-10.0, max_val=10.0)
+    task.start()
+    assert task.read(100).shape == (100, 2)
+    assert task.read_raw(10).shape == (10, 2)
+    assert task._get_cached_names_of_channels() == ['Dev1/ai0', 'Dev1/ai1']
+    task.clear()
+    assert task._channel_cache is None
+    from nidaqmx import DigitalInputTask
+    task = DigitalInputTask()
+    task.create_channel('Dev1/port0/line0', grouping='for_all_lines')
+    data = task.read(10)[0]
+    assert data.dtype == np.uint8 and data.shape == (10, 1)
+    task.create_channel('Dev1/port0/line4:5', grouping='for_all_lines')
+    data = task.read(10)[0]
+    assert data.dtype == np.uint16 and data.shape == (10, 2)
+    task.clear()
+    assert task._channel_cache is None
+
+def test_read_timeout_and_overwrite():
+    task = make_ai_task(rate=1000.0)
+    task.start()
+    with pytest.raises(NIDAQmxRuntimeError, match='-200284') as info:
+        task.read(1000, timeout=0.01)
+    assert info.value.code == -200284
+    task.stop()
+    task.set_buffer_size(100)
+    task.start()
+    time.sleep(0.2)
+    with pytest.raises(NIDAQmxRuntimeError, match='-200279'):
+        task.read(10)
+    task.clear()
+
+def test_events_of_finite_task():
+    task = make_ai_task('Dev1/ai5', rate=2000.0, sample_mode='finite',
+                        samples_per_channel=300)
+    samples = []
+    done = []
+    task.register_every_n_samples_event(lambda t, e, n, d: samples.append(n) or 0, samples=100)
+    task.register_done_event(lambda t, status, d=None: done.append(status) or 0)
+    task.start()
+    task.wait_until_done(1.0)
+    time.sleep(0.05)
+    task.clear()
+    assert samples == [100, 100, 100]
+    assert done == [0]
+
+def test_analog_output_loopback():
+    lib = get_simulated_library()
+    lib.connect('Dev1/ao2', 'Dev1/ai8')
+    try:
+        ao = AnalogOutputTask()
+        ao.create_voltage_channel('Dev1/ao2', min_val=-10.0, max_val=10.0)
+        ao.write(2.5, auto_start=True)
+        ai = AnalogInputTask()
+        ai.create_voltage_channel('Dev1/ai8', min_val=-10.0, max_val=10.0)
+        assert ai.read_scalar() == 2.5
+        ao.clear()
+        ai.clear()
+    finally:
+        lib.connect(None, 'Dev1/ai8')
+
+def test_parse_and_bind_prototypes():
+    import ctypes
+    from nidaqmx import libnidaqmx
+    from nidaqmx.libnidaqmx import (_parse_prototype, _bind_function, _String,
+                                    TaskHandle, int32, uInt32, uInt64, float64, void_p)
+    header = {
+        'CreateTask': 'int32 __CFUNC     DAQmxCreateTask                (const char taskName[], TaskHandle *taskHandle);',
+        'CfgSampClkTiming': 'int32 __CFUNC     DAQmxCfgSampClkTiming          (TaskHandle taskHandle, const char source[], float64 rate, int32 activeEdge, int32 sampleMode, uInt64 sampsPerChan);',
+        'ReadAnalogF64': 'int32 __CFUNC     DAQmxReadAnalogF64             (TaskHandle taskHandle, int32 numSampsPerChan, float64 timeout, bool32 fillMode, float64 readArray[], uInt32 arraySizeInSamps, int32 *sampsPerChanRead, bool32 *reserved);',
+        'GetReadTotalSampPerChanAcquired': 'int32 __CFUNC DAQmxGetReadTotalSampPerChanAcquired(TaskHandle taskHandle, uInt64 *data);',
+        'SetReadOffset': 'int32 __CFUNC DAQmxSetReadOffset(TaskHandle taskHandle, int32 data);',
+        'RegisterDoneEvent': 'int32 __CFUNC     DAQmxRegisterDoneEvent         (TaskHandle task, uInt32 options, DAQmxDoneEventCallbackPtr callbackFunction, void *callbackData);',
+        }
+    assert _parse_prototype(header['CreateTask']) == (
+        'CreateTask', ('int32', ('const char[]', 'TaskHandle*')))
+    assert _parse_prototype(header['GetReadTotalSampPerChanAcquired']) == (
+        'GetReadTotalSampPerChanAcquired', ('int32', ('TaskHandle', 'uInt64*')))
+    assert _parse_prototype('int32 __CFUNC DAQmxGetSysNIDAQMajorVersion(uInt32 *data);')[1] == (
+        'int32', ('uInt32*',))
+    assert _parse_prototype('int32 __CFUNC DAQmxSelfTestDevice(void);')[1] == ('int32', ())
+    assert _parse_prototype('#define DAQmx_Val_Volts  10348 // Volts') is None
+    assert _parse_prototype('int32 __CFUNC_C   DAQmxGetChanAttribute          (TaskHandle taskHandle, const char channel[], int32 attribute, void *value, ...);') is None
+
+    assert get_simulated_library() is not None
+    prototypes = libnidaqmx._get_header()[2]
+    expected_argtypes = {
+        'CreateTask': [_String, void_p],
+        'CfgSampClkTiming': [TaskHandle, _String, float64, int32, int32, uInt64],
+        'ReadAnalogF64': [TaskHandle, int32, float64, uInt32, void_p, uInt32, void_p, void_p],
+        'GetReadTotalSampPerChanAcquired': [TaskHandle, void_p],
+        'SetReadOffset': [TaskHandle, int32],
+        'RegisterDoneEvent': [TaskHandle, uInt32, void_p, void_p],
+        }
+    for name, line in header.items():
+        assert _parse_prototype(line) == (name, prototypes[name])
+        func = _bind_function(name)
+        assert func.argtypes == expected_argtypes[name]
+        assert func.restype is int32
+    with pytest.raises(ctypes.ArgumentError):
+        libnidaqmx._functions['SetReadOffset'](None, uInt32(1))
+
+def test_call_stats():
+    import nidaqmx
+    from nidaqmx import libnidaqmx
+    stats = nidaqmx.stats()
+    stats.reset()
+    stats.enable()
+    try:
+        task = make_ai_task('Dev1/ai0', rate=1000.0)
+        task.start()
+        task.read(10)
+        with pytest.raises(NIDAQmxRuntimeError):
+            task.read(1000, timeout=0.0)
+        task.clear()
+    finally:
+        stats.disable()
+    assert not any(hasattr(f, '__wrapped__') for f in libnidaqmx._functions.values())
+    d = stats.as_dict()
+    read = d['ReadAnalogF64']
+    assert read['count'] == 2 and read['errors'] == 1
+    assert 0.005 < read['max'] <= read['total']
+    assert sum(count for bound, count in read['histogram']) == 2
+    assert d['CHK']['count'] == 1
+    text = stats.to_openmetrics()
+    assert 'nidaqmx_call_seconds_count{function="ReadAnalogF64"} 2\n' in text
+    assert 'nidaqmx_call_errors_total{function="ReadAnalogF64"} 1\n' in text
+    assert text.endswith('# EOF\n')
+
+def test_control_loop():
+    import nidaqmx
+    from nidaqmx import ControlLoop
+    lib = get_simulated_library()
+    lib.connect('Dev1/ao3', 'Dev1/ai9')
+    lib.set_signal('Dev1/ai10', lambda t: np.full(len(t), 2.0))
+    try:
+        ai = AnalogInputTask()
+        ai.create_voltage_channel('Dev1/ai9:10', min_val=-10.0, max_val=10.0)
+        ao = AnalogOutputTask()
+        ao.create_voltage_channel('Dev1/ao3', min_val=-10.0, max_val=10.0)
+        def step(inputs, outputs):
+            # Integral control of ai9 to the setpoint on ai10.
+            outputs[0] += 0.5 * (inputs[1] - inputs[0])
+        with ControlLoop(ai, ao, step, rate=1000.0) as loop:
+            assert loop.run(duration=0.2) == 200
+            time.sleep(0.01)
+            stats = nidaqmx.stats()
+            stats.reset()
+            stats.enable()
+            try:
+                loop.run(iterations=2)
+            finally:
+                stats.disable()
+        statistics = loop.get_statistics()
+        ai.clear()
+        ao.clear()
+    finally:
+        lib.connect(None, 'Dev1/ai9')
+        lib.set_signal('Dev1/ai10', None)
+    assert abs(loop.inputs[0] - 2.0) < 1e-6
+    assert statistics['iterations'] == 202
+    recorded = stats.as_dict()
+    for name in ['WaitForNextSampleClock', 'ReadAnalogF64', 'WriteAnalogF64']:
+        assert recorded[name]['count'] == 2
+    assert loop.late >= 1
+    assert abs(statistics['period'] - 1e-3) < 1e-3
+    assert sorted(statistics['jitter']) == [50, 90, 99, 99.9]
+
+def test_read_raw_and_scale(tmpdir):
+    from nidaqmx.sinks import NpySink
+    lib = get_simulated_library()
+    lib.set_signal('Dev1/ai12', lambda t: np.full(len(t), -3.3))
+    try:
+        task = make_ai_task('Dev1/ai11:12', rate=1000.0)
+        scaler = task.get_scaler()
+        assert scaler.coefficients.shape == (2, 2)
+        task.start()
+        raw = task.read_raw(100, fill_mode='group_by_channel')
+        volts = task.read(100)
+        time.sleep(0.03)
+        raw_out = np.full((20, 2), -9999, dtype=np.int16)
+        all_raw = task.read_raw(-1, out=raw_out)
+        filename = str(tmpdir.join('raw.npy'))
+        with NpySink(filename, task, raw=True) as sink:
+            sink.read(50)
+        task.clear()
+    finally:
+        lib.set_signal('Dev1/ai12', None)
+    assert raw.dtype == np.int16 and raw.shape == (2, 100)
+    lsb = 20.0 / 65536
+    assert np.abs(scaler.scale(raw, 'group_by_channel')[1] + 3.3).max() <= lsb
+    assert np.abs(volts[:, 1] + 3.3).max() < 1e-9
+    assert all_raw.shape == (20, 2)
+    assert np.abs(scaler(all_raw)[:, 1] + 3.3).max() <= lsb
+    stored = np.load(filename)
+    assert stored.dtype == np.int16 and stored.shape == (50, 2)
+    out = np.empty((50, 2), dtype=np.float32)
+    assert np.abs(scaler(stored, out=out)[:, 1] + 3.3).max() <= lsb
+
+def test_read_float32():
+    lib = get_simulated_library()
+    lib.set_signal('Dev1/ai1', lambda t: t % 1.0)
+    try:
+        task = make_ai_task('Dev1/ai0:2', rate=5000.0)
+        # Read through several staging blocks.
+        task.staging_samples = 64
+        task.start()
+        data = task.read(200, dtype=np.float32)
+        by_channel = task.read(100, fill_mode='group_by_channel', dtype=np.float32)
+        blocks = [block.copy() for block in task.iter_blocks(150, max_blocks=2, dtype=np.float32)]
+        task.clear()
+    finally:
+        lib.set_signal('Dev1/ai1', None)
+    assert data.dtype == np.float32 and data.shape == (200, 3)
+    assert by_channel.dtype == np.float32 and by_channel.shape == (3, 100)
+    assert [block.dtype for block in blocks] == [np.float32, np.float32]
+    ramp = np.concatenate([data[:, 1], by_channel[1]] + [block[:, 1] for block in blocks])
+    assert np.allclose(np.diff(ramp) % 1.0, 2e-4, atol=1e-5)
+
+def test_read_port():
+    from nidaqmx import DigitalInputTask
+    from nidaqmx.digital import unpack_lines
+    task = DigitalInputTask()
+    task.create_channel('Dev1/port0/line0:3', grouping='for_all_lines')
+    task.configure_timing_sample_clock(rate=16000.0)
+    task.start()
+    data = task.read_port(400)
+    task.clear()
+    assert data.dtype == np.uint32 and data.shape == (400, 1)
+    assert data.max() < 16
+    line0, line1 = unpack_lines(data[:, 0], [0, 1])
+    assert np.array_equal(line0, data[:, 0] & 1)
+    line2 = unpack_lines(data[:, 0], 2)
+    assert line2.shape == (400,) and np.array_equal(line2, (data[:, 0] >> 2) & 1)
+    # Line L toggles at 1000 / 2**L Hz.
+    assert abs(np.count_nonzero(np.diff(line0)) - 50) <= 1
+    assert abs(np.count_nonzero(np.diff(line1)) - 25) <= 1
+    task = DigitalInputTask()
+    task.create_channel('Dev1/port1', grouping='for_all_lines')
+    assert task.get_port_width('Dev1/port1') == 8
+    assert task.read_port().dtype == np.uint8
+    task.clear()
+
+def test_write_port_and_pack_lines(monkeypatch):
+    from nidaqmx import DigitalInputTask, DigitalOutputTask
+    from nidaqmx import digital
+    monkeypatch.setattr(digital, 'chunk_samples', 7)
+    rng = np.random.RandomState(0)
+    matrix = rng.rand(100, 3) > 0.5
+    expected = (matrix * np.array([1, 1 << 4, 1 << 17])).sum(axis=1)
+    packed = digital.pack_lines(matrix, [0, 4, 17])
+    assert packed.dtype == np.uint32 and np.array_equal(packed, expected)
+    assert np.array_equal(digital.pack_lines(list(matrix.T), [0, 4, 17]), expected)
+    assert np.array_equal(digital.unpack_lines(packed, [0, 4, 17]), matrix.T)
+    assert digital.pack_lines(matrix[:, :2]).dtype == np.uint8
+    port = rng.rand(100, 16) > 0.5
+    for dtype in [np.uint16, np.uint32]:
+        assert np.array_equal(digital.pack_lines(port, dtype=dtype),
+                              digital.pack_lines(list(port.T), dtype=dtype))
+    lib = get_simulated_library()
+    for line in range(8):
+        lib.connect('Dev1/port1/line%d' % (line), 'Dev1/port2/line%d' % (line))
+    try:
+        do = DigitalOutputTask()
+        do.create_channel('Dev1/port1', grouping='for_all_lines')
+        di = DigitalInputTask()
+        di.create_channel('Dev1/port2', grouping='for_all_lines')
+        do.write_port(0xa5)
+        assert di.read_port(1)[0, 0] == 0xa5
+        do.write_port(np.array([0x3c], dtype=np.uint8))
+        assert di.read_port(1)[0, 0] == 0x3c
+        do.clear()
+        di.clear()
+    finally:
+        for line in range(8):
+            lib.connect(None, 'Dev1/port2/line%d' % (line))
+
+def test_change_event_reader():
+    from nidaqmx import ChangeEventReader, CounterInputTask, DigitalInputTask
+    lib = get_simulated_library()
+    lib.set_signal('Dev1/ctr0', lambda t: np.floor(t * 1e6))
+    try:
+        di = DigitalInputTask()
+        di.create_channel('Dev1/port0/line0:3', grouping='for_all_lines')
+        di.configure_timing_sample_clock(rate=16000.0)
+        counter = CounterInputTask()
+        # Starts close to rollover.
+        counter.create_channel_count_edges('Dev1/ctr0', init=(1 << 32) - 5000)
+        counter.configure_timing_sample_clock(source='/Dev1/di/SampleClock', rate=16000.0)
+        with pytest.raises(ValueError, match='timebase_rate'):
+            ChangeEventReader(di, 256, counter_task=counter)
+        with ChangeEventReader(di, 256, lines=[0, 1], counter_task=counter,
+                               timebase_rate=1e6) as reader:
+            events = np.concatenate([reader.read(200), reader.read(200)])
+        di.clear()
+        counter.clear()
+    finally:
+        lib.set_signal('Dev1/ctr0', None)
+    assert reader.samples_read == 400
+    line0 = events[events['line'] == 0]
+    line1 = events[events['line'] == 1]
+    assert abs(len(line0) - 50) <= 1 and abs(len(line1) - 25) <= 1
+    assert set(events['line']) == set([0, 1])
+    assert np.all(np.diff(line0['edge']) != 0)
+    assert np.all(np.diff(events['sample']) >= 0)
+    # Line 0 toggles every 8 samples, every 500 us.
+    assert np.all(np.diff(line0['sample']) == 8)
+    assert np.allclose(np.diff(line0['time']), 500e-6, atol=2e-6)
+    assert np.allclose(events['time'] - events['time'][0],
+                       (events['sample'] - events['sample'][0]) / 16000.0, atol=2e-6)
+
+def test_counter_read_float64():
+    from nidaqmx import CounterInputTask, StreamingReader
+    lib = get_simulated_library()
+    # 5 kHz input signal on ctr1.
+    lib.set_signal('Dev1/ctr1', lambda t: np.floor(t * 5000.0))
+    try:
+        task = CounterInputTask()
+        task.create_channel_freq('Dev1/ctr1', min_val=100.0, max_val=1e4)
+        task.configure_timing_sample_clock(rate=1000.0)
+        task.start()
+        freq = task.read(50)
+        out = np.zeros(20)
+        n = task.read_into(out)
+        task.stop()
+        with StreamingReader(task, 25, n_blocks=4) as reader:
+            sequence_numbers, blocks = reader.read_blocks(max_blocks=1, timeout=1.0)
+        task.clear()
+        edges = CounterInputTask()
+        edges.create_channel_count_edges('Dev1/ctr1')
+        edges.configure_timing_sample_clock(rate=1000.0)
+        edges.start()
+        counts = edges.read(10)
+        edges.stop()
+        with StreamingReader(edges, 10, n_blocks=4) as reader:
+            sequence_numbers, count_blocks = reader.read_blocks(max_blocks=1, timeout=1.0)
+        edges.clear()
+    finally:
+        lib.set_signal('Dev1/ctr1', None)
+    assert freq.dtype == np.float64 and freq.shape == (50,)
+    assert np.allclose(freq, 5000.0, atol=5.0)
+    assert n == 20 and np.allclose(out, 5000.0, atol=5.0)
+    assert blocks.dtype == np.float64 and blocks.shape == (1, 25)
+    assert np.allclose(blocks, 5000.0, atol=5.0)
+    assert counts.dtype == np.int32 and np.all(np.diff(counts) == 5)
+    assert count_blocks.dtype == np.int32 and np.all(np.diff(count_blocks[0]) == 5)
+
+def test_encoder_stream():
+    from nidaqmx import CounterInputTask, EncoderStream
+    lib = get_simulated_library()
+    # Moves down at 2e6 counts per second from count 0, so that the
+    # counter wraps around at the first sample.
+    lib.set_signal('Dev1/ctr2', lambda t: np.floor(-2e6 * t))
+    try:
+        task = CounterInputTask()
+        task.create_channel_linear_encoder('Dev1/ctr2')
+        task.configure_timing_sample_clock(rate=1000.0)
+        stream = EncoderStream(task, 64, dist_per_pulse=1e-6, offset=1.0)
+        with stream:
+            positions = np.concatenate([stream.read(50), stream.read(50)])
+            more, velocities = stream.read(64, velocity=True)
+        task.clear()
+    finally:
+        lib.set_signal('Dev1/ctr2', None)
+    assert stream.samples_read == 164
+    assert positions.dtype == np.float64 and len(positions) == 100
+    assert np.allclose(positions[0], 1.0 - 2e-3, atol=2e-6)
+    assert np.allclose(np.diff(np.concatenate([positions, more])), -2e-3, atol=2e-6)
+    assert np.allclose(velocities, -2.0, atol=2e-3)
+    assert stream.ticks == round((more[-1] - 1.0) * 1e6)
+    counts = np.array([(1 << 32) - 2, 1, 2, (1 << 32) - 1], dtype=np.int64).astype(np.uint32)
+    assert list(EncoderStream(task, 4).unwrap(counts)) == [-2, 1, 2, -1]
+
+def test_compile_and_stream_pulses():
+    from nidaqmx import CounterOutputTask
+    from nidaqmx.counter import compile_pulses, iter_pulse_blocks
+    high, low = compile_pulses([1e3, 3e3, 5e6, 1e3], [0.25, 0.5, 0.5, 1.0], 20e6)
+    assert high.dtype == np.uint32
+    assert list(high) == [5000, 3334, 2, 19998] and list(low) == [15000, 3333, 2, 2]
+    with pytest.raises(ValueError, match='Quantization error'):
+        compile_pulses([1e3, 3e6], 0.5, 20e6, max_error=0.01)
+    with pytest.raises(ValueError, match='Expected frequencies'):
+        compile_pulses([1e3, 7e6], 0.5, 20e6)
+    blocks = [(h.copy(), l.copy()) for h, l in
+              iter_pulse_blocks([np.full(5, 0.5), [0.25, 0.75]], 3, 1e6, frequency=1e3)]
+    assert [len(h) for h, l in blocks] == [3, 3, 1]
+    assert list(np.concatenate([h for h, l in blocks])) == [500] * 5 + [250, 750]
+    task = CounterOutputTask()
+    task.create_channel_ticks('Dev1/ctr3', source='/Dev1/100kHzTimebase')
+    assert task.get_timebase_rate() == 1e5
+    task.configure_timing_implicit(samples_per_channel=200)
+    def setpoints():
+        for i in range(10):
+            yield np.linspace(0.1, 0.9, 50)
+    assert task.stream_pulses(setpoints(), 100, frequency=2e3, max_blocks=3) == 300
+    time.sleep(0.05)
+    generated = task.get_samples_per_channel_generated()
+    task.clear()
+    # 2 kHz pulses.
+    assert 90 <= generated <= 150
+
+def test_streaming_writer():
+    from nidaqmx import StreamingWriter
+    def make_task():
+        task = AnalogOutputTask()
+        task.create_voltage_channel('Dev1/ao1', min_val=-10.0, max_val=10.0)
+        task.configure_timing_sample_clock(rate=10000.0)
+        return task
+    def blocks(pause_at=None):
+        for i in range(20):
+            if i == pause_at:
+                time.sleep(0.08)
+            yield np.full(100, i * 0.1)
+    task = make_task()
+    writer = StreamingWriter(task, blocks(), 100, n_blocks=4)
+    writer.start()
+    assert writer.join(1.0)
+    generated = task.get_samples_per_channel_generated()
+    writer.stop()
+    task.clear()
+    assert writer.error is None
+    assert writer.blocks_written == 20 and writer.samples_written == 2000
+    assert generated == 2000
+    assert writer.underflows == 0 and 0 < writer.min_headroom <= 400
+    # A source that falls behind by more than the buffer underflows.
+    task = make_task()
+    try:
+        from queue import Queue
+    except ImportError:
+        from Queue import Queue
+    queue = Queue()
+    for block in blocks():
+        queue.put(block)
+    with StreamingWriter(task, blocks(pause_at=10), 100, n_blocks=4) as writer:
+        assert writer.join(1.0)
+    with StreamingWriter(task, queue, 100, n_blocks=8, fill_level=400) as queued:
+        queue.put(None)
+        assert queued.join(1.0)
+    assert writer.underflows == 1 and writer.min_headroom == 0
+    assert queued.samples_written == 2000 and queued.underflows == 0
+    assert queued.min_headroom <= 400
+    # The queue is not waited for after its first block.
+    queue.put(np.zeros(100))
+    t0 = time.time()
+    queued = StreamingWriter(task, queue, 100, n_blocks=4, timeout=5.0)
+    queued.start()
+    assert time.time() - t0 < 1.0 and queued.samples_written == 100
+    queue.put(None)
+    assert queued.join(1.0)
+    queued.stop()
+    # Errors of the writing thread are raised by join and stop.
+    def failing():
+        yield np.zeros(100)
+        yield np.zeros(100)
+        raise RuntimeError('source failed')
+    writer = StreamingWriter(task, failing(), 100, n_blocks=4, fill_level=100)
+    writer.start()
+    with pytest.raises(RuntimeError, match='source failed'):
+        writer.join(1.0)
+    with pytest.raises(RuntimeError, match='source failed'):
+        writer.stop()
+    task.clear()
+
+def test_streaming_writer_underflow_error():
+    from nidaqmx import StreamingWriter
+    task = AnalogOutputTask()
+    task.create_voltage_channel('Dev1/ao1', min_val=-10.0, max_val=10.0)
+    task.configure_timing_sample_clock(rate=10000.0)
+    # With a Done event, the generation stops on an underflow.
+    task.register_done_event(lambda task, status, data=None: 0)
+    def blocks():
+        for i in range(20):
+            if i == 10:
+                time.sleep(0.1)
+            yield np.full(100, i * 0.1)
+    writer = StreamingWriter(task, blocks(), 100, n_blocks=4)
+    writer.start()
+    with pytest.raises(NIDAQmxRuntimeError) as info:
+        writer.join(1.0)
+    task.clear()
+    assert info.value.code == -200290 and writer.error is info.value
+    assert writer.underflows == 1
+
+def _read_tdms(filename):
+    """
+    Returns the segments of a TDMS file as a list of ``(toc, number
+    of raw data bytes, samples per chunk)``, and the properties and
+    data of its objects by path.
+    """
+    import struct
+    from nidaqmx import tdms
+    dtypes = dict((code, dtype) for dtype, code in tdms.tdms_types.items())
+    with open(filename, 'rb') as f:
+        content = f.read()
+    def unpack(fmt):
+        values = struct.unpack_from(fmt, content, pos[0])
+        pos[0] += struct.calcsize(fmt)
+        return values
+    def unpack_string():
+        n, = unpack('<I')
+        pos[0] += n
+        return content[pos[0] - n:pos[0]].decode('utf-8')
+    pos = [0]
+    segments, properties, data, indexes, paths = [], {}, {}, {}, []
+    while pos[0] < len(content):
+        tag, toc, version, next_offset, raw_offset = unpack('<4sIIQQ')
+        assert tag == b'TDSm' and version == tdms.tdms_version
+        start = pos[0]
+        if toc & tdms.kTocMetaData:
+            if toc & tdms.kTocNewObjList:
+                paths = []
+            for i in range(unpack('<I')[0]):
+                path = unpack_string()
+                if unpack('<I')[0] == 20:
+                    indexes[path] = unpack('<IIQ')[::2]
+                    if path not in paths:
+                        paths.append(path)
+                for j in range(unpack('<I')[0]):
+                    name = unpack_string()
+                    code, = unpack('<I')
+                    if code == tdms.tdsTypeString:
+                        value = unpack_string()
+                    else:
+                        value, = unpack('<d' if code == 10 else '<q')
+                    properties.setdefault(path, {})[name] = value
+        assert pos[0] == start + raw_offset
+        code, count = indexes[paths[0]]
+        raw = np.frombuffer(content[start + raw_offset:start + next_offset], dtype=dtypes[code])
+        if toc & tdms.kTocInterleavedData:
+            chunks = raw.reshape(-1, count, len(paths)).transpose(0, 2, 1)
+        else:
+            chunks = raw.reshape(-1, len(paths), count)
+        for i, path in enumerate(paths):
+            data[path] = np.concatenate([data.get(path, raw[:0]), chunks[:, i].ravel()])
+        segments.append((toc, next_offset - raw_offset, count))
+        pos[0] = start + next_offset
+    return segments, properties, data
+
+def test_tdms_writer(tmpdir):
+    from nidaqmx.tdms import (TdmsWriter, kTocMetaData, kTocNewObjList, kTocRawData,
+                              kTocInterleavedData)
+    lib = get_simulated_library()
+    lib.set_signal('Dev1/ai13', lambda t: t % 1.0)
+    lib.set_signal('Dev1/ai14', lambda t: np.full(len(t), -1.5))
+    try:
+        for fill_mode in ['group_by_scan_number', 'group_by_channel']:
+            task = make_ai_task('Dev1/ai13:14', rate=5000.0)
+            task.start()
+            filename = str(tmpdir.join('%s.tdms' % (fill_mode)))
+            last = np.array([[0.5, 1.0, 1.5, 2.0, 2.5], [-0.5, -1.0, -1.5, -2.0, -2.5]])
+            if fill_mode == 'group_by_scan_number':
+                last = last.T
+            with TdmsWriter(filename, task, 10, chunks_per_segment=3, fill_mode=fill_mode,
+                            group_name='capture') as writer:
+                for i in range(4):
+                    assert writer.read() == 10
+                writer.write(last)
+            task.clear()
+            assert writer.samples_written == 45 and writer.segments_written == 3
+            segments, properties, data = _read_tdms(filename)
+            interleaved = kTocInterleavedData if fill_mode == 'group_by_scan_number' else 0
+            assert segments == [
+                (kTocMetaData | kTocNewObjList | kTocRawData | interleaved, 30 * 2 * 8, 10),
+                (kTocRawData | interleaved, 10 * 2 * 8, 10),
+                (kTocMetaData | kTocRawData | interleaved, 5 * 2 * 8, 5)]
+            ai13 = "/'capture'/'Dev1/ai13'"
+            ai14 = "/'capture'/'Dev1/ai14'"
+            assert sorted(data) == [ai13, ai14]
+            assert properties[ai13]['NI_ChannelName'] == 'Dev1/ai13'
+            assert properties[ai13]['wf_increment'] == 1.0 / 5000.0
+            assert properties[ai14]['minimum'] == -10.0 and properties[ai14]['maximum'] == 10.0
+            assert len(data[ai13]) == len(data[ai14]) == 45
+            assert np.allclose(np.diff(data[ai13][:40]) % 1.0, 2e-4)
+            assert np.all(data[ai14][:40] == -1.5)
+            assert list(data[ai13][40:]) == [0.5, 1.0, 1.5, 2.0, 2.5]
+            assert list(data[ai14][40:]) == [-0.5, -1.0, -1.5, -2.0, -2.5]
+    finally:
+        lib.set_signal('Dev1/ai13', None)
+        lib.set_signal('Dev1/ai14', None)
+
+def test_task_group_read():
+    from nidaqmx import TaskGroup
+    tasks = [make_ai_task('Dev1/ai0:1'), make_ai_task('Dev1/ai2')]
+    with TaskGroup(dict(first=tasks[0], second=tasks[1])) as group:
+        group.alter_state('commit')
+        start_timing = group.start()
+        t0 = time.time()
+        data, timing = group.read(1000)
+        elapsed = time.time() - t0
+        stacked, _ = group.read(500, stack=True)
+        blocks = dict(group._blocks)
+        out = np.zeros((500, 3))
+        stacked_out, _ = group.read(500, stack=True, out=out)
+        assert all(group._blocks[key][1] is block for key, (_, block) in blocks.items())
+        by_channel, _ = group.read(100, fill_mode='group_by_channel', stack=True)
+        buffers = dict(first=np.zeros((100, 2)), second=np.zeros((100, 1)))
+        data_out, _ = group.read(100, out=buffers)
+        group.stop()
+        assert group['second'] is tasks[1]
+    for task in tasks:
+        task.clear()
+    assert sorted(start_timing) == sorted(timing) == ['first', 'second']
+    assert data['first'].shape == (1000, 2) and data['second'].shape == (1000, 1)
+    # The reads wait for the same 0.1 s of samples concurrently.
+    assert 0.09 < elapsed < 0.15
+    assert max(timing.values()) <= elapsed
+    assert stacked.shape == (500, 3) and by_channel.shape == (3, 100)
+    assert stacked_out is out and np.abs(out).max() <= 1.0
+    for name in ['first', 'second']:
+        assert np.shares_memory(data_out[name], buffers[name])
+        assert data_out[name].shape == buffers[name].shape
+
+def test_synchronized_tasks(monkeypatch):
+    from nidaqmx import SynchronizedTasks
+    lib = get_simulated_library()
+    lib.connect('Dev1/ao1', 'Dev1/ai7')
+    try:
+        master = AnalogInputTask('sync_master')
+        master.create_voltage_channel('Dev1/ai7', min_val=-10.0, max_val=10.0)
+        ai = AnalogInputTask('sync_ai')
+        ai.create_voltage_channel('Dev1/ai3', min_val=-10.0, max_val=10.0)
+        ao = AnalogOutputTask('sync_ao')
+        ao.create_voltage_channel('Dev1/ao1', min_val=-10.0, max_val=10.0)
+        sync = SynchronizedTasks(master, [ai, ao])
+        sync.configure_timing_sample_clock(rate=10000.0, sample_mode='finite',
+                                           samples_per_channel=500)
+        ao.write(np.linspace(0.0, 1.0, 500), auto_start=False)
+        order = []
+        for task in sync.tasks:
+            monkeypatch.setattr(task, 'start',
+                                lambda task=task, start=task.start: order.append(task.name)
+                                or start())
+        skew = sync.start()
+        sync.wait_until_done(1.0)
+        data = master.read(500)
+        sync.stop()
+        group = sync._group
+        sync.commit()
+        assert sync._group is group
+        sync.close()
+        assert sync._group is None
+        for task in sync.tasks:
+            task.clear()
+    finally:
+        lib.connect(None, 'Dev1/ai7')
+    assert sync.committed and sync.start_duration < 0.1
+    assert order == ['sync_ai', 'sync_ao', 'sync_master']
+    assert sorted(skew) == ['sync_ai', 'sync_ao']
+    # The slaves share the clock of the master, so the skew is only
+    # the clock running while it is measured, 1 ms at most.
+    assert all(abs(n) <= 10 for n in skew.values())
+    # The output is generated on the clock of the master from its
+    # first sample on, within a sample of the loopback.
+    assert np.abs(data[:, 0] - np.linspace(0.0, 1.0, 500)).max() <= 1.01 / 499
+
+def test_synchronized_wait_until_done():
+    from nidaqmx import SynchronizedTasks
+    master = make_ai_task('Dev1/ai0', rate=1000.0, sample_mode='finite',
+                          samples_per_channel=200)
+    slave = make_ai_task('Dev1/ai1', rate=1000.0)
+    with SynchronizedTasks(master, [slave]) as sync:
+        sync.start()
+        t0 = time.time()
+        # The master is done after 0.2 s and the slave never is, so
+        # the timeout passes 0.3 s after the call, not 0.5 s.
+        with pytest.raises(NIDAQmxRuntimeError):
+            sync.wait_until_done(0.3)
+        elapsed = time.time() - t0
+        sync.stop()
+    master.clear()
+    slave.clear()
+    assert 0.25 < elapsed < 0.45
+
+def test_npy_sink(tmpdir):
+    import json
+    from nidaqmx.sinks import NpySink
+    lib = get_simulated_library()
+    lib.set_signal('Dev1/ai4', lambda t: t % 1.0)
+    try:
+        task = make_ai_task('Dev1/ai4:5', rate=5000.0)
+        filename = str(tmpdir.join('capture.npy'))
+        task.start()
+        with NpySink(filename, task, samples_per_channel=100, grow_samples=64) as sink:
+            assert sink.read(80) == 80
+            sink.flush()
+            # A capture in progress loads up to the last flush.
+            partial = np.load(filename, mmap_mode='r')
+            assert partial.shape == (80, 2) and partial.dtype == np.float64
+            assert np.array_equal(partial, sink.data)
+            del partial
+            # Grows the file past its initial size, remapping it.
+            for i in range(3):
+                assert sink.read(50) == 50
+            assert sink._capacity == 292
+            assert os.path.getsize(filename) == 128 + 292 * 2 * 8
+            sink.write(np.full((10, 2), 7.0))
+        task.clear()
+    finally:
+        lib.set_signal('Dev1/ai4', None)
+    assert sink.samples_written == 240
+    assert os.path.getsize(filename) == 128 + 240 * 2 * 8
+    with open(filename, 'rb') as f:
+        assert f.read(128).endswith(b'\n')
+    data = np.load(filename)
+    assert data.shape == (240, 2) and data.dtype == np.float64
+    assert np.allclose(np.diff(data[:230, 0]) % 1.0, 2e-4)
+    assert np.all(data[230:] == 7.0)
+    with open(str(tmpdir.join('capture.json'))) as f:
+        metadata = json.load(f)
+    assert metadata['samples_per_channel'] == 240 and metadata['dtype'] == '<f8'
+    assert [c['name'] for c in metadata['channels']] == ['Dev1/ai4', 'Dev1/ai5']
+    assert metadata['channels'][0]['units'] == 'volts'
+    assert metadata['sample_clock_rate'] == 5000.0
+    class SmallHeaderSink(NpySink):
+        header_size = 64
+    task = make_ai_task('Dev1/ai4:5')
+    with pytest.raises(ValueError, match='header'):
+        SmallHeaderSink(str(tmpdir.join('small.npy')), task)
+    task.clear()
+
+def test_streaming_reader():
+    from nidaqmx import StreamingReader
+    lib = get_simulated_library()
+    lib.set_signal('Dev1/ai1', lambda t: t % 1.0)
+    try:
+        task = make_ai_task('Dev1/ai1', rate=10000.0)
+        with StreamingReader(task, 100, n_blocks=4) as reader:
+            # A consumer that falls behind by 10 blocks.
+            time.sleep(0.1)
+            sequence_numbers, blocks = reader.read_blocks()
+            overruns = reader.overruns
+            latest = reader.get_latest(250)
+            time.sleep(0.05)
+            more_numbers, more = reader.read_blocks()
+        task.clear()
+    finally:
+        lib.set_signal('Dev1/ai1', None)
+    assert 1 <= len(sequence_numbers) <= 3 and blocks.shape[1:] == (100, 1)
+    assert np.all(np.diff(sequence_numbers) == 1)
+    assert overruns == sequence_numbers[0] >= 6
+    assert reader.overruns == overruns + more_numbers[0] - sequence_numbers[-1] - 1
+    assert np.allclose(np.diff(blocks.reshape(-1)) % 1.0, 1e-4)
+    assert latest.shape == (250, 1)
+    assert np.allclose(np.diff(latest[:, 0]) % 1.0, 1e-4)
+    # The error of the reading thread is raised to the consumer.
+    task = AnalogInputTask()
+    task.create_voltage_channel('Dev1/ai1', min_val=-10.0, max_val=10.0)
+    # An external sample clock that never ticks.
+    task.configure_timing_sample_clock(source='/Dev1/PFI0', rate=10000.0)
+    reader = StreamingReader(task, 100, n_blocks=4, timeout=0.05)
+    reader.start()
+    with pytest.raises(NIDAQmxRuntimeError, match='-200284'):
+        reader.read_blocks(timeout=1.0)
+    with pytest.raises(NIDAQmxRuntimeError, match='-200284'):
+        reader.get_latest(10)
+    reader.stop()
+    task.clear()
+    assert not reader.running and reader.blocks_read == 0